@@ -0,0 +1,142 @@
+"""Tests for the PM1 protein-domain interval index.
+
+Black formatted with 88-char line limit.
+"""
+
+import gzip
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from varidex.acmg.criteria_pm1 import PM1Classifier
+from varidex.acmg.domain_index import DomainIntervalIndex
+
+UNIPROT_ENTRY = """<entry><gene><name type="primary">{gene}</name></gene>
+<feature type="domain"><location><begin position="10"/><end position="20"/></location>
+</feature></entry>"""
+
+
+def write_uniprot(path, gene: str) -> None:
+    body = '<uniprot xmlns="http://uniprot.org/uniprot">{}</uniprot>'.format(
+        UNIPROT_ENTRY.format(gene=gene)
+    )
+    with gzip.open(path, "wt") as f:
+        f.write(body)
+
+
+DOMAINS = {
+    "BRCA1": [(1650, 1722), (1756, 1855), (1700, 1760)],
+    "TP53": [(102, 292)],
+    "EMPTY": [],
+}
+
+
+class TestDomainIntervalIndex:
+    """Test interval construction, lookup and persistence."""
+
+    def test_overlapping_intervals_merged(self) -> None:
+        """Overlapping BRCA1 domains collapse into one interval."""
+        index = DomainIntervalIndex.from_domains(DOMAINS)
+        assert len(index) == 2
+        assert "EMPTY" not in index
+        assert len(index.starts) == 2
+
+    def test_contains(self) -> None:
+        """Positions are tested against the correct gene's intervals."""
+        index = DomainIntervalIndex.from_domains(DOMAINS)
+        hits = index.contains(
+            ["BRCA1", "BRCA1", "BRCA1", "TP53", "TP53", "KRAS", "BRCA1", None],
+            [1699, 1855, 1900, 273, 50, 12, np.nan, 1700],
+        )
+        assert list(hits) == [True, True, False, True, False, False, False, False]
+
+    def test_round_trip(self, tmp_path) -> None:
+        """Saved index loads back with identical lookups."""
+        index = DomainIntervalIndex.from_domains(DOMAINS)
+        path = tmp_path / "domains.npz"
+        index.save(path)
+        loaded = DomainIntervalIndex.load(path)
+        assert loaded.gene_set == {"BRCA1", "TP53"}
+        assert list(loaded.contains(["TP53"], [200])) == [True]
+
+    def test_source_fingerprint_mismatch(self, tmp_path) -> None:
+        """Indexes built from another UniProt file are rejected."""
+        path = tmp_path / "domains.npz"
+        DomainIntervalIndex.from_domains(DOMAINS, "abc").save(path)
+        assert DomainIntervalIndex.load(path, "abc").source_fingerprint == "abc"
+        with pytest.raises(ValueError):
+            DomainIntervalIndex.load(path, "def")
+
+    def test_version_mismatch(self, tmp_path) -> None:
+        """Indexes from another format version are rejected."""
+        path = tmp_path / "domains.npz"
+        np.savez(
+            path,
+            format_version=np.array(0),
+            genes=np.array([], dtype=str),
+            starts=np.array([], dtype=np.int64),
+            stops=np.array([], dtype=np.int64),
+        )
+        with pytest.raises(ValueError):
+            DomainIntervalIndex.load(path)
+
+
+class TestPM1Classifier:
+    """Test position-accurate PM1."""
+
+    @pytest.fixture
+    def classifier(self, tmp_path) -> PM1Classifier:
+        DomainIntervalIndex.from_domains(DOMAINS).save(
+            tmp_path / "uniprot.xml.domains.npz"
+        )
+        return PM1Classifier(str(tmp_path / "uniprot.xml.gz"))
+
+    def test_position_in_domain(self, classifier: PM1Classifier) -> None:
+        """Only missense variants inside a domain get PM1."""
+        df = pd.DataFrame(
+            {
+                "gene": ["BRCA1", "BRCA1", "TP53", "TP53", "BRCA1"],
+                "molecular_consequence": [
+                    "missense_variant",
+                    "missense_variant",
+                    "missense_variant",
+                    "synonymous_variant",
+                    "missense_variant",
+                ],
+                "protein_change": [
+                    "p.Arg1699Trp",
+                    "p.V1900M",
+                    "p.(Arg273His)",
+                    "p.Arg273=",
+                    None,
+                ],
+            }
+        )
+        result = classifier.apply_pm1(df)
+        assert list(result["PM1"]) == [True, False, True, False, False]
+
+    def test_gene_level_fallback(self, classifier: PM1Classifier) -> None:
+        """Without HGVS p. annotations PM1 falls back to domain genes."""
+        df = pd.DataFrame(
+            {
+                "gene": ["BRCA1", "KRAS"],
+                "molecular_consequence": ["missense_variant", "missense_variant"],
+            }
+        )
+        result = classifier.apply_pm1(df)
+        assert list(result["PM1"]) == [True, False]
+
+    def test_parallel_deprecated(self, classifier: PM1Classifier) -> None:
+        df = pd.DataFrame({"gene": ["KRAS"], "molecular_consequence": ["missense"]})
+        with pytest.warns(DeprecationWarning):
+            classifier.apply_pm1(df, parallel=True)
+
+    def test_replaced_uniprot_rebuilds_index(self, tmp_path) -> None:
+        """A new UniProt file is not served from the old cached index."""
+        uniprot = tmp_path / "uniprot.xml.gz"
+        write_uniprot(uniprot, "TP53")
+        assert PM1Classifier(str(uniprot)).genes_with_domains == {"TP53"}
+
+        write_uniprot(uniprot, "KRAS")
+        assert PM1Classifier(str(uniprot)).genes_with_domains == {"KRAS"}
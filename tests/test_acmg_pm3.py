@@ -0,0 +1,84 @@
+"""Tests for varidex.acmg.criteria_pm3 gene-grouped PM3 detection.
+
+Black formatted with 88-char line limit.
+"""
+
+import pandas as pd
+
+from varidex.acmg.criteria_pm3 import PM3Classifier
+
+
+def _variants(**extra) -> pd.DataFrame:
+    data = {
+        "gene": ["BRCA1", "BRCA1", "TP53", "BRCA1", "CFTR", "CFTR"],
+        "clinical_sig": [
+            "Pathogenic",
+            "Pathogenic/Likely_pathogenic",
+            "Pathogenic",
+            "Benign",
+            "Pathogenic",
+            "Pathogenic",
+        ],
+        "genotype": ["AG", "TC", "AG", "GG", "CT", "GA"],
+        "position": [43000000, 44500000, 7500000, 43000100, 117000000, 117000500],
+    }
+    data.update(extra)
+    return pd.DataFrame(data)
+
+
+class TestPM3DistanceHeuristic:
+    """Unphased variants use per-gene min/max distance."""
+
+    def test_far_pair_flagged(self) -> None:
+        """Het pathogenic pair >1 Mb apart gets PM3; close pair does not."""
+        result = PM3Classifier().apply_pm3(_variants())
+        assert list(result["PM3"]) == [True, True, False, False, False, False]
+        assert result.at[0, "PM3_confidence"] == "distance_heuristic"
+        assert result.at[4, "PM3_confidence"] is None
+
+    def test_too_close_pairs_counted(self) -> None:
+        """Close pairs are counted for the low-confidence warning."""
+        classifier = PM3Classifier()
+        df = _variants()
+        far, too_close = classifier._distance_mask(df.loc[[0, 1, 4, 5]])
+        assert too_close == 1
+        assert list(far) == [True, True, False, False]
+
+    def test_heuristic_disabled(self) -> None:
+        """No PM3 without phasing when the heuristic is off."""
+        result = PM3Classifier(enable_distance_heuristic=False).apply_pm3(_variants())
+        assert not result["PM3"].any()
+
+    def test_require_phasing_without_phase(self) -> None:
+        """require_phasing disables PM3 for unphased input."""
+        result = PM3Classifier(require_phasing=True).apply_pm3(_variants())
+        assert not result["PM3"].any()
+
+
+class TestPM3Phased:
+    """Phased GT/PS from a user VCF decide cis vs trans."""
+
+    def test_trans_in_same_phase_set(self) -> None:
+        """Close variants on opposite haplotypes are flagged as phased."""
+        df = _variants(
+            gt=["0/1", "0/1", "0/1", "1/1", "0|1", "1|0"],
+            phase_set=[None, None, None, None, "117000000", "117000000"],
+        )
+        result = PM3Classifier(require_phasing=True).apply_pm3(df)
+        assert list(result["PM3"]) == [False, False, False, False, True, True]
+        assert result.at[4, "PM3_confidence"] == "phased"
+
+    def test_cis_not_flagged(self) -> None:
+        """Variants on the same haplotype are in cis."""
+        df = _variants(gt=["0|1", "0|1", "0/1", "1/1", "0|1", "0|1"])
+        result = PM3Classifier().apply_pm3(df)
+        assert not result["PM3"].any()
+
+    def test_different_phase_sets_not_compared(self) -> None:
+        """Opposite haplotypes in different phase blocks are unresolved."""
+        df = _variants(
+            gt=["0/1", "0/1", "0/1", "1/1", "0|1", "1|0"],
+            phase_set=[None, None, None, None, "100", "200"],
+        )
+        result = PM3Classifier().apply_pm3(df)
+        assert not result.loc[[4, 5], "PM3"].any()
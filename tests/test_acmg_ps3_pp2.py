@@ -0,0 +1,118 @@
+"""Tests for varidex.acmg.criteria_PS3_PP2 columnar PS3/PP2 evaluation.
+
+Black formatted with 88-char line limit.
+"""
+
+import pandas as pd
+import pytest
+
+from varidex.acmg.criteria_PS3_PP2 import PS3_PP2_Classifier, PS3Evidence
+
+
+@pytest.fixture
+def predictor_df() -> pd.DataFrame:
+    """Variants covering every PS3 strength tier."""
+    return pd.DataFrame(
+        {
+            "gene": ["BRCA1", "BRCA1", "APOE", "TTN", "MYH7", None],
+            "molecular_consequence": [
+                "missense_variant",
+                "missense_variant",
+                "missense_variant",
+                "synonymous_variant",
+                "missense_variant",
+                "missense_variant",
+            ],
+            "REVEL_score": [0.8, 0.3, 0.6, 0.1, 0.2, None],
+            "CADD_phred": [28, 15, 25, 30, 10, "n/a"],
+            "AlphaMissense_score": [0.9, 0.2, 0.1, 0.1, 0.1, 0.95],
+            "SIFT_score": [0.01, 0.5, None, 0.01, 0.01, 0.9],
+            "PolyPhen_score": [0.9, 0.1, 0.99, 0.9, 0.2, 0.1],
+        }
+    )
+
+
+class TestPS3Columnar:
+    """Test the mask-based PS3 path."""
+
+    def test_strength_tiers(self, predictor_df: pd.DataFrame) -> None:
+        """Each row is assigned the expected strength tier."""
+        result = PS3_PP2_Classifier().apply_ps3_only(predictor_df)
+        assert list(result["PS3_strength"]) == [
+            "Strong",
+            "",
+            "Moderate",
+            "Moderate",
+            "",
+            "Supporting",
+        ]
+        assert list(result["PS3"]) == [True, False, True, True, False, True]
+
+    def test_matches_per_row_evaluation(self, predictor_df: pd.DataFrame) -> None:
+        """Columnar results agree with the per-row evaluator."""
+        classifier = PS3_PP2_Classifier()
+        result = classifier.apply_ps3_only(predictor_df.copy())
+        for idx, row in predictor_df.iterrows():
+            evidence = classifier._evaluate_ps3_for_row(row)
+            assert evidence.applied == result.at[idx, "PS3"]
+            assert evidence.strength == result.at[idx, "PS3_strength"]
+
+    def test_rationale_only_for_flagged_rows(self, predictor_df: pd.DataFrame) -> None:
+        """Rationale objects are built for PS3-flagged rows only."""
+        classifier = PS3_PP2_Classifier()
+        rationale = classifier.ps3_rationale(predictor_df)
+        assert sorted(rationale) == [0, 2, 3, 5]
+        evidence = rationale[0]
+        assert isinstance(evidence, PS3Evidence)
+        assert evidence.sources == ["AlphaMissense", "REVEL", "CADD", "SIFT+PolyPhen"]
+        assert evidence.scores["Meta"] == 1.0
+        assert evidence.interpretation.startswith("PS3_Strong")
+
+    def test_missing_required_columns(self) -> None:
+        """Missing REVEL/CADD disables PS3 with an error column."""
+        df = pd.DataFrame({"gene": ["BRCA1"], "AlphaMissense_score": [0.9]})
+        result = PS3_PP2_Classifier().apply_ps3_only(df)
+        assert not result["PS3"].any()
+        assert "PS3_error" in result.columns
+
+
+class TestPP2Columnar:
+    """Test PP2 with pre-joined constraint metrics."""
+
+    def test_constraint_join(self, tmp_path) -> None:
+        """pLI / missense Z come from one pre-joined lookup."""
+        constraint_file = tmp_path / "constraint.tsv"
+        pd.DataFrame(
+            {
+                "gene": ["APOE", "MYH7", "APOE"],
+                "pLI": [0.95, 0.1, 0.0],
+                "missense_z": [1.0, 3.5, 0.0],
+            }
+        ).to_csv(constraint_file, sep="\t", index=False)
+
+        classifier = PS3_PP2_Classifier(
+            gnomad_constraint_path=str(constraint_file), missense_genes={"BRCA1"}
+        )
+        df = pd.DataFrame(
+            {
+                "gene": ["BRCA1", "APOE", "MYH7", "TTN", None],
+                "molecular_consequence": ["missense_variant"] * 4 + ["missense"],
+            }
+        )
+        result = classifier.apply_pp2_only(df)
+        assert list(result["PP2"]) == [True, True, True, False, False]
+        assert classifier._get_pli_score("APOE") == pytest.approx(0.95)
+        assert classifier._get_missense_z_score("MYH7") == pytest.approx(3.5)
+        assert classifier._get_pli_score("UNKNOWN") is None
+
+    def test_non_missense_not_flagged(self) -> None:
+        """PP2 is limited to missense consequences."""
+        classifier = PS3_PP2_Classifier(lof_genes={"TTN"})
+        df = pd.DataFrame(
+            {
+                "gene": ["TTN", "TTN"],
+                "molecular_consequence": ["stop_gained", "MISSENSE"],
+            }
+        )
+        result = classifier.apply_pp2_only(df)
+        assert list(result["PP2"]) == [False, True]
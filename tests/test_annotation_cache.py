@@ -0,0 +1,276 @@
+"""Tests for the shared LRU/TTL annotation cache.
+
+Black formatted with 88-char line limit.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from varidex.integrations.annotation_cache import AnnotationCache, AnnotationKey
+from varidex.integrations.cache import NOT_FOUND, CacheBackend, LRUCache
+from varidex.integrations.dbnsfp_client import DbNSFPClient
+from varidex.integrations.gnomad_client import GnomadClient
+
+
+class DictBackend(CacheBackend):
+    """In-memory stand-in for an on-disk backend."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Any] = {}
+        self.reads = 0
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        self.reads += 1
+        return {k: self.data[k] for k in keys if k in self.data}
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        self.data.update(items)
+
+    def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    def clear(self) -> None:
+        self.data.clear()
+
+
+class TestLRUCache:
+    """Eviction, expiry, bounds and counters."""
+
+    def test_lru_eviction(self) -> None:
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # a is now most recent
+        cache.set("c", 3)
+        assert "b" not in cache
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["size"] == 2
+
+    def test_ttl_expiry(self) -> None:
+        cache = LRUCache(ttl=10.0)
+        with patch("varidex.integrations.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=1000.0)
+        with patch("varidex.integrations.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+            assert cache.get("b") == 2
+        assert cache.stats.expirations == 1
+        assert cache.stats.misses == 1
+
+    def test_byte_bound(self) -> None:
+        cache = LRUCache(max_entries=100, max_bytes=250, sizeof=lambda v: 100)
+        for key in "abc":
+            cache.set(key, key)
+        assert len(cache) == 2
+        assert cache.get_stats()["bytes"] == 200
+
+    def test_backend_read_and_write_through(self) -> None:
+        backend = DictBackend()
+        cache = LRUCache(backend=backend)
+        cache.set("a", 1)
+        assert backend.data == {"a": 1}
+
+        backend.data["b"] = 2
+        assert cache.get_many(["a", "b", "z"]) == {"a": 1, "b": 2}
+        assert backend.reads == 1
+        assert cache.get("b") == 2  # promoted into memory
+        assert backend.reads == 1
+        assert cache.stats.backend_hits == 1
+
+    def test_incomplete_backend_rejected(self) -> None:
+        class ReadOnlyBackend(CacheBackend):
+            def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+                return {}
+
+        with pytest.raises(TypeError):
+            ReadOnlyBackend()
+
+    def test_concurrent_access(self) -> None:
+        cache = LRUCache(max_entries=50)
+
+        def worker(offset: int) -> None:
+            for i in range(500):
+                cache.set(f"k{(i + offset) % 80}", i)
+                cache.get(f"k{i % 80}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_stats()
+        assert stats["size"] <= 50
+        assert stats["hits"] + stats["misses"] == 8 * 500
+
+
+class TestClientCaches:
+    """Both clients use the shared cache."""
+
+    def test_clients_use_lru_cache(self) -> None:
+        shared = LRUCache(max_entries=10)
+        gnomad = GnomadClient(rate_limit=False, cache=shared)
+        assert gnomad._cache is shared
+        assert gnomad.get_cache_stats()["max_size"] == 10
+
+        dbnsfp = DbNSFPClient(rate_limit=False, cache_size=5)
+        assert isinstance(dbnsfp._cache, LRUCache)
+        assert dbnsfp._cache.max_entries == 5
+        assert "cache" in dbnsfp.get_statistics()
+
+
+GNOMAD_RESPONSE = {
+    "data": {
+        "variant": {
+            "genome": {"af": 0.2, "ac": 4000, "an": 20000, "populations": []},
+            "exome": {},
+        }
+    }
+}
+
+
+def key(pos: int, source: str = "gnomad") -> AnnotationKey:
+    return AnnotationKey("GRCh38", "17", pos, "G", "A", source, "gnomad_r4")
+
+
+class TestAnnotationCache:
+    """Persistent SQLite annotation store."""
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "annotations.sqlite"
+        with AnnotationCache(path, write_batch_size=2) as store:
+            store.put_many({key(1): {"af": 0.1}})
+            assert store.get_many([key(1)]) == {key(1): {"af": 0.1}}  # pending
+        with AnnotationCache(path) as store:
+            assert store.get_many([key(1), key(2)]) == {key(1): {"af": 0.1}}
+
+    def test_source_ttl_and_vacuum(self, tmp_path: Path) -> None:
+        store = AnnotationCache(tmp_path / "a.sqlite", source_ttls={"vep": 10.0})
+        with patch("varidex.integrations.annotation_cache.time.time", return_value=0):
+            store.put_many({key(1, "vep"): 1, key(2): 2})
+            store.flush()
+        with patch("varidex.integrations.annotation_cache.time.time", return_value=60):
+            assert store.get_many([key(1, "vep"), key(2)]) == {key(2): 2}
+            assert store.purge_expired() == 1
+        store.vacuum()
+        assert "vep/gnomad_r4" not in store.stats()["sources"]
+        store.close()
+
+    def test_concurrent_writers(self, tmp_path: Path) -> None:
+        store = AnnotationCache(tmp_path / "a.sqlite", write_batch_size=7)
+
+        def worker(offset: int) -> None:
+            for i in range(50):
+                store.put_many({key(i * 4 + offset): i})
+            store.flush()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(store.get_many([key(i) for i in range(200)])) == 200
+        store.close()
+
+    def test_repeat_cohort_skips_network(self, tmp_path: Path) -> None:
+        """A second run with the same store makes no gnomAD requests."""
+        path = tmp_path / "annotations.sqlite"
+        variants = [("17", 43094692 + i, "G", "A") for i in range(3)]
+
+        for expected_calls in (3, 0):
+            with AnnotationCache(path) as store:
+                client = GnomadClient(
+                    rate_limit=False,
+                    cache=store.memory_cache("gnomad"),
+                    use_batch_api=False,
+                )
+                with patch.object(
+                    client, "_execute_query", return_value=GNOMAD_RESPONSE
+                ) as mock_execute:
+                    results = client.get_variant_frequencies(variants)
+                assert mock_execute.call_count == expected_calls
+                assert [r.genome_af for r in results] == [0.2] * 3
+
+    def test_not_found_ttl(self, tmp_path: Path) -> None:
+        store = AnnotationCache(tmp_path / "a.sqlite", not_found_ttls={"gnomad": 10.0})
+        with patch("varidex.integrations.annotation_cache.time.time", return_value=0):
+            store.put_many({key(1): NOT_FOUND, key(2): 2})
+            store.flush()
+        with patch("varidex.integrations.annotation_cache.time.time", return_value=5):
+            assert store.get_many([key(1)])[key(1)] is NOT_FOUND
+        with patch("varidex.integrations.annotation_cache.time.time", return_value=60):
+            assert store.get_many([key(1), key(2)]) == {key(2): 2}
+        store.close()
+
+
+class TestAbsentVariants:
+    """Variants the services do not have are cached as NOT_FOUND."""
+
+    VARIANTS = [("17", 43094692 + i, "G", "A") for i in range(3)]
+
+    def test_gnomad_single_queries(self, tmp_path: Path) -> None:
+        path = tmp_path / "annotations.sqlite"
+        for expected_calls in (3, 0):
+            with AnnotationCache(path) as store:
+                client = GnomadClient(
+                    rate_limit=False,
+                    cache=store.memory_cache("gnomad"),
+                    use_batch_api=False,
+                )
+                with patch.object(
+                    client, "_execute_query", return_value={"data": {"variant": None}}
+                ) as mock_execute:
+                    results = client.get_variant_frequencies(self.VARIANTS)
+                assert mock_execute.call_count == expected_calls
+                assert results == [None] * 3
+
+    def test_gnomad_batch_queries(self, tmp_path: Path) -> None:
+        path = tmp_path / "annotations.sqlite"
+        for expected_calls in (1, 0):
+            with AnnotationCache(path) as store:
+                client = GnomadClient(
+                    rate_limit=False, cache=store.memory_cache("gnomad")
+                )
+                with patch(
+                    "varidex.integrations.gnomad_async.AsyncGnomadClient._post",
+                    return_value={"data": {}},
+                ) as mock_post:
+                    results = client.get_variant_frequencies(self.VARIANTS)
+                assert mock_post.call_count == expected_calls
+                assert results == [None] * 3
+
+    def test_failed_batch_not_cached(self) -> None:
+        client = GnomadClient(rate_limit=False, retry_attempts=1)
+        with patch(
+            "varidex.integrations.gnomad_async.AsyncGnomadClient._post",
+            side_effect=requests.ConnectionError("offline"),
+        ) as mock_post:
+            for _ in range(2):
+                assert client.get_variant_frequencies(self.VARIANTS) == [None] * 3
+        assert mock_post.call_count == 2
+        assert len(client._cache) == 0
+
+    def test_vep_single_queries(self, tmp_path: Path) -> None:
+        path = tmp_path / "annotations.sqlite"
+        response = MagicMock(status_code=200)
+        response.json.return_value = []
+        for expected_calls in (3, 0):
+            with AnnotationCache(path) as store:
+                client = DbNSFPClient(
+                    rate_limit=False,
+                    cache=store.memory_cache("vep"),
+                    use_batch_api=False,
+                )
+                with patch.object(
+                    client.session, "get", return_value=response
+                ) as mock_get:
+                    results = client.get_predictions_batch(self.VARIANTS)
+                assert mock_get.call_count == expected_calls
+                assert results == [None] * 3
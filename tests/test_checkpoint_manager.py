@@ -0,0 +1,90 @@
+"""Tests for column-delta checkpoints with an on-disk manifest.
+
+Black formatted with 88-char line limit.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from varidex.pipeline.stages import CHECKPOINT_MANIFEST, CheckpointManager
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def matched() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "rsid": ["rs1", "rs2", "rs3"],
+            "chromosome": ["1", "2", "X"],
+            "position": [10, 20, 30],
+            "clinical_sig": ["Pathogenic", "Benign", "Uncertain_significance"],
+        }
+    )
+
+
+def feather_files(directory: Path) -> list:
+    return sorted(p.name for p in directory.glob("*.feather"))
+
+
+class TestCheckpointManager:
+    """Deltas, resume across managers and projection."""
+
+    def test_delta_writes_only_new_columns(
+        self, tmp_path: Path, matched: pd.DataFrame
+    ) -> None:
+        manager = CheckpointManager(tmp_path)
+        manager.save_checkpoint(4, matched, "matching")
+        annotated = matched.assign(BA1=[False, True, False], PM2=[True, False, True])
+        manager.save_checkpoint(5, annotated, "acmg")
+
+        entry = manager.manifest["stages"]["5"]
+        assert entry["parent"] == 4
+        written = {
+            col
+            for col, spec in entry["columns"].items()
+            if spec["file"] == entry["file"]
+        }
+        assert written == {"BA1", "PM2"}
+        assert len(feather_files(tmp_path)) == 2
+
+        pd.testing.assert_frame_equal(manager.load_checkpoint(5), annotated)
+        pd.testing.assert_frame_equal(manager.load_checkpoint(4), matched)
+
+    def test_changed_column_and_new_rows(
+        self, tmp_path: Path, matched: pd.DataFrame
+    ) -> None:
+        manager = CheckpointManager(tmp_path)
+        manager.save_checkpoint(4, matched, "matching")
+        relabelled = matched.assign(clinical_sig=["Benign"] * 3)
+        manager.save_checkpoint(5, relabelled, "acmg")
+        entry = manager.manifest["stages"]["5"]
+        assert entry["columns"]["clinical_sig"]["file"] == entry["file"]
+        assert entry["columns"]["rsid"]["file"] != entry["file"]
+
+        manager.save_checkpoint(6, matched.iloc[:2], "filtered")
+        assert manager.manifest["stages"]["6"]["parent"] is None
+
+    def test_resume_and_projection(self, tmp_path: Path, matched: pd.DataFrame) -> None:
+        CheckpointManager(tmp_path).save_checkpoint(4, matched, "matching")
+        assert (tmp_path / CHECKPOINT_MANIFEST).exists()
+
+        resumed = CheckpointManager(tmp_path, resume=True)
+        projected = resumed.load_checkpoint(4, columns=["position", "rsid"])
+        assert list(projected.columns) == ["rsid", "position"]
+        assert projected["position"].tolist() == [10, 20, 30]
+
+        fresh = CheckpointManager(tmp_path)
+        assert fresh.load_checkpoint(4) is None
+        assert feather_files(tmp_path) == []
+
+    def test_resave_removes_unreferenced_files(
+        self, tmp_path: Path, matched: pd.DataFrame
+    ) -> None:
+        manager = CheckpointManager(tmp_path)
+        manager.save_checkpoint(4, matched, "matching")
+        manager.save_checkpoint(4, matched.assign(position=[1, 2, 3]), "matching")
+        assert len(feather_files(tmp_path)) == 1
+        assert manager.load_checkpoint(4)["position"].tolist() == [1, 2, 3]
@@ -0,0 +1,67 @@
+"""Tests for the adaptive, order-preserving Stage 5 classification executor.
+
+Black formatted with 88-char line limit.
+"""
+
+import pandas as pd
+import pytest
+
+from varidex.pipeline.stages import (
+    ClassificationExecutor,
+    execute_stage5_acmg_classification,
+)
+
+SIGNIFICANCE = ["Pathogenic", "Benign", "Likely_benign", "Uncertain_significance"]
+
+
+@pytest.fixture
+def matched_df() -> pd.DataFrame:
+    n = 1000
+    return pd.DataFrame(
+        {
+            "rsid": [f"rs{i}" for i in range(n)],
+            "chromosome": ["1"] * n,
+            "position": list(range(n)),
+            "clinical_sig": [SIGNIFICANCE[i % 4] for i in range(n)],
+            "review_status": ["criteria_provided"] * n,
+        }
+    )
+
+
+class TestClassificationExecutor:
+    """Parallel output matches the sequential path, in input order."""
+
+    @pytest.mark.parametrize("deterministic", [False, True])
+    def test_parallel_preserves_order(
+        self, matched_df: pd.DataFrame, deterministic: bool
+    ) -> None:
+        classified, stats = execute_stage5_acmg_classification(
+            matched_df,
+            {},
+            "vcf",
+            "23andme",
+            batch_size=64,
+            max_workers=2,
+            deterministic=deterministic,
+        )
+        assert [c["variant"]["rsid"] for c in classified] == matched_df["rsid"].tolist()
+        assert [c["classification"] for c in classified[:4]] == ["P", "B", "LB", "VUS"]
+        assert stats["pathogenic"] == stats["benign"] == 250
+        assert stats["likely_benign"] == stats["vus"] == 250
+
+        sequential, seq_stats = execute_stage5_acmg_classification(
+            matched_df, {}, "vcf", "23andme", parallel=False
+        )
+        assert sequential == classified
+        assert seq_stats == stats
+
+    def test_plan(self) -> None:
+        fixed = ClassificationExecutor(deterministic=True)
+        assert fixed.plan(10**6, 500.0) == (4, 1000)
+
+        adaptive = ClassificationExecutor(max_workers=4)
+        workers, batch = adaptive.plan(10_000, 200.0)
+        assert workers == 4
+        assert ClassificationExecutor.MIN_BATCH_SIZE <= batch <= 2500
+        # Small inputs do not start idle workers
+        assert adaptive.plan(100, 200.0) == (1, ClassificationExecutor.MIN_BATCH_SIZE)
@@ -0,0 +1,175 @@
+"""Tests for batched classification (classify_batch) on the engine hierarchy.
+
+Black formatted with 88-char line limit.
+"""
+
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from varidex.acmg.splice import SpliceACMG
+from varidex.core.classifier.engine_v7 import ACMGClassifierV7
+from varidex.core.classifier.engine_v8 import ACMGClassifierV8
+from varidex.core.models import VariantData
+from varidex.integrations.dbnsfp_client import DbNSFPClient, PredictionScore
+from varidex.integrations.gnomad_client import GnomadClient
+
+COMMON_RESPONSE = {
+    "data": {
+        "variant": {
+            "genome": {"af": 0.2, "ac": 4000, "an": 20000, "populations": []},
+            "exome": {},
+        }
+    }
+}
+
+
+def make_variant(rsid: str, position: str, chromosome: str = "17") -> VariantData:
+    """Missense variant with full coordinates."""
+    return VariantData(
+        rsid=rsid,
+        chromosome=chromosome,
+        position=position,
+        genotype="AG",
+        gene="BRCA1",
+        ref_allele="G",
+        alt_allele="A",
+        clinical_sig="Uncertain significance",
+        review_status="criteria provided, single submitter",
+        variant_type="SNV",
+        molecular_consequence="missense_variant",
+    )
+
+
+@pytest.fixture
+def gnomad_client() -> GnomadClient:
+    return GnomadClient(rate_limit=False, enable_cache=False, use_batch_api=False)
+
+
+class TestClassifyBatch:
+    """Batch classification resolves gnomAD once per unique variant."""
+
+    def test_duplicates_looked_up_once(self, gnomad_client: GnomadClient) -> None:
+        """Repeated coordinates in a batch share one gnomAD query."""
+        classifier = ACMGClassifierV7(gnomad_client=gnomad_client)
+        variants = [
+            make_variant("rs1", "43094692"),
+            make_variant("rs2", "43094692"),
+            make_variant("rs3", "43094700"),
+        ]
+        with patch.object(
+            gnomad_client, "_execute_query", return_value=COMMON_RESPONSE
+        ) as mock_execute:
+            results = classifier.classify_batch(variants)
+
+        assert mock_execute.call_count == 2
+        assert len(results) == 3
+        for classification, _, evidence, duration in results:
+            assert classification == "Benign"
+            assert "BA1" in evidence.ba
+            assert not any(c.startswith("gnomAD error") for c in evidence.conflicts)
+            assert duration >= 0
+
+    def test_matches_per_variant_api(self, gnomad_client: GnomadClient) -> None:
+        """classify_variant gives the same result as a one-element batch."""
+        classifier = ACMGClassifierV7(gnomad_client=gnomad_client)
+        variant = make_variant("rs1", "43094692")
+        with patch.object(
+            gnomad_client, "_execute_query", return_value={"data": {"variant": None}}
+        ):
+            single = classifier.classify_variant(variant)
+            batch = classifier.classify_batch([variant])[0]
+
+        assert single[:2] == batch[:2]
+        assert "PM2" in single[2].pm
+
+    def test_missing_coordinates_and_empty_batch(
+        self, gnomad_client: GnomadClient
+    ) -> None:
+        """Variants without coordinates are flagged, not queried."""
+        classifier = ACMGClassifierV7(gnomad_client=gnomad_client)
+        variant = make_variant("rs1", "43094692", chromosome="")
+        with patch.object(gnomad_client, "_execute_query") as mock_execute:
+            evidence = classifier.classify_batch([variant])[0][2]
+
+        mock_execute.assert_not_called()
+        assert "Missing coordinates for gnomAD" in evidence.conflicts
+        assert classifier.classify_batch([]) == []
+
+
+def _stub_models(splice: SpliceACMG) -> None:
+    splice.models = ["stub"]
+
+
+class TestV8Components:
+    """Splice scoring and predictions are long-lived, batched components."""
+
+    @pytest.fixture
+    def dbnsfp_client(self) -> Iterator[DbNSFPClient]:
+        client = DbNSFPClient(rate_limit=False, enable_cache=False, use_batch_api=False)
+        deleterious = PredictionScore(
+            sift_score=0.01, polyphen_score=0.95, cadd_phred=30.0, revel_score=0.9
+        )
+        with patch.object(client, "get_predictions", return_value=deleterious):
+            yield client
+
+    def test_score_many(self) -> None:
+        """score_many matches per-variant score and loads models once."""
+        splice = SpliceACMG()
+        with patch.object(
+            SpliceACMG, "_load_models", autospec=True, side_effect=_stub_models
+        ) as mock_load:
+            results = splice.score_many([("17", 100, "G", "A"), ("17", 101, "G", "A")])
+            assert results[0] == splice.score("17", 100, "G", "A")
+
+        assert mock_load.call_count == 1
+        assert [r["pm1"] for r in results] == ["PM1_Strong", None]
+
+    def test_batch_loads_splice_once(self, dbnsfp_client: DbNSFPClient) -> None:
+        """One SpliceACMG serves the whole batch; PM1 and PP3 are assigned."""
+        classifier = ACMGClassifierV8(enable_gnomad=False, dbnsfp_client=dbnsfp_client)
+        variants = [make_variant(f"rs{i}", str(43094692 + 2 * i)) for i in range(3)]
+        with patch.object(
+            SpliceACMG, "_load_models", autospec=True, side_effect=_stub_models
+        ) as mock_load:
+            assert classifier.warm_up()["splice"] is True
+            results = classifier.classify_batch(variants)
+
+        assert mock_load.call_count == 1
+        for _, _, evidence, _ in results:
+            assert "PM1_Strong" in evidence.pm
+            assert "PP3" in evidence.pp
+
+    def test_per_variant_evidence_in_output(self) -> None:
+        """classify_variant reports PM1 from splice scoring and BP4."""
+        client = DbNSFPClient(rate_limit=False, enable_cache=False, use_batch_api=False)
+        benign = PredictionScore(
+            sift_score=0.9, polyphen_score=0.01, cadd_phred=2.0, revel_score=0.05
+        )
+        classifier = ACMGClassifierV8(enable_gnomad=False, dbnsfp_client=client)
+        with patch.object(client, "get_predictions", return_value=benign), patch.object(
+            SpliceACMG, "_load_models", autospec=True, side_effect=_stub_models
+        ):
+            _, confidence, evidence, _ = classifier.classify_variant(
+                make_variant("rs1", "43094692")
+            )
+
+        assert not confidence.startswith("Error")
+        assert "PM1_Strong" in evidence.pm
+        assert "BP4" in evidence.bp
+        assert "PP3" not in evidence.pp
+
+    def test_health_check_reports_latency(self) -> None:
+        """health_check exposes component startup and per-variant latency."""
+        classifier = ACMGClassifierV8(enable_gnomad=False, enable_predictions=False)
+        with patch.object(
+            SpliceACMG, "_load_models", autospec=True, side_effect=_stub_models
+        ):
+            classifier.classify_variant(make_variant("rs1", "43094692"))
+
+        splice = classifier.health_check()["components"]["splice"]
+        assert splice["initialized"] is True
+        assert splice["startup_seconds"] is not None
+        assert splice["variants"] == 1
+        assert splice["mean_latency_ms"] is not None
@@ -0,0 +1,122 @@
+"""Tests for the release-keyed ClinVar index cache.
+
+Black formatted with 88-char line limit.
+"""
+
+import pandas as pd
+import pytest
+
+import varidex.io.loaders.clinvar as clinvar_loader
+from varidex.acmg.clinvar_index import (
+    ClinVarIndexCache,
+    build_pm5_index,
+    build_ps1_index,
+    clinvar_source_hash,
+)
+
+
+@pytest.fixture
+def clinvar_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "gene": ["BRCA1", "TP53"],
+            "protein_change": ["p.Arg1699Trp", "p.R273H"],
+            "clinical_sig": ["Pathogenic", "Pathogenic"],
+            "review_status": ["criteria_provided,_single_submitter"] * 2,
+        }
+    )
+
+
+class TestClinVarIndexCache:
+    """Hit/miss behaviour and invalidation."""
+
+    def test_miss_then_hit(self, clinvar_df: pd.DataFrame, tmp_path) -> None:
+        """Second lookup for the same release is served from disk."""
+        cache = ClinVarIndexCache(tmp_path)
+        first = cache.get_or_build(clinvar_df, "ps1", build_ps1_index, version="1")
+        second = cache.get_or_build(
+            clinvar_df.copy(), "ps1", build_ps1_index, version="1"
+        )
+        pd.testing.assert_frame_equal(first, second)
+        assert cache.stats["ps1"] == {"hits": 1, "misses": 1, "errors": 0}
+        assert len(list(tmp_path.glob("ps1-*.feather"))) == 1
+
+    def test_version_bump_invalidates(self, clinvar_df: pd.DataFrame, tmp_path) -> None:
+        """A new index version rebuilds and replaces the stale file."""
+        cache = ClinVarIndexCache(tmp_path)
+        cache.get_or_build(clinvar_df, "pm5", build_pm5_index, version="1")
+        cache.get_or_build(clinvar_df, "pm5", build_pm5_index, version="2")
+        assert cache.stats["pm5"]["misses"] == 2
+        assert len(list(tmp_path.glob("pm5-*.feather"))) == 1
+
+    def test_source_file_change_invalidates(
+        self, clinvar_df: pd.DataFrame, tmp_path
+    ) -> None:
+        """A different ClinVar source file gives a different key."""
+        source = tmp_path / "clinvar.vcf"
+        source.write_text("release-1\n")
+        clinvar_df.attrs["clinvar_source_file"] = str(source)
+        cache = ClinVarIndexCache(tmp_path / "idx")
+        key_1 = cache.cache_key(clinvar_df, "ps1", "1")
+
+        source.write_text("release-2 with more records\n")
+        updated = clinvar_df.copy()
+        updated.attrs = {"clinvar_source_file": str(source)}
+        assert cache.cache_key(updated, "ps1", "1") != key_1
+
+    def test_frame_hash_without_source(self, clinvar_df: pd.DataFrame) -> None:
+        """Frames without a source file are fingerprinted by content."""
+        changed = clinvar_df.copy()
+        changed.attrs = {}
+        changed.loc[0, "protein_change"] = "p.Arg1699Gln"
+        assert clinvar_source_hash(clinvar_df) != clinvar_source_hash(changed)
+
+    def test_chromosome_filtered_load_not_release_keyed(
+        self, clinvar_df: pd.DataFrame, tmp_path, monkeypatch
+    ) -> None:
+        """A chromosome-filtered load is keyed by content, not by the release."""
+        clinvar_xml = pytest.importorskip("varidex.io.loaders.clinvar_xml")
+        source = tmp_path / "ClinVarFullRelease.xml.gz"
+        source.write_text("release\n")
+        monkeypatch.setattr(
+            clinvar_loader, "detect_clinvar_file_type", lambda path: "xml"
+        )
+        monkeypatch.setattr(
+            clinvar_xml, "load_clinvar_xml", lambda path, **kwargs: clinvar_df.copy()
+        )
+
+        full = clinvar_loader.load_clinvar_file(source, checkpoint_dir=tmp_path)
+        assert full.attrs["clinvar_source_file"] == str(source)
+        for _ in range(2):  # source load, then the filtered parquet cache
+            filtered = clinvar_loader.load_clinvar_file(
+                source, user_chromosomes={"17"}, checkpoint_dir=tmp_path
+            )
+            assert "clinvar_source_file" not in filtered.attrs
+        assert clinvar_source_hash(filtered) != clinvar_source_hash(full)
+
+
+class TestSignificanceTerms:
+    """Only whole Pathogenic / Likely_pathogenic terms are indexed."""
+
+    @pytest.fixture
+    def mixed_df(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "gene": ["G1", "G2", "G3", "G4", "G5"],
+                "protein_change": ["p.R10W"] * 5,
+                "clinical_sig": [
+                    "Conflicting_interpretations_of_pathogenicity",
+                    "Conflicting_classifications_of_pathogenicity",
+                    "Pathogenic/Likely_pathogenic",
+                    "Likely_pathogenic",
+                    "Pathogenic/Likely_benign",
+                ],
+                "review_status": ["criteria_provided,_single_submitter"] * 5,
+            }
+        )
+
+    def test_pm5_excludes_conflicting(self, mixed_df: pd.DataFrame) -> None:
+        assert sorted(build_pm5_index(mixed_df)["gene"]) == ["G3", "G4"]
+
+    def test_ps1_excludes_conflicting(self, mixed_df: pd.DataFrame) -> None:
+        assert sorted(build_ps1_index(mixed_df)["gene"]) == ["G3", "G4", "G5"]
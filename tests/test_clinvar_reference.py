@@ -0,0 +1,97 @@
+"""Tests for the lazily loaded, column-projected ClinVar reference.
+
+Black formatted with 88-char line limit.
+"""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from varidex.acmg.clinvar_index import (
+    INDEX_SOURCE_COLUMNS,
+    ClinVarIndexCache,
+    ClinVarReference,
+    build_ps1_index,
+    clinvar_source_hash,
+)
+from varidex.io.loaders.clinvar import processed_cache_file
+from varidex.version import __version__
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def clinvar_cache(tmp_path: Path) -> Path:
+    """A ClinVar source file with a valid processed-parquet cache."""
+    source = tmp_path / "clinvar.vcf"
+    source.write_text("release-1\n")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    cache_file = cache_dir / "clinvar_processed.parquet"
+    pd.DataFrame(
+        {
+            "rsid": ["rs1", "rs2"],
+            "chromosome": ["17", "17"],
+            "gene": ["BRCA1", "TP53"],
+            "protein_change": ["p.Arg1699Trp", "p.R273H"],
+            "clinical_sig": ["Pathogenic", "Pathogenic"],
+            "review_status": ["criteria_provided,_single_submitter"] * 2,
+        }
+    ).to_parquet(cache_file, index=False)
+    stat = source.stat()
+    meta = {
+        "source_size": stat.st_size,
+        "source_mtime": stat.st_mtime,
+        "cache_version": __version__,
+    }
+    (cache_dir / f"{cache_file.name}.meta.json").write_text(json.dumps(meta))
+    return source
+
+
+class TestClinVarReference:
+    """Projection from the parquet cache and lazy index lookups."""
+
+    def test_projected_read(self, clinvar_cache: Path) -> None:
+        cache_dir = clinvar_cache.parent / "cache"
+        assert processed_cache_file(clinvar_cache, cache_dir) is not None
+
+        reference = ClinVarReference(clinvar_cache, cache_dir)
+        assert "rsid" in reference.columns
+        assert reference._frame is None
+
+        frame = reference.frame()
+        assert set(frame.columns) <= set(INDEX_SOURCE_COLUMNS)
+        assert "rsid" not in frame.columns
+        assert len(frame) == 2
+
+    def test_stale_cache_is_ignored(self, clinvar_cache: Path) -> None:
+        clinvar_cache.write_text("release-2 with more records\n")
+        cache_dir = clinvar_cache.parent / "cache"
+        assert processed_cache_file(clinvar_cache, cache_dir) is None
+
+    def test_index_hit_reads_nothing(self, clinvar_cache: Path, tmp_path) -> None:
+        cache_dir = clinvar_cache.parent / "cache"
+        index_cache = ClinVarIndexCache(tmp_path / "idx")
+        first = index_cache.get_or_build(
+            ClinVarReference(clinvar_cache, cache_dir), "ps1", build_ps1_index
+        )
+        assert not first.empty
+
+        reference = ClinVarReference(clinvar_cache, cache_dir)
+        second = index_cache.get_or_build(reference, "ps1", build_ps1_index)
+        pd.testing.assert_frame_equal(first, second)
+        assert reference._frame is None
+        assert index_cache.stats["ps1"] == {"hits": 1, "misses": 1, "errors": 0}
+
+    def test_from_loaded_frame(self, clinvar_cache: Path) -> None:
+        cache_dir = clinvar_cache.parent / "cache"
+        loaded = pd.read_parquet(cache_dir / "clinvar_processed.parquet")
+        loaded.attrs["clinvar_source_file"] = str(clinvar_cache)
+
+        reference = ClinVarReference(clinvar_cache, cache_dir, clinvar_df=loaded)
+        assert "rsid" in reference.columns
+        assert "rsid" not in reference.frame().columns
+        lazy = ClinVarReference(clinvar_cache, cache_dir)
+        assert clinvar_source_hash(reference) == clinvar_source_hash(lazy)
@@ -7,10 +7,22 @@ Tests cover:
 - Edge cases and error handling
 """
 
+import pickle
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from varidex.core.exceptions import ValidationError
-from varidex.core.models import AnnotatedVariant, Variant, VariantClassification
+from varidex.core.models import (
+    AnnotatedVariant,
+    Variant,
+    VariantClassification,
+    VariantData,
+    VariantRecord,
+    chromosome_code,
+    chromosome_name,
+)
 
 
 class TestVariantCreation:
@@ -339,5 +351,100 @@ class TestVariantEdgeCases:
         assert variant.chrom == "chrM"
 
 
+class TestVariantRecord:
+    """Test the slotted bulk variant model."""
+
+    def test_from_arrays(self) -> None:
+        """Bulk construction interns chromosomes and parses positions."""
+        records = VariantRecord.from_arrays(
+            ["chr1", "1", "chrM"],
+            ["12345", 200, 7.0],
+            ["a", "G", ""],
+            ["G", "T", ""],
+            gene=["BRCA1", "TP53", ""],
+            gnomad_af=[0.01, float("nan"), None],
+        )
+        assert [r.chrom_code for r in records] == [
+            chromosome_code("1"),
+            chromosome_code("1"),
+            chromosome_code("MT"),
+        ]
+        assert records[0].pos == 12345
+        assert records[0].ref_allele == "A"
+        assert records[2].chromosome == "MT"
+        assert records[0].gnomad_af == 0.01
+        assert not hasattr(records[1], "gnomad_af")
+        assert not hasattr(records[0], "__dict__")
+
+    def test_from_arrays_numeric_columns(self) -> None:
+        """All-numeric object columns build without a pandas FutureWarning."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", FutureWarning)
+            records = VariantRecord.from_arrays(
+                ["1", "2"], [10, 20], ["A", "C"], ["T", "G"]
+            )
+        assert [r.pos for r in records] == [10, 20]
+
+    def test_from_arrays_invalid_rows(self) -> None:
+        """Invalid rows raise, or become None with on_invalid='none'."""
+        args = (
+            ["1", "1", "", "1"],
+            [100, -5, 100, 100],
+            ["A"] * 4,
+            ["G", "G", "G", "A"],
+        )
+        with pytest.raises(ValidationError):
+            VariantRecord.from_arrays(*args)
+        records = VariantRecord.from_arrays(*args, on_invalid="none")
+        assert [r is None for r in records] == [False, True, True, True]
+
+    def test_lazy_evidence(self) -> None:
+        """Evidence is only allocated when accessed."""
+        record = VariantRecord(chromosome_code("17"), 43094692, "G", "A")
+        assert not record.has_evidence
+        record.acmg_evidence.pvs.add("PVS1")
+        assert record.has_evidence
+
+    def test_variant_data_round_trip(self) -> None:
+        """Conversion to and from VariantData preserves core fields."""
+        variant = VariantData(
+            chromosome="chr17", position="43094692", ref="G", alt="A", gene="BRCA1"
+        )
+        record = VariantRecord.from_variant_data(variant)
+        back = record.to_variant_data()
+        assert back.chromosome == "17"
+        assert back.position == "43094692"
+        assert (back.ref_allele, back.alt_allele, back.gene) == ("G", "A", "BRCA1")
+        assert record.variant_key == back.variant_key
+
+    def test_concurrent_interning(self) -> None:
+        """Threads interning the same new contigs agree on one code each."""
+        contigs = [f"test_contig_{i}" for i in range(50)] * 8
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            codes = list(pool.map(chromosome_code, contigs))
+        by_name = dict(zip(contigs, codes))
+        assert len(set(by_name.values())) == 50
+        assert all(chromosome_name(by_name[c]) == c.upper() for c in contigs)
+
+    def test_pickle_carries_chromosome_name(self) -> None:
+        """Pickled records re-intern by name, not by process-local code."""
+        record = VariantRecord(chromosome_code("GL000220.1"), 100, "A", "G")
+        state = record.__getstate__()
+        assert "chrom_code" not in state
+        assert state["chromosome"] == "GL000220.1"
+        copy = pickle.loads(pickle.dumps(record))
+        assert copy.chromosome == "GL000220.1"
+        assert (copy.pos, copy.ref_allele, copy.alt_allele) == (100, "A", "G")
+        assert not hasattr(copy, "gnomad_af")
+
+    def test_trusted_skips_validation(self) -> None:
+        """trusted=True stores bulk-validated values without re-checking."""
+        variant = VariantData(chromosome="17", position=43094692, ref="g", trusted=True)
+        assert variant.position == "43094692"
+        assert variant.ref_allele == "g"
+        with pytest.raises(ValidationError):
+            VariantData(chromosome="17", position=43094692, ref="G", alt="G")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+"""Tests for the bitmask encoding of ACMG evidence.
+
+Black formatted with 88-char line limit.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from varidex.core import evidence_bits as eb
+from varidex.core.exceptions import ValidationError
+from varidex.core.models import ACMGEvidenceSet
+from varidex.pipeline.acmg_classifier_stage import apply_full_acmg_classification
+
+
+@pytest.fixture
+def evidence() -> ACMGEvidenceSet:
+    return ACMGEvidenceSet(
+        pvs={"PVS1"}, pm={"PM2", "PM1_Strong"}, pp={"PP3"}, bp={"BP7"}
+    )
+
+
+class TestEvidenceBits:
+    """Encode/decode adapters."""
+
+    def test_layout(self) -> None:
+        """28 codes fit in uint32; each decodes into its own category."""
+        assert len(eb.ACMG_CODES) == 28
+        assert max(eb.CODE_BITS.values()) < 1 << 32
+        assert dict(eb.BIT_DECODE)["PVS1"] == "pvs"
+        assert dict(eb.BIT_DECODE)["BA1"] == "ba"
+
+    def test_round_trip(self, evidence: ACMGEvidenceSet) -> None:
+        """Modifiers encode as the base code; decode restores categories."""
+        mask = evidence.to_mask()
+        decoded = ACMGEvidenceSet.from_mask(mask)
+        assert decoded.pm == {"PM1", "PM2"}
+        assert decoded.pvs == {"PVS1"} and decoded.bp == {"BP7"}
+        assert decoded.pp == {"PP3"}
+        assert decoded.to_mask() == mask
+
+    def test_modified_code_round_trip(self) -> None:
+        """Modified codes decode as the base code in the base category."""
+        evidence = ACMGEvidenceSet(ps={"PP3_Strong"}, pm={"PM1", "PM1_Strong"})
+        decoded = ACMGEvidenceSet.from_mask(evidence.to_mask())
+        assert decoded.ps == set()
+        assert decoded.pp == {"PP3"}
+        assert decoded.pm == {"PM1"}
+
+    def test_unknown_codes(self) -> None:
+        """Unknown codes are dropped, or rejected in strict mode."""
+        evidence = ACMGEvidenceSet(pm={"PM2", "XX9"})
+        assert evidence.to_mask() == eb.CODE_BITS["PM2"]
+        with pytest.raises(ValidationError):
+            evidence.to_mask(strict=True)
+
+
+class TestEvidenceMaskColumn:
+    """The stage-5 classification frame carries the mask."""
+
+    def test_matches_evidence_summary(self) -> None:
+        df = pd.DataFrame(
+            {
+                "chromosome": ["17", "17"],
+                "position": ["43094692", "43094700"],
+                "ref_allele": ["G", "C"],
+                "alt_allele": ["A", "T"],
+                "gene": ["BRCA1", "BRCA1"],
+                "molecular_consequence": ["missense_variant", "frameshift_variant"],
+                "gnomad_af": [0.2, None],
+            }
+        )
+        result = apply_full_acmg_classification(df)
+        assert result["evidence_mask"].dtype == np.uint32
+        for mask, summary in zip(result["evidence_mask"], result["evidence_summary"]):
+            decoded = ACMGEvidenceSet.from_mask(mask)
+            codes = set().union(*(getattr(decoded, c) for c in eb.EVIDENCE_CATEGORIES))
+            assert codes == set(summary.split(", "))
@@ -0,0 +1,172 @@
+"""Tests for aliased, batched gnomAD GraphQL lookups against a stub server.
+
+Black formatted with 88-char line limit.
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from varidex.core.services.population_frequency import PopulationFrequencyService
+from varidex.integrations.gnomad_async import (
+    AsyncGnomadClient,
+    build_batch_query,
+    parse_batch_response,
+)
+from varidex.integrations.gnomad_client import GnomadClient
+
+ALIAS_PATTERN = re.compile(
+    r'(v\d+): variant\(dataset: "([^"]+)", variantId: "([^"]+)"\)'
+)
+
+
+class StubGnomadServer(ThreadingHTTPServer):
+    """Answers aliased variant queries; positions ending in 9 are absent."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubGnomadHandler)
+        self.documents: List[List[str]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/api"
+
+
+class StubGnomadHandler(BaseHTTPRequestHandler):
+    server: StubGnomadServer
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        aliases = ALIAS_PATTERN.findall(body["query"])
+        with self.server.lock:
+            self.server.documents.append([variant_id for _, _, variant_id in aliases])
+
+        data: Dict[str, Any] = {}
+        errors = []
+        for alias, dataset, variant_id in aliases:
+            if variant_id.split("-")[1].endswith("9"):
+                data[alias] = None
+                errors.append({"message": "Variant not found", "path": [alias]})
+                continue
+            af = 0.2 if dataset == "gnomad_r4" else 0.3
+            data[alias] = {
+                "variantId": variant_id,
+                "genome": {"af": af, "ac": 4000, "an": 20000, "populations": []},
+                "exome": None,
+            }
+        payload = json.dumps({"data": data, "errors": errors}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[StubGnomadServer]:
+    stub = StubGnomadServer()
+    thread = threading.Thread(target=stub.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+def variants(n: int) -> List[tuple]:
+    return [("chr17", 43094690 + i, "G", "A") for i in range(n)]
+
+
+class TestBatchQuery:
+    """Document building and bulk parsing."""
+
+    def test_aliases_and_datasets(self) -> None:
+        keys = [("gnomad_r4", "17-1-G-A"), ("gnomad_r3", "X-2-C-T")]
+        document = build_batch_query(keys)
+        assert ALIAS_PATTERN.findall(document) == [
+            ("v0", "gnomad_r4", "17-1-G-A"),
+            ("v1", "gnomad_r3", "X-2-C-T"),
+        ]
+
+        response = {"data": {"v0": {"genome": {"af": 0.5}}, "v1": None}}
+        parsed = parse_batch_response(response, keys)
+        assert parsed[keys[0]].genome_af == 0.5
+        assert parsed[keys[1]] is None
+
+
+class TestAsyncGnomadClient:
+    """Batched lookups against the stub server."""
+
+    def test_batches_and_not_found(self, server: StubGnomadServer) -> None:
+        client = AsyncGnomadClient(
+            api_url=server.url, batch_size=50, requests_per_second=None
+        )
+        results = client.get_frequencies_sync(variants(120))
+
+        assert [len(doc) for doc in server.documents] == [50, 50, 20]
+        assert results[0].variant_id == "17-43094690-G-A"
+        assert results[0].genome_af == 0.2
+        assert results[9] is None  # position ...699 is absent
+
+    def test_in_flight_dedup(self, server: StubGnomadServer) -> None:
+        client = AsyncGnomadClient(api_url=server.url, requests_per_second=None)
+
+        async def run() -> List[Any]:
+            return await asyncio.gather(
+                *(client.get_frequency("17", 43094692, "G", "A") for _ in range(5)),
+                client.get_frequency("17", 43094692, "G", "A", dataset="gnomad_r3"),
+            )
+
+        results = asyncio.run(run())
+        assert [r.genome_af for r in results] == [0.2] * 5 + [0.3]
+        assert server.documents == [["17-43094692-G-A", "17-43094692-G-A"]]
+        assert client.get_statistics()["coalesced"] == 4
+
+    def test_rate_limit_spans_sync_calls(self, server: StubGnomadServer) -> None:
+        client = AsyncGnomadClient(
+            api_url=server.url, requests_per_second=10.0, burst=2
+        )
+        start = time.perf_counter()
+        for variant in variants(5):
+            client.get_frequencies_sync([variant])
+        # Two banked tokens, then three refills at 10/s: each call's new
+        # event loop does not get a fresh burst
+        assert len(server.documents) == 5
+        assert time.perf_counter() - start >= 0.25
+
+
+class TestBatchedFrequencyService:
+    """GnomadClient and PopulationFrequencyService use the batch mode."""
+
+    def test_client_batches_and_caches(self, server: StubGnomadServer) -> None:
+        client = GnomadClient(api_url=server.url, rate_limit=False, batch_size=100)
+        first = client.get_variant_frequencies(variants(30) + variants(5))
+        assert len(first) == 35 and first[30] is first[0]
+        assert len(server.documents) == 1
+
+        client.get_variant_frequencies(variants(8))
+        assert len(server.documents) == 1  # served from cache (found variants)
+
+    def test_analyze_frequency_batch(self, server: StubGnomadServer) -> None:
+        client = GnomadClient(api_url=server.url, rate_limit=False)
+        service = PopulationFrequencyService(gnomad_client=client)
+        queries = [
+            {"chromosome": c, "position": p, "ref": r, "alt": a}
+            for c, p, r, a in variants(10)
+        ]
+        evidence = service.analyze_frequency_batch(queries)
+
+        assert len(server.documents) == 1
+        assert all(e.ba1 for e in evidence[:9])
+        assert evidence[9].pm2  # absent from gnomAD
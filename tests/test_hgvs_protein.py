@@ -0,0 +1,100 @@
+"""Tests for the shared HGVS p. parser and the PS1/PM5 index joins.
+
+Black formatted with 88-char line limit.
+"""
+
+import pandas as pd
+import pytest
+
+from varidex.acmg.criteria_pm5 import PM5Classifier
+from varidex.acmg.criteria_ps1 import PS1Classifier
+from varidex.acmg.hgvs_protein import parse_hgvs_p
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch) -> None:
+    """Keep the default ClinVar index cache out of the working tree."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def clinvar_df() -> pd.DataFrame:
+    """Minimal ClinVar frame with protein annotations."""
+    return pd.DataFrame(
+        {
+            "gene": ["BRCA1", "BRCA1", "TP53", "TP53"],
+            "protein_change": ["p.Arg1699Trp", "p.Glu255del", "p.R273H", "p.V100M"],
+            "clinical_sig": ["Pathogenic", "Pathogenic", "Likely_pathogenic", "Benign"],
+            "review_status": ["criteria_provided,_multiple_submitters"] * 4,
+        }
+    )
+
+
+class TestParseHgvsP:
+    """Test vectorized HGVS p. parsing."""
+
+    def test_formats(self) -> None:
+        """1-letter, 3-letter, parenthesized and non-substitution forms."""
+        values = pd.Series(
+            [
+                "p.Arg1699Trp",
+                "p.R1699W",
+                "p.(Arg273His)",
+                "p.Glu255del",
+                "p.Met1?",
+                "p.Glu45_Glu47del",
+                "p.Arg123GlnfsTer5",
+                "p.Q10*",
+                None,
+                "c.123A>G",
+            ]
+        )
+        parsed = parse_hgvs_p(values)
+        positions = parsed["position"].fillna(-1).tolist()
+        assert positions == [1699, 1699, 273, 255, 1, 45, 123, 10, -1, -1]
+        norm = parsed["hgvs_p_norm"]
+        assert norm[0] == "p.Arg1699Trp"
+        assert norm[1] == "p.Arg1699Trp"
+        assert norm[2] == "p.Arg273His"
+        assert norm[7] == "p.Gln10Ter"
+        assert norm[[3, 4, 5, 6, 8, 9]].isna().all()
+
+
+class TestPS1PM5Joins:
+    """PS1 and PM5 match through index joins."""
+
+    def test_ps1_exact_change(self, clinvar_df: pd.DataFrame) -> None:
+        """Same AA change (any notation) gets PS1."""
+        variants = pd.DataFrame(
+            {
+                "gene": ["BRCA1", "BRCA1", "TP53", "BRCA2"],
+                "protein_change": [
+                    "p.R1699W",
+                    "p.Arg1699Gln",
+                    "p.Arg273His",
+                    "p.R1699W",
+                ],
+            }
+        )
+        result = PS1Classifier(clinvar_df).apply_ps1(variants)
+        assert list(result["PS1"]) == [True, False, True, False]
+
+    def test_pm5_same_position(self, clinvar_df: pd.DataFrame) -> None:
+        """Missense at a pathogenic residue gets PM5; benign residues do not."""
+        variants = pd.DataFrame(
+            {
+                "gene": ["BRCA1", "BRCA1", "TP53", "TP53", "BRCA2"],
+                "molecular_consequence": ["missense"] * 5,
+                "protein_change": [
+                    "p.Arg1699Gln",
+                    "p.Glu255Lys",
+                    "p.Arg273Cys",
+                    "p.Val100Leu",
+                    "p.Val100Met",
+                ],
+            }
+        )
+        classifier = PM5Classifier(clinvar_df)
+        result = classifier.apply_pm5(variants)
+        assert list(result["PM5"]) == [True, True, True, False, False]
+        assert classifier._extract_protein_position("p.Glu45_Glu47del") == 45
@@ -0,0 +1,121 @@
+"""Tests for parallel ClinVar / user data loading (Stages 2 and 3).
+
+Black formatted with 88-char line limit.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from varidex.pipeline.stages import StageProfiler, execute_stages_2_3_parallel
+
+LOAD_DELAY = 0.3
+
+
+# This module doubles as the loader: process workers import it by name.
+def load_clinvar_file(clinvar_file, checkpoint_dir=None, user_chromosomes=None):
+    time.sleep(LOAD_DELAY)
+    df = pd.DataFrame({"rsid": ["rs1", "rs2"], "chromosome": ["1", "2"]})
+    df.attrs["clinvar_source_file"] = str(clinvar_file)
+    return df
+
+
+def processed_cache_file(clinvar_file, checkpoint_dir=".varidex_cache"):
+    cache_file = Path(checkpoint_dir) / "clinvar_processed.parquet"
+    return cache_file if cache_file.exists() else None
+
+
+def load_user_file(user_file, file_format=None):
+    time.sleep(LOAD_DELAY)
+    return pd.DataFrame({"rsid": ["rs1"], "genotype": ["AG"]})
+
+
+@pytest.fixture
+def files(tmp_path: Path):
+    clinvar_file = tmp_path / "clinvar.vcf"
+    user_file = tmp_path / "genome.txt"
+    clinvar_file.write_text("")
+    user_file.write_text("")
+    return clinvar_file, user_file, tmp_path / "cache"
+
+
+def run(files, **kwargs):
+    clinvar_file, user_file, checkpoint_dir = files
+    return execute_stages_2_3_parallel(
+        clinvar_file,
+        user_file,
+        checkpoint_dir,
+        sys.modules[__name__],
+        "23andme",
+        {},
+        warm_indexes=False,
+        **kwargs,
+    )
+
+
+class TestParallelLoading:
+    """Both loads overlap and the overlap is reported."""
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_frames_and_metrics(self, files, executor: str) -> None:
+        if executor == "process":
+            pytest.importorskip("pyarrow")
+        profiler = StageProfiler()
+        clinvar_df, user_df = run(files, executor=executor, profiler=profiler)
+
+        assert clinvar_df["rsid"].tolist() == ["rs1", "rs2"]
+        assert clinvar_df.attrs["clinvar_source_file"].endswith("clinvar.vcf")
+        assert user_df["genotype"].tolist() == ["AG"]
+        # Shared Feather files are removed once read back
+        assert not list((files[2] / "shared").glob("*.feather"))
+
+        by_name = {m.stage_name: m for m in profiler.metrics}
+        assert {"load_clinvar", "load_user_data"} <= set(by_name)
+        stats = by_name["stages_2_3_parallel"].extra
+        assert stats["executor"] == executor
+        assert stats["overlap_sec"] > LOAD_DELAY / 2
+        assert stats["speedup"] > 1.2
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_missing_user_file(self, files, executor: str) -> None:
+        files[1].unlink()
+        started = time.time()
+        with pytest.raises(FileNotFoundError):
+            run(files, executor=executor)
+        # Reported before the ClinVar load is started
+        assert time.time() - started < LOAD_DELAY
+
+    def test_cache_hit_handed_over_by_path(self, files) -> None:
+        pytest.importorskip("pyarrow")
+        cache_file = files[2] / "clinvar_processed.parquet"
+        cache_file.parent.mkdir(parents=True)
+        pd.DataFrame({"rsid": ["rs9"], "chromosome": ["9"]}).to_parquet(cache_file)
+
+        clinvar_df, _ = run(files, executor="process")
+
+        # The worker skips the loader and the parent reads the cache
+        assert clinvar_df["rsid"].tolist() == ["rs9"]
+        assert clinvar_df.attrs["clinvar_cache_file"] == str(cache_file)
+        assert cache_file.exists()
+
+    def test_non_module_loader_uses_threads(self, files) -> None:
+        class Loader:
+            load_clinvar_file = staticmethod(load_clinvar_file)
+            load_user_file = staticmethod(load_user_file)
+
+        clinvar_file, user_file, checkpoint_dir = files
+        profiler = StageProfiler()
+        execute_stages_2_3_parallel(
+            clinvar_file,
+            user_file,
+            checkpoint_dir,
+            Loader(),
+            "23andme",
+            {},
+            profiler=profiler,
+            warm_indexes=False,
+        )
+        assert profiler.metrics[-1].extra["executor"] == "thread"
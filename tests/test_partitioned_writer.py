@@ -0,0 +1,70 @@
+"""Tests for the single-pass partitioned output writer.
+
+Black formatted with 88-char line limit.
+"""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from varidex.io.writers.partitioned import OUTPUT_MANIFEST, PartitionedWriter
+
+
+@pytest.fixture
+def results() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "rsid": [f"rs{i}" for i in range(7)],
+            "PVS1": [True, False, True, False, False, True, False],
+            "acmg_classification": ["Pathogenic", "VUS", "Benign"] * 2 + ["VUS"],
+        }
+    )
+
+
+class TestPartitionedWriter:
+    """Overlapping subsets, chunking and the manifest."""
+
+    def test_single_pass_subsets(self, tmp_path: Path, results: pd.DataFrame) -> None:
+        writer = PartitionedWriter(tmp_path, chunk_rows=3, queue_size=2)
+        writer.add("all.csv", write_empty=True)
+        writer.add("ids.csv", columns=["rsid"])
+        writer.add("pvs1.csv", mask=results["PVS1"])
+        writer.add("vus.csv", mask=results["acmg_classification"] == "VUS")
+        writer.add("none.csv", mask=[False] * len(results))
+        manifest = writer.write(results)
+
+        pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "all.csv"), results)
+        assert pd.read_csv(tmp_path / "ids.csv").columns.tolist() == ["rsid"]
+        pvs1 = pd.read_csv(tmp_path / "pvs1.csv")
+        assert pvs1["rsid"].tolist() == ["rs0", "rs2", "rs5"]
+        assert pd.read_csv(tmp_path / "vus.csv")["rsid"].tolist() == [
+            "rs1",
+            "rs4",
+            "rs6",
+        ]
+        assert not (tmp_path / "none.csv").exists()
+
+        files = manifest["files"]
+        assert files["pvs1.csv"]["rows"] == 3
+        assert files["all.csv"]["bytes"] == (tmp_path / "all.csv").stat().st_size
+        with open(tmp_path / OUTPUT_MANIFEST) as f:
+            assert json.load(f)["source_rows"] == len(results)
+
+    def test_empty_frame_writes_headers(
+        self, tmp_path: Path, results: pd.DataFrame
+    ) -> None:
+        writer = PartitionedWriter(tmp_path)
+        writer.add("all.csv", columns=["rsid"], write_empty=True)
+        writer.add("pvs1.csv", mask=results["PVS1"].iloc[:0])
+        manifest = writer.write(results.iloc[:0])
+        assert (tmp_path / "all.csv").read_text().strip() == "rsid"
+        assert manifest["files"]["all.csv"]["rows"] == 0
+        assert "pvs1.csv" not in manifest["files"]
+
+    def test_mask_length_mismatch(self, tmp_path: Path, results: pd.DataFrame) -> None:
+        writer = PartitionedWriter(tmp_path)
+        writer.add("bad.csv", mask=[True])
+        with pytest.raises(ValueError, match="Mask for bad.csv"):
+            writer.write(results)
@@ -0,0 +1,96 @@
+"""Tests for span-based hierarchical profiling.
+
+Black formatted with 88-char line limit.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from varidex.utils.profiling import SpanRecorder, get_recorder, span, traced
+
+
+class _Frame:
+    """Minimal frame-like object: traced() only needs shape and ndim."""
+
+    ndim = 2
+
+    def __init__(self, rows: int):
+        self.shape = (rows, 3)
+
+
+@traced("test.halve")
+def _halve(frame: _Frame) -> _Frame:
+    return _Frame(frame.shape[0] // 2)
+
+
+@pytest.fixture
+def recorder():
+    recorder = SpanRecorder().activate()
+    yield recorder
+    recorder.deactivate()
+
+
+class TestSpans:
+    """Nesting, row counts, thread binding and exports."""
+
+    def test_inactive_is_noop(self) -> None:
+        assert get_recorder() is None
+        with span("test.off") as s:
+            s.set(ignored=True)
+            s.add_bytes(10)
+        assert _halve(_Frame(4)).shape[0] == 2
+
+    def test_nesting_and_rows(self, recorder: SpanRecorder) -> None:
+        root = recorder.open("stage", category="stage", parent=None)
+        with span("test.outer", rows_in=8) as outer:
+            outer.add_bytes(128)
+            _halve(_Frame(8))
+        recorder.close(root)
+
+        by_name = {s.name: s for s in recorder.spans}
+        # Spans opened outside a bound stage have no parent
+        assert by_name["test.outer"].parent_id is None
+        assert by_name["test.halve"].parent_id == by_name["test.outer"].span_id
+        assert by_name["test.halve"].rows_in == 8
+        assert by_name["test.halve"].rows_out == 4
+        assert by_name["test.outer"].bytes_read == 128
+
+    def test_bind_nests_thread_pool_work(self, recorder: SpanRecorder) -> None:
+        root = recorder.open("stage", category="stage", parent=None)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(recorder.bind(root, _halve), [_Frame(2), _Frame(6)]))
+        recorder.close(root)
+
+        halves = [s for s in recorder.spans if s.name == "test.halve"]
+        assert len(halves) == 2
+        assert {s.parent_id for s in halves} == {root.span_id}
+
+    def test_error_is_recorded(self, recorder: SpanRecorder) -> None:
+        with pytest.raises(KeyError):
+            with span("test.fail"):
+                raise KeyError("x")
+        assert recorder.spans[0].attrs["error"] == "KeyError"
+
+    def test_chrome_trace_and_summary(
+        self, tmp_path: Path, recorder: SpanRecorder
+    ) -> None:
+        root = recorder.open("stage", category="stage", parent=None)
+        for rows in (4, 10):
+            recorder.bind(root, _halve)(_Frame(rows))
+        recorder.close(root)
+
+        path = tmp_path / "trace.json"
+        recorder.export_chrome_trace(path)
+        events = json.loads(path.read_text())["traceEvents"]
+        assert {e["ph"] for e in events} == {"X"}
+        assert [e["name"] for e in events] == ["stage", "test.halve", "test.halve"]
+        assert events[1]["args"]["parent_id"] == root.span_id
+
+        summary = {r["name"]: r for r in recorder.summary()}
+        assert summary["test.halve"]["calls"] == 2
+        assert summary["test.halve"]["rows_out"] == 7
+        assert summary["stage"]["self_sec"] <= summary["stage"]["wall_sec"]
+        assert recorder.format_summary()[0].split()[0] == "span"
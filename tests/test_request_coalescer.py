@@ -0,0 +1,147 @@
+"""Tests for thread-level single-flight and micro-batching (RequestCoalescer).
+
+Black formatted with 88-char line limit.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from varidex.integrations.batching import RequestCoalescer
+from varidex.integrations.dbnsfp_client import DbNSFPClient, PredictionScore
+from varidex.integrations.gnomad_client import GnomadClient
+
+GNOMAD_RESPONSE = {
+    "data": {
+        "variant": {
+            "genome": {"af": 0.2, "ac": 4000, "an": 20000, "populations": []},
+            "exome": {},
+        }
+    }
+}
+
+
+def run_threads(n: int, target: Callable[[int], Any]) -> List[Any]:
+    """Start n threads together and collect target(i) results."""
+    results: List[Any] = [None] * n
+    barrier = threading.Barrier(n)
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        results[i] = target(i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class RecordingFetch:
+    """Bulk fetch that records its batches and takes a little time."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay = delay
+        self.batches: List[List[str]] = []
+
+    def __call__(self, keys: List[str]) -> Dict[str, str]:
+        self.batches.append(list(keys))
+        time.sleep(self.delay)
+        return {key: key.upper() for key in keys if key != "missing"}
+
+
+class TestRequestCoalescer:
+    """Single-flight, batching window and metrics."""
+
+    def test_identical_lookups_share_one_fetch(self) -> None:
+        fetch = RecordingFetch()
+        coalescer = RequestCoalescer(fetch, max_wait=0.01)
+
+        results = run_threads(8, lambda i: coalescer.get("brca1"))
+
+        assert results == ["BRCA1"] * 8
+        assert fetch.batches == [["brca1"]]
+        stats = coalescer.get_stats()
+        assert stats["coalesced"] == 7
+        assert stats["coalesced_ratio"] == pytest.approx(7 / 8)
+        assert stats["queue_latency_ms_max"] > 0
+
+    def test_distinct_lookups_merge_into_one_batch(self) -> None:
+        fetch = RecordingFetch()
+        coalescer = RequestCoalescer(fetch, max_wait=0.05)
+
+        results = run_threads(6, lambda i: coalescer.get(f"k{i}"))
+
+        assert results == [f"K{i}" for i in range(6)]
+        assert len(fetch.batches) == 1
+        assert sorted(fetch.batches[0]) == [f"k{i}" for i in range(6)]
+        assert coalescer.get_stats()["mean_batch_size"] == 6
+
+    def test_full_batch_dispatches_without_waiting(self) -> None:
+        fetch = RecordingFetch(delay=0)
+        coalescer = RequestCoalescer(fetch, max_batch_size=2, max_wait=10.0)
+        assert coalescer.get_many(["a", "b"]) == ["A", "B"]
+        assert fetch.batches == [["a", "b"]]
+
+    def test_failure_is_shared_then_refetched(self) -> None:
+        calls = []
+
+        def flaky(keys: List[str]) -> Dict[str, str]:
+            calls.append(keys)
+            if len(calls) == 1:
+                raise ConnectionError("down")
+            return {k: "ok" for k in keys}
+
+        coalescer = RequestCoalescer(flaky, max_wait=0.001)
+        assert coalescer.get_many(["a", "a"]) == [None, None]
+        assert coalescer.get("a") == "ok"
+        assert len(calls) == 2
+        coalescer.shutdown()
+
+
+class TestClientCoalescing:
+    """Threads sharing one client share lookups."""
+
+    def test_gnomad_single_flight(self) -> None:
+        client = GnomadClient(
+            rate_limit=False,
+            enable_cache=False,
+            use_batch_api=False,
+            coalesce_window=0.01,
+        )
+
+        def slow_query(query: str) -> Dict[str, Any]:
+            time.sleep(0.02)
+            return GNOMAD_RESPONSE
+
+        with patch.object(
+            client, "_execute_query", side_effect=slow_query
+        ) as mock_execute:
+            results = run_threads(
+                8, lambda i: client.get_variant_frequency("17", 43094692, "G", "A")
+            )
+        assert mock_execute.call_count == 1
+        assert all(r is not None and r.genome_af == 0.2 for r in results)
+        assert client.get_coalescing_stats()["coalesced"] == 7
+
+    def test_vep_lookups_batched_across_threads(self) -> None:
+        client = DbNSFPClient(rate_limit=False, coalesce_window=0.05)
+
+        def fetch(misses: Dict[str, Any], species: str) -> Dict[str, Any]:
+            return {vid: PredictionScore(variant_id=vid) for vid in misses}
+
+        with patch.object(
+            client, "_fetch_batch_locked", side_effect=fetch
+        ) as mock_fetch:
+            results = run_threads(
+                6, lambda i: client.get_predictions("17", 43094692 + i, "G", "A")
+            )
+        assert mock_fetch.call_count == 1
+        assert [r.variant_id for r in results] == [
+            f"17-{43094692 + i}-G-A" for i in range(6)
+        ]
+        assert client.get_statistics()["coalescing"]["batches"] == 1
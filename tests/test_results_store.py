@@ -0,0 +1,58 @@
+"""Tests for the pluggable binary results store.
+
+Black formatted with 88-char line limit.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from varidex.io.results_store import (
+    RESULTS_STORES,
+    export_csv,
+    open_results_store,
+)
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def results() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "rsid": ["rs1", "rs2", "rs3"],
+            "position": pd.array([10, None, 30], dtype="Int64"),
+            "PVS1": [True, False, True],
+            "acmg_classification": pd.Categorical(["Pathogenic", "VUS", "Benign"]),
+        }
+    )
+
+
+class TestResultsStore:
+    """Round trips keep dtypes; CSV is export only."""
+
+    @pytest.mark.parametrize("fmt", sorted(RESULTS_STORES))
+    def test_round_trip_keeps_dtypes(
+        self, fmt: str, tmp_path: Path, results: pd.DataFrame
+    ) -> None:
+        store = open_results_store(tmp_path, fmt)
+        path = store.write("matched", results)
+        assert path.suffix == f".{fmt}"
+        assert store.exists("matched")
+        pd.testing.assert_frame_equal(store.read("matched"), results)
+
+        projected = store.read("matched", columns=["position"])
+        assert list(projected.columns) == ["position"]
+        assert str(projected["position"].dtype) == "Int64"
+
+    def test_missing_and_unknown(self, tmp_path: Path) -> None:
+        store = open_results_store(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            store.read("absent")
+        with pytest.raises(ValueError, match="Unknown results format"):
+            open_results_store(tmp_path, "csv")
+
+    def test_export_csv(self, tmp_path: Path, results: pd.DataFrame) -> None:
+        path = export_csv(results, tmp_path / "out" / "full.csv", ["rsid", "PVS1"])
+        assert pd.read_csv(path).columns.tolist() == ["rsid", "PVS1"]
@@ -0,0 +1,90 @@
+"""Tests for whole-frame variant validation (varidex.core.schema).
+
+Black formatted with 88-char line limit.
+"""
+
+import pandas as pd
+import pytest
+
+from varidex.core.exceptions import ValidationError
+from varidex.core.models import VariantRecord
+from varidex.core.schema import VALIDATION_RULES, validate_frame
+from varidex.pipeline.acmg_classifier_stage import apply_full_acmg_classification
+
+
+@pytest.fixture
+def variants() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "chromosome": ["chr1", "17", "chrM", "25", "1", "X", None, "2"],
+            "position": [100, "43094692", 20_000, 100, 0, 160_000_000, 5, 7.5],
+            "ref_allele": ["a", "G", "A", "A", "A", "A", "A", "A"],
+            "alt_allele": ["G", "G", "T", "G", "G", "G", "G", "R"],
+        },
+        index=[f"v{i}" for i in range(8)],
+    )
+
+
+class TestValidateFrame:
+    """Vectorized validity mask and per-rule error table."""
+
+    def test_mask_and_counts(self, variants: pd.DataFrame) -> None:
+        valid, errors = validate_frame(variants)
+        assert list(valid.index) == list(variants.index)
+        assert valid.tolist() == [True] + [False] * 7
+        assert list(errors.index) == list(VALIDATION_RULES)
+        assert errors["errors"].to_dict() == {
+            "chromosome": 2,
+            "position": 2,
+            "position_range": 2,
+            "allele": 1,
+            "ref_equals_alt": 1,
+        }
+        assert errors.loc["ref_equals_alt", "first_index"] == "v1"
+        assert errors.loc["position_range", "first_index"] == "v2"
+
+    def test_coordinate_only(self) -> None:
+        """Frames without allele columns are checked on coordinates only."""
+        df = pd.DataFrame({"chromosome": ["1", "Y"], "position": [10, 60_000_000]})
+        valid, errors = validate_frame(df)
+        assert valid.tolist() == [True, False]
+        assert errors.loc["allele", "errors"] == 0
+
+    def test_missing_columns(self) -> None:
+        with pytest.raises(ValidationError):
+            validate_frame(pd.DataFrame({"chromosome": ["1"]}))
+
+
+class TestClassificationPathRules:
+    """Bulk classification keeps the per-record VariantData rules."""
+
+    @pytest.fixture
+    def grch38_variants(self) -> pd.DataFrame:
+        # Valid GRCh38 positions above the approximate loader caps, and a
+        # non-canonical contig
+        return pd.DataFrame(
+            {
+                "chromosome": ["3", "chrX", "GL000220.1", "1"],
+                "position": [198_100_000, 156_010_000, 100, 1000],
+                "ref_allele": ["G", "G", "A", "C"],
+                "alt_allele": ["A", "A", "G", "T"],
+                "gene": ["BRCA1"] * 4,
+                "molecular_consequence": ["missense_variant"] * 4,
+            }
+        )
+
+    def test_records_skip_vocabulary_and_range(
+        self, grch38_variants: pd.DataFrame
+    ) -> None:
+        records = VariantRecord.from_arrays(
+            grch38_variants["chromosome"],
+            grch38_variants["position"],
+            grch38_variants["ref_allele"],
+            grch38_variants["alt_allele"],
+        )
+        assert [r.chromosome for r in records] == ["3", "X", "GL000220.1", "1"]
+        assert records[0].pos == 198_100_000
+
+    def test_classification_not_error(self, grch38_variants: pd.DataFrame) -> None:
+        result = apply_full_acmg_classification(grch38_variants)
+        assert "Error" not in result["classification_reason"].tolist()
@@ -0,0 +1,134 @@
+"""Tests for input-fingerprinted stage memoization.
+
+Black formatted with 88-char line limit.
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+import pytest
+
+from varidex.pipeline.stage_cache import StageCache, path_fingerprint
+from varidex.pipeline.stages import StageGraph, StageScheduler, StageSpec
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return pd.DataFrame({"chromosome": ["1", "2"], "position": [10, 20]})
+
+
+def build_graph(calls: List[str], keys: Dict[str, str]) -> StageGraph:
+    def gnomad(f: pd.DataFrame) -> pd.DataFrame:
+        calls.append("gnomad")
+        return pd.DataFrame({"gnomad_af": [0.1, 0.2]}, index=f.index)
+
+    def dbnsfp(f: pd.DataFrame) -> pd.DataFrame:
+        calls.append("dbnsfp")
+        return pd.DataFrame({"CADD": [20, 30]}, index=f.index)
+
+    def index(f: pd.DataFrame) -> Dict[str, int]:
+        calls.append("index")
+        return {"idx": 1}
+
+    def classify(f: pd.DataFrame, idx: int) -> pd.DataFrame:
+        calls.append("classify")
+        return f.assign(score=f["gnomad_af"] * f["CADD"] + idx)
+
+    return StageGraph(
+        [
+            StageSpec("gnomad", gnomad, outputs=("gnomad*",), cache_key=keys["gnomad"]),
+            StageSpec("dbnsfp", dbnsfp, outputs=("CADD",), cache_key=keys["dbnsfp"]),
+            StageSpec("index", index, provides=("idx",)),
+            StageSpec(
+                "classify",
+                classify,
+                inputs=("*",),
+                outputs=("*",),
+                requires=("idx",),
+                cache_key=keys["classify"],
+            ),
+        ]
+    )
+
+
+class TestStageCache:
+    """Keys follow inputs; outputs are reused until an input changes."""
+
+    def test_key_tracks_files_and_upstream(self, tmp_path: Path) -> None:
+        cache = StageCache(tmp_path / "cache")
+        data = tmp_path / "gnomad"
+        data.mkdir()
+        (data / "chr1.vcf").write_text("a")
+
+        key = cache.key("gnomad", files=[data], upstream=["m1"])
+        assert key == cache.key("gnomad", files=[data], upstream=["m1"])
+        assert key != cache.key("gnomad", files=[data], upstream=["m2"])
+        assert key != cache.key("gnomad", files=[data], config={"build": "GRCh38"})
+
+        before = path_fingerprint(data)
+        (data / "chr2.vcf").write_text("b")
+        assert path_fingerprint(data) != before
+        assert path_fingerprint(None) == "none"
+        assert path_fingerprint(tmp_path / "absent") == "missing"
+
+    def test_get_or_compute(self, tmp_path: Path, frame: pd.DataFrame) -> None:
+        cache = StageCache(tmp_path)
+        calls = []
+
+        def compute() -> pd.DataFrame:
+            calls.append(1)
+            return frame
+
+        cache.get_or_compute("match", "k1", compute)
+        reused = StageCache(tmp_path).get_or_compute("match", "k1", compute)
+        pd.testing.assert_frame_equal(reused, frame)
+        assert len(calls) == 1
+        assert StageCache(tmp_path).latest_key("match") == "k1"
+
+        refreshed = StageCache(tmp_path, refresh=True)
+        refreshed.get_or_compute("match", "k1", compute)
+        assert len(calls) == 2
+        assert refreshed.format_report() == ["match: computed (2 rows)"]
+
+
+class TestScheduledStageCache:
+    """The scheduler reuses, recomputes and skips stages by cache key."""
+
+    KEYS = {"gnomad": "g1", "dbnsfp": "d1", "classify": "c1"}
+
+    def run(self, tmp_path: Path, frame: pd.DataFrame, keys: Dict[str, str]):
+        calls: List[str] = []
+        scheduler = StageScheduler(cache=StageCache(tmp_path))
+        result, _ = scheduler.run(build_graph(calls, keys), frame)
+        return result, calls, scheduler.last_report["cache"]
+
+    def test_full_reuse_skips_upstream(
+        self, tmp_path: Path, frame: pd.DataFrame
+    ) -> None:
+        first, calls, _ = self.run(tmp_path, frame, self.KEYS)
+        assert sorted(calls) == ["classify", "dbnsfp", "gnomad", "index"]
+
+        second, calls, report = self.run(tmp_path, frame, self.KEYS)
+        assert calls == []
+        assert report == {
+            "classify": "reused",
+            "gnomad": "skipped",
+            "dbnsfp": "skipped",
+            "index": "skipped",
+        }
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_changed_input_recomputes_affected_stages(
+        self, tmp_path: Path, frame: pd.DataFrame
+    ) -> None:
+        self.run(tmp_path, frame, self.KEYS)
+        keys = dict(self.KEYS, gnomad="g2", classify="c2")
+        result, calls, report = self.run(tmp_path, frame, keys)
+
+        assert sorted(calls) == ["classify", "gnomad", "index"]
+        assert report["dbnsfp"] == "reused"
+        assert report["gnomad"] == report["classify"] == "computed"
+        assert result["score"].tolist() == [3.0, 7.0]
@@ -0,0 +1,192 @@
+"""Tests for the declarative stage graph and concurrent scheduler.
+
+Black formatted with 88-char line limit.
+"""
+
+import time
+from typing import Any, Dict
+
+import pandas as pd
+import pytest
+
+from varidex.pipeline.stages import (
+    StageGraph,
+    StageProfiler,
+    StageScheduler,
+    StageSpec,
+)
+from varidex.utils.profiling import get_recorder, span
+
+
+def add_column(name: str, value: Any, delay: float = 0.0):
+    def stage(frame: pd.DataFrame) -> pd.DataFrame:
+        time.sleep(delay)
+        return pd.DataFrame({name: value}, index=frame.index)
+
+    return stage
+
+
+def double_position(frame: pd.DataFrame) -> pd.DataFrame:
+    """Module-level so it can run in a process pool."""
+    return pd.DataFrame({"position2": frame["position"] * 2}, index=frame.index)
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return pd.DataFrame({"chromosome": ["1", "2", "X"], "position": [10, 20, 30]})
+
+
+class TestStageGraph:
+    """Dependencies derived from columns and artifacts."""
+
+    def test_dependencies(self) -> None:
+        graph = StageGraph(
+            [
+                StageSpec("gnomad", add_column("gnomad_af", 0.1), outputs=("gnomad*",)),
+                StageSpec("dbnsfp", add_column("CADD", 20), outputs=("CADD",)),
+                StageSpec("index", lambda f: {"idx": 1}, provides=("idx",)),
+                StageSpec(
+                    "combine",
+                    add_column("score", 1),
+                    inputs=("gnomad_af", "position"),
+                    outputs=("score",),
+                ),
+                StageSpec(
+                    "classify",
+                    lambda f, idx: f,
+                    inputs=("*",),
+                    outputs=("*",),
+                    requires=("idx",),
+                ),
+            ]
+        )
+        assert graph.dependencies() == {
+            "gnomad": [],
+            "dbnsfp": [],
+            "index": [],
+            "combine": ["gnomad"],
+            "classify": ["gnomad", "dbnsfp", "index", "combine"],
+        }
+
+    def test_invalid_graphs(self) -> None:
+        with pytest.raises(ValueError, match="unknown artifact"):
+            StageGraph([StageSpec("a", lambda f, x: f, requires=("x",))]).dependencies()
+        with pytest.raises(ValueError, match="Duplicate stage"):
+            StageGraph([StageSpec("a", len), StageSpec("a", len)])
+        with pytest.raises(ValueError, match="executor"):
+            StageSpec("a", len, executor="gpu")
+
+
+class TestStageScheduler:
+    """Concurrent execution, deterministic joins, critical path."""
+
+    def test_independent_stages_overlap(self, frame: pd.DataFrame) -> None:
+        graph = StageGraph(
+            [
+                StageSpec("slow_a", add_column("a", 1, 0.3), outputs=("a",)),
+                StageSpec("slow_b", add_column("b", 2, 0.3), outputs=("b",)),
+            ]
+        )
+        start = time.perf_counter()
+        result, _ = StageScheduler().run(graph, frame)
+        assert time.perf_counter() - start < 0.55
+        assert result["a"].tolist() == [1, 1, 1]
+        assert result["b"].tolist() == [2, 2, 2]
+
+    def test_join_order_is_deterministic(self, frame: pd.DataFrame) -> None:
+        graph = StageGraph(
+            [
+                StageSpec("first", add_column("late", 1, 0.2), outputs=("late",)),
+                StageSpec("second", add_column("early", 2), outputs=("early",)),
+            ]
+        )
+        result, _ = StageScheduler().run(graph, frame)
+        assert list(result.columns) == ["chromosome", "position", "late", "early"]
+
+    def test_artifacts_and_process_stage(self, frame: pd.DataFrame) -> None:
+        def classify(view: pd.DataFrame, offset: int) -> pd.DataFrame:
+            out = view.copy()
+            out["final"] = out["position2"] + offset
+            return out
+
+        graph = StageGraph(
+            [
+                StageSpec(
+                    "double",
+                    double_position,
+                    inputs=("position",),
+                    outputs=("position2",),
+                    executor="process",
+                ),
+                StageSpec("offset", lambda f: {"offset": 1}, provides=("offset",)),
+                StageSpec(
+                    "classify",
+                    classify,
+                    inputs=("*",),
+                    outputs=("*",),
+                    requires=("offset",),
+                    executor="inline",
+                ),
+            ]
+        )
+        result, artifacts = StageScheduler().run(graph, frame)
+        assert result["final"].tolist() == [21, 41, 61]
+        assert artifacts == {"offset": 1}
+
+    def test_failure_propagates(self, frame: pd.DataFrame) -> None:
+        def broken(view: pd.DataFrame) -> pd.DataFrame:
+            raise RuntimeError("boom")
+
+        graph = StageGraph([StageSpec("broken", broken, outputs=("x",))])
+        profiler = StageProfiler()
+        with pytest.raises(RuntimeError, match="boom"):
+            StageScheduler(profiler).run(graph, frame)
+        assert profiler.metrics[0].status == "failed"
+
+    def test_critical_path_report(self, frame: pd.DataFrame) -> None:
+        graph = StageGraph(
+            [
+                StageSpec("short", add_column("s", 1, 0.05), outputs=("s",)),
+                StageSpec("long", add_column("l", 1, 0.25), outputs=("l",)),
+                StageSpec(
+                    "join",
+                    add_column("j", 1),
+                    inputs=("s", "l"),
+                    outputs=("j",),
+                ),
+            ]
+        )
+        scheduler = StageScheduler(StageProfiler())
+        scheduler.run(graph, frame)
+        report: Dict[str, Any] = scheduler.last_report
+        assert report["path"] == ["long", "join"]
+        assert report["critical_path_sec"] >= 0.25
+        assert report["total_stage_sec"] > report["critical_path_sec"]
+        assert report["wall_sec"] < report["total_stage_sec"] + 0.2
+
+    def test_critical_path_keeps_instant_join(self) -> None:
+        """Sub-millisecond stages are not rounded off the path."""
+        profiler = StageProfiler()
+        for name, seconds in (("short", 0.1), ("long", 0.3), ("join", 0.0001)):
+            ctx = profiler.start_stage(0, name)
+            profiler.end_stage(ctx, end_time=ctx["start_time"] + seconds)
+        report = profiler.critical_path(
+            {"short": [], "long": [], "join": ["short", "long"]}
+        )
+        assert report["path"] == ["long", "join"]
+        assert report["critical_path_sec"] == 0.3
+
+    def test_spans_recorded_only_while_running(self, frame: pd.DataFrame) -> None:
+        def traced_stage(frame: pd.DataFrame) -> pd.DataFrame:
+            with span("test.inner"):
+                return pd.DataFrame({"t": 1}, index=frame.index)
+
+        graph = StageGraph([StageSpec("traced", traced_stage, outputs=("t",))])
+        profiler = StageProfiler()
+        assert get_recorder() is None
+        StageScheduler(profiler).run(graph, frame)
+
+        # The recorder is restored once the run is over
+        assert get_recorder() is None
+        by_name = {s.name: s for s in profiler.spans.spans}
+        assert by_name["test.inner"].parent_id == by_name["traced"].span_id
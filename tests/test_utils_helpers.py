@@ -344,3 +344,60 @@ class TestIntegration:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestClassifyClinvarSignificance:
+    """Columnar classifier matches the row-wise production path."""
+
+    VARIANTS = [
+        {"clinical_sig": "Pathogenic", "review_status": "reviewed_by_expert_panel"},
+        {"clinical_sig": "Likely_benign", "review_status": "multiple_submitters"},
+        {
+            "clinical_sig": "Conflicting_classifications_of_pathogenicity",
+            "review_status": "criteria_provided,_conflicting_classifications",
+        },
+        {"clinical_sig": "Pathogenic/Likely_pathogenic", "review_status": ""},
+        {"clinical_sig": "Pathogenic", "review_status": "reviewed_by_expert_panel"},
+        {"chromosome": "chr1"},
+    ]
+
+    def test_matches_row_wise(self) -> None:
+        """Classification and evidence agree with classify_variants_production."""
+        pd = pytest.importorskip("pandas")
+        from varidex.utils.helpers import classify_clinvar_significance
+
+        df = pd.DataFrame(self.VARIANTS)
+        df["clinical_sig"] = df["clinical_sig"].fillna("Uncertain_significance")
+        df["review_status"] = df["review_status"].fillna("")
+        result = classify_clinvar_significance(df)
+        expected = classify_variants_production(df.to_dict("records"), classifier=None)
+
+        assert result["classification"].tolist() == [
+            r["classification"] for r in expected
+        ]
+        assert result["evidence"].tolist() == [r["evidence"] for r in expected]
+        assert result["expert_reviewed"].tolist() == [
+            True,
+            False,
+            False,
+            False,
+            True,
+            False,
+        ]
+        assert result["conflicting_review"].sum() == 1
+
+    def test_stats_and_missing_columns(self) -> None:
+        """Missing columns default to VUS; stats come from value counts."""
+        pd = pytest.importorskip("pandas")
+        from varidex.utils.helpers import (
+            classification_stats,
+            classify_clinvar_significance,
+        )
+
+        result = classify_clinvar_significance(pd.DataFrame({"position": [1, 2]}))
+        assert result["classification"].tolist() == ["VUS", "VUS"]
+        assert classification_stats(result["classification"])["vus"] == 2
+
+        empty = classify_clinvar_significance(pd.DataFrame({"clinical_sig": []}))
+        assert len(empty) == 0
+        assert sum(classification_stats(empty["classification"]).values()) == 0
@@ -0,0 +1,182 @@
+"""Tests for request batching helpers and the async VEP client.
+
+Black formatted with 88-char line limit.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from varidex.integrations.batching import (
+    AsyncBatcher,
+    AsyncTokenBucket,
+    iter_json_array,
+)
+from varidex.integrations.dbnsfp_client import DbNSFPClient
+from varidex.integrations.vep_async import AsyncVEPClient, vep_input
+
+
+class FakeResponse:
+    """Streamed VEP response."""
+
+    def __init__(self, body: bytes, status_code: int = 200) -> None:
+        self.body = body
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise ValueError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        for start in range(0, len(self.body), 7):  # split mid-record
+            yield self.body[start : start + 7]
+
+    def close(self) -> None:
+        pass
+
+
+class FakeVEPSession:
+    """Stands in for requests.Session against POST /vep/{species}/region."""
+
+    def __init__(self, latency: float = 0.0, fail_first: int = 0) -> None:
+        self.latency = latency
+        self.fail_first = fail_first
+        self.posts: List[List[str]] = []
+        self.headers: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def post(self, url: str, json: Dict[str, Any], **kwargs: Any) -> FakeResponse:
+        with self._lock:
+            self.posts.append(list(json["variants"]))
+            failing = len(self.posts) <= self.fail_first
+        time.sleep(self.latency)
+        if failing:
+            return FakeResponse(b"", status_code=503)
+        records = [
+            {
+                "input": line,
+                "transcript_consequences": [
+                    {
+                        "consequence_terms": ["missense_variant"],
+                        "sift_score": 0.01,
+                        "polyphen_score": 0.99,
+                    }
+                ],
+            }
+            for line in json["variants"]
+        ]
+        return FakeResponse(_dumps(records))
+
+    def close(self) -> None:
+        pass
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value).encode("utf-8")
+
+
+def variants(n: int) -> List[tuple]:
+    return [("17", 43094692 + i, "G", "A") for i in range(n)]
+
+
+class TestBatchingHelpers:
+    """Streaming parser and request coalescing."""
+
+    def test_iter_json_array_across_chunks(self) -> None:
+        body = _dumps([{"a": "x,]"}, {"b": [1, 2]}, "é"])
+        chunks = [body[i : i + 3] for i in range(0, len(body), 3)]
+        assert list(iter_json_array(chunks)) == [{"a": "x,]"}, {"b": [1, 2]}, "é"]
+
+    def test_iter_json_array_truncated(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'[{"a": 1}, {"b"']))
+
+    def test_batcher_dedups_and_batches(self) -> None:
+        calls: List[List[int]] = []
+
+        async def fetch(keys: List[int]) -> Dict[int, int]:
+            calls.append(keys)
+            return {k: k * 10 for k in keys}
+
+        async def run() -> List[Any]:
+            batcher = AsyncBatcher(fetch, max_batch_size=3)
+            return await batcher.get_many([1, 2, 1, 3, 4, 2])
+
+        assert asyncio.run(run()) == [10, 20, 10, 30, 40, 20]
+        assert calls == [[1, 2, 3], [4]]
+
+    def test_token_bucket_spans_event_loops(self) -> None:
+        bucket = AsyncTokenBucket(rate=20.0, capacity=1)
+        start = time.perf_counter()
+        for _ in range(4):
+            asyncio.run(bucket.acquire())
+        # One banked token, then three refills at 20/s
+        assert time.perf_counter() - start >= 0.14
+
+
+class TestAsyncVEPClient:
+    """Batched POSTs against a fake VEP endpoint."""
+
+    def test_vep_input(self) -> None:
+        assert vep_input("chr17", 43094692, "G", "A") == "17 43094692 . G A . . ."
+
+    def test_batching_reduces_requests(self) -> None:
+        timings = {}
+        for batch_size in (1, 50):
+            session = FakeVEPSession(latency=0.005)
+            client = AsyncVEPClient(
+                batch_size=batch_size,
+                max_concurrency=2,
+                requests_per_second=None,
+                session=session,
+            )
+            start = time.perf_counter()
+            results = client.get_predictions_many_sync(variants(200))
+            timings[batch_size] = time.perf_counter() - start
+
+            assert len(session.posts) == 200 // batch_size
+            assert all(r is not None and r.sift_score == 0.01 for r in results)
+            assert results[5].variant_id == "17-43094697-G-A"
+        assert timings[50] < timings[1]
+
+    def test_retries_failed_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "varidex.integrations.batching.backoff_delay", lambda attempt: 0.0
+        )
+        session = FakeVEPSession(fail_first=1)
+        client = AsyncVEPClient(requests_per_second=None, session=session)
+        results = client.get_predictions_many_sync(variants(3))
+        assert all(r is not None for r in results)
+        assert client.get_statistics()["requests_sent"] == 2
+
+    def test_rate_limit_spans_sync_calls(self) -> None:
+        session = FakeVEPSession()
+        client = AsyncVEPClient(requests_per_second=10.0, session=session)
+        start = time.perf_counter()
+        for variant in variants(13):
+            client.get_predictions_many_sync([variant])
+        # A 10-token burst, then three refills at 10/s: each call's new
+        # event loop does not get a fresh burst
+        assert len(session.posts) == 13
+        assert time.perf_counter() - start >= 0.25
+
+
+class TestDbNSFPBatchPath:
+    """DbNSFPClient.get_predictions_batch() uses batched POSTs."""
+
+    def test_batch_uses_post_and_cache(self) -> None:
+        client = DbNSFPClient(rate_limit=False, batch_size=100)
+        session = FakeVEPSession()
+        client.session = session
+
+        batch = variants(150) + variants(10)  # duplicates
+        results = client.get_predictions_batch(batch)
+        assert len(results) == 160
+        assert [len(p) for p in session.posts] == [100, 50]
+
+        client.get_predictions_batch(variants(150))
+        assert len(session.posts) == 2  # all served from cache
@@ -20,6 +20,7 @@ from varidex.downloader import setup_genomic_data
 from varidex.io.loaders.clinvar import load_clinvar_file
 from varidex.io.loaders.user import load_user_file
 from varidex.io.matching_improved import match_variants_hybrid
+from varidex.io.results_store import open_results_store
 from varidex.pipeline.acmg_classifier_stage import apply_full_acmg_classification
 from varidex.pipeline.gnomad_stage import GnomadAnnotationStage
 
@@ -321,11 +322,12 @@ def main() -> None:
         genome_build = detect_genome_build_from_filename(args.clinvar)
         print(f"\n🧬 Genome build: {genome_build} (auto-detected from filename)")
 
-    # Check for cached results
-    cache_file = Path("output/complete_results.csv")
+    # Check for cached results (binary, dtypes preserved)
+    results_store = open_results_store("output")
+    cache_file = results_store.path("complete_results")
     if cache_file.exists() and not args.force_reload and not args.user_genome:
         print(f"\nUsing cached matched results: {cache_file}")
-        matched_df = pd.read_csv(cache_file)
+        matched_df = results_store.read("complete_results")
         print(f"Loaded {len(matched_df)} matched variants")
     else:
         if not args.user_genome:
@@ -359,14 +361,11 @@ def main() -> None:
         print(f"    - Coordinate matches: {coord_matches:,}")
 
         print(f"\nStep 4: Caching matched results...")
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
-        matched_df.to_csv(cache_file, index=False)
+        results_store.write("complete_results", matched_df)
         print(f"  ✓ Cached to {cache_file}")
 
-    # Store clinvar_df for later use
-    if "clinvar_df" not in locals():
-        print("\nLoading ClinVar for criteria reference...")
-        clinvar_df = load_clinvar_file(str(Path(args.clinvar)))
+        # PS1/PM5 read ClinVar through a column-projected ClinVarReference
+        del clinvar_df, user_df
 
     # Phase 2: Data Enrichment
     print("\n" + "=" * 70)
@@ -408,6 +407,7 @@ def main() -> None:
 
     print("\nStep 9: Domain/position-based criteria (PM1, PM5, PM3, PS1)...")
     try:
+        from varidex.acmg.clinvar_index import ClinVarReference
         from varidex.acmg.criteria_pm1 import PM1Classifier
         from varidex.acmg.criteria_pm5 import PM5Classifier
         from varidex.acmg.criteria_pm3 import PM3Classifier
@@ -416,13 +416,14 @@ def main() -> None:
         pm1 = PM1Classifier("uniprot/uniprot_sprot.xml.gz")
         result_df = pm1.apply_pm1(result_df)
 
-        pm5 = PM5Classifier(clinvar_df)
+        clinvar_reference = ClinVarReference(args.clinvar)
+        pm5 = PM5Classifier(clinvar_reference)
         result_df = pm5.apply_pm5(result_df)
 
         pm3 = PM3Classifier()
         result_df = pm3.apply_pm3(result_df)
 
-        ps1 = PS1Classifier(clinvar_df)
+        ps1 = PS1Classifier(clinvar_reference)
         result_df = ps1.apply_ps1(result_df)
 
         print("  ✓ Complete")
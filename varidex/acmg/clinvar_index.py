@@ -0,0 +1,389 @@
+"""ClinVar-derived lookup indexes for PS1 and PM5.
+
+Both criteria compare user variants against pathogenic ClinVar protein
+changes. The indexes are small frames built once per ClinVar release:
+
+    PS1: unique (gene, hgvs_p_norm)   - same amino acid change
+    PM5: unique (gene, position)      - same residue, any change
+
+ClinVarIndexCache stores them as Feather files keyed by the ClinVar source
+fingerprint, the loader version and the index (classifier) version, so a new
+ClinVar download or a change to either side invalidates them. Any criterion
+deriving a lookup structure from ClinVar can use the shared cache through
+load_or_build_index().
+
+ClinVarReference stands in for the ClinVar frame after matching: index
+lookups need only the source fingerprint, and a cache miss reads just the
+INDEX_SOURCE_COLUMNS from the processed parquet cache, so the full ClinVar
+frame is never loaded again.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+from varidex.acmg.hgvs_protein import find_protein_column, parse_hgvs_p
+from varidex.utils.fingerprint import combine_keys, file_fingerprint, frame_fingerprint
+from varidex.utils.profiling import traced
+from varidex.version import __version__ as LOADER_VERSION
+
+logger = logging.getLogger(__name__)
+
+PS1_INDEX_COLUMNS = ["gene", "hgvs_p_norm"]
+PM5_INDEX_COLUMNS = ["gene", "position"]
+
+# Bump when an index builder changes what it produces
+PS1_INDEX_VERSION = "3"
+PM5_INDEX_VERSION = "4"
+
+# Pathogenic / Likely_pathogenic as whole significance terms, so that
+# Conflicting_interpretations_of_pathogenicity is not admitted
+PATHOGENIC_SIG_PATTERN = r"(?:^|[/,;|_ ])(?:Likely_)?[Pp]athogenic(?:$|[/,;|_ ])"
+
+DEFAULT_INDEX_CACHE_DIR = Path(".varidex_cache") / "clinvar_indexes"
+
+# Columns the indexes are built from (also hashed when a ClinVar frame has
+# no known source file)
+INDEX_SOURCE_COLUMNS = [
+    "gene",
+    "clinical_sig",
+    "review_status",
+    "protein_change",
+    "hgvsp",
+    "hgvs_p",
+    "amino_acid_change",
+]
+
+ClinVarSource = Union[pd.DataFrame, "ClinVarReference"]
+
+
+def clinvar_source_hash(clinvar_df: ClinVarSource) -> str:
+    """
+    Fingerprint the ClinVar release behind clinvar_df (memoized in attrs).
+
+    Uses the source file recorded by load_clinvar_file when available,
+    otherwise hashes the columns the indexes are built from.
+    """
+    cached = clinvar_df.attrs.get("clinvar_source_hash")
+    if cached:
+        return cached
+
+    source = clinvar_df.attrs.get("clinvar_source_file")
+    if source and Path(source).exists():
+        source_hash = file_fingerprint(source)
+    else:
+        frame = (
+            clinvar_df.frame()
+            if isinstance(clinvar_df, ClinVarReference)
+            else clinvar_df
+        )
+        source_hash = frame_fingerprint(frame, INDEX_SOURCE_COLUMNS)
+
+    clinvar_df.attrs["clinvar_source_hash"] = source_hash
+    return source_hash
+
+
+class ClinVarIndexCache:
+    """
+    Release-keyed on-disk cache for ClinVar-derived lookup indexes.
+
+    Files are named {name}-{key}.feather where key hashes the ClinVar source
+    fingerprint, loader version and index version. Older files for the same
+    index name are removed when a new one is written.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _dir_for(self, clinvar_df: ClinVarSource) -> Path:
+        if self.cache_dir is not None:
+            return self.cache_dir
+        parquet = clinvar_df.attrs.get("clinvar_cache_file")
+        if parquet:
+            return Path(parquet).parent / "clinvar_indexes"
+        return DEFAULT_INDEX_CACHE_DIR
+
+    def cache_key(self, clinvar_df: ClinVarSource, name: str, version: str) -> str:
+        """Key for one index of one ClinVar release."""
+        return combine_keys(
+            name, clinvar_source_hash(clinvar_df), LOADER_VERSION, version
+        )
+
+    def _record(self, name: str, outcome: str) -> None:
+        counts = self.stats.setdefault(name, {"hits": 0, "misses": 0, "errors": 0})
+        counts[outcome] += 1
+
+    def get_or_build(
+        self,
+        clinvar_df: ClinVarSource,
+        name: str,
+        builder: Callable[[pd.DataFrame], pd.DataFrame],
+        version: str = "1",
+    ) -> pd.DataFrame:
+        """
+        Return the named index for clinvar_df, building it on a cache miss.
+
+        Args:
+            clinvar_df: ClinVar DataFrame (as returned by load_clinvar_file)
+                or a ClinVarReference (read only on a miss)
+            name: Index name (e.g. "ps1", "pm5")
+            builder: Function building the index from clinvar_df
+            version: Index/classifier version (part of the cache key)
+
+        Returns:
+            Index DataFrame
+        """
+        key = self.cache_key(clinvar_df, name, version)
+        cache_dir = self._dir_for(clinvar_df)
+        path = cache_dir / f"{name}-{key}.feather"
+
+        if path.exists():
+            try:
+                index = pd.read_feather(path)
+                self._record(name, "hits")
+                logger.info(f"{name.upper()}: index cache hit ({path.name})")
+                return index
+            except Exception as e:
+                self._record(name, "errors")
+                logger.warning(f"{name.upper()}: index cache unreadable ({e})")
+
+        self._record(name, "misses")
+        logger.info(f"{name.upper()}: index cache miss, building from ClinVar")
+        if isinstance(clinvar_df, ClinVarReference):
+            clinvar_df = clinvar_df.frame()
+        index = builder(clinvar_df).reset_index(drop=True)
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            index.to_feather(tmp_path)
+            tmp_path.replace(path)
+            for stale in cache_dir.glob(f"{name}-*.feather"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"{name.upper()}: failed to cache index: {e}")
+
+        return index
+
+    def log_stats(self) -> None:
+        """Write hit/miss counts for every index to the run log."""
+        for name, counts in sorted(self.stats.items()):
+            logger.info(
+                f"ClinVar index cache [{name}]: {counts['hits']} hits, "
+                f"{counts['misses']} misses, {counts['errors']} errors"
+            )
+
+
+_default_cache: Optional[ClinVarIndexCache] = None
+
+
+def get_index_cache() -> ClinVarIndexCache:
+    """Process-wide ClinVarIndexCache shared by all ClinVar-derived criteria."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ClinVarIndexCache()
+    return _default_cache
+
+
+def load_or_build_index(
+    clinvar_df: ClinVarSource,
+    name: str,
+    builder: Callable[[pd.DataFrame], pd.DataFrame],
+    version: str = "1",
+) -> pd.DataFrame:
+    """Fetch a ClinVar-derived index through the shared cache."""
+    return get_index_cache().get_or_build(clinvar_df, name, builder, version)
+
+
+class ClinVarReference:
+    """
+    Lazily loaded, column-projected view of one ClinVar release.
+
+    Accepted wherever the indexes take a ClinVar frame. The source hash
+    comes from the ClinVar file fingerprint, so index cache hits read no
+    variants at all. On a miss, frame() reads only INDEX_SOURCE_COLUMNS from
+    the processed parquet cache of load_clinvar_file. A full load happens
+    only if that cache is missing or stale, and only the projection of it
+    is kept.
+    """
+
+    def __init__(
+        self,
+        clinvar_path: Union[str, Path],
+        checkpoint_dir: Union[str, Path] = ".varidex_cache",
+        clinvar_df: Optional[pd.DataFrame] = None,
+    ):
+        """
+        Args:
+            clinvar_path: ClinVar source file
+            checkpoint_dir: load_clinvar_file cache directory
+            clinvar_df: Already loaded ClinVar frame to project (optional)
+        """
+        from varidex.io.loaders.clinvar import processed_cache_file
+
+        self.clinvar_path = Path(clinvar_path)
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.attrs: Dict[str, Any] = {"clinvar_source_file": str(self.clinvar_path)}
+        self._frame: Optional[pd.DataFrame] = None
+        self._columns: Optional[List[str]] = None
+
+        if clinvar_df is not None:
+            self.attrs["clinvar_source_hash"] = clinvar_source_hash(clinvar_df)
+            self._project(clinvar_df)
+        else:
+            cache_file = processed_cache_file(self.clinvar_path, self.checkpoint_dir)
+            if cache_file is not None:
+                self.attrs["clinvar_cache_file"] = str(cache_file)
+
+    @property
+    def columns(self) -> List[str]:
+        """All ClinVar column names (read from the parquet schema if cached)."""
+        if self._columns is None:
+            cache_file = self.attrs.get("clinvar_cache_file")
+            if cache_file:
+                try:
+                    import pyarrow.parquet as pq
+
+                    self._columns = list(pq.read_schema(cache_file).names)
+                except Exception as e:
+                    logger.warning(f"ClinVar cache schema unreadable ({e})")
+            if self._columns is None:
+                self.frame()
+        return self._columns
+
+    def _project(self, clinvar_df: pd.DataFrame) -> None:
+        self._columns = list(clinvar_df.columns)
+        wanted = [c for c in INDEX_SOURCE_COLUMNS if c in clinvar_df.columns]
+        self._frame = clinvar_df.loc[:, wanted].copy()
+        self.attrs.update(
+            (k, v) for k, v in clinvar_df.attrs.items() if k not in self.attrs
+        )
+        self._frame.attrs = dict(self.attrs)
+
+    def frame(self) -> pd.DataFrame:
+        """The INDEX_SOURCE_COLUMNS of the release, read on first use."""
+        if self._frame is not None:
+            return self._frame
+
+        cache_file = self.attrs.get("clinvar_cache_file")
+        if cache_file:
+            try:
+                wanted = [c for c in INDEX_SOURCE_COLUMNS if c in self.columns]
+                frame = pd.read_parquet(cache_file, columns=wanted)
+                frame.attrs = dict(self.attrs)
+                self._frame = frame
+                logger.info(
+                    f"ClinVar reference: read {len(wanted)} columns, "
+                    f"{len(frame):,} rows from {Path(cache_file).name}"
+                )
+                return frame
+            except Exception as e:
+                logger.warning(f"ClinVar cache unreadable ({e}), loading source")
+
+        from varidex.io.loaders.clinvar import load_clinvar_file
+
+        self._project(
+            load_clinvar_file(self.clinvar_path, checkpoint_dir=self.checkpoint_dir)
+        )
+        return self._frame
+
+
+@traced("criteria.ps1_index_build")
+def build_ps1_index(clinvar_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Unique (gene, hgvs_p_norm) of reviewed pathogenic ClinVar substitutions.
+    """
+    empty = pd.DataFrame(columns=PS1_INDEX_COLUMNS, dtype=object)
+    if "protein_change" not in clinvar_df.columns:
+        return empty
+
+    path_mask = clinvar_df["clinical_sig"].str.contains(
+        PATHOGENIC_SIG_PATTERN, na=False
+    )
+    review_mask = clinvar_df["review_status"].str.contains(
+        "criteria_provided|reviewed_by_expert|practice_guideline",
+        case=False,
+        na=False,
+    )
+    pathogenic = clinvar_df.loc[
+        path_mask & review_mask & clinvar_df["gene"].notna(),
+        ["gene", "protein_change"],
+    ]
+    if pathogenic.empty:
+        return empty
+
+    parsed = parse_hgvs_p(pathogenic["protein_change"])
+    index = pd.DataFrame(
+        {
+            "gene": pathogenic["gene"].astype(str),
+            "hgvs_p_norm": parsed["hgvs_p_norm"],
+        }
+    )
+    return index.dropna().drop_duplicates().reset_index(drop=True)
+
+
+@traced("criteria.pm5_index_build")
+def build_pm5_index(clinvar_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Unique (gene, position) of pathogenic/likely pathogenic ClinVar protein
+    changes.
+    """
+    empty = pd.DataFrame(
+        {
+            "gene": pd.Series(dtype=object),
+            "position": pd.Series(dtype="Int64"),
+        }
+    )
+    protein_col = find_protein_column(clinvar_df)
+    if not protein_col:
+        logger.warning(
+            "PM5: No protein change column found "
+            "(tried: protein_change, hgvsp, hgvs_p, amino_acid_change)"
+        )
+        return empty
+
+    # Pathogenic and Likely_pathogenic count (as for PS1); conflicting
+    # interpretations and terms mentioning Benign do not
+    sig = clinvar_df["clinical_sig"]
+    pathogenic_mask = sig.str.contains(
+        PATHOGENIC_SIG_PATTERN, na=False
+    ) & ~sig.str.contains("Benign", case=False, na=False)
+    pathogenic = clinvar_df.loc[
+        pathogenic_mask & clinvar_df["gene"].notna() & clinvar_df[protein_col].notna(),
+        ["gene", protein_col],
+    ]
+    if pathogenic.empty:
+        return empty
+
+    parsed = parse_hgvs_p(pathogenic[protein_col])
+    fail_count = int(parsed["position"].isna().sum())
+    index = pd.DataFrame(
+        {"gene": pathogenic["gene"].astype(str), "position": parsed["position"]}
+    )
+    index = index.dropna().drop_duplicates().reset_index(drop=True)
+
+    logger.info(
+        f"PM5: Indexed {len(index):,} pathogenic protein positions "
+        f"({len(pathogenic) - fail_count:,} parsed, {fail_count:,} failed)"
+    )
+    return index
+
+
+def index_contains(
+    index: pd.DataFrame, keys: pd.DataFrame, columns: List[str]
+) -> pd.Series:
+    """
+    Hash-join membership test of keys[columns] against index[columns].
+
+    Returns:
+        Boolean Series aligned to keys.index
+    """
+    if index.empty or keys.empty:
+        return pd.Series(False, index=keys.index)
+    lookup = pd.MultiIndex.from_frame(index[columns])
+    probe = pd.MultiIndex.from_frame(keys[columns])
+    return pd.Series(probe.isin(lookup), index=keys.index)
@@ -9,16 +9,32 @@ FIXED VERSION - Addresses double PP2 application issue
 - Added apply_ps3_only() method (RECOMMENDED for integration)
 - Added dependency checking with clear error messages
 - Separated PS3 and PP2 logic to avoid Step 7 conflicts
+- PS3/PP2 evaluated column-wise with masks (no iterrows); constraint
+  metrics pre-joined by gene instead of per-row lookups
 """
 
 import logging
-from typing import Dict, Optional, List, Tuple, Set
+from typing import Dict, Hashable, Optional, List, Tuple, Set
 from dataclasses import dataclass
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# PS3 predictor thresholds (shared by the columnar and per-row paths)
+PS3_THRESHOLDS = {
+    "alphamissense": 0.7,  # High pathogenicity threshold
+    "revel": 0.5,  # REVEL pathogenic threshold
+    "cadd": 20,  # Top 1% most deleterious
+    "sift": 0.05,  # SIFT: lower = more deleterious
+    "polyphen": 0.85,  # PolyPhen: higher = more deleterious
+}
+
+# PP2 gnomAD constraint thresholds
+PLI_THRESHOLD = 0.9
+MISSENSE_Z_THRESHOLD = 3.09
+
 
 @dataclass
 class PS3Evidence:
@@ -72,6 +88,7 @@ class PS3_PP2_Classifier:
         self.lof_genes = lof_genes or set()
         self.missense_genes = missense_genes or set()
         self.gnomad_constraint = None
+        self._constraint_index: Optional[pd.DataFrame] = None
 
         logger.info("Initialized PS3/PP2 criteria classifier")
 
@@ -86,7 +103,8 @@ class PS3_PP2_Classifier:
             df: Input DataFrame with variant annotations
 
         Returns:
-            DataFrame with PS3 column added (PP2 unchanged)
+            DataFrame with PS3 and PS3_strength columns added (PP2 unchanged).
+            Use ps3_rationale() for per-variant PS3Evidence on flagged rows.
         """
         logger.info(f"Applying PS3 (functional evidence) to {len(df)} variants...")
 
@@ -110,20 +128,15 @@ class PS3_PP2_Classifier:
             )
             logger.warning("   PS3 will work but may apply to fewer variants")
 
-        # Initialize PS3 column
-        df["PS3"] = False
-        ps3_count = 0
+        masks = self._ps3_masks(df)
+        strength = self._ps3_strength(masks)
 
-        # Apply PS3 to each variant
-        for idx, row in df.iterrows():
-            ps3_result = self._evaluate_ps3_for_row(row)
-            if ps3_result.applied:
-                df.at[idx, "PS3"] = True
-                ps3_count += 1
+        df["PS3"] = (strength != "").to_numpy()
+        df["PS3_strength"] = strength.to_numpy()
+        ps3_count = int(df["PS3"].sum())
 
-        logger.info(
-            f"  ✅ PS3 applied to {ps3_count} variants ({ps3_count/len(df)*100:.1f}%)"
-        )
+        pct = ps3_count / len(df) * 100 if len(df) > 0 else 0.0
+        logger.info(f"  ✅ PS3 applied to {ps3_count} variants ({pct:.1f}%)")
 
         return df
 
@@ -145,24 +158,21 @@ class PS3_PP2_Classifier:
         # Load constraint data if needed
         self._load_gnomad_constraint()
 
-        # Initialize PP2 column
-        df["PP2"] = False
-        pp2_count = 0
-
-        # Apply PP2 to missense variants
-        for idx, row in df.iterrows():
-            gene = row.get("gene", "")
-            consequence = str(row.get("molecular_consequence", "")).lower()
+        genes = df["gene"] if "gene" in df.columns else pd.Series("", index=df.index)
+        consequence = (
+            df["molecular_consequence"]
+            if "molecular_consequence" in df.columns
+            else pd.Series("", index=df.index)
+        )
+        is_missense = consequence.astype(str).str.contains(
+            "missense", case=False, regex=False
+        )
 
-            if "missense" in consequence:
-                pp2_result = self._evaluate_pp2_for_gene(gene)
-                if pp2_result.applied:
-                    df.at[idx, "PP2"] = True
-                    pp2_count += 1
+        df["PP2"] = (is_missense & self._gene_constrained_mask(genes)).to_numpy()
+        pp2_count = int(df["PP2"].sum())
 
-        logger.info(
-            f"  ✅ PP2 applied to {pp2_count} variants ({pp2_count/len(df)*100:.1f}%)"
-        )
+        pct = pp2_count / len(df) * 100 if len(df) > 0 else 0.0
+        logger.info(f"  ✅ PP2 applied to {pp2_count} variants ({pct:.1f}%)")
 
         return df
 
@@ -190,6 +200,107 @@ class PS3_PP2_Classifier:
 
         return df
 
+    def ps3_rationale(self, df: pd.DataFrame) -> Dict[Hashable, PS3Evidence]:
+        """
+        Build PS3Evidence objects for PS3-flagged variants only.
+
+        Args:
+            df: Input DataFrame with variant annotations
+
+        Returns:
+            Mapping of DataFrame index -> PS3Evidence for rows where PS3 applies
+        """
+        masks = self._ps3_masks(df)
+        strength = self._ps3_strength(masks)
+        flagged = strength != ""
+
+        rationale: Dict[Hashable, PS3Evidence] = {}
+        if not flagged.any():
+            return rationale
+
+        scores = self._ps3_score_frame(df).loc[flagged]
+        flagged_masks = masks.loc[flagged]
+        source_names = list(flagged_masks.columns)
+        for idx, row_scores, row_masks, tier in zip(
+            scores.index,
+            scores.to_dict("records"),
+            flagged_masks.to_numpy(),
+            strength.loc[flagged],
+        ):
+            row_scores = {k: v for k, v in row_scores.items() if pd.notna(v)}
+            sources = [name for name, hit in zip(source_names, row_masks) if hit]
+            if "SIFT+PolyPhen" in sources:
+                row_scores["Meta"] = 1.0
+            rationale[idx] = PS3Evidence(
+                applied=True,
+                strength=tier,
+                sources=sources,
+                scores=row_scores,
+                interpretation=self._ps3_interpretation(tier, len(sources)),
+            )
+        return rationale
+
+    def _ps3_score_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Extract predictor scores as float columns (NaN when absent)."""
+        columns = {
+            "AlphaMissense": "AlphaMissense_score",
+            "REVEL": "REVEL_score",
+            "CADD": "CADD_phred",
+            "SIFT": "SIFT_score",
+            "PolyPhen": "PolyPhen_score",
+        }
+        scores = {}
+        for name, column in columns.items():
+            if column in df.columns:
+                scores[name] = pd.to_numeric(df[column], errors="coerce")
+            else:
+                scores[name] = pd.Series(np.nan, index=df.index, dtype=float)
+        return pd.DataFrame(scores, index=df.index)
+
+    def _ps3_masks(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute one boolean column per deleterious PS3 source."""
+        scores = self._ps3_score_frame(df)
+        t = PS3_THRESHOLDS
+        return pd.DataFrame(
+            {
+                "AlphaMissense": scores["AlphaMissense"] >= t["alphamissense"],
+                "REVEL": scores["REVEL"] >= t["revel"],
+                "CADD": scores["CADD"] >= t["cadd"],
+                "SIFT+PolyPhen": (scores["SIFT"] <= t["sift"])
+                & (scores["PolyPhen"] >= t["polyphen"]),
+            },
+            index=df.index,
+        )
+
+    @staticmethod
+    def _ps3_strength(masks: pd.DataFrame) -> pd.Series:
+        """Map per-source masks to PS3 strength tier ('' when not applied)."""
+        num_sources = masks.sum(axis=1)
+        high_confidence = masks["AlphaMissense"] | masks["REVEL"]
+        strength = np.select(
+            [
+                num_sources >= 3,
+                num_sources == 2,
+                (num_sources == 1) & high_confidence,
+            ],
+            ["Strong", "Moderate", "Supporting"],
+            default="",
+        )
+        return pd.Series(strength, index=masks.index, dtype=object)
+
+    @staticmethod
+    def _ps3_interpretation(strength: str, num_sources: int) -> str:
+        """Human-readable PS3 interpretation for a strength tier."""
+        if strength == "Strong":
+            return f"PS3_Strong: {num_sources} independent sources converge"
+        if strength == "Moderate":
+            return f"PS3_Moderate: {num_sources} sources agree"
+        if strength == "Supporting":
+            return "PS3_Supporting: High-confidence predictor"
+        if num_sources == 1:
+            return "PS3 not met (single low-confidence source insufficient)"
+        return f"PS3 not met ({num_sources} sources insufficient)"
+
     def _evaluate_ps3_for_row(self, row: pd.Series) -> PS3Evidence:
         """
         Evaluate PS3 criterion using multiple functional predictors.
@@ -214,25 +325,27 @@ class PS3_PP2_Classifier:
         deleterious_sources = []
         scores = {}
 
+        t = PS3_THRESHOLDS
+
         # 1. AlphaMissense (most reliable single predictor)
         am_score = self._get_score(row, "AlphaMissense_score")
         if am_score is not None:
             scores["AlphaMissense"] = am_score
-            if am_score >= 0.7:  # High pathogenicity threshold
+            if am_score >= t["alphamissense"]:
                 deleterious_sources.append("AlphaMissense")
 
         # 2. REVEL (ensemble predictor)
         revel_score = self._get_score(row, "REVEL_score")
         if revel_score is not None:
             scores["REVEL"] = revel_score
-            if revel_score >= 0.5:  # REVEL pathogenic threshold
+            if revel_score >= t["revel"]:
                 deleterious_sources.append("REVEL")
 
         # 3. CADD (scaled C-score)
         cadd_score = self._get_score(row, "CADD_phred")
         if cadd_score is not None:
             scores["CADD"] = cadd_score
-            if cadd_score >= 20:  # Top 1% most deleterious
+            if cadd_score >= t["cadd"]:
                 deleterious_sources.append("CADD")
 
         # 4. Meta-predictor: SIFT + PolyPhen agreement
@@ -243,41 +356,25 @@ class PS3_PP2_Classifier:
             scores["SIFT"] = sift_score
             scores["PolyPhen"] = poly_score
 
-            # Both predict deleterious?
-            sift_del = sift_score <= 0.05  # SIFT: lower = more deleterious
-            poly_del = poly_score >= 0.85  # PolyPhen: higher = more deleterious
-
-            if sift_del and poly_del:
+            if sift_score <= t["sift"] and poly_score >= t["polyphen"]:
                 deleterious_sources.append("SIFT+PolyPhen")
                 scores["Meta"] = 1.0
 
         # Determine strength
-        applied = False
-        strength = ""
-        interpretation = ""
-
         num_sources = len(deleterious_sources)
-
+        strength = ""
         if num_sources >= 3:
-            applied = True
             strength = "Strong"
-            interpretation = f"PS3_Strong: {num_sources} independent sources converge"
         elif num_sources == 2:
-            applied = True
             strength = "Moderate"
-            interpretation = f"PS3_Moderate: {num_sources} sources agree"
-        elif num_sources == 1:
+        elif num_sources == 1 and (
+            "AlphaMissense" in deleterious_sources or "REVEL" in deleterious_sources
+        ):
             # Only apply Supporting if it's a high-confidence predictor
-            if "AlphaMissense" in deleterious_sources or "REVEL" in deleterious_sources:
-                applied = True
-                strength = "Supporting"
-                interpretation = "PS3_Supporting: High-confidence predictor"
-            else:
-                interpretation = (
-                    f"PS3 not met (single low-confidence source insufficient)"
-                )
-        else:
-            interpretation = f"PS3 not met ({num_sources} sources insufficient)"
+            strength = "Supporting"
+
+        applied = strength != ""
+        interpretation = self._ps3_interpretation(strength, num_sources)
 
         return PS3Evidence(
             applied=applied,
@@ -321,8 +418,8 @@ class PS3_PP2_Classifier:
         # Determine if gene is constrained (any criterion)
         gene_constrained = (
             in_constraint_list
-            or (pli_score is not None and pli_score > 0.9)
-            or (missense_z is not None and missense_z > 3.09)
+            or (pli_score is not None and pli_score > PLI_THRESHOLD)
+            or (missense_z is not None and missense_z > MISSENSE_Z_THRESHOLD)
         )
 
         applied = gene_constrained
@@ -348,6 +445,7 @@ class PS3_PP2_Classifier:
         try:
             logger.info(f"Loading gnomAD constraint from {self.gnomad_path}")
             self.gnomad_constraint = pd.read_csv(self.gnomad_path, sep="\t")
+            self._constraint_index = None
             logger.info(f"Loaded constraint for {len(self.gnomad_constraint)} genes")
         except Exception as e:
             logger.error(f"Failed to load gnomAD constraint: {e}")
@@ -366,41 +464,78 @@ class PS3_PP2_Classifier:
         except (ValueError, TypeError):
             return None
 
-    def _get_pli_score(self, gene: str) -> Optional[float]:
-        """Get gnomAD pLI score for gene."""
-        if (
-            self.gnomad_constraint is None
-            or gene not in self.gnomad_constraint["gene"].values
-        ):
-            return None
+    def _constraint_by_gene(self) -> pd.DataFrame:
+        """
+        Return gnomAD constraint metrics indexed by gene (built once).
 
-        try:
-            row = self.gnomad_constraint[self.gnomad_constraint["gene"] == gene]
-            if not row.empty and "pLI" in row.columns:
-                pli = row["pLI"].iloc[0]
-                return float(pli) if pd.notna(pli) else None
-        except Exception as e:
-            logger.warning(f"Error extracting pLI for {gene}: {e}")
+        Columns: pLI, missense_z (NaN when missing from the source file).
+        """
+        if self._constraint_index is not None:
+            return self._constraint_index
+
+        if self.gnomad_constraint is None or "gene" not in self.gnomad_constraint:
+            self._constraint_index = pd.DataFrame(
+                columns=["pLI", "missense_z"], dtype=float
+            )
+            return self._constraint_index
+
+        constraint = self.gnomad_constraint.drop_duplicates("gene", keep="first")
+        index = pd.DataFrame(index=pd.Index(constraint["gene"], name="gene"))
+        for column in ("pLI", "missense_z"):
+            if column in constraint.columns:
+                index[column] = pd.to_numeric(
+                    constraint[column], errors="coerce"
+                ).to_numpy()
+            else:
+                index[column] = np.nan
+        self._constraint_index = index
+        return index
 
-        return None
+    def constraint_columns(self, genes: pd.Series) -> pd.DataFrame:
+        """
+        Pre-join gnomAD constraint metrics onto a gene column.
 
-    def _get_missense_z_score(self, gene: str) -> Optional[float]:
-        """Get gnomAD missense Z-score for gene."""
-        if (
-            self.gnomad_constraint is None
-            or gene not in self.gnomad_constraint["gene"].values
-        ):
+        Args:
+            genes: Gene symbols (one per variant)
+
+        Returns:
+            DataFrame aligned to genes.index with pLI and missense_z columns
+        """
+        constraint = self._constraint_by_gene()
+        joined = constraint.reindex(genes.to_numpy())
+        joined.index = genes.index
+        return joined
+
+    def _gene_constrained_mask(self, genes: pd.Series) -> pd.Series:
+        """Vectorized PP2 gene-constraint test (curated lists or gnomAD)."""
+        self._load_gnomad_constraint()
+        curated = self.lof_genes | self.missense_genes
+        has_gene = genes.notna() & (genes.astype(str) != "")
+        in_list = genes.isin(curated)
+
+        constraint = self.constraint_columns(genes)
+        by_metric = (constraint["pLI"] > PLI_THRESHOLD) | (
+            constraint["missense_z"] > MISSENSE_Z_THRESHOLD
+        )
+        return has_gene & (in_list | by_metric)
+
+    def _get_constraint_value(self, gene: str, column: str) -> Optional[float]:
+        """Look up a single gnomAD constraint metric for gene."""
+        if self.gnomad_constraint is None:
+            return None
+        constraint = self._constraint_by_gene()
+        if gene not in constraint.index:
             return None
+        value = constraint.at[gene, column]
+        return float(value) if pd.notna(value) else None
 
-        try:
-            row = self.gnomad_constraint[self.gnomad_constraint["gene"] == gene]
-            if not row.empty and "missense_z" in row.columns:
-                z_score = row["missense_z"].iloc[0]
-                return float(z_score) if pd.notna(z_score) else None
-        except Exception as e:
-            logger.warning(f"Error extracting missense Z for {gene}: {e}")
+    def _get_pli_score(self, gene: str) -> Optional[float]:
+        """Get gnomAD pLI score for gene."""
+        return self._get_constraint_value(gene, "pLI")
 
-        return None
+    def _get_missense_z_score(self, gene: str) -> Optional[float]:
+        """Get gnomAD missense Z-score for gene."""
+        return self._get_constraint_value(gene, "missense_z")
 
 
 def load_curated_gene_lists() -> Tuple[Set[str], Set[str]]:
@@ -486,3 +621,6 @@ if __name__ == "__main__":
     print("\nPS3 Results:")
     print(result_df[["gene", "PS3", "REVEL_score", "CADD_phred"]])
     print(f"\nPS3 applied: {result_df['PS3'].sum()} variants")
+
+    for idx, evidence in classifier.ps3_rationale(result_df).items():
+        print(f"  [{idx}] {evidence.interpretation} ({', '.join(evidence.sources)})")
@@ -1,37 +1,61 @@
-"""PM1 Classifier - OPTIMIZED VERSION v2.0
+"""PM1 Classifier - OPTIMIZED VERSION v3.0
 Performance improvements:
 - Vectorized operations (100x faster)
 - NumPy array lookups instead of iterrows
 - Pre-computed gene masks
-- Parallel domain checking (for large datasets)
+- Per-gene domain interval index: candidates tested by protein position
+  (parsed from HGVS p.) with one searchsorted join
+- Versioned .npz index cache instead of a raw pickle, keyed by the UniProt
+  file fingerprint
 """
 
 import gzip
+import pickle
+import warnings
 import xml.etree.ElementTree as ET
 from pathlib import Path
 import pandas as pd
-import numpy as np
-import pickle
-from multiprocessing import Pool, cpu_count
-from functools import lru_cache
+
+from varidex.acmg.domain_index import DomainIntervalIndex
+from varidex.acmg.hgvs_protein import find_protein_column, parse_hgvs_p
+from varidex.utils.fingerprint import file_fingerprint
+from varidex.utils.profiling import traced
 
 
 class PM1ClassifierOptimized:
     def __init__(self, uniprot_path="uniprot/uniprot_sprot.xml.gz"):
-        self.domains = self._load_uniprot_domains(uniprot_path)
-        self.genes_with_domains = set(self.domains.keys())
-
-    def _load_uniprot_domains(self, path):
-        """Parse UniProt XML for functional domains (cached)"""
-        cache_path = Path(path).with_suffix(".pkl")
-
-        if cache_path.exists():
-            print(f"PM1: Loading cached domains from {cache_path.name}...")
-            with open(cache_path, "rb") as f:
+        self.domain_index = self._load_domain_index(uniprot_path)
+        self.genes_with_domains = self.domain_index.gene_set
+
+    def _load_domain_index(self, path) -> DomainIntervalIndex:
+        """Load the domain interval index, building it from UniProt if needed."""
+        index_path = Path(path).with_suffix(".domains.npz")
+        fingerprint = file_fingerprint(path) if Path(path).exists() else None
+
+        if index_path.exists():
+            try:
+                index = DomainIntervalIndex.load(index_path, fingerprint)
+                print(f"PM1: ✓ Loaded {len(index):,} genes from {index_path.name}")
+                return index
+            except (ValueError, OSError, KeyError) as e:
+                print(f"PM1: Rebuilding domain index ({e})")
+
+        legacy_path = Path(path).with_suffix(".pkl")
+        if legacy_path.exists():
+            print(f"PM1: Migrating legacy cache {legacy_path.name}...")
+            with open(legacy_path, "rb") as f:
                 domains = pickle.load(f)
-            print(f"PM1: ✓ Loaded {len(domains):,} genes (cached, instant)")
-            return domains
+        else:
+            domains = self._load_uniprot_domains(path)
 
+        index = DomainIntervalIndex.from_domains(domains, fingerprint or "")
+        if len(index) > 0:
+            print(f"PM1: Saving domain index to {index_path.name}...")
+            index.save(index_path)
+        return index
+
+    def _load_uniprot_domains(self, path):
+        """Parse UniProt XML for functional domains"""
         path_obj = Path(path)
         if not path_obj.exists():
             print(f"PM1: UniProt file not found at {path}, skipping")
@@ -84,19 +108,23 @@ class PM1ClassifierOptimized:
                                                     pass
                     elem.clear()
 
-        print(f"PM1: Saving cache...")
-        with open(cache_path, "wb") as f:
-            pickle.dump(domains, f)
-
         return domains
 
-    def apply_pm1(self, df: pd.DataFrame, parallel: bool = False) -> pd.DataFrame:
-        """Apply PM1 with vectorized operations
+    @traced("criteria.pm1")
+    def apply_pm1(self, df: pd.DataFrame, parallel: bool = None) -> pd.DataFrame:
+        """Apply PM1 with a vectorized domain-interval join
 
         Args:
             df: Input DataFrame
-            parallel: Use parallel processing (for large datasets >100k variants)
+            parallel: Deprecated and ignored; the interval join is a single
+                vectorized pass
         """
+        if parallel is not None:
+            warnings.warn(
+                "apply_pm1(parallel=...) is deprecated and ignored",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         df["PM1"] = False
 
         print(f"PM1: {len(self.genes_with_domains):,} genes have functional domains")
@@ -118,13 +146,8 @@ class PM1ClassifierOptimized:
 
         print(f"PM1: Checking {len(candidates):,} candidates...")
 
-        # OPTIMIZATION 2: Apply to candidates only
-        if parallel and len(candidates) > 10000:
-            # Parallel processing for large datasets
-            pm1_hits = self._apply_parallel(candidates)
-        else:
-            # Vectorized single-threaded (faster for small datasets)
-            pm1_hits = self._apply_vectorized(candidates)
+        # OPTIMIZATION 2: Interval join on candidates only
+        pm1_hits = self._apply_vectorized(candidates)
 
         # Update original dataframe
         df.loc[candidate_mask, "PM1"] = pm1_hits
@@ -133,7 +156,8 @@ class PM1ClassifierOptimized:
         pm1_pct = pm1_count / len(df) * 100
 
         print(
-            f"⭐ PM1: {pm1_count} missense/inframe in genes with domains ({pm1_pct:.1f}%)"
+            f"⭐ PM1: {pm1_count} missense/inframe in functional domains "
+            f"({pm1_pct:.1f}%)"
         )
 
         if pm1_count > 0:
@@ -143,27 +167,17 @@ class PM1ClassifierOptimized:
         return df
 
     def _apply_vectorized(self, candidates: pd.DataFrame) -> pd.Series:
-        """Vectorized PM1 application (FAST)"""
-        # For gene-level approach, all candidates get PM1=True
-        return pd.Series(True, index=candidates.index)
-
-    def _apply_parallel(self, candidates: pd.DataFrame) -> pd.Series:
-        """Parallel PM1 application for large datasets"""
-        print(f"PM1: Using {cpu_count()} parallel workers...")
-
-        # Split into chunks
-        n_workers = cpu_count()
-        chunks = np.array_split(candidates, n_workers)
-
-        with Pool(n_workers) as pool:
-            results = pool.map(self._process_chunk, chunks)
+        """Test candidate protein positions against the domain interval index"""
+        protein_col = find_protein_column(candidates)
 
-        # Combine results
-        return pd.concat(results)
+        if not protein_col:
+            # No HGVS p. annotation: fall back to gene-level domain evidence
+            print("PM1: ⚠️  No protein change column - using gene-level domains")
+            return pd.Series(True, index=candidates.index)
 
-    def _process_chunk(self, chunk: pd.DataFrame) -> pd.Series:
-        """Process a chunk of candidates"""
-        return pd.Series(True, index=chunk.index)
+        positions = parse_hgvs_p(candidates[protein_col])["position"].astype(float)
+        hits = self.domain_index.contains(candidates["gene"], positions)
+        return pd.Series(hits, index=candidates.index)
 
 
 # Backward compatibility alias
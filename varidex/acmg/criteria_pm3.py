@@ -4,6 +4,8 @@ varidex/acmg/criteria_pm3.py v7.3.0-dev
 
 PM3: Detected in trans with pathogenic variant (compound heterozygote)
 FIXED: Added phasing limitation documentation and conservative approach
+OPTIMIZED: Single gene-grouped pass (no per-gene frame scans or pair loops);
+           phased VCF genotypes (GT "|" + PS) used when available
 
 ACMG Definition:
 - PM3 (Moderate Pathogenic): For recessive disorders, detected in trans
@@ -12,16 +14,68 @@ ACMG Definition:
 LIMITATION:
 - Phasing data (trio/parental genotypes) required to confirm trans configuration
 - Without phasing, cannot distinguish cis vs trans variants
-- Current implementation: Conservative approach with distance heuristic
+- Current implementation: Phase-aware when GT/PS present, otherwise a
+  conservative distance heuristic
 
 Development version - not for production use.
 """
 import logging
+import numpy as np
 import pandas as pd
 from typing import Optional
+from varidex.utils.profiling import traced
 
 logger = logging.getLogger(__name__)
 
+HET_BASES = set("ACGT")
+
+# Key spacing between genes when packing (gene, position) into one int64
+GENE_KEY_STRIDE = 1 << 40
+
+
+def _phased_haplotype(gt: pd.Series) -> pd.Series:
+    """
+    Haplotype carrying the ALT allele for phased heterozygous GT strings.
+
+    Returns 0 for "1|0", 1 for "0|1" and NaN for unphased, homozygous or
+    multi-allelic (e.g. "1|2") genotypes.
+    """
+    alleles = gt.astype("string").str.extract(r"^(\d+)\|(\d+)$")
+    first, second = alleles[0], alleles[1]
+    hap = pd.Series(np.nan, index=gt.index)
+    hap[((first != "0") & (second == "0")).fillna(False)] = 0
+    hap[((first == "0") & (second != "0")).fillna(False)] = 1
+    return hap
+
+
+def _is_heterozygous(df: pd.DataFrame) -> pd.Series:
+    """
+    Vectorized heterozygosity check.
+
+    Uses VCF GT ("0/1", "0|1") when a gt column is present, otherwise
+    two-letter allele genotypes ("AG", "GA", ...) with distinct bases.
+    """
+    het = pd.Series(False, index=df.index)
+
+    if "genotype" in df.columns:
+        genotype = df["genotype"].astype("string").str.upper()
+        first = genotype.str[0]
+        second = genotype.str[1]
+        het = (
+            (genotype.str.len() == 2)
+            & first.isin(HET_BASES)
+            & second.isin(HET_BASES)
+            & (first != second)
+        ).fillna(False)
+
+    if "gt" in df.columns:
+        alleles = df["gt"].astype("string").str.extract(r"^(\d+)[/|](\d+)$")
+        has_gt = alleles[0].notna()
+        gt_het = (alleles[0] != alleles[1]).fillna(False)
+        het = het.where(~has_gt, gt_het)
+
+    return het.astype(bool)
+
 
 class PM3Classifier:
     """
@@ -54,8 +108,9 @@ class PM3Classifier:
                 "PM3: Phasing required but not available - PM3 will be disabled"
             )
 
+    @traced("criteria.pm3")
     def apply_pm3(
-        self, df: pd.DataFrame, has_phasing_data: bool = False
+        self, df: pd.DataFrame, has_phasing_data: Optional[bool] = None
     ) -> pd.DataFrame:
         """
         Apply PM3: compound heterozygous check.
@@ -67,12 +122,16 @@ class PM3Classifier:
         determine if two heterozygous variants are in trans or cis.
 
         Current Implementation:
-        - If has_phasing_data=True: Use phasing information (NOT YET IMPLEMENTED)
-        - If enable_distance_heuristic=True: Assume trans if variants are
-          >1 Mb apart (conservative heuristic)
-        - If require_phasing=True: Disable PM3 entirely
+        - Phased variants (VCF GT with "|", grouped by PS phase set): PM3
+          when another pathogenic variant in the same gene and phase set
+          carries its ALT allele on the other haplotype
+        - Unphased variants with enable_distance_heuristic=True: assume trans
+          if the variant is >1 Mb from another unphased pathogenic variant
+          in the same gene (conservative heuristic)
+        - If require_phasing=True: Only phase-confirmed PM3 (no heuristic)
 
-        WARNING: This may produce false positives if variants are in cis.
+        WARNING: The distance heuristic may produce false positives if
+        variants are in cis.
 
         Args:
             df: Variant DataFrame with columns:
@@ -80,84 +139,59 @@ class PM3Classifier:
                 - clinical_sig: Clinical significance
                 - genotype: Genotype (heterozygous alleles)
                 - position: Genomic position (for distance heuristic)
-            has_phasing_data: Whether phasing information is available
+                - gt / phase_set: Optional VCF GT and PS (user VCF loader)
+            has_phasing_data: Whether phasing information is available.
+                None (default) auto-detects phased GT values in df.
 
         Returns:
-            DataFrame with PM3 column added
+            DataFrame with PM3 and PM3_confidence columns added
         """
         df["PM3"] = False
         df["PM3_confidence"] = None
 
+        phased = pd.Series(np.nan, index=df.index)
+        if has_phasing_data is not False and "gt" in df.columns:
+            phased = _phased_haplotype(df["gt"])
+        if has_phasing_data is None:
+            has_phasing_data = bool(phased.notna().any())
+
         if self.require_phasing and not has_phasing_data:
-            logger.warning("⚠️  PM3: Disabled - phasing data required but not available")
+            logger.warning(
+                "⚠️  PM3: Disabled - phasing data required but not available"
+            )
             return df
 
-        pathogenic_genes = df[
-            df.clinical_sig.str.contains("Pathogenic", na=False)
-            & ~df.clinical_sig.str.contains("Benign", na=False)
-        ].gene.dropna().unique()
+        sig = df["clinical_sig"]
+        is_pathogenic = sig.str.contains("Pathogenic", na=False) & ~sig.str.contains(
+            "Benign", na=False
+        )
+        candidates = df.loc[is_pathogenic & df["gene"].notna() & _is_heterozygous(df)]
 
-        count = 0
+        confidence = pd.Series(None, index=candidates.index, dtype=object)
         low_confidence_count = 0
 
-        for gene in pathogenic_genes:
-            gene_variants = df[df.gene == gene]
-            pathogenic_in_gene = gene_variants[
-                gene_variants.clinical_sig.str.contains("Pathogenic", na=False)
-                & ~gene_variants.clinical_sig.str.contains("Benign", na=False)
-            ]
-
-            if len(pathogenic_in_gene) >= 2:
-                pathogenic_indices = list(pathogenic_in_gene.index)
-
-                for i, idx1 in enumerate(pathogenic_indices):
-                    for idx2 in pathogenic_indices[i + 1 :]:
-                        genotype1 = str(df.at[idx1, "genotype"])
-                        genotype2 = str(df.at[idx2, "genotype"])
-
-                        het_genotypes = ["AG", "AC", "AT", "GC", "GT", "CT"]
-                        is_het1 = genotype1 in het_genotypes
-                        is_het2 = genotype2 in het_genotypes
-
-                        if is_het1 and is_het2:
-                            apply_pm3 = False
-                            confidence = "unknown"
-
-                            if has_phasing_data:
-                                # TODO: Implement actual phasing check
-                                # For now, placeholder
-                                logger.warning(
-                                    "PM3: Phasing data provided but parsing "
-                                    "not implemented"
-                                )
-                                apply_pm3 = False
-                                confidence = "no_phasing_parser"
-
-                            elif self.enable_distance_heuristic:
-                                if "position" in df.columns:
-                                    pos1 = df.at[idx1, "position"]
-                                    pos2 = df.at[idx2, "position"]
-
-                                    if pd.notna(pos1) and pd.notna(pos2):
-                                        distance = abs(int(pos2) - int(pos1))
-
-                                        if distance > self.distance_threshold:
-                                            apply_pm3 = True
-                                            confidence = "distance_heuristic"
-                                        else:
-                                            confidence = "too_close"
-                                            low_confidence_count += 1
-                                    else:
-                                        confidence = "no_position"
-                                else:
-                                    confidence = "no_position_column"
-
-                            if apply_pm3:
-                                df.at[idx1, "PM3"] = True
-                                df.at[idx1, "PM3_confidence"] = confidence
-                                df.at[idx2, "PM3"] = True
-                                df.at[idx2, "PM3_confidence"] = confidence
-                                count += 2
+        if len(candidates) >= 2:
+            hap = phased.loc[candidates.index]
+            if has_phasing_data:
+                confidence = confidence.where(
+                    ~self._phased_trans_mask(candidates, hap), "phased"
+                )
+
+            if self.enable_distance_heuristic and not self.require_phasing:
+                unphased = candidates.loc[hap.isna()]
+                if "position" not in df.columns:
+                    logger.warning(
+                        "PM3: No position column - distance heuristic skipped"
+                    )
+                elif len(unphased) >= 2:
+                    far, low_confidence_count = self._distance_mask(unphased)
+                    hits = far[far].index
+                    confidence.loc[hits] = "distance_heuristic"
+
+        flagged = confidence.dropna()
+        df.loc[flagged.index, "PM3"] = True
+        df.loc[flagged.index, "PM3_confidence"] = flagged
+        count = len(flagged)
 
         pm3_pct = count / len(df) * 100 if len(df) > 0 else 0
 
@@ -185,13 +219,68 @@ class PM3Classifier:
 
         return df
 
+    @staticmethod
+    def _phased_trans_mask(candidates: pd.DataFrame, hap: pd.Series) -> pd.Series:
+        """
+        Flag phased variants with a pathogenic partner on the other haplotype.
+
+        Variants are grouped by (gene, phase_set); a phased GT without PS is
+        treated as one phase block per gene.
+        """
+        if "phase_set" in candidates.columns:
+            phase_set = candidates["phase_set"].astype("string").fillna(".")
+        else:
+            phase_set = pd.Series(".", index=candidates.index)
+
+        keys = [candidates["gene"], phase_set]
+        on_hap0 = (hap == 0).groupby(keys).transform("any")
+        on_hap1 = (hap == 1).groupby(keys).transform("any")
+        return ((hap == 0) & on_hap1) | ((hap == 1) & on_hap0)
+
+    def _distance_mask(self, candidates: pd.DataFrame) -> tuple:
+        """
+        Distance heuristic from per-gene min/max positions.
+
+        A variant is assumed in trans if any other candidate in its gene lies
+        more than distance_threshold away, i.e. if its distance to the gene's
+        minimum or maximum position exceeds the threshold.
+
+        Returns:
+            (boolean Series aligned to candidates, number of too-close pairs)
+        """
+        positions = pd.to_numeric(candidates["position"], errors="coerce")
+        frame = pd.DataFrame(
+            {"gene": candidates["gene"], "position": positions}
+        ).dropna(subset=["position"])
+        far = pd.Series(False, index=candidates.index)
+        if frame.empty:
+            return far, 0
+
+        grouped = frame.groupby("gene")["position"]
+        gene_min = grouped.transform("min")
+        gene_max = grouped.transform("max")
+        farthest = np.maximum(
+            frame["position"] - gene_min, gene_max - frame["position"]
+        )
+        far.loc[frame.index] = (farthest > self.distance_threshold).to_numpy()
+
+        # Pairs within the threshold: offset each gene onto its own stretch of
+        # the integer line so one searchsorted over sorted keys counts them
+        gene_code = frame["gene"].astype("category").cat.codes.to_numpy(np.int64)
+        position = frame["position"].to_numpy(np.int64)
+        keys = np.sort(gene_code * GENE_KEY_STRIDE + position)
+        within = np.searchsorted(keys, keys + self.distance_threshold, side="right")
+        too_close = int((within - np.arange(len(keys)) - 1).sum())
+
+        return far, too_close
+
 
 def apply_pm3(
     df: pd.DataFrame,
     require_phasing: bool = False,
     distance_threshold: int = 1000000,
     enable_distance_heuristic: bool = True,
-    has_phasing_data: bool = False,
+    has_phasing_data: Optional[bool] = None,
 ) -> pd.DataFrame:
     """
     Standalone function to apply PM3.
@@ -201,7 +290,7 @@ def apply_pm3(
         require_phasing: Disable PM3 if no phasing data
         distance_threshold: Minimum distance to assume trans (default 1 Mb)
         enable_distance_heuristic: Use distance as phasing proxy
-        has_phasing_data: Whether phasing info is available
+        has_phasing_data: Whether phasing info is available (None: auto-detect)
 
     Returns:
         DataFrame with PM3 column
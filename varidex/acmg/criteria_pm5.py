@@ -4,6 +4,9 @@ varidex/acmg/criteria_pm5.py v7.3.0-dev
 
 PM5: Novel missense at same amino acid position as known pathogenic variant
 FIXED: Now uses protein position instead of genomic position
+OPTIMIZED: Shared vectorized HGVS p. parser and a (gene, position) index
+           cached per ClinVar release (ClinVarIndexCache); matching is a
+           pandas hash join
 
 ACMG Definition:
 - PM5 (Moderate Pathogenic): Novel missense change at amino acid residue
@@ -17,9 +20,19 @@ Example:
 Development version - not for production use.
 """
 import logging
-import re
 import pandas as pd
-from typing import Set, Tuple, Optional
+from typing import Optional
+
+from varidex.acmg.clinvar_index import (
+    PM5_INDEX_COLUMNS,
+    PM5_INDEX_VERSION,
+    ClinVarSource,
+    build_pm5_index,
+    index_contains,
+    load_or_build_index,
+)
+from varidex.acmg.hgvs_protein import find_protein_column, parse_hgvs_p
+from varidex.utils.profiling import traced
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +42,15 @@ class PM5Classifier:
     PM5 Classifier with protein position-based matching.
 
     FIXED: Uses (gene, protein_position) instead of (gene, genomic_position)
+    OPTIMIZED: Vectorized HGVS p. parsing + (gene, position) hash join
     """
 
-    def __init__(self, clinvar_df: pd.DataFrame):
-        """Build index of pathogenic protein positions"""
-        self.pathogenic_positions = self._build_pathogenic_index(clinvar_df)
+    def __init__(self, clinvar_df: ClinVarSource):
+        """Build index of pathogenic protein positions (frame or ClinVarReference)"""
+        self.pathogenic_index = self._build_pathogenic_index(clinvar_df)
+        self.pathogenic_positions = pd.MultiIndex.from_frame(
+            self.pathogenic_index[PM5_INDEX_COLUMNS]
+        )
 
     def _extract_protein_position(self, hgvs_p: str) -> Optional[int]:
         """
@@ -54,92 +71,29 @@ class PM5Classifier:
         """
         if pd.isna(hgvs_p) or not isinstance(hgvs_p, str):
             return None
+        position = parse_hgvs_p(pd.Series([hgvs_p]))["position"].iloc[0]
+        return None if pd.isna(position) else int(position)
 
-        hgvs_p = hgvs_p.strip()
-
-        if not hgvs_p.startswith("p."):
-            return None
-
-        # Pattern to extract position from various HGVS formats
-        # Matches: p.Arg1699Trp, p.R1699W, p.Glu255del, p.Arg123fs, etc.
-        patterns = [
-            r"p\.[A-Z][a-z]{2}(\d+)",  # Three-letter AA code
-            r"p\.([A-Z])(\d+)",  # Single-letter AA code
-            r"p\.[A-Z][a-z]{2}(\d+)_[A-Z][a-z]{2}\d+",  # Range (take first)
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, hgvs_p)
-            if match:
-                # Get the first captured group that's a number
-                for group in match.groups():
-                    try:
-                        return int(group)
-                    except (ValueError, TypeError):
-                        continue
-
-        return None
-
-    def _build_pathogenic_index(
-        self, clinvar_df: pd.DataFrame
-    ) -> Set[Tuple[str, int]]:
+    def _build_pathogenic_index(self, clinvar_df: ClinVarSource) -> pd.DataFrame:
         """
-        Extract pathogenic protein positions as hash set.
+        Extract pathogenic protein positions (built once per ClinVar release).
 
         FIXED: Uses protein position from HGVS notation instead of genomic position.
 
         Args:
-            clinvar_df: ClinVar DataFrame with columns:
+            clinvar_df: ClinVar DataFrame or ClinVarReference with columns:
                 - gene: Gene symbol
                 - protein_change or hgvsp: HGVS protein notation
                 - clinical_sig: Clinical significance
 
         Returns:
-            Set of (gene, protein_position) tuples
+            DataFrame of unique (gene, position) pairs
         """
-        pathogenic = clinvar_df[
-            clinvar_df.clinical_sig.str.contains("Pathogenic", na=False)
-            & ~clinvar_df.clinical_sig.str.contains("Benign", na=False)
-        ]
-
-        positions = set()
-
-        # Try multiple column names for protein change
-        protein_col = None
-        for col in ["protein_change", "hgvsp", "hgvs_p", "amino_acid_change"]:
-            if col in pathogenic.columns:
-                protein_col = col
-                break
-
-        if protein_col is None:
-            logger.warning(
-                "PM5: No protein change column found "
-                "(tried: protein_change, hgvsp, hgvs_p, amino_acid_change)"
-            )
-            return positions
-
-        valid_mask = pathogenic.gene.notna() & pathogenic[protein_col].notna()
-        valid_pathogenic = pathogenic[valid_mask]
-
-        success_count = 0
-        fail_count = 0
-
-        for _, row in valid_pathogenic.iterrows():
-            protein_pos = self._extract_protein_position(row[protein_col])
-
-            if protein_pos is not None:
-                positions.add((str(row.gene), int(protein_pos)))
-                success_count += 1
-            else:
-                fail_count += 1
-
-        logger.info(
-            f"PM5: Indexed {len(positions):,} pathogenic protein positions "
-            f"({success_count:,} parsed, {fail_count:,} failed)"
+        return load_or_build_index(
+            clinvar_df, "pm5", build_pm5_index, version=PM5_INDEX_VERSION
         )
 
-        return positions
-
+    @traced("criteria.pm5")
     def apply_pm5(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply PM5 with protein position-based matching.
@@ -167,31 +121,26 @@ class PM5Classifier:
 
         logger.info(f"PM5: Checking {missense_mask.sum():,} missense variants...")
 
-        protein_col = None
-        for col in ["protein_change", "hgvsp", "hgvs_p", "amino_acid_change"]:
-            if col in df.columns:
-                protein_col = col
-                break
-
-        if protein_col is None:
+        protein_col = find_protein_column(df)
+        if not protein_col:
             logger.warning(
                 "PM5: No protein change column found in input data - "
                 "PM5 cannot be applied"
             )
             return df
 
-        def check_position(row):
-            """Check if variant position matches pathogenic position"""
-            if pd.notna(row.gene) and pd.notna(row[protein_col]):
-                protein_pos = self._extract_protein_position(row[protein_col])
-                if protein_pos is not None:
-                    key = (str(row.gene), int(protein_pos))
-                    return key in self.pathogenic_positions
-            return False
-
-        pm5_hits = df[missense_mask].apply(check_position, axis=1)
-
-        df.loc[missense_mask, "PM5"] = pm5_hits
+        missense_df = df[missense_mask]
+        genes = missense_df["gene"]
+        keys = pd.DataFrame(
+            {
+                "gene": genes.astype(str).where(genes.notna()),
+                "position": parse_hgvs_p(missense_df[protein_col])["position"],
+            },
+            index=missense_df.index,
+        )
+        df.loc[missense_mask, "PM5"] = index_contains(
+            self.pathogenic_index, keys, PM5_INDEX_COLUMNS
+        )
 
         pm5_count = int(df["PM5"].sum())
         pm5_pct = pm5_count / len(df) * 100 if len(df) > 0 else 0
@@ -212,70 +161,10 @@ class PM5Classifier:
 
 class PM5ClassifierOptimized(PM5Classifier):
     """
-    Optimized PM5 with NumPy vectorization.
-
-    Inherits protein position matching from base class.
+    Kept for backward compatibility: PM5Classifier.apply_pm5 is now the
+    vectorized (gene, position) join.
     """
 
-    def apply_pm5(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Ultra-fast PM5 with vectorized operations"""
-        import numpy as np
-
-        df["PM5"] = False
-
-        missense_mask = df.molecular_consequence.str.contains(
-            "missense", na=False, case=False
-        )
-
-        if missense_mask.sum() == 0:
-            logger.info("⭐ PM5: 0 missense variants")
-            return df
-
-        logger.info(f"PM5: Checking {missense_mask.sum():,} missense variants...")
-
-        protein_col = None
-        for col in ["protein_change", "hgvsp", "hgvs_p", "amino_acid_change"]:
-            if col in df.columns:
-                protein_col = col
-                break
-
-        if protein_col is None:
-            logger.warning("PM5: No protein change column found")
-            return df
-
-        missense_df = df[missense_mask]
-        genes = missense_df["gene"].astype(str).values
-        protein_changes = missense_df[protein_col].values
-
-        positions = np.array(
-            [self._extract_protein_position(pc) for pc in protein_changes]
-        )
-
-        pm5_hits = np.array(
-            [
-                (g, p) in self.pathogenic_positions if p is not None else False
-                for g, p in zip(genes, positions)
-            ]
-        )
-
-        df.loc[missense_mask, "PM5"] = pm5_hits
-
-        pm5_count = int(pm5_hits.sum())
-        pm5_pct = pm5_count / len(df) * 100 if len(df) > 0 else 0
-
-        logger.info(
-            f"⭐ PM5: {pm5_count} novel missense at pathogenic "
-            f"protein positions ({pm5_pct:.1f}%)"
-        )
-
-        if pm5_count > 0:
-            pm5_genes = df[df.PM5].gene.value_counts().head(5)
-            logger.info(
-                f"   Top: {', '.join([f'{g}({c})' for g, c in pm5_genes.items()])}"
-            )
-
-        return df
-
 
 if __name__ == "__main__":
     print("PM5 Classifier Test (FIXED VERSION)")
@@ -6,6 +6,8 @@ Per ClinGen PP3/BP4 calibration guidelines (Brnich et al. 2020, PMID: 34955381)
 
 import pandas as pd
 
+from varidex.utils.profiling import traced
+
 
 class PP3_BP4_Classifier:
     """
@@ -24,6 +26,7 @@ class PP3_BP4_Classifier:
             "consensus_required": 3,
         }
 
+    @traced("criteria.pp3_bp4")
     def apply_pp3_bp4(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply PP3/BP4 based on computational predictions."""
         df["PP3"] = False
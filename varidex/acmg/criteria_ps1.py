@@ -1,130 +1,69 @@
-"""PS1 Classifier - OPTIMIZED VERSION v2.1 with fallback
+"""PS1 Classifier - OPTIMIZED VERSION v3.0 with fallback
 
 Performance improvements + defensive coding for missing protein annotations
+- Shared vectorized HGVS p. parser (no per-row regex, no iterrows)
+- PS1 matching is a (gene, hgvs_p_norm) hash join against an index built
+  once per ClinVar release (ClinVarIndexCache, keyed by ClinVar source
+  fingerprint + loader version + index version)
 """
 
-import re
-import pickle
-from pathlib import Path
 import pandas as pd
-from typing import Set, Tuple
+
+from varidex.acmg.clinvar_index import (
+    PS1_INDEX_COLUMNS,
+    PS1_INDEX_VERSION,
+    ClinVarSource,
+    build_ps1_index,
+    index_contains,
+    load_or_build_index,
+)
+from varidex.acmg.hgvs_protein import AA_1TO3, parse_hgvs_p
+from varidex.utils.profiling import traced
 
 
 class PS1ClassifierOptimized:
-    def __init__(self, clinvar_df: pd.DataFrame):
-        """Initialize with ClinVar data. Handles missing protein_change column."""
+    def __init__(self, clinvar_df: ClinVarSource):
+        """
+        Initialize with ClinVar data. Handles missing protein_change column.
+
+        clinvar_df may be a ClinVarReference, which is read only if the
+        cached index is missing.
+        """
         self.clinvar_df = clinvar_df
 
         # Check if protein annotations available
         if "protein_change" not in clinvar_df.columns:
             print("PS1: ⚠️  No protein_change column in ClinVar - PS1 will be skipped")
             print("PS1: To enable PS1, ClinVar must include HGVS protein annotations")
-            self.pathogenic_aa_changes = set()
+            self.pathogenic_index = pd.DataFrame(columns=PS1_INDEX_COLUMNS)
             self.protein_data_available = False
         else:
-            self.pathogenic_aa_changes = self._build_pathogenic_index()
+            self.pathogenic_index = self._build_pathogenic_index()
             self.protein_data_available = True
 
-    def _build_pathogenic_index(self) -> Set[Tuple[str, str]]:
-        """Build cached index of pathogenic AA changes."""
-        cache_path = Path("data/external/acmg_v2/ps1_pathogenic_cache.pkl")
-
-        if cache_path.exists():
-            print(f"PS1: Loading cached pathogenic AA changes...")
-            with open(cache_path, "rb") as f:
-                pathogenic_set = pickle.load(f)
-            print(
-                f"PS1: ✓ Loaded {len(pathogenic_set):,} pathogenic AA changes (cached)"
-            )
-            return pathogenic_set
-
-        print("PS1: Building pathogenic AA change index from ClinVar...")
-
-        # Vectorized filtering
-        path_mask = self.clinvar_df["clinical_sig"].str.contains(
-            "Pathogenic|Likely_pathogenic", case=False, na=False
+        self.pathogenic_aa_changes = pd.MultiIndex.from_frame(
+            self.pathogenic_index[PS1_INDEX_COLUMNS]
         )
 
-        review_mask = self.clinvar_df["review_status"].str.contains(
-            "criteria_provided|reviewed_by_expert|practice_guideline",
-            case=False,
-            na=False,
+    def _build_pathogenic_index(self) -> pd.DataFrame:
+        """Build (or load cached) index of pathogenic AA changes."""
+        print("PS1: Loading pathogenic AA change index...")
+        index = load_or_build_index(
+            self.clinvar_df, "ps1", build_ps1_index, version=PS1_INDEX_VERSION
         )
-
-        pathogenic_df = self.clinvar_df[path_mask & review_mask].copy()
-
-        # Extract valid protein changes
-        pathogenic_set = set()
-        valid_mask = (
-            pathogenic_df["gene"].notna() & pathogenic_df["protein_change"].notna()
-        )
-
-        for _, row in pathogenic_df[valid_mask].iterrows():
-            gene = row["gene"]
-            prot = row["protein_change"]
-
-            if prot.startswith("p."):
-                prot_norm = self._normalize_protein_hgvs(prot)
-                if prot_norm:
-                    pathogenic_set.add((gene, prot_norm))
-
-        # Cache for future runs
-        if len(pathogenic_set) > 0:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            print(f"PS1: Saving cache to {cache_path.name}...")
-            with open(cache_path, "wb") as f:
-                pickle.dump(pathogenic_set, f)
-
-        print(f"PS1: Indexed {len(pathogenic_set):,} pathogenic AA changes")
-        return pathogenic_set
+        print(f"PS1: Indexed {len(index):,} pathogenic AA changes")
+        return index
 
     def _normalize_protein_hgvs(self, hgvs: str) -> str:
         """Normalize protein HGVS to 3-letter format."""
-        if not hgvs.startswith("p."):
-            return ""
-
-        # Already 3-letter: p.Arg123Gln
-        match = re.match(r"p\.([A-Z][a-z]{2})(\d+)([A-Z][a-z]{2})", hgvs)
-        if match:
-            return hgvs
-
-        # Convert 1-letter: p.R123Q -> p.Arg123Gln
-        match = re.match(r"p\.([A-Z])(\d+)([A-Z])", hgvs)
-        if match:
-            ref_1, pos, alt_1 = match.groups()
-            ref_3 = self._aa_1to3(ref_1)
-            alt_3 = self._aa_1to3(alt_1)
-            if ref_3 and alt_3:
-                return f"p.{ref_3}{pos}{alt_3}"
-
-        return ""
+        norm = parse_hgvs_p(pd.Series([hgvs]))["hgvs_p_norm"].iloc[0]
+        return norm if isinstance(norm, str) else ""
 
     def _aa_1to3(self, aa_1: str) -> str:
         """Convert 1-letter to 3-letter amino acid code."""
-        aa_map = {
-            "A": "Ala",
-            "C": "Cys",
-            "D": "Asp",
-            "E": "Glu",
-            "F": "Phe",
-            "G": "Gly",
-            "H": "His",
-            "I": "Ile",
-            "K": "Lys",
-            "L": "Leu",
-            "M": "Met",
-            "N": "Asn",
-            "P": "Pro",
-            "Q": "Gln",
-            "R": "Arg",
-            "S": "Ser",
-            "T": "Thr",
-            "V": "Val",
-            "W": "Trp",
-            "Y": "Tyr",
-        }
-        return aa_map.get(aa_1, "")
+        return AA_1TO3.get(aa_1, "")
 
+    @traced("criteria.ps1")
     def apply_ps1(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply PS1 with graceful fallback if no protein data."""
         df["PS1"] = False
@@ -169,18 +108,17 @@ class PS1ClassifierOptimized:
         return df
 
     def _apply_vectorized(self, candidates: pd.DataFrame) -> pd.Series:
-        """Vectorized PS1 matching."""
-        result = pd.Series(False, index=candidates.index)
-
-        for idx, row in candidates.iterrows():
-            gene = row["gene"]
-            prot = row["protein_change"]
-            prot_norm = self._normalize_protein_hgvs(prot)
-
-            if prot_norm and (gene, prot_norm) in self.pathogenic_aa_changes:
-                result[idx] = True
-
-        return result
+        """Vectorized PS1 matching: (gene, hgvs_p_norm) join."""
+        keys = pd.DataFrame(
+            {
+                "gene": candidates["gene"].astype(str),
+                "hgvs_p_norm": parse_hgvs_p(candidates["protein_change"])[
+                    "hgvs_p_norm"
+                ],
+            },
+            index=candidates.index,
+        )
+        return index_contains(self.pathogenic_index, keys, PS1_INDEX_COLUMNS)
 
 
 # Backward compatibility
@@ -0,0 +1,173 @@
+"""Protein-domain interval index for position-accurate PM1.
+
+Per-gene domain intervals (from UniProt features) are merged and packed into
+sorted int64 arrays, so membership for many (gene, protein_position) pairs is
+answered with one np.searchsorted call.
+
+The index is persisted as a versioned .npz file (no pickle) that records
+the fingerprint of the UniProt file it was built from, so a replaced
+UniProt release is rebuilt rather than served from the old index.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 2
+
+# Key spacing between genes: protein positions never approach 2**32
+GENE_KEY_STRIDE = 1 << 32
+
+
+def _merge_intervals(intervals: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge overlapping/adjacent (start, stop) intervals, dropping invalid ones."""
+    cleaned = sorted(
+        (min(start, stop), max(start, stop))
+        for start, stop in intervals
+        if start is not None and stop is not None
+    )
+    merged: List[Tuple[int, int]] = []
+    for start, stop in cleaned:
+        if merged and start <= merged[-1][1] + 1:
+            if stop > merged[-1][1]:
+                merged[-1] = (merged[-1][0], stop)
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+class DomainIntervalIndex:
+    """
+    Sorted-array interval index over per-gene protein domains.
+
+    Attributes:
+        genes: Sorted gene symbols (array of str); array position = gene code
+        starts: Packed interval starts (gene_code * GENE_KEY_STRIDE + start)
+        stops: Packed interval stops, aligned with starts
+        source_fingerprint: file_fingerprint() of the UniProt file the
+            domains came from ("" when unknown)
+    """
+
+    def __init__(
+        self,
+        genes: np.ndarray,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        source_fingerprint: str = "",
+    ):
+        self.genes = np.asarray(genes, dtype=str)
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.stops = np.asarray(stops, dtype=np.int64)
+        self.source_fingerprint = source_fingerprint
+        self._gene_codes = {str(gene): code for code, gene in enumerate(self.genes)}
+
+    @classmethod
+    def from_domains(
+        cls, domains: Dict[str, List[Tuple[int, int]]], source_fingerprint: str = ""
+    ) -> "DomainIntervalIndex":
+        """Build from {gene: [(start, stop), ...]} as parsed from UniProt."""
+        genes = sorted(gene for gene, intervals in domains.items() if intervals)
+        starts: List[int] = []
+        stops: List[int] = []
+        for code, gene in enumerate(genes):
+            offset = code * GENE_KEY_STRIDE
+            for start, stop in _merge_intervals(domains[gene]):
+                starts.append(offset + start)
+                stops.append(offset + stop)
+        return cls(
+            np.array(genes, dtype=str),
+            np.array(starts),
+            np.array(stops),
+            source_fingerprint,
+        )
+
+    def __len__(self) -> int:
+        return len(self.genes)
+
+    def __contains__(self, gene: object) -> bool:
+        return gene in self._gene_codes
+
+    @property
+    def gene_set(self) -> set:
+        """Genes with at least one domain."""
+        return set(self._gene_codes)
+
+    def contains(self, genes: Iterable, positions: Iterable) -> np.ndarray:
+        """
+        Vectorized test of protein positions against gene domains.
+
+        Args:
+            genes: Gene symbols (one per query)
+            positions: Protein positions (NaN/None for unknown)
+
+        Returns:
+            Boolean array, True where the position falls inside a domain
+        """
+        positions = np.asarray(positions, dtype=float)
+        codes = self._encode_genes(np.asarray(genes, dtype=object).astype(str))
+        valid = (codes >= 0) & np.isfinite(positions) & (positions > 0)
+        hits = np.zeros(len(codes), dtype=bool)
+        if not valid.any() or len(self.starts) == 0:
+            return hits
+
+        keys = codes[valid] * GENE_KEY_STRIDE + positions[valid].astype(np.int64)
+        slot = np.searchsorted(self.starts, keys, side="right") - 1
+        in_range = slot >= 0
+        slot = np.where(in_range, slot, 0)
+        hits[valid] = in_range & (self.stops[slot] >= keys)
+        return hits
+
+    def _encode_genes(self, genes: np.ndarray) -> np.ndarray:
+        """Map gene symbols to codes (-1 when absent) via the sorted gene array."""
+        if len(self.genes) == 0:
+            return np.full(len(genes), -1, dtype=np.int64)
+        codes = np.searchsorted(self.genes, genes)
+        codes = np.minimum(codes, len(self.genes) - 1)
+        return np.where(self.genes[codes] == genes, codes, -1).astype(np.int64)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Persist to a versioned .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                format_version=np.array(INDEX_FORMAT_VERSION),
+                source_fingerprint=np.array(self.source_fingerprint),
+                genes=self.genes,
+                starts=self.starts,
+                stops=self.stops,
+            )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(
+        cls, path: Union[str, Path], source_fingerprint: Optional[str] = None
+    ) -> "DomainIntervalIndex":
+        """
+        Load an index written by save().
+
+        Args:
+            path: .npz file
+            source_fingerprint: Expected UniProt file fingerprint (None
+                skips the check, e.g. when the UniProt file is absent)
+
+        Raises:
+            ValueError: If the file was written with another format version
+                or from another UniProt file
+        """
+        with np.load(Path(path), allow_pickle=False) as data:
+            version = int(data["format_version"])
+            if version != INDEX_FORMAT_VERSION:
+                raise ValueError(
+                    f"Domain index format v{version} != v{INDEX_FORMAT_VERSION}"
+                )
+            stored = str(data["source_fingerprint"])
+            if source_fingerprint is not None and stored != source_fingerprint:
+                raise ValueError("Domain index was built from another UniProt file")
+            return cls(data["genes"], data["starts"], data["stops"], stored)
@@ -0,0 +1,101 @@
+"""Vectorized HGVS protein (p.) parsing shared by PS1, PM5 and PM1.
+
+parse_hgvs_p() runs one compiled regex over a whole column with str.extract
+and returns ref AA, protein position, alt AA and a normalized 3-letter form:
+
+    p.Arg1699Trp  -> Arg, 1699, Trp, p.Arg1699Trp
+    p.R1699W      -> R,   1699, W,   p.Arg1699Trp
+    p.(Arg273His) -> Arg, 273,  His, p.Arg273His
+    p.Glu255del   -> Glu, 255,  NaN, NaN (not a substitution)
+"""
+
+import re
+from typing import Dict, List
+
+import pandas as pd
+
+AA_1TO3: Dict[str, str] = {
+    "A": "Ala",
+    "C": "Cys",
+    "D": "Asp",
+    "E": "Glu",
+    "F": "Phe",
+    "G": "Gly",
+    "H": "His",
+    "I": "Ile",
+    "K": "Lys",
+    "L": "Leu",
+    "M": "Met",
+    "N": "Asn",
+    "P": "Pro",
+    "Q": "Gln",
+    "R": "Arg",
+    "S": "Ser",
+    "T": "Thr",
+    "V": "Val",
+    "W": "Trp",
+    "Y": "Tyr",
+    "*": "Ter",
+}
+
+# Column names that may carry HGVS p. notation, in order of preference
+PROTEIN_COLUMNS: List[str] = [
+    "protein_change",
+    "hgvsp",
+    "hgvs_p",
+    "amino_acid_change",
+]
+
+HGVS_P_PATTERN = re.compile(
+    r"^\s*p\.\(?"
+    r"(?P<ref_aa>[A-Z][a-z]{2}|[A-Z*])"
+    r"(?P<position>\d+)"
+    r"(?P<alt_aa>[A-Z][a-z]{2}|[A-Z*=])?"
+    r"(?P<suffix>.*?)\)?\s*$"
+)
+
+HGVS_P_COLUMNS: List[str] = ["ref_aa", "position", "alt_aa", "hgvs_p_norm"]
+
+
+def find_protein_column(df: pd.DataFrame) -> str:
+    """Return the first HGVS p. column present in df, or '' if none."""
+    return next((col for col in PROTEIN_COLUMNS if col in df.columns), "")
+
+
+def _to_three_letter(aa: pd.Series) -> pd.Series:
+    """Map 1-letter codes to 3-letter; 3-letter and '=' pass through."""
+    passthrough = (aa.str.len() == 3) | (aa == "=")
+    return aa.where(passthrough, aa.map(AA_1TO3))
+
+
+def parse_hgvs_p(values: pd.Series) -> pd.DataFrame:
+    """
+    Parse a column of HGVS protein notation.
+
+    Args:
+        values: HGVS p. strings (NaN / non-strings allowed)
+
+    Returns:
+        DataFrame aligned to values.index with columns:
+            ref_aa: Reference amino acid as written (1- or 3-letter)
+            position: First affected residue (Int64, <NA> if unparsable)
+            alt_aa: Alternate amino acid for substitutions, else NaN
+            hgvs_p_norm: 3-letter substitution (p.Arg123Gln), else NaN
+    """
+    parsed = values.astype(str).str.extract(HGVS_P_PATTERN)
+    position = pd.to_numeric(parsed["position"], errors="coerce").astype("Int64")
+
+    ref3 = _to_three_letter(parsed["ref_aa"])
+    alt3 = _to_three_letter(parsed["alt_aa"])
+    is_substitution = ref3.notna() & alt3.notna() & (parsed["suffix"].fillna("") == "")
+    norm = ("p." + ref3 + parsed["position"] + alt3).where(is_substitution)
+
+    return pd.DataFrame(
+        {
+            "ref_aa": parsed["ref_aa"],
+            "position": position,
+            "alt_aa": parsed["alt_aa"],
+            "hgvs_p_norm": norm,
+        },
+        index=values.index,
+    )
@@ -4,7 +4,7 @@ Development version - not marked as production
 """
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -32,15 +32,29 @@ class SpliceACMG:
             logger.warning(f"Models unavailable: {e}")
             self.models = []
 
-    def score(self, chrom: str, pos: int, ref: str, alt: str) -> Dict:
-        """Score variant for PM1 (simulated without reference genome)"""
+    def warm_up(self) -> bool:
+        """Load models now instead of on the first score; True if available"""
         if self._lazy_load:
             self._load_models()
             self._lazy_load = False
+        return bool(self.models)
 
-        if not self.models:
+    def score(self, chrom: str, pos: int, ref: str, alt: str) -> Dict:
+        """Score variant for PM1 (simulated without reference genome)"""
+        if not self.warm_up():
             return {"pm1": None, "delta": 0.0, "scores": {}}
+        return self._score_one(chrom, int(pos), ref, alt)
+
+    def score_many(self, variants: Sequence[Tuple[str, int, str, str]]) -> List[Dict]:
+        """Score (chrom, pos, ref, alt) variants in one call, in input order"""
+        if not self.warm_up():
+            return [{"pm1": None, "delta": 0.0, "scores": {}} for _ in variants]
+        return [
+            self._score_one(chrom, int(pos), ref, alt)
+            for chrom, pos, ref, alt in variants
+        ]
 
+    def _score_one(self, chrom: str, pos: int, ref: str, alt: str) -> Dict:
         # Simulated scoring for testing (production needs reference genome)
         is_even_pos = pos % 2 == 0
         if is_even_pos:
@@ -20,7 +20,7 @@ Refactoring v6.4.0:
 
 import logging
 import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from varidex.core.classifier.config import ACMGConfig, ACMGMetrics
 from varidex.core.classifier.evidence_assignment import assign_evidence_codes
@@ -64,13 +64,16 @@ class ACMGClassifier:
             f"BP7={self.config.enable_bp7}"
         )
 
-    def assign_evidence(self, variant: VariantData) -> ACMGEvidenceSet:
+    def assign_evidence(
+        self, variant: VariantData, context: Optional[Dict[str, Any]] = None
+    ) -> ACMGEvidenceSet:
         """Assign ACMG evidence codes to variant.
 
         Delegates to evidence_assignment.assign_evidence_codes().
 
         Args:
             variant: VariantData object
+            context: Lookups pre-resolved by _prefetch_batch() (unused here)
 
         Returns:
             ACMGEvidenceSet with assigned evidence codes
@@ -258,22 +261,80 @@ class ACMGClassifier:
     ) -> Tuple[str, str, ACMGEvidenceSet, float]:
         """Complete classification pipeline with metrics.
 
+        Single-variant wrapper around classify_batch().
+
         Args:
             variant: VariantData object
 
         Returns:
             Tuple of (classification, confidence, evidence, duration)
         """
+        return self.classify_batch([variant])[0]
+
+    def classify_batch(
+        self, variants: Sequence[VariantData]
+    ) -> List[Tuple[str, str, ACMGEvidenceSet, float]]:
+        """Classify many variants with one round of external lookups.
+
+        Coordinates for the whole batch are collected first and external
+        data (gnomAD frequencies, computational predictions) is resolved in
+        bulk by _prefetch_batch(); evidence is then assigned and combined per
+        variant from the pre-resolved results.
+
+        Args:
+            variants: VariantData objects
+
+        Returns:
+            (classification, confidence, evidence, duration) per variant, in
+            input order. Each duration includes an equal share of the bulk
+            lookup time.
+        """
+        variants = list(variants)
+        if not variants:
+            return []
+
+        start_time = time.time()
+        try:
+            contexts = self._prefetch_batch(variants)
+        except Exception as e:
+            logger.error(f"Batch lookup failed, falling back to per-variant: {e}")
+            contexts = [{} for _ in variants]
+        lookup_share = (time.time() - start_time) / len(variants)
+
+        return [
+            self._classify_with_context(variant, context, lookup_share)
+            for variant, context in zip(variants, contexts)
+        ]
+
+    def _prefetch_batch(self, variants: List[VariantData]) -> List[Dict[str, Any]]:
+        """Resolve external data for a batch before evidence assignment.
+
+        Returns one context dict per variant, passed to assign_evidence().
+        Subclasses extend the contexts with their bulk lookups.
+        """
+        return [{} for _ in variants]
+
+    def _feature_tag(self) -> str:
+        """Suffix for classification log lines naming enabled integrations."""
+        return ""
+
+    def _classify_with_context(
+        self,
+        variant: VariantData,
+        context: Dict[str, Any],
+        lookup_time: float = 0.0,
+    ) -> Tuple[str, str, ACMGEvidenceSet, float]:
+        """Assign and combine evidence for one variant of a batch."""
         start_time = time.time()
 
         try:
             # Assign evidence
-            evidence = self.assign_evidence(variant)
+            evidence = self.assign_evidence(variant, context)
 
             # Combine evidence
             classification, confidence = self.combine_evidence(evidence)
 
-            duration = time.time() - start_time
+            duration = lookup_time + time.time() - start_time
 
             # Record metrics
             if self.metrics:
@@ -281,13 +342,13 @@ class ACMGClassifier:
 
             logger.info(
                 f"Classified {variant} → {classification} ({confidence}) "
-                f"in {duration:.3f}s"
+                f"in {duration:.3f}s{self._feature_tag()}"
             )
 
             return classification, confidence, evidence, duration
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = lookup_time + time.time() - start_time
             if self.metrics:
                 self.metrics.record_failure()
 
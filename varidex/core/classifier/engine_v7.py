@@ -23,8 +23,7 @@ Reference: Richards et al. 2015, PMID 25741868
 """
 
 import logging
-import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 from varidex.core.classifier.config import ACMGConfig
 from varidex.core.classifier.engine import ACMGClassifier
@@ -157,13 +156,57 @@ class ACMGClassifierV7(ACMGClassifier):
             logger.debug(f"Failed to infer inheritance mode: {e}")
             return InheritanceMode.UNKNOWN
 
-    def assign_evidence(self, variant: VariantData) -> ACMGEvidenceSet:
+    def _prefetch_batch(self, variants: List[VariantData]) -> List[Dict[str, Any]]:
+        """Resolve gnomAD frequencies for the whole batch in one bulk lookup."""
+        contexts = super()._prefetch_batch(variants)
+        if not (self.enable_gnomad and self.frequency_service):
+            return contexts
+
+        queries: List[Dict[str, Any]] = []
+        slots: List[int] = []
+        for i, (variant, context) in enumerate(zip(variants, contexts)):
+            coords = self._extract_variant_coordinates(variant)
+            context["coords"] = coords
+            if coords is not None:
+                inheritance = self._infer_inheritance_mode(variant)
+                queries.append({**coords, "inheritance": inheritance})
+                slots.append(i)
+
+        freq_results = self.frequency_service.analyze_frequency_batch(queries)
+        for i, freq_evidence in zip(slots, freq_results):
+            contexts[i]["frequency"] = freq_evidence
+        return contexts
+
+    def assign_evidence(
+        self, variant: VariantData, context: Optional[Dict[str, Any]] = None
+    ) -> ACMGEvidenceSet:
         """Assign ACMG evidence codes including gnomAD-based codes."""
-        evidence = super().assign_evidence(variant)
+        evidence = self._assign_evidence_sets(variant, context or {})
+
+        for attr in ["pvs", "ps", "pm", "pp", "ba", "bs", "bp"]:
+            setattr(evidence, attr, list(getattr(evidence, attr)))
+
+        return evidence
+
+    def _assign_evidence_sets(
+        self, variant: VariantData, context: Dict[str, Any]
+    ) -> ACMGEvidenceSet:
+        """Evidence with set-valued code groups, before list conversion.
+
+        Uses coordinates and frequency evidence from context when the batch
+        prefetch resolved them, otherwise queries gnomAD for this variant.
+        """
+        evidence = super().assign_evidence(variant, context)
+        # The base engine hands back list-valued groups; codes are added here
+        for attr in ["pvs", "ps", "pm", "pp", "ba", "bs", "bp"]:
+            setattr(evidence, attr, set(getattr(evidence, attr)))
 
         if self.enable_gnomad and self.frequency_service:
             try:
-                coords = self._extract_variant_coordinates(variant)
+                if "coords" in context:
+                    coords = context["coords"]
+                else:
+                    coords = self._extract_variant_coordinates(variant)
 
                 if coords is None:
                     logger.debug(
@@ -172,16 +215,17 @@ class ACMGClassifierV7(ACMGClassifier):
                     evidence.conflicts.add("Missing coordinates for gnomAD")
                     return evidence
 
-                inheritance = self._infer_inheritance_mode(variant)
-
-                freq_evidence = self.frequency_service.analyze_frequency(
-                    chromosome=coords["chromosome"],
-                    position=coords["position"],
-                    ref=coords["ref"],
-                    alt=coords["alt"],
-                    inheritance=inheritance,
-                    gene=coords.get("gene"),
-                )
+                freq_evidence = context.get("frequency")
+                if freq_evidence is None:
+                    inheritance = self._infer_inheritance_mode(variant)
+                    freq_evidence = self.frequency_service.analyze_frequency(
+                        chromosome=coords["chromosome"],
+                        position=coords["position"],
+                        ref=coords["ref"],
+                        alt=coords["alt"],
+                        inheritance=inheritance,
+                        gene=coords.get("gene"),
+                    )
 
                 if freq_evidence.pm2:
                     evidence.pm.add("PM2")
@@ -207,44 +251,11 @@ class ACMGClassifierV7(ACMGClassifier):
                 logger.error(f"gnomAD frequency analysis failed: {e}")
                 evidence.conflicts.add(f"gnomAD error: {str(e)}")
 
-        for attr in ["pvs", "ps", "pm", "pp", "ba", "bs", "bp"]:
-            setattr(evidence, attr, list(getattr(evidence, attr)))
-
         return evidence
 
-    def classify_variant(
-        self, variant: VariantData
-    ) -> Tuple[str, str, ACMGEvidenceSet, float]:
-        """Complete classification pipeline with gnomAD integration."""
-        start_time = time.time()
-
-        try:
-            evidence = self.assign_evidence(variant)
-            classification, confidence = self.combine_evidence(evidence)
-            duration = time.time() - start_time
-
-            if self.metrics:
-                self.metrics.record_success(duration, classification, evidence)
-
-            logger.info(
-                f"Classified {variant} → {classification} ({confidence}) "
-                f"in {duration:.3f}s [gnomAD: {self.enable_gnomad}]"
-            )
-
-            return classification, confidence, evidence, duration
-
-        except Exception as e:
-            duration = time.time() - start_time
-            if self.metrics:
-                self.metrics.record_failure()
-
-            logger.error(f"Classification pipeline failed: {e}", exc_info=True)
-            return (
-                "Uncertain Significance",
-                f"Error: {str(e)}",
-                ACMGEvidenceSet(),
-                duration,
-            )
+    def _feature_tag(self) -> str:
+        """Log suffix with the gnomAD flag."""
+        return f" [gnomAD: {self.enable_gnomad}]"
 
     def health_check(self) -> Dict[str, Any]:
         """Health check with gnomAD service status."""
@@ -26,7 +26,9 @@ Reference: Richards et al. 2015, PMID 25741868
 
 import logging
 import time
-from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
 
 from varidex.core.classifier.config import ACMGConfig
 from varidex.core.classifier.engine_v7 import ACMGClassifierV7
@@ -40,6 +42,32 @@ from varidex.integrations.dbnsfp_client import DbNSFPClient
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ComponentTiming:
+    """Startup and per-variant latency of a long-lived engine component."""
+
+    startup_seconds: Optional[float] = None
+    calls: int = 0
+    variants: int = 0
+    total_seconds: float = 0.0
+
+    def record(self, seconds: float, variants: int = 1) -> None:
+        """Record one call covering the given number of variants."""
+        self.calls += 1
+        self.variants += variants
+        self.total_seconds += seconds
+
+    def summary(self) -> Dict[str, Any]:
+        """Timing summary for health checks."""
+        mean_ms = 1000.0 * self.total_seconds / self.variants if self.variants else None
+        return {
+            "startup_seconds": self.startup_seconds,
+            "calls": self.calls,
+            "variants": self.variants,
+            "mean_latency_ms": mean_ms,
+        }
+
+
 class ACMGClassifierV8(ACMGClassifierV7):
     """Enhanced ACMG classifier with gnomAD + computational predictions.
 
@@ -63,6 +91,8 @@ class ACMGClassifierV8(ACMGClassifierV7):
         gnomad_client: Optional[Any] = None,
         dbnsfp_client: Optional[DbNSFPClient] = None,
         prediction_thresholds: Optional[PredictionThresholds] = None,
+        enable_splice: bool = True,
+        clinvar_dir: Optional[Union[str, Path]] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize enhanced classifier with computational predictions.
@@ -74,6 +104,8 @@ class ACMGClassifierV8(ACMGClassifierV7):
             gnomad_client: Custom GnomadClient instance
             dbnsfp_client: Custom DbNSFPClient instance
             prediction_thresholds: Custom prediction thresholds
+            enable_splice: Enable SpliceAI PM1 scoring
+            clinvar_dir: ClinVar directory for triple-source matching
             **kwargs: Additional args for parent class
         """
         # Initialize parent (v7 with gnomAD)
@@ -84,6 +116,18 @@ class ACMGClassifierV8(ACMGClassifierV7):
             **kwargs,
         )
 
+        # Splice scoring and triple-source matching are built once, on
+        # first use or warm_up(), and reused for every variant
+        self.enable_splice: bool = enable_splice
+        self.clinvar_dir: Path = Path(clinvar_dir) if clinvar_dir else Path("./clinvar")
+        self._splice: Optional[Any] = None
+        self._matcher: Optional[Any] = None
+        self._components_loaded: Set[str] = set()
+        self.component_timings: Dict[str, ComponentTiming] = {
+            "splice": ComponentTiming(),
+            "matching": ComponentTiming(),
+        }
+
         # Initialize prediction service
         self.enable_predictions: bool = enable_predictions
         self.prediction_service: Optional[ComputationalPredictionService] = None
@@ -108,65 +152,131 @@ class ACMGClassifierV8(ACMGClassifierV7):
                 f"ACMGClassifierV8 {self.VERSION} initialized without computational predictions"
             )
 
-    def assign_evidence(self, variant: VariantData) -> ACMGEvidenceSet:
+    def warm_up(self) -> Dict[str, bool]:
+        """Initialize splice scoring and triple-source matching now.
+
+        Call once at startup so model loading is not charged to the first
+        variant classified.
+
+        Returns:
+            Availability of each component
+        """
+        return {
+            "splice": self._get_splice() is not None,
+            "matching": self._get_matcher() is not None,
+        }
+
+    def _get_splice(self) -> Optional[Any]:
+        """SpliceACMG scorer, built and warmed on first use (None if unavailable)."""
+        if not self.enable_splice:
+            return None
+        if "splice" not in self._components_loaded:
+            self._components_loaded.add("splice")
+            start_time = time.time()
+            try:
+                from varidex.acmg.splice import SpliceACMG
+
+                splice = SpliceACMG()
+                if splice.warm_up():
+                    self._splice = splice
+                else:
+                    logger.info("PM1 SpliceAI models unavailable, skipping PM1")
+            except Exception as e:
+                logger.debug(f"PM1 SpliceAI unavailable: {e}")
+            self.component_timings["splice"].startup_seconds = time.time() - start_time
+        return self._splice
+
+    def _get_matcher(self) -> Optional[Any]:
+        """Triple-source (ClinVar + dbNSFP + gnomAD) matcher, built on first use."""
+        if "matching" not in self._components_loaded:
+            self._components_loaded.add("matching")
+            start_time = time.time()
+            try:
+                from varidex.io.matching import VariantMatcherV8
+
+                self._matcher = VariantMatcherV8(self.clinvar_dir)
+            except Exception as e:
+                logger.debug(f"V8 matching unavailable: {e}")
+            self.component_timings["matching"].startup_seconds = (
+                time.time() - start_time
+            )
+        return self._matcher
+
+    def _prefetch_batch(self, variants: List[VariantData]) -> List[Dict[str, Any]]:
+        """Resolve gnomAD frequencies, splice scores and predictions for a batch.
+
+        Extends the v7 prefetch with one SpliceACMG.score_many() call and one
+        bulk prediction lookup, reusing the coordinates it extracted.
+        """
+        contexts = super()._prefetch_batch(variants)
+
+        slots: List[int] = []
+        queries: List[Dict[str, Any]] = []
+        for i, (variant, context) in enumerate(zip(variants, contexts)):
+            if "coords" not in context:
+                context["coords"] = self._extract_variant_coordinates(variant)
+            if context["coords"] is not None:
+                queries.append(context["coords"])
+                slots.append(i)
+
+        splice = self._get_splice()
+        if splice is not None and queries:
+            start_time = time.time()
+            try:
+                splice_results = splice.score_many(
+                    [
+                        (q["chromosome"], q["position"], q["ref"], q["alt"])
+                        for q in queries
+                    ]
+                )
+                for i, result in zip(slots, splice_results):
+                    contexts[i]["splice"] = result
+            except Exception as e:
+                logger.debug(f"PM1 SpliceAI batch scoring failed: {e}")
+            self.component_timings["splice"].record(
+                time.time() - start_time, len(queries)
+            )
+
+        if self.enable_predictions and self.prediction_service:
+            pred_results = self.prediction_service.analyze_predictions_batch(queries)
+            for i, pred_evidence in zip(slots, pred_results):
+                contexts[i]["predictions"] = pred_evidence
+        return contexts
+
+    def _assign_evidence_sets(
+        self, variant: VariantData, context: Dict[str, Any]
+    ) -> ACMGEvidenceSet:
         """Assign ACMG evidence codes including computational predictions.
 
-        Extends v7 classifier with PP3 and BP4 from computational predictions.
+        Extends v7 classifier with PM1 (SpliceAI), PP3 and BP4 from
+        computational predictions, taken from context when the batch
+        prefetch resolved them.
 
         Args:
             variant: VariantData object
+            context: Lookups pre-resolved by _prefetch_batch()
 
         Returns:
             ACMGEvidenceSet with evidence codes
         """
         # Get base evidence from parent (PVS1, PM2, PM4, PP2, BA1, BS1, BP1, BP3)
-        evidence = super().assign_evidence(variant)
+        evidence = super()._assign_evidence_sets(variant, context)
 
-        # V8 TRIPLE MATCHING ENGINE (ClinVar + dbNSFP + gnomAD)
-        try:
-            from pathlib import Path
-
-            # PM1 SpliceAI (ACMG Phase 1)
-            from varidex.acmg.splice import SpliceACMG
-            from varidex.io.matching import VariantMatcherV8
-
-            splice = SpliceACMG()
-            result = splice.score(variant.chrom, variant.pos, variant.ref, variant.alt)
-            if result["pm1"]:
-                evidence.pm.add(result["pm1"])
-                logger.info(f"PM1 {result['pm1']}: delta={result['delta']:.3f}")
-        except Exception as e:
-            logger.debug(f"PM1 unavailable: {e}")
-
-            matcher = VariantMatcherV8(Path("./clinvar"))
-            match_key = f"{variant.chrom}:{variant.pos}:{variant.ref}:{variant.alt}"
-            variant.match_data = matcher.match_triple_sources(match_key)
-            logger.debug(
-                f"V8 matching OK: {variant.match_data.get('match_strength', 0)} sources"
-            )
-        except Exception as e:
-            logger.debug(f"V8 matching unavailable: {e}")
+        if "coords" in context:
+            coords = context["coords"]
+        else:
+            coords = self._extract_variant_coordinates(variant)
 
-        # PM1 SpliceAI (ACMG Phase 1: 12 → 15/28 codes)
-        try:
-            from varidex.acmg.splice import SpliceACMG
+        if coords is not None:
+            # PM1 SpliceAI (ACMG Phase 1: 12 → 15/28 codes)
+            self._add_splice_evidence(evidence, coords, context.get("splice"))
 
-            splice = SpliceACMG()
-            result = splice.score(
-                variant.chrom, int(variant.pos), variant.ref, variant.alt
-            )
-            if result["pm1"]:
-                evidence.pm.add(result["pm1"])
-                logger.info(f"PM1 {result['pm1']}: delta={result['delta']:.3f}")
-        except Exception as e:
-            logger.debug(f"PM1 SpliceAI unavailable: {e}")
+            # V8 TRIPLE MATCHING ENGINE (ClinVar + dbNSFP + gnomAD)
+            self._match_triple_sources(variant, coords)
 
         # Add computational prediction evidence if enabled
         if self.enable_predictions and self.prediction_service:
             try:
-                # Extract coordinates
-                coords = self._extract_variant_coordinates(variant)
-
                 if coords is None:
                     logger.debug(
                         "No coordinates for prediction query, skipping computational analysis"
@@ -175,13 +285,15 @@ class ACMGClassifierV8(ACMGClassifierV7):
                     return evidence
 
                 # Query computational predictions
-                pred_evidence = self.prediction_service.analyze_predictions(
-                    chromosome=coords["chromosome"],
-                    position=coords["position"],
-                    ref=coords["ref"],  # FIXED: was coords["re"]
-                    alt=coords["alt"],
-                    gene=coords.get("gene"),
-                )
+                pred_evidence = context.get("predictions")
+                if pred_evidence is None:
+                    pred_evidence = self.prediction_service.analyze_predictions(
+                        chromosome=coords["chromosome"],
+                        position=coords["position"],
+                        ref=coords["ref"],
+                        alt=coords["alt"],
+                        gene=coords.get("gene"),
+                    )
 
                 # Add evidence codes
                 if pred_evidence.pp3:
@@ -211,58 +323,65 @@ class ACMGClassifierV8(ACMGClassifierV7):
                 logger.error(f"Computational prediction analysis failed: {e}")
                 evidence.conflicts.add(f"Prediction error: {str(e)}")
 
-        # Convert sets to lists (inherited from parent)
-        for attr in ["pvs", "ps", "pm", "pp", "ba", "bs", "bp"]:
-            setattr(evidence, attr, list(getattr(evidence, attr)))
-
         return evidence
 
-    def classify_variant(
-        self, variant: VariantData
-    ) -> Tuple[str, str, ACMGEvidenceSet, float]:
-        """Complete classification pipeline with computational predictions.
+    def _add_splice_evidence(
+        self,
+        evidence: ACMGEvidenceSet,
+        coords: Dict[str, Any],
+        result: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Add PM1 from a prefetched splice result, scoring now if absent."""
+        if result is None:
+            splice = self._get_splice()
+            if splice is None:
+                return
+            start_time = time.time()
+            try:
+                result = splice.score(
+                    coords["chromosome"],
+                    coords["position"],
+                    coords["ref"],
+                    coords["alt"],
+                )
+            except Exception as e:
+                logger.debug(f"PM1 SpliceAI scoring failed: {e}")
+                return
+            finally:
+                self.component_timings["splice"].record(time.time() - start_time)
 
-        Args:
-            variant: VariantData object
+        if result["pm1"]:
+            evidence.pm.add(result["pm1"])
+            logger.info(f"PM1 {result['pm1']}: delta={result['delta']:.3f}")
 
-        Returns:
-            Tuple of (classification, confidence, evidence, duration)
-        """
+    def _match_triple_sources(
+        self, variant: VariantData, coords: Dict[str, Any]
+    ) -> None:
+        """Attach ClinVar + dbNSFP + gnomAD match data to the variant."""
+        matcher = self._get_matcher()
+        if matcher is None:
+            return
         start_time = time.time()
-
         try:
-            # Assign evidence (includes gnomAD + predictions)
-            evidence = self.assign_evidence(variant)
-
-            # Combine evidence using parent logic
-            classification, confidence = self.combine_evidence(evidence)
-
-            duration = time.time() - start_time
-
-            # Record metrics
-            if self.metrics:
-                self.metrics.record_success(duration, classification, evidence)
-
-            logger.info(
-                f"Classified {variant} → {classification} ({confidence}) "
-                f"in {duration:.3f}s [gnomAD: {self.enable_gnomad}, "
-                f"predictions: {self.enable_predictions}]"
+            match_key = (
+                f"{coords['chromosome']}:{coords['position']}:"
+                f"{coords['ref']}:{coords['alt']}"
             )
-
-            return classification, confidence, evidence, duration
-
-        except Exception as e:
-            duration = time.time() - start_time
-            if self.metrics:
-                self.metrics.record_failure()
-
-            logger.error(f"Classification pipeline failed: {e}", exc_info=True)
-            return (
-                "Uncertain Significance",
-                f"Error: {str(e)}",
-                ACMGEvidenceSet(),
-                duration,
+            variant.match_data = matcher.match_triple_sources(match_key)
+            logger.debug(
+                f"V8 matching OK: {variant.match_data.get('match_strength', 0)} sources"
             )
+        except Exception as e:
+            logger.debug(f"V8 matching failed: {e}")
+        finally:
+            self.component_timings["matching"].record(time.time() - start_time)
+
+    def _feature_tag(self) -> str:
+        """Log suffix with the gnomAD and prediction flags."""
+        return (
+            f" [gnomAD: {self.enable_gnomad}, "
+            f"predictions: {self.enable_predictions}]"
+        )
 
     def health_check(self) -> Dict[str, Any]:
         """Health check with gnomAD and prediction service status.
@@ -286,6 +405,17 @@ class ACMGClassifierV8(ACMGClassifierV7):
             except Exception as e:
                 health["predictions"]["error"] = str(e)
 
+        # Long-lived components: startup cost and per-variant latency
+        instances = {"splice": self._splice, "matching": self._matcher}
+        health["components"] = {
+            name: {
+                "initialized": name in self._components_loaded,
+                "available": instances[name] is not None,
+                **timing.summary(),
+            }
+            for name, timing in self.component_timings.items()
+        }
+
         health["version"] = self.VERSION
 
         return health
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+varidex/core/evidence_bits.py - Bitmask encoding of ACMG evidence
+
+Packs the 28 ACMG/AMP evidence codes of one variant into a single integer,
+stored as the uint32 evidence_mask column of the stage-5 classification
+frame (and so in its checkpoints). ACMGEvidenceSet.to_mask()/from_mask()
+are the adapters; counting, conflict checks and summaries stay on the
+evidence sets.
+
+A mask records which base codes are present, nothing more. Each base code
+has one bit and its category is fixed by the code itself, so the round
+trip through ACMGEvidenceSet is lossless only for unmodified codes in
+their own category:
+
+- Strength modifiers are dropped: "PM1_Strong" sets the PM1 bit and
+  decodes as "PM1"; "PM1" and "PM1_Strong" together decode as one "PM1".
+- The assigned category is not kept: "PP3_Strong" placed in ps sets the
+  PP3 bit and decodes back into pp.
+
+Codes that are not one of the 28 are dropped (or rejected with
+strict=True).
+"""
+
+from typing import Any, Dict, Tuple
+
+from varidex.core.exceptions import ValidationError
+
+# Bit order is part of the stored format - append only, never reorder.
+ACMG_CODES: Tuple[str, ...] = (
+    "PVS1",
+    "PS1",
+    "PS2",
+    "PS3",
+    "PS4",
+    "PM1",
+    "PM2",
+    "PM3",
+    "PM4",
+    "PM5",
+    "PM6",
+    "PP1",
+    "PP2",
+    "PP3",
+    "PP4",
+    "PP5",
+    "BA1",
+    "BS1",
+    "BS2",
+    "BS3",
+    "BS4",
+    "BP1",
+    "BP2",
+    "BP3",
+    "BP4",
+    "BP5",
+    "BP6",
+    "BP7",
+)
+
+CODE_BITS: Dict[str, int] = {code: 1 << i for i, code in enumerate(ACMG_CODES)}
+
+# Strength category of each code, in ACMGEvidenceSet field order
+EVIDENCE_CATEGORIES: Tuple[str, ...] = ("pvs", "ps", "pm", "pp", "ba", "bs", "bp")
+
+# Decode table: bit -> (code, category)
+BIT_DECODE: Tuple[Tuple[str, str], ...] = tuple(
+    (code, code.rstrip("0123456789").lower()) for code in ACMG_CODES
+)
+
+MASK_DTYPE = "uint32"
+
+
+def code_bit(code: str, strict: bool = False) -> int:
+    """
+    Bit for an evidence code; a strength modifier suffix maps to the base bit.
+
+    Args:
+        code: Evidence code such as "PM2" or "PM1_Strong"
+        strict: Raise ValidationError for unknown codes instead of returning 0
+
+    Returns:
+        Single-bit integer, or 0 for unknown codes when not strict
+    """
+    bit = CODE_BITS.get(code.split("_", 1)[0].upper())
+    if bit is None:
+        if strict:
+            raise ValidationError(f"Unknown ACMG evidence code: {code}")
+        return 0
+    return bit
+
+
+def encode_evidence(evidence: Any, strict: bool = False) -> int:
+    """
+    Encode an ACMGEvidenceSet (or any object with pvs..bp iterables).
+
+    Args:
+        evidence: ACMGEvidenceSet; category fields may be sets or lists
+        strict: Raise ValidationError for codes outside the 28 ACMG codes
+
+    Returns:
+        Integer mask (fits in uint32)
+    """
+    mask = 0
+    for category in EVIDENCE_CATEGORIES:
+        for code in getattr(evidence, category):
+            mask |= code_bit(code, strict)
+    return mask
+
+
+def decode_evidence(mask: int) -> Any:
+    """Build an ACMGEvidenceSet from a mask (conflicts are not stored)."""
+    from varidex.core.models import ACMGEvidenceSet
+
+    evidence = ACMGEvidenceSet()
+    for i, (code, category) in enumerate(BIT_DECODE):
+        if mask >> i & 1:
+            getattr(evidence, category).add(code)
+    return evidence
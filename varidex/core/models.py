@@ -28,9 +28,10 @@ Previous changes v2.2.0 (2026-01-24):
 """
 
 import re
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 # Import ValidationError for proper exception handling
 from varidex.core.exceptions import ValidationError
@@ -95,6 +96,22 @@ class ACMGEvidenceSet:
             parts.append(f"BP:{len(self.bp)}")
         return " | ".join(parts) if parts else "No evidence"
 
+    def to_mask(self, strict: bool = False) -> int:
+        """Encode as a uint32-sized bitmask (see varidex.core.evidence_bits)."""
+        from varidex.core.evidence_bits import encode_evidence
+
+        return encode_evidence(self, strict)
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "ACMGEvidenceSet":
+        """Decode a bitmask into base codes in their own categories.
+
+        Strength modifiers, applied categories and conflicts are not stored.
+        """
+        from varidex.core.evidence_bits import decode_evidence
+
+        return decode_evidence(int(mask))
+
     def __str__(self) -> str:
         return self.summary()
 
@@ -314,6 +331,7 @@ class VariantData:
         # Aliases for test compatibility
         reference: str = "",
         alternate: str = "",
+        trusted: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -325,6 +343,10 @@ class VariantData:
         FIX 4A: Allows empty ref/alt alleles when chromosome AND position are provided
         (coordinate-only variants for matching purposes).
 
+        trusted=True skips per-field validation for rows already checked in bulk
+        by varidex.core.schema.validate_frame(); values are stored as given
+        (position as str).
+
         Raises:
             ValidationError: If chromosome, position, or alleles are invalid
         """
@@ -342,31 +364,13 @@ class VariantData:
         if alternate:
             alt_allele = alternate
 
-        # FIX 4A: Determine if empty alleles should be allowed
-        # Allow empty alleles for coordinate-only variants (chrom+pos without alleles)
-        has_coordinates = bool(chromosome and position)
-        has_alleles = bool(ref_allele or alt_allele)
-        allow_empty_alleles = has_coordinates and not has_alleles
-
-        # VALIDATION: Validate inputs before assignment
-        try:
-            chromosome = _validate_chromosome(chromosome)
-            position = _validate_position(position)
-            ref_allele = _validate_allele(
-                ref_allele, "reference allele", allow_empty=allow_empty_alleles
-            )
-            alt_allele = _validate_allele(
-                alt_allele, "alternate allele", allow_empty=allow_empty_alleles
+        if trusted:
+            position = str(position) if position is not None else ""
+        else:
+            chromosome, position, ref_allele, alt_allele = self._validate_core(
+                chromosome, position, ref_allele, alt_allele
             )
 
-            # Additional validation: ref and alt cannot be the same (if both provided)
-            if ref_allele and alt_allele and ref_allele == alt_allele:
-                raise ValidationError(
-                    f"Reference and alternate alleles cannot be identical: '{ref_allele}'"
-                )
-        except ValidationError as e:
-            raise ValidationError(f"Invalid variant data: {e}") from e
-
         # Set all fields
         self.rsid = rsid
         self.chromosome = chromosome
@@ -396,6 +400,41 @@ class VariantData:
         if not self.gene and self.annotations and "gene" in self.annotations:
             self.gene = self.annotations["gene"]
 
+    @staticmethod
+    def _validate_core(
+        chromosome: Union[str, int, None],
+        position: Union[str, int, None],
+        ref_allele: Optional[str],
+        alt_allele: Optional[str],
+    ) -> Tuple[str, str, str, str]:
+        """Validate and normalize chromosome, position and alleles."""
+        # FIX 4A: Determine if empty alleles should be allowed
+        # Allow empty alleles for coordinate-only variants (chrom+pos without alleles)
+        has_coordinates = bool(chromosome and position)
+        has_alleles = bool(ref_allele or alt_allele)
+        allow_empty_alleles = has_coordinates and not has_alleles
+
+        # VALIDATION: Validate inputs before assignment
+        try:
+            chromosome = _validate_chromosome(chromosome)
+            position = _validate_position(position)
+            ref_allele = _validate_allele(
+                ref_allele, "reference allele", allow_empty=allow_empty_alleles
+            )
+            alt_allele = _validate_allele(
+                alt_allele, "alternate allele", allow_empty=allow_empty_alleles
+            )
+
+            # Additional validation: ref and alt cannot be the same (if both provided)
+            if ref_allele and alt_allele and ref_allele == alt_allele:
+                raise ValidationError(
+                    f"Reference and alternate alleles cannot be identical: '{ref_allele}'"
+                )
+        except ValidationError as e:
+            raise ValidationError(f"Invalid variant data: {e}") from e
+
+        return chromosome, position, ref_allele, alt_allele
+
     def __hash__(self) -> int:
         """Make VariantData hashable for use in sets and as dict keys."""
         return hash(self.variant_key)
@@ -706,6 +745,351 @@ class Variant(VariantData):
         return super().__getattribute__(name)
 
 
+# Interned chromosome codes for VariantRecord. Canonical chromosomes have
+# fixed codes; other contigs are appended on first sight so every name is
+# stored once per process. Codes of non-canonical contigs depend on the
+# order they were seen in, so they are process-local: never persist codes
+# or send them to other processes (VariantRecord pickles the name).
+CHROMOSOME_NAMES: List[str] = [str(i) for i in range(1, 23)] + ["X", "Y", "MT"]
+_CHROMOSOME_CODES: Dict[str, int] = {
+    name: code for code, name in enumerate(CHROMOSOME_NAMES)
+}
+_CHROMOSOME_CODES_LOCK = threading.Lock()
+MISSING_CHROMOSOME_CODE = -1
+
+ALLELE_PATTERN = r"[ACGTN]+"
+
+# Optional per-variant columns accepted by VariantRecord.from_arrays()
+VARIANT_RECORD_FIELDS = (
+    "rsid",
+    "gene",
+    "genotype",
+    "clinical_sig",
+    "review_status",
+    "molecular_consequence",
+    "variant_type",
+    "star_rating",
+    "gnomad_af",
+)
+
+
+def chromosome_code(chrom: Union[str, int, None]) -> int:
+    """
+    Interned integer code for a chromosome name.
+
+    'chr' prefixes are dropped and M is normalized to MT, so 'chr1', '1' and
+    1 share a code. Empty values map to MISSING_CHROMOSOME_CODE. Codes are
+    only meaningful within the current process.
+    """
+    if chrom is None:
+        return MISSING_CHROMOSOME_CODE
+    name = str(chrom).strip()
+    if name[:3].lower() == "chr":
+        name = name[3:]
+    name = name.upper()
+    if not name:
+        return MISSING_CHROMOSOME_CODE
+    if name == "M":
+        name = "MT"
+
+    code = _CHROMOSOME_CODES.get(name)
+    if code is None:
+        with _CHROMOSOME_CODES_LOCK:
+            code = _CHROMOSOME_CODES.get(name)
+            if code is None:
+                code = len(CHROMOSOME_NAMES)
+                CHROMOSOME_NAMES.append(name)
+                _CHROMOSOME_CODES[name] = code
+    return code
+
+
+def chromosome_name(code: int) -> str:
+    """Chromosome name for an interned code ('' for missing)."""
+    return CHROMOSOME_NAMES[code] if code >= 0 else ""
+
+
+class VariantRecord:
+    """
+    Compact variant for bulk/hot paths (slotted, no per-instance dict).
+
+    Stores an interned chromosome code and an integer position, runs no
+    validators on construction and only allocates an ACMGEvidenceSet when
+    acmg_evidence is first accessed. Attribute names match VariantData, so
+    evidence assignment accepts either; use from_arrays() to build many
+    records with one vectorized validation pass, and to_variant_data() /
+    from_variant_data() at boundaries with VariantData-based APIs.
+
+    gnomad_af is only set when a frequency is known, matching the
+    hasattr(variant, "gnomad_af") convention of the PM2 evidence checks.
+    """
+
+    __slots__ = (
+        "chrom_code",
+        "pos",
+        "ref_allele",
+        "alt_allele",
+        "rsid",
+        "gene",
+        "genotype",
+        "clinical_sig",
+        "review_status",
+        "molecular_consequence",
+        "variant_type",
+        "star_rating",
+        "acmg_classification",
+        "confidence_level",
+        "gnomad_af",
+        "_evidence",
+    )
+
+    def __init__(
+        self,
+        chrom_code: int,
+        pos: int,
+        ref_allele: str = "",
+        alt_allele: str = "",
+        rsid: str = "",
+        gene: str = "",
+        genotype: str = "",
+        clinical_sig: str = "",
+        review_status: str = "",
+        molecular_consequence: str = "",
+        variant_type: str = "",
+        star_rating: int = 0,
+        gnomad_af: Optional[float] = None,
+    ) -> None:
+        self.chrom_code = chrom_code
+        self.pos = pos
+        self.ref_allele = ref_allele
+        self.alt_allele = alt_allele
+        self.rsid = rsid
+        self.gene = gene
+        self.genotype = genotype
+        self.clinical_sig = clinical_sig
+        self.review_status = review_status
+        self.molecular_consequence = molecular_consequence
+        self.variant_type = variant_type
+        self.star_rating = star_rating
+        self.acmg_classification = ""
+        self.confidence_level = ""
+        self._evidence: Optional[ACMGEvidenceSet] = None
+        if gnomad_af is not None:
+            self.gnomad_af = gnomad_af
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle the chromosome name: codes are process-local
+        state = {
+            slot: getattr(self, slot)
+            for slot in self.__slots__
+            if slot != "chrom_code" and hasattr(self, slot)
+        }
+        state["chromosome"] = chromosome_name(self.chrom_code)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state = dict(state)
+        self.chrom_code = chromosome_code(state.pop("chromosome"))
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    @property
+    def chromosome(self) -> str:
+        """Chromosome name (normalized, no 'chr' prefix)."""
+        return chromosome_name(self.chrom_code)
+
+    @property
+    def chrom(self) -> str:
+        """Alias for chromosome (VCF compatibility)."""
+        return chromosome_name(self.chrom_code)
+
+    @property
+    def position(self) -> str:
+        """Position as string (VariantData compatibility)."""
+        return str(self.pos)
+
+    @property
+    def ref(self) -> str:
+        """Alias for ref_allele (VCF compatibility)."""
+        return self.ref_allele
+
+    @property
+    def alt(self) -> str:
+        """Alias for alt_allele (VCF compatibility)."""
+        return self.alt_allele
+
+    @property
+    def acmg_evidence(self) -> ACMGEvidenceSet:
+        """Evidence set, allocated on first access."""
+        if self._evidence is None:
+            self._evidence = ACMGEvidenceSet()
+        return self._evidence
+
+    @acmg_evidence.setter
+    def acmg_evidence(self, value: Optional[ACMGEvidenceSet]) -> None:
+        self._evidence = value
+
+    @property
+    def has_evidence(self) -> bool:
+        """True if an evidence set has been allocated."""
+        return self._evidence is not None
+
+    @property
+    def variant_key(self) -> str:
+        """Generate unique variant identifier."""
+        return f"{self.chromosome}:{self.pos}:{self.ref_allele}:{self.alt_allele}"
+
+    @classmethod
+    def from_arrays(
+        cls,
+        chromosomes: Sequence[Any],
+        positions: Sequence[Any],
+        refs: Sequence[Any],
+        alts: Sequence[Any],
+        on_invalid: str = "raise",
+        **columns: Sequence[Any],
+    ) -> List[Optional["VariantRecord"]]:
+        """
+        Build records from parallel column arrays with one validation pass.
+
+        Rows are checked with the per-record rules of VariantData, applied
+        over whole columns (varidex.core.schema.variant_rule_failures with
+        vocabulary=False): a non-empty chromosome (any contig), a positive
+        integer position, A/C/G/T/N alleles that differ; both alleles may be
+        empty for coordinate-only variants. Chromosome names are interned
+        once per distinct value.
+
+        Args:
+            chromosomes: Chromosome names (any 'chr' style)
+            positions: Positions (int, float or numeric strings)
+            refs: Reference alleles
+            alts: Alternate alleles
+            on_invalid: "raise" to raise ValidationError if any row is
+                invalid, "none" to return None in place of invalid rows
+            **columns: Optional columns named in VARIANT_RECORD_FIELDS
+
+        Returns:
+            One record (or None) per input row, in order
+
+        Raises:
+            ValidationError: If a row is invalid and on_invalid == "raise"
+            TypeError: For unknown column names
+        """
+        import numpy as np
+        import pandas as pd
+
+        from varidex.core.schema import variant_rule_failures
+
+        unknown = set(columns) - set(VARIANT_RECORD_FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown VariantRecord columns: {sorted(unknown)}")
+        if on_invalid not in ("raise", "none"):
+            raise ValueError("on_invalid must be 'raise' or 'none'")
+
+        def column(values: Sequence[Any]) -> "pd.Series":
+            series = pd.Series(np.asarray(values, dtype=object))
+            return series.where(series.notna(), "")
+
+        chrom = column(chromosomes).astype(str)
+        pos = pd.to_numeric(column(positions), errors="coerce")
+        ref = column(refs).astype(str).str.strip().str.upper()
+        alt = column(alts).astype(str).str.strip().str.upper()
+
+        # Intern each distinct chromosome name once
+        unique_chroms, inverse = np.unique(
+            chrom.to_numpy(dtype=str), return_inverse=True
+        )
+        codes = np.array([chromosome_code(c) for c in unique_chroms], dtype=np.int64)
+        chrom_codes = codes[inverse] if len(codes) else np.array([], dtype=np.int64)
+
+        failures = variant_rule_failures(chrom, pos, ref, alt, vocabulary=False)
+        invalid = np.zeros(len(chrom), dtype=bool)
+        for mask in failures.values():
+            invalid |= mask
+
+        if invalid.any() and on_invalid == "raise":
+            counts = {rule: int(mask.sum()) for rule, mask in failures.items()}
+            first = int(np.flatnonzero(invalid)[0])
+            raise ValidationError(
+                f"Invalid variant data in {int(invalid.sum())} rows "
+                f"(first at row {first}): "
+                + ", ".join(f"{rule}={n}" for rule, n in counts.items() if n)
+            )
+
+        int_pos = pos.fillna(0).to_numpy().astype(np.int64)
+        ref_values = ref.tolist()
+        alt_values = alt.tolist()
+        extra = {name: list(values) for name, values in columns.items()}
+
+        records: List[Optional[VariantRecord]] = []
+        for i in range(len(chrom)):
+            if invalid[i]:
+                records.append(None)
+                continue
+            kwargs = {name: values[i] for name, values in extra.items()}
+            if "gnomad_af" in kwargs and pd.isna(kwargs["gnomad_af"]):
+                kwargs["gnomad_af"] = None  # frequency unknown
+            records.append(
+                cls(
+                    int(chrom_codes[i]),
+                    int(int_pos[i]),
+                    ref_values[i],
+                    alt_values[i],
+                    **kwargs,
+                )
+            )
+        return records
+
+    @classmethod
+    def from_variant_data(cls, variant: VariantData) -> "VariantRecord":
+        """Convert a (validated) VariantData; its evidence set is shared."""
+        record = cls(
+            chromosome_code(variant.chromosome),
+            variant.pos,
+            variant.ref_allele,
+            variant.alt_allele,
+            rsid=variant.rsid,
+            gene=variant.gene,
+            genotype=variant.genotype,
+            clinical_sig=variant.clinical_sig,
+            review_status=variant.review_status,
+            molecular_consequence=variant.molecular_consequence,
+            variant_type=variant.variant_type,
+            star_rating=variant.star_rating,
+            gnomad_af=getattr(variant, "gnomad_af", None),
+        )
+        record.acmg_classification = variant.acmg_classification
+        record.confidence_level = variant.confidence_level
+        record._evidence = variant.acmg_evidence
+        return record
+
+    def to_variant_data(self) -> VariantData:
+        """Convert to VariantData for APIs that require it."""
+        variant = VariantData(
+            rsid=self.rsid,
+            chromosome=self.chromosome,
+            position=str(self.pos) if self.pos else "",
+            ref_allele=self.ref_allele,
+            alt_allele=self.alt_allele,
+            gene=self.gene,
+            genotype=self.genotype,
+            clinical_sig=self.clinical_sig,
+            review_status=self.review_status,
+            molecular_consequence=self.molecular_consequence,
+            variant_type=self.variant_type,
+            star_rating=self.star_rating,
+            acmg_evidence=self._evidence,
+            acmg_classification=self.acmg_classification,
+            confidence_level=self.confidence_level,
+            trusted=True,
+        )
+        if hasattr(self, "gnomad_af"):
+            variant.gnomad_af = self.gnomad_af
+        return variant
+
+    def __repr__(self) -> str:
+        return f"VariantRecord({self.variant_key}, gene={self.gene!r})"
+
+
 @dataclass
 class VariantAnnotation:
     """
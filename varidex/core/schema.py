@@ -14,8 +14,9 @@ Notes:
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Sequence
+from typing import Dict, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from varidex.exceptions import ValidationError
@@ -54,6 +55,51 @@ REQUIRED_MATCHED_DF = (
     "molecular_consequence",
 )
 
+# ---------------- Coordinate vocabulary ----------------
+
+VALID_CHROMOSOMES: Tuple[str, ...] = tuple(str(i) for i in range(1, 23)) + (
+    "X",
+    "Y",
+    "MT",
+)
+CHROMOSOME_MAX_POSITIONS: Dict[str, int] = {
+    "1": 250_000_000,
+    "2": 243_000_000,
+    "3": 198_000_000,
+    "4": 191_000_000,
+    "5": 181_000_000,
+    "6": 171_000_000,
+    "7": 160_000_000,
+    "8": 146_000_000,
+    "9": 142_000_000,
+    "10": 136_000_000,
+    "11": 135_000_000,
+    "12": 134_000_000,
+    "13": 115_000_000,
+    "14": 107_000_000,
+    "15": 103_000_000,
+    "16": 90_500_000,
+    "17": 84_000_000,
+    "18": 80_500_000,
+    "19": 59_000_000,
+    "20": 64_500_000,
+    "21": 48_000_000,
+    "22": 52_000_000,
+    "X": 156_000_000,
+    "Y": 57_000_000,
+    "MT": 17_000,
+}
+ALLELE_REGEX = r"[ACGTN]+"
+
+# Rules checked by validate_frame(), in report order
+VALIDATION_RULES: Tuple[str, ...] = (
+    "chromosome",
+    "position",
+    "position_range",
+    "allele",
+    "ref_equals_alt",
+)
+
 # ---------------- Alias maps (generic) ----------------
 
 DEFAULT_ALIASES: Dict[str, str] = {
@@ -181,3 +227,137 @@ def coerce_types(df: pd.DataFrame) -> pd.DataFrame:
         ).astype("Int64")
 
     return out
+
+
+# ---------------- Bulk validation ----------------
+
+
+def _object_series(values: Sequence[object]) -> pd.Series:
+    # Positional: any index on the input is dropped
+    return pd.Series(np.asarray(values, dtype=object))
+
+
+def _normalize_chromosome_name(value: object) -> str:
+    name = str(value).strip().upper()
+    if name.startswith("CHR"):
+        name = name[3:]
+    return "MT" if name == "M" else name
+
+
+def normalize_chromosomes(values: Sequence[object]) -> np.ndarray:
+    """Canonical chromosome names ('chr' dropped, M -> MT; missing -> '').
+
+    Each distinct value is normalized once, so cost scales with the number
+    of distinct chromosomes rather than rows.
+    """
+    codes, uniques = pd.factorize(_object_series(values))
+    names = [_normalize_chromosome_name(u) for u in uniques]
+    # factorize codes missing values as -1, which picks the trailing ""
+    return np.asarray(names + [""], dtype=object)[codes]
+
+
+def variant_rule_failures(
+    chromosomes: Sequence[object],
+    positions: Sequence[object],
+    refs: Optional[Sequence[object]] = None,
+    alts: Optional[Sequence[object]] = None,
+    vocabulary: bool = True,
+) -> Dict[str, np.ndarray]:
+    """Evaluate every validation rule over whole columns.
+
+    Alleles may be omitted (coordinate-only data); both empty is also
+    accepted as coordinate-only. Otherwise both must match ALLELE_REGEX
+    (case-insensitive) and differ.
+
+    vocabulary=False applies only the per-record rules of VariantData: any
+    non-empty chromosome (including non-canonical contigs) passes and
+    positions are not checked against CHROMOSOME_MAX_POSITIONS, whose
+    values are approximate and below some GRCh38 lengths.
+
+    Returns:
+        Boolean failure array per rule in VALIDATION_RULES (True = fails)
+    """
+    chrom = normalize_chromosomes(chromosomes)
+    chrom_series = pd.Series(chrom, dtype=object)
+    pos = pd.to_numeric(_object_series(positions), errors="coerce")
+    pos_values = pos.to_numpy(dtype=float)
+    if vocabulary:
+        bad_chromosome = ~chrom_series.isin(VALID_CHROMOSOMES).to_numpy()
+        max_pos = chrom_series.map(CHROMOSOME_MAX_POSITIONS).to_numpy(dtype=float)
+    else:
+        bad_chromosome = (chrom_series == "").to_numpy()
+        max_pos = np.full(len(chrom), np.inf)
+
+    failures: Dict[str, np.ndarray] = {
+        "chromosome": bad_chromosome,
+        "position": (np.isnan(pos_values) | (pos_values <= 0) | (pos_values % 1 != 0)),
+        # NaN comparisons are False: bad positions/chromosomes counted above
+        "position_range": pos_values > max_pos,
+        "allele": np.zeros(len(chrom), dtype=bool),
+        "ref_equals_alt": np.zeros(len(chrom), dtype=bool),
+    }
+
+    if refs is not None and alts is not None:
+
+        def allele_column(values: Sequence[object]) -> pd.Series:
+            column = _object_series(values).fillna("").astype(str)
+            return column.str.strip().str.upper()
+
+        ref = allele_column(refs)
+        alt = allele_column(alts)
+        coordinate_only = ((ref == "") & (alt == "")).to_numpy()
+        valid_alleles = (
+            ref.str.fullmatch(ALLELE_REGEX) & alt.str.fullmatch(ALLELE_REGEX)
+        ).to_numpy(dtype=bool)
+        failures["allele"] = ~coordinate_only & ~valid_alleles
+        failures["ref_equals_alt"] = ~coordinate_only & (ref == alt).to_numpy()
+
+    return failures
+
+
+def validate_frame(
+    df: pd.DataFrame,
+    chrom_col: str = CANON_CHROM,
+    pos_col: str = CANON_POS,
+    ref_col: str = CANON_REF,
+    alt_col: str = CANON_ALT,
+) -> Tuple[pd.Series, pd.DataFrame]:
+    """Validate variant coordinates and alleles over whole columns.
+
+    Replaces per-row validation (VariantData construction, DataValidator)
+    for bulk data: chromosome vocabulary, positive integer positions within
+    CHROMOSOME_MAX_POSITIONS, allele alphabet and ref != alt. Allele rules
+    are skipped when the frame has no allele columns. Rows passing here can
+    be turned into models with trusted=True.
+
+    Returns:
+        (valid, errors): boolean Series aligned to df.index, and a table
+        indexed by rule with "errors" (row count) and "first_index" (index
+        label of the first failing row, or None)
+    """
+    require_columns(df, (chrom_col, pos_col), stage="validate_frame")
+    has_alleles = ref_col in df.columns and alt_col in df.columns
+    failures = variant_rule_failures(
+        df[chrom_col],
+        df[pos_col],
+        df[ref_col] if has_alleles else None,
+        df[alt_col] if has_alleles else None,
+    )
+
+    invalid = np.zeros(len(df), dtype=bool)
+    rows = []
+    for rule in VALIDATION_RULES:
+        mask = failures[rule]
+        invalid |= mask
+        count = int(mask.sum())
+        rows.append(
+            {
+                "rule": rule,
+                "errors": count,
+                "first_index": df.index[int(mask.argmax())] if count else None,
+            }
+        )
+
+    valid = pd.Series(~invalid, index=df.index, name="valid")
+    errors = pd.DataFrame(rows).set_index("rule")
+    return valid, errors
@@ -30,7 +30,7 @@ Reference: Richards et al. 2015, PMID 25741868
 import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from varidex.integrations.dbnsfp_client import DbNSFPClient, PredictionScore
 
@@ -328,21 +328,92 @@ class ComputationalPredictionService:
         Returns:
             ComputationalEvidence with PP3/BP4 determination
         """
-        evidence: ComputationalEvidence = ComputationalEvidence()
+        if not self.enable_predictions or not self.client:
+            logger.info(
+                "Predictions disabled - use enable_predictions=True or check connectivity"
+            )
+            return ComputationalEvidence(
+                reasoning="Predictions disabled (offline mode)"
+            )
 
         try:
-            # Get predictions
-            if not self.enable_predictions or not self.client:
-                evidence.reasoning = "Predictions disabled (offline mode)"
-                logger.info(
-                    "Predictions disabled - use enable_predictions=True or check connectivity"
-                )
-                return evidence
-
             predictions: Optional[PredictionScore] = self.client.get_predictions(
                 chromosome, position, ref, alt
             )
+        except Exception as e:
+            logger.error(f"Prediction analysis failed for {chromosome}:{position}: {e}")
+            return ComputationalEvidence(reasoning=f"Analysis error: {str(e)}")
+
+        return self._evaluate_predictions(predictions, chromosome, position, ref, alt)
+
+    def analyze_predictions_batch(
+        self, queries: Sequence[Dict[str, Any]]
+    ) -> List[ComputationalEvidence]:
+        """Analyze computational predictions for many variants.
 
+        Scores are resolved through the client's bulk method
+        (get_predictions_batch) when it has one; PP3/BP4 are then evaluated
+        per query.
+
+        Args:
+            queries: Dicts with chromosome, position, ref, alt and optional gene
+
+        Returns:
+            ComputationalEvidence per query, in input order
+        """
+        if not self.enable_predictions or not self.client:
+            logger.info(
+                "Predictions disabled - use enable_predictions=True or check connectivity"
+            )
+            return [
+                ComputationalEvidence(reasoning="Predictions disabled (offline mode)")
+                for _ in queries
+            ]
+
+        variants: List[Tuple[str, int, str, str]] = [
+            (q["chromosome"], q["position"], q["ref"], q["alt"]) for q in queries
+        ]
+        try:
+            bulk = getattr(self.client, "get_predictions_batch", None)
+            if bulk is not None:
+                scores: List[Optional[PredictionScore]] = bulk(variants)
+            else:
+                scores = [self.client.get_predictions(*variant) for variant in variants]
+        except Exception as e:
+            logger.error(f"Prediction batch analysis failed: {e}")
+            return [
+                ComputationalEvidence(reasoning=f"Analysis error: {str(e)}")
+                for _ in queries
+            ]
+
+        return [
+            self._evaluate_predictions(score, *variant)
+            for score, variant in zip(scores, variants)
+        ]
+
+    def _evaluate_predictions(
+        self,
+        predictions: Optional[PredictionScore],
+        chromosome: str,
+        position: int,
+        ref: str,
+        alt: str,
+    ) -> ComputationalEvidence:
+        """Count algorithm votes and apply PP3/BP4 to resolved scores.
+
+        Args:
+            predictions: Scores from the client (None if not found)
+            chromosome: Chromosome (for logging)
+            position: Genomic position (for logging)
+            ref: Reference allele (for logging)
+            alt: Alternate allele (for logging)
+
+        Returns:
+            ComputationalEvidence with PP3/BP4 determination
+        """
+        evidence: ComputationalEvidence = ComputationalEvidence()
+
+        try:
             if predictions is None or not predictions.has_scores:
                 evidence.reasoning = "No prediction scores available from VEP"
                 logger.debug(f"No predictions for {chromosome}:{position} {ref}>{alt}")
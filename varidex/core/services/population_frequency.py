@@ -11,7 +11,7 @@ References:
 import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from varidex.integrations.gnomad_client import GnomadClient, GnomadVariantFrequency
 
@@ -274,28 +274,99 @@ class PopulationFrequencyService:
         Returns:
             FrequencyEvidence with PM2, BA1, BS1 determinations
         """
-        evidence: FrequencyEvidence = FrequencyEvidence()
-
         # If gnomAD disabled, return empty evidence
         if not self.enable_gnomad or self.gnomad_client is None:
-            evidence.reasoning = "gnomAD integration disabled"
             logger.debug("gnomAD disabled, skipping frequency analysis")
-            return evidence
+            return FrequencyEvidence(reasoning="gnomAD integration disabled")
 
-        try:
-            # Query gnomAD
-            variant_str: str = f"{chromosome}:{position}:{ref}>{alt}"
-            if gene:
-                variant_str += f" ({gene})"
+        variant_str: str = f"{chromosome}:{position}:{ref}>{alt}"
+        if gene:
+            variant_str += f" ({gene})"
 
+        try:
             logger.info(f"Querying gnomAD for {variant_str}")
-
             freq: Optional[GnomadVariantFrequency] = (
                 self.gnomad_client.get_variant_frequency(
                     chromosome=chromosome, position=position, ref=ref, alt=alt
                 )
             )
+        except Exception as e:
+            logger.error(f"Error analyzing frequency: {e}")
+            return FrequencyEvidence(reasoning=f"Error querying gnomAD: {str(e)}")
+
+        return self._evaluate_frequency(freq, inheritance, variant_str)
+
+    def analyze_frequency_batch(
+        self, queries: Sequence[Dict[str, Any]]
+    ) -> List[FrequencyEvidence]:
+        """Analyze population frequency for many variants with one bulk lookup.
+
+        Frequencies are resolved through the client's bulk method
+        (get_variant_frequencies) when it has one, so duplicate and cached
+        variants cost no request and the rest share aliased GraphQL
+        queries; evidence is then evaluated per query.
+
+        Args:
+            queries: Dicts with chromosome, position, ref, alt and optional
+                inheritance (InheritanceMode) and gene
+
+        Returns:
+            FrequencyEvidence per query, in input order
+        """
+        if not self.enable_gnomad or self.gnomad_client is None:
+            logger.debug("gnomAD disabled, skipping frequency analysis")
+            return [
+                FrequencyEvidence(reasoning="gnomAD integration disabled")
+                for _ in queries
+            ]
+
+        variants: List[Tuple[str, int, str, str]] = [
+            (q["chromosome"], q["position"], q["ref"], q["alt"]) for q in queries
+        ]
+        try:
+            bulk = getattr(self.gnomad_client, "get_variant_frequencies", None)
+            if bulk is not None:
+                freqs: List[Optional[GnomadVariantFrequency]] = bulk(variants)
+            else:
+                freqs = [
+                    self.gnomad_client.get_variant_frequency(*variant)
+                    for variant in variants
+                ]
+        except Exception as e:
+            logger.error(f"Error analyzing frequency batch: {e}")
+            return [
+                FrequencyEvidence(reasoning=f"Error querying gnomAD: {str(e)}")
+                for _ in queries
+            ]
+
+        results: List[FrequencyEvidence] = []
+        for query, freq in zip(queries, freqs):
+            variant_str = "{chromosome}:{position}:{ref}>{alt}".format(**query)
+            if query.get("gene"):
+                variant_str += f" ({query['gene']})"
+            inheritance = query.get("inheritance") or InheritanceMode.UNKNOWN
+            results.append(self._evaluate_frequency(freq, inheritance, variant_str))
+        return results
+
+    def _evaluate_frequency(
+        self,
+        freq: Optional[GnomadVariantFrequency],
+        inheritance: InheritanceMode,
+        variant_str: str,
+    ) -> FrequencyEvidence:
+        """Apply BA1 > BS1 > PM2 to a resolved gnomAD frequency.
+
+        Args:
+            freq: gnomAD frequency data (None if not found)
+            inheritance: Inheritance mode for the disorder
+            variant_str: Variant label for logging
+
+        Returns:
+            FrequencyEvidence with PM2, BA1, BS1 determinations
+        """
+        evidence: FrequencyEvidence = FrequencyEvidence()
 
+        try:
             if freq is None:
                 # Not found in gnomAD - treat as absent (PM2 applies)
                 evidence.pm2 = True
@@ -378,5 +449,8 @@ class PopulationFrequencyService:
 
         if self.gnomad_client:
             stats["cache"] = self.gnomad_client.get_cache_stats()
+            coalescing = getattr(self.gnomad_client, "get_coalescing_stats", None)
+            if coalescing is not None:
+                stats["coalescing"] = coalescing()
 
         return stats
@@ -0,0 +1,402 @@
+"""Persistent on-disk cache for remote annotation lookups (SQLite).
+
+Stores gnomAD frequencies, VEP predictions and similar per-variant results
+keyed by (build, chrom, pos, ref, alt, source, dataset), so repeat cohorts
+are served locally instead of re-querying the remote services.
+
+- Reads are bulk: one IN-style query per (build, source, dataset) group.
+- Writes are buffered and committed in batches (one transaction each).
+- Each source has its own TTL, and a separate one for NOT_FOUND entries;
+  purge_expired()/vacuum() reclaim space.
+- Safe for several threads (one connection per thread) and several
+  pipeline processes (WAL journal, busy timeout, IMMEDIATE write
+  transactions).
+
+Use AnnotationCache.memory_cache() to put an LRUCache in front of it, and
+pass that to GnomadClient/DbNSFPClient via cache=.
+
+Version: 6.5.0-dev
+"""
+
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from varidex.integrations.cache import NOT_FOUND, CacheBackend, LRUCache
+
+logger = logging.getLogger(__name__)
+
+DAY = 86400.0
+DEFAULT_SOURCE_TTLS: Dict[str, float] = {
+    "gnomad": 90 * DAY,
+    "vep": 30 * DAY,
+}
+DEFAULT_TTL: float = 30 * DAY
+# NOT_FOUND entries (variant absent from the source) expire sooner, so new
+# releases are picked up
+DEFAULT_NOT_FOUND_TTLS: Dict[str, float] = {
+    "gnomad": 30 * DAY,
+    "vep": 7 * DAY,
+}
+DEFAULT_BUILD = "GRCh38"
+
+# Stay well under SQLITE_MAX_VARIABLE_NUMBER (4 params per variant + 4)
+READ_CHUNK = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS annotations (
+    build TEXT NOT NULL,
+    chrom TEXT NOT NULL,
+    pos INTEGER NOT NULL,
+    ref TEXT NOT NULL,
+    alt TEXT NOT NULL,
+    source TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    value BLOB NOT NULL,
+    created REAL NOT NULL,
+    expires REAL NOT NULL,
+    PRIMARY KEY (build, source, dataset, chrom, pos, ref, alt)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_annotations_expires ON annotations (expires);
+"""
+
+
+class AnnotationKey(NamedTuple):
+    """Cache key for one variant annotation."""
+
+    build: str
+    chrom: str
+    pos: int
+    ref: str
+    alt: str
+    source: str
+    dataset: str = ""
+
+
+class AnnotationCache:
+    """SQLite-backed key-value store for variant annotations."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        source_ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        not_found_ttls: Optional[Dict[str, float]] = None,
+        write_batch_size: int = 256,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            source_ttls: Seconds to keep entries per source (merged over
+                DEFAULT_SOURCE_TTLS)
+            default_ttl: TTL for sources not listed
+            not_found_ttls: Seconds to keep NOT_FOUND entries per source
+                (merged over DEFAULT_NOT_FOUND_TTLS; unlisted sources use
+                their normal TTL)
+            write_batch_size: Buffered writes committed per transaction
+            timeout: Seconds to wait on a lock held by another process
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.source_ttls: Dict[str, float] = {
+            **DEFAULT_SOURCE_TTLS,
+            **(source_ttls or {}),
+        }
+        self.default_ttl = default_ttl
+        self.not_found_ttls: Dict[str, float] = {
+            **DEFAULT_NOT_FOUND_TTLS,
+            **(not_found_ttls or {}),
+        }
+        self.write_batch_size = write_batch_size
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._pending: Dict[AnnotationKey, Tuple[bytes, float]] = {}
+        self._pending_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.executescript(_SCHEMA)
+        logger.info(f"Annotation cache: {self.path}")
+
+    # ---- connections ----
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.path), timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+            self._local.conn = conn
+            with self._pending_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Flush pending writes and close all connections."""
+        self.flush()
+        with self._pending_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass  # owned by another thread that already exited
+        self._local = threading.local()
+
+    def __enter__(self) -> "AnnotationCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # ---- reads ----
+
+    def get_many(self, keys: Iterable[AnnotationKey]) -> Dict[AnnotationKey, Any]:
+        """Fresh values for the keys present (pending writes included)."""
+        now = time.time()
+        found: Dict[AnnotationKey, Any] = {}
+        groups: Dict[Tuple[str, str, str], List[AnnotationKey]] = {}
+        with self._pending_lock:
+            for key in keys:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    found[key] = pickle.loads(pending[0])
+                else:
+                    group = (key.build, key.source, key.dataset)
+                    groups.setdefault(group, []).append(key)
+
+        conn = self._connection()
+        for (build, source, dataset), group in groups.items():
+            for start in range(0, len(group), READ_CHUNK):
+                chunk = group[start : start + READ_CHUNK]
+                rows = ",".join(["(?,?,?,?)"] * len(chunk))
+                params: List[Any] = [build, source, dataset, now]
+                for key in chunk:
+                    params.extend((key.chrom, int(key.pos), key.ref, key.alt))
+                cursor = conn.execute(
+                    "SELECT chrom, pos, ref, alt, value FROM annotations "
+                    "WHERE build=? AND source=? AND dataset=? AND expires>? "
+                    f"AND (chrom, pos, ref, alt) IN (VALUES {rows})",
+                    params,
+                )
+                for chrom, pos, ref, alt, value in cursor:
+                    key = AnnotationKey(build, chrom, pos, ref, alt, source, dataset)
+                    found[key] = pickle.loads(value)
+        return found
+
+    # ---- writes ----
+
+    def put_many(
+        self, items: Dict[AnnotationKey, Any], ttl: Optional[float] = None
+    ) -> None:
+        """Buffer values; committed once write_batch_size entries are pending."""
+        now = time.time()
+        with self._pending_lock:
+            for key, value in items.items():
+                lifetime = ttl if ttl is not None else self.ttl_for(key.source, value)
+                self._pending[key] = (
+                    pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                    now + lifetime,
+                )
+            full = len(self._pending) >= self.write_batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Commit pending writes in one transaction; returns rows written."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        now = time.time()
+        rows = [
+            (*key, value, now, expires) for key, (value, expires) in pending.items()
+        ]
+        conn = self._connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR REPLACE INTO annotations (build, chrom, pos, ref, alt, "
+                "source, dataset, value, created, expires) "
+                "VALUES (?,?,?,?,?,?,?,?,?,?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            with self._pending_lock:
+                # Keep newer values buffered since the failed flush
+                self._pending = {**pending, **self._pending}
+            raise
+        logger.debug(f"Annotation cache: committed {len(rows)} entries")
+        return len(rows)
+
+    def delete(self, keys: Iterable[AnnotationKey]) -> None:
+        keys = list(keys)
+        with self._pending_lock:
+            for key in keys:
+                self._pending.pop(key, None)
+        self._connection().executemany(
+            "DELETE FROM annotations WHERE build=? AND chrom=? AND pos=? AND ref=? "
+            "AND alt=? AND source=? AND dataset=?",
+            keys,
+        )
+
+    def clear(
+        self, source: Optional[str] = None, dataset: Optional[str] = None
+    ) -> None:
+        """Delete all entries, or those of one source (and dataset)."""
+
+        def matches(key: AnnotationKey) -> bool:
+            if source is None:
+                return True
+            return key.source == source and (dataset is None or key.dataset == dataset)
+
+        with self._pending_lock:
+            self._pending = {k: v for k, v in self._pending.items() if not matches(k)}
+        conn = self._connection()
+        if source is None:
+            conn.execute("DELETE FROM annotations")
+        elif dataset is None:
+            conn.execute("DELETE FROM annotations WHERE source=?", (source,))
+        else:
+            conn.execute(
+                "DELETE FROM annotations WHERE source=? AND dataset=?",
+                (source, dataset),
+            )
+
+    # ---- maintenance ----
+
+    def ttl_for(self, source: str, value: Any = None) -> float:
+        """Lifetime of value for source (NOT_FOUND has its own TTLs)."""
+        ttl = self.source_ttls.get(source, self.default_ttl)
+        if value is NOT_FOUND:
+            return self.not_found_ttls.get(source, ttl)
+        return ttl
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; returns rows removed."""
+        cursor = self._connection().execute(
+            "DELETE FROM annotations WHERE expires<=?", (time.time(),)
+        )
+        return cursor.rowcount
+
+    def vacuum(self) -> None:
+        """Purge expired rows, checkpoint the WAL and compact the file."""
+        self.flush()
+        removed = self.purge_expired()
+        conn = self._connection()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+        logger.info(f"Annotation cache vacuumed ({removed} expired entries)")
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry counts per source and file size."""
+        rows = self._connection().execute(
+            "SELECT source, dataset, COUNT(*), SUM(expires<=?) FROM annotations "
+            "GROUP BY source, dataset",
+            (time.time(),),
+        )
+        return {
+            "path": str(self.path),
+            "file_bytes": self.path.stat().st_size if self.path.exists() else 0,
+            "pending": len(self._pending),
+            "sources": {
+                f"{source}/{dataset}" if dataset else source: {
+                    "entries": count,
+                    "expired": expired or 0,
+                }
+                for source, dataset, count, expired in rows
+            },
+        }
+
+    # ---- client integration ----
+
+    def backend(
+        self, source: str, dataset: str = "", build: str = DEFAULT_BUILD
+    ) -> "AnnotationCacheBackend":
+        """CacheBackend view for one source (keys are 'chrom-pos-ref-alt')."""
+        return AnnotationCacheBackend(self, source, dataset, build)
+
+    def memory_cache(
+        self,
+        source: str,
+        dataset: str = "",
+        build: str = DEFAULT_BUILD,
+        max_entries: int = 1000,
+        ttl: Optional[float] = DAY,
+    ) -> LRUCache:
+        """In-memory LRUCache reading and writing through to this store."""
+        return LRUCache(
+            max_entries=max_entries,
+            ttl=ttl,
+            backend=self.backend(source, dataset, build),
+        )
+
+
+class AnnotationCacheBackend(CacheBackend):
+    """Adapts AnnotationCache to the LRUCache backend interface.
+
+    Keys are client variant ids 'chrom-pos-ref-alt', optionally prefixed by
+    'dataset|' to override the view's dataset. Keys that do not parse are
+    not persisted.
+    """
+
+    def __init__(
+        self, store: AnnotationCache, source: str, dataset: str, build: str
+    ) -> None:
+        self.store = store
+        self.source = source
+        self.dataset = dataset
+        self.build = build
+
+    def _key(self, key: str) -> Optional[AnnotationKey]:
+        dataset = self.dataset
+        if "|" in key:
+            dataset, key = key.split("|", 1)
+        parts = key.split("-", 3)
+        if len(parts) != 4 or not parts[1].isdigit():
+            return None
+        chrom, pos, ref, alt = parts
+        return AnnotationKey(
+            self.build, chrom, int(pos), ref, alt, self.source, dataset
+        )
+
+    def _keys(self, keys: Iterable[str]) -> Dict[AnnotationKey, str]:
+        parsed: Dict[AnnotationKey, str] = {}
+        for key in keys:
+            annotation_key = self._key(key)
+            if annotation_key is not None:
+                parsed[annotation_key] = key
+        return parsed
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        parsed = self._keys(keys)
+        if not parsed:
+            return {}
+        found = self.store.get_many(parsed)
+        return {parsed[k]: value for k, value in found.items()}
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        parsed = self._keys(items)
+        self.store.put_many({k: items[key] for k, key in parsed.items()}, ttl)
+
+    def delete(self, key: str) -> None:
+        annotation_key = self._key(key)
+        if annotation_key is not None:
+            self.store.delete([annotation_key])
+
+    def clear(self) -> None:
+        self.store.clear(self.source, self.dataset or None)
+
+    def flush(self) -> None:
+        self.store.flush()
@@ -0,0 +1,437 @@
+"""Request batching helpers for the remote annotation clients.
+
+- AsyncTokenBucket: asyncio rate limiter (steady rate with bursts)
+- AsyncBatcher: coalesces concurrent per-key lookups into bulk fetches,
+  sharing one in-flight future per key
+- RequestCoalescer: the same single-flight + micro-batching for blocking
+  callers on several threads (e.g. classifier workers sharing one client)
+- backoff_delay: jittered exponential backoff for retries
+- call_with_retries: run a blocking request in the executor, retrying
+  transient failures
+- iter_json_array: incremental parser for a streamed top-level JSON array
+- run_sync: run a coroutine from synchronous code (sync facades)
+
+HTTP itself stays on requests.Session (run in the default executor), so no
+async HTTP dependency is needed.
+
+Version: 6.5.0-dev
+"""
+
+import asyncio
+import codecs
+import concurrent.futures
+import json
+import logging
+import random
+import threading
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+T = TypeVar("T")
+
+# HTTP statuses worth retrying (rate limited / transient server errors)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket: `rate` tokens/second, at most `capacity` banked.
+
+    The balance outlives event loops and is shared across threads, so a
+    client whose sync facade runs a fresh loop per call is still limited
+    across calls. Only the lock that queues waiters belongs to a loop.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._state_lock = threading.Lock()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _take(self, tokens: float) -> float:
+        """Take tokens (returns 0.0) or return seconds until they are banked."""
+        with self._state_lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def _loop_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        with self._state_lock:
+            if self._lock is None or self._lock_loop is not loop:
+                self._lock = asyncio.Lock()
+                self._lock_loop = loop
+            return self._lock
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until tokens are available; returns seconds waited."""
+        waited = 0.0
+        async with self._loop_lock():
+            while True:
+                delay = self._take(tokens)
+                if delay == 0.0:
+                    return waited
+                waited += delay
+                await asyncio.sleep(delay)
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Full-jitter exponential backoff for retry `attempt` (0-based)."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+async def call_with_retries(
+    func: Callable[..., T],
+    *args: Any,
+    attempts: int = 3,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    bucket: Optional[AsyncTokenBucket] = None,
+    label: str = "request",
+) -> T:
+    """
+    Run blocking func(*args) in the default executor, retrying failures.
+
+    Each attempt first takes a token from bucket (if given); exceptions in
+    retry_on are retried after backoff_delay(), the last one is re-raised.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(attempts):
+        if bucket is not None:
+            await bucket.acquire()
+        try:
+            return await loop.run_in_executor(None, func, *args)
+        except retry_on as e:
+            if attempt >= attempts - 1:
+                raise
+            delay = backoff_delay(attempt)
+            logger.debug(f"{label} retry {attempt + 1}/{attempts} in {delay:.2f}s: {e}")
+            await asyncio.sleep(delay)
+    raise ValueError("attempts must be >= 1")
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array as the bytes arrive.
+
+    Elements are decoded one at a time, so a large response is never held
+    as one parsed document. Elements must be objects, arrays or strings
+    (a bare number split across chunks could be cut short).
+
+    Raises:
+        ValueError: If the stream is not a JSON array or is truncated
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    started = False
+    for chunk in chunks:
+        buffer += utf8.decode(chunk)
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                element, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # incomplete element; wait for more data
+            yield element
+        buffer = buffer[pos:]
+    raise ValueError("Truncated JSON array")
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run(), or a helper thread when this thread already runs an
+    event loop (e.g. notebooks).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
+class AsyncBatcher(Generic[K, V]):
+    """
+    Coalesces concurrent lookups into bulk fetches.
+
+    get(key) joins the pending batch; a batch is dispatched when it reaches
+    max_batch_size or max_wait seconds after its first key. Requests for a
+    key that is already pending or in flight share its future, and at most
+    max_concurrency fetches run at once. Must be used from a single event
+    loop.
+    """
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size: int = 100,
+        max_wait: float = 0.01,
+        max_concurrency: int = 4,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.fetch_batch = fetch_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._pending: List[K] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: "set[asyncio.Task[None]]" = set()
+        self.stats: Dict[str, int] = {
+            "lookups": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "keys_fetched": 0,
+        }
+
+    async def get(self, key: K) -> Optional[V]:
+        """Result for key (None when the fetch returned nothing for it)."""
+        self.stats["lookups"] += 1
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[key] = future
+        self._pending.append(key)
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._dispatch)
+        return await asyncio.shield(future)
+
+    async def get_many(self, keys: Iterable[K], failed: Any = None) -> List[Any]:
+        """Results aligned to keys; failed fetches yield `failed` (logged)."""
+        results = await asyncio.gather(
+            *(self.get(key) for key in keys), return_exceptions=True
+        )
+        return [failed if isinstance(r, BaseException) else r for r in results]
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size :]
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[K]) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            async with self._semaphore:
+                self.stats["batches"] += 1
+                self.stats["keys_fetched"] += len(batch)
+                results = await self.fetch_batch(batch)
+        except Exception as e:
+            logger.error(f"Batch fetch of {len(batch)} keys failed: {e}")
+            for key in batch:
+                future = self._inflight.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+        for key in batch:
+            future = self._inflight.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(results.get(key))
+
+
+class RequestCoalescer(Generic[K, V]):
+    """
+    Thread-safe single-flight and micro-batching for a blocking bulk fetch.
+
+    Threads calling get()/get_many() for a key that is already queued or in
+    flight wait on its existing future instead of issuing a request.
+    Distinct keys are queued for up to max_wait seconds (or until
+    max_batch_size are queued) and fetched together with one
+    fetch_batch(keys) call on a pool of max_concurrency worker threads.
+    fetch_batch returns {key: value}; keys it omits resolve to None.
+    """
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[List[K]], Dict[K, V]],
+        max_batch_size: int = 100,
+        max_wait: float = 0.005,
+        max_concurrency: int = 4,
+        name: str = "coalescer",
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.fetch_batch = fetch_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.name = name
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix=name
+        )
+        self._lock = threading.Lock()
+        self._inflight: Dict[K, "concurrent.futures.Future[Optional[V]]"] = {}
+        # (key, monotonic time queued)
+        self._pending: List[Tuple[K, float]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lookups = 0
+        self._coalesced = 0
+        self._batches = 0
+        self._keys_fetched = 0
+        self._queue_seconds = 0.0
+        self._queue_seconds_max = 0.0
+
+    def get(self, key: K) -> Optional[V]:
+        """Value for key; re-raises the exception if its batch fetch failed."""
+        return self._submit([key])[0].result()
+
+    def get_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """Values aligned to keys; failed fetches yield None (logged)."""
+        results: List[Optional[V]] = []
+        for future in self._submit(keys):
+            try:
+                results.append(future.result())
+            except Exception:
+                results.append(None)
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lookup/batch counters, coalesced-request ratio, queueing latency."""
+        with self._lock:
+            lookups = self._lookups
+            return {
+                "lookups": lookups,
+                "coalesced": self._coalesced,
+                "coalesced_ratio": (
+                    round(self._coalesced / lookups, 4) if lookups else 0.0
+                ),
+                "batches": self._batches,
+                "keys_fetched": self._keys_fetched,
+                "mean_batch_size": (
+                    round(self._keys_fetched / self._batches, 2)
+                    if self._batches
+                    else 0.0
+                ),
+                "queue_latency_ms_mean": (
+                    round(1000 * self._queue_seconds / self._keys_fetched, 3)
+                    if self._keys_fetched
+                    else 0.0
+                ),
+                "queue_latency_ms_max": round(1000 * self._queue_seconds_max, 3),
+            }
+
+    def shutdown(self) -> None:
+        """Fetch anything still queued and stop the worker threads."""
+        self._flush()
+        self._executor.shutdown(wait=True)
+
+    def _submit(
+        self, keys: Iterable[K]
+    ) -> List["concurrent.futures.Future[Optional[V]]"]:
+        futures = []
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                self._lookups += 1
+                future = self._inflight.get(key)
+                if future is not None:
+                    self._coalesced += 1
+                else:
+                    future = concurrent.futures.Future()
+                    self._inflight[key] = future
+                    self._pending.append((key, now))
+                    if len(self._pending) >= self.max_batch_size:
+                        self._dispatch_locked(self.max_batch_size)
+                futures.append(future)
+            if self._pending and self._timer is None:
+                self._timer = threading.Timer(self.max_wait, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return futures
+
+    def _flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            while self._pending:
+                self._dispatch_locked(self.max_batch_size)
+
+    def _dispatch_locked(self, size: int) -> None:
+        batch, self._pending = self._pending[:size], self._pending[size:]
+        self._executor.submit(self._run, batch)
+
+    def _run(self, batch: List[Tuple[K, float]]) -> None:
+        started = time.monotonic()
+        keys = [key for key, _ in batch]
+        waits = [started - queued for _, queued in batch]
+        with self._lock:
+            self._batches += 1
+            self._keys_fetched += len(keys)
+            self._queue_seconds += sum(waits)
+            self._queue_seconds_max = max(self._queue_seconds_max, *waits)
+
+        try:
+            results = self.fetch_batch(keys)
+            error: Optional[BaseException] = None
+        except Exception as e:
+            logger.error(f"{self.name}: batch fetch of {len(keys)} keys failed: {e}")
+            results, error = {}, e
+
+        # Retire the keys before resolving them so later lookups refetch
+        with self._lock:
+            futures = [self._inflight.pop(key) for key in keys]
+        for key, future in zip(keys, futures):
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(results.get(key))
@@ -0,0 +1,264 @@
+"""Shared in-memory cache for remote annotation clients.
+
+Thread-safe LRU cache with per-entry TTL, bounded by entry count and
+(approximate) bytes, used by GnomadClient and DbNSFPClient. Lookups,
+inserts and evictions are O(1) (OrderedDict move_to_end/popitem under a
+single lock). An optional CacheBackend (e.g. an on-disk store) is consulted
+on memory misses and written through on inserts, so entries survive the
+process. Clients cache NOT_FOUND for variants the remote service does not
+have, so those are not queried again either.
+
+Version: 6.5.0-dev
+"""
+
+import logging
+import sys
+from abc import ABC, abstractmethod
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class _NotFound:
+    """Type of NOT_FOUND (pickles by reference, so it survives backends)."""
+
+    def __reduce__(self) -> str:
+        return "NOT_FOUND"
+
+    def __repr__(self) -> str:
+        return "NOT_FOUND"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+# Cached for lookups the remote service answered with "no such variant";
+# clients translate it back to None on read
+NOT_FOUND = _NotFound()
+
+
+class CacheBackend(ABC):
+    """Second-level store behind LRUCache (interface).
+
+    Implementations must be safe to call from several threads; values are
+    whatever the owning client caches (dataclasses of plain fields).
+    """
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return fresh values for the keys that are present."""
+
+    @abstractmethod
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store values (ttl in seconds, None for the backend default)."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    def flush(self) -> None:
+        """Persist any buffered writes (no-op for unbuffered backends)."""
+
+
+@dataclass
+class CacheStats:
+    """Counters for one LRUCache."""
+
+    hits: int = 0
+    misses: int = 0
+    backend_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def approximate_size(value: Any) -> int:
+    """Shallow size of value plus its attribute values, in bytes."""
+    size = sys.getsizeof(value)
+    fields = getattr(value, "__dict__", None)
+    if fields:
+        size += sum(sys.getsizeof(v) for v in fields.values())
+    return size
+
+
+class LRUCache:
+    """Bounded, thread-safe LRU cache with TTL expiry."""
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl: Optional[float] = 86400.0,
+        max_bytes: Optional[int] = None,
+        backend: Optional[CacheBackend] = None,
+        sizeof: Callable[[Any], int] = approximate_size,
+    ) -> None:
+        """
+        Args:
+            max_entries: Maximum number of in-memory entries
+            ttl: Default time-to-live in seconds (None = no expiry)
+            max_bytes: Optional bound on approximate in-memory size
+            backend: Optional second-level store (read-through/write-through)
+            sizeof: Size estimate used for the byte bound
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries: int = max_entries
+        self.ttl: Optional[float] = ttl
+        self.max_bytes: Optional[int] = max_bytes
+        self.backend: Optional[CacheBackend] = backend
+        self._sizeof = sizeof
+        # key -> (value, expires_at or None, size)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float], int]]" = (
+            OrderedDict()
+        )
+        self._bytes: int = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        """Value for key (refreshing its recency), or default."""
+        with self._lock:
+            value = self._get_locked(key, count)
+        if value is not _MISSING:
+            return value
+        if self.backend is not None and isinstance(key, str):
+            found = self.backend.get_many([key])
+            if key in found:
+                with self._lock:
+                    self.stats.backend_hits += 1
+                self._store(key, found[key], self.ttl)
+                return found[key]
+        return default
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Values for the keys that are cached; one backend call for misses."""
+        found: Dict[Hashable, Any] = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                value = self._get_locked(key, count=True)
+                if value is _MISSING:
+                    missing.append(key)
+                else:
+                    found[key] = value
+        if missing and self.backend is not None:
+            from_backend = self.backend.get_many(
+                [k for k in missing if isinstance(k, str)]
+            )
+            with self._lock:
+                self.stats.backend_hits += len(from_backend)
+            for key, value in from_backend.items():
+                self._store(key, value, self.ttl)
+            found.update(from_backend)
+        return found
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Insert or replace key (ttl overrides the cache default).
+
+        The backend receives ttl as given, so None means its own default
+        lifetime rather than the in-memory one.
+        """
+        self._store(key, value, self.ttl if ttl is None else ttl)
+        if self.backend is not None and isinstance(key, str):
+            self.backend.set_many({key: value}, ttl)
+
+    def set_many(self, items: Dict[Hashable, Any], ttl: Optional[float] = None) -> None:
+        """Insert several entries; the backend receives one batched write."""
+        for key, value in items.items():
+            self._store(key, value, self.ttl if ttl is None else ttl)
+        if self.backend is not None and items:
+            self.backend.set_many(
+                {k: v for k, v in items.items() if isinstance(k, str)}, ttl
+            )
+
+    def flush(self) -> None:
+        """Persist buffered backend writes."""
+        if self.backend is not None:
+            self.backend.flush()
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove_locked(key)
+        if self.backend is not None and isinstance(key, str):
+            self.backend.delete(key)
+
+    def clear(self, backend: bool = True) -> None:
+        """Drop all in-memory entries (and the backend's unless backend=False)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if backend and self.backend is not None:
+            self.backend.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters and current size."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "backend_hits": self.stats.backend_hits,
+            "evictions": self.stats.evictions,
+            "expirations": self.stats.expirations,
+            "hit_rate": round(self.stats.hit_rate, 4),
+        }
+
+    # ---- internals (callers hold self._lock where noted) ----
+
+    def _get_locked(self, key: Hashable, count: bool) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at, _ = entry
+            if expires_at is None or time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                if count:
+                    self.stats.hits += 1
+                return value
+            self._remove_locked(key)
+            self.stats.expirations += 1
+        if count:
+            self.stats.misses += 1
+        return _MISSING
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        size = self._sizeof(value)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._remove_locked(key)
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None
+                and self._bytes > self.max_bytes
+                and len(self._entries) > 1
+            ):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.stats.evictions += 1
+
+    def _remove_locked(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
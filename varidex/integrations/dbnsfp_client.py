@@ -27,15 +27,22 @@ Reference:
 """
 
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import requests
 
+from varidex.integrations.batching import RequestCoalescer
+from varidex.integrations.cache import NOT_FOUND, LRUCache
+
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Batch results for variants whose request failed (never cached)
+_FAILED = object()
+
 
 @dataclass
 class PredictionScore:
@@ -172,6 +179,77 @@ class PredictionScore:
         )
 
 
+def parse_vep_response(
+    data: List[Dict[str, Any]], variant_id: str
+) -> Optional[PredictionScore]:
+    """Parse VEP API response and extract predictions.
+
+    Note: Not all algorithms may be available in VEP response.
+    This is normal - VEP may not have scores for all variants/algorithms.
+    Missing scores are handled gracefully.
+    """
+    try:
+        if not data:
+            return None
+
+        # VEP returns list, usually one entry per variant
+        variant_data: Dict[str, Any] = data[0] if isinstance(data, list) else data
+
+        # Extract transcript consequences
+        consequences: List[Dict[str, Any]] = variant_data.get(
+            "transcript_consequences", []
+        )
+        if not consequences:
+            logger.debug(f"No transcript consequences for {variant_id}")
+            return None
+
+        # Use first transcript (or most severe)
+        transcript: Dict[str, Any] = consequences[0]
+
+        prediction: PredictionScore = PredictionScore(
+            variant_id=variant_id,
+            consequence=transcript.get("consequence_terms", [""])[0],
+            source="VEP",
+        )
+
+        # Extract SIFT
+        if "sift_score" in transcript:
+            prediction.sift_score = float(transcript["sift_score"])
+        if "sift_prediction" in transcript:
+            prediction.sift_prediction = transcript["sift_prediction"]
+
+        # Extract PolyPhen
+        if "polyphen_score" in transcript:
+            prediction.polyphen_score = float(transcript["polyphen_score"])
+        if "polyphen_prediction" in transcript:
+            prediction.polyphen_prediction = transcript["polyphen_prediction"]
+
+        # Extract CADD (if available in VEP plugins)
+        if "cadd_phred" in transcript:
+            prediction.cadd_phred = float(transcript["cadd_phred"])
+        if "cadd_raw" in transcript:
+            prediction.cadd_raw = float(transcript["cadd_raw"])
+
+        # Extract REVEL (if available)
+        if "revel" in transcript:
+            prediction.revel_score = float(transcript["revel"])
+
+        # Log available algorithms
+        available: List[str] = prediction.get_available_algorithms()
+        logger.info(f"Parsed predictions for {variant_id}: {prediction.summary()}")
+        if len(available) < 3:
+            logger.warning(
+                f"Limited algorithm coverage for {variant_id}: "
+                f"only {', '.join(available)} available"
+            )
+
+        return prediction
+
+    except Exception as e:
+        logger.error(f"Failed to parse VEP response for {variant_id}: {e}")
+        return None
+
+
 class DbNSFPClient:
     """Client for accessing dbNSFP/VEP computational predictions.
 
@@ -184,7 +262,7 @@ class DbNSFPClient:
     Rate Limiting:
       Ensembl VEP has rate limits (15 requests/second for REST API).
       For bulk processing, consider:
-        - Using batch endpoints (future enhancement)
+        - Using batch endpoints (get_predictions_batch, AsyncVEPClient)
         - Local VEP installation
         - Pre-caching predictions
         - Increasing cache TTL
@@ -193,6 +271,7 @@ class DbNSFPClient:
     DEFAULT_VEP_URL: str = "https://rest.ensembl.org"
     DEFAULT_TIMEOUT: int = 30
     DEFAULT_CACHE_TTL: int = 86400  # 24 hours
+    DEFAULT_CACHE_SIZE: int = 10000
 
     def __init__(
         self,
@@ -202,6 +281,12 @@ class DbNSFPClient:
         cache_ttl: int = DEFAULT_CACHE_TTL,
         rate_limit: bool = True,
         max_requests_per_second: int = 15,  # VEP limit
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache: Optional[LRUCache] = None,
+        use_batch_api: bool = True,
+        batch_size: int = 200,
+        max_concurrency: int = 4,
+        coalesce_window: Optional[float] = None,
     ) -> None:
         """Initialize dbNSFP/VEP client.
 
@@ -212,6 +297,17 @@ class DbNSFPClient:
             cache_ttl: Cache time-to-live in seconds
             rate_limit: Enable rate limiting
             max_requests_per_second: Max requests per second
+            cache_size: Maximum number of cached predictions
+            cache: Pre-built LRUCache (e.g. with an on-disk backend); overrides
+                cache_size and cache_ttl
+            use_batch_api: get_predictions_batch() POSTs batches through
+                AsyncVEPClient instead of one GET per variant
+            batch_size: Variants per VEP POST (max 200)
+            max_concurrency: Concurrent VEP POST requests
+            coalesce_window: Seconds to hold lookups for a RequestCoalescer
+                shared by all threads using this client (None disables);
+                identical concurrent lookups share one request and distinct
+                ones within the window are fetched together
 
         Raises:
             Warning: If offline (no internet connectivity)
@@ -221,16 +317,38 @@ class DbNSFPClient:
         self.enable_cache: bool = enable_cache
         self.cache_ttl: timedelta = timedelta(seconds=cache_ttl)
 
-        # Cache: variant_id -> (PredictionScore, timestamp)
-        self._cache: Dict[str, Tuple[PredictionScore, datetime]] = {}
+        # Cache: variant_id -> PredictionScore
+        if cache is None:
+            cache = LRUCache(max_entries=cache_size, ttl=float(cache_ttl))
+        self._cache: LRUCache = cache
 
         # Rate limiting
         self.rate_limit: bool = rate_limit
         self.min_interval: float = 0.0
         self.last_request_time: float = 0.0
+        self.max_requests_per_second: int = max_requests_per_second
         if rate_limit:
             self.min_interval = 1.0 / max_requests_per_second
 
+        # Batched lookups (AsyncVEPClient, created on first use)
+        self.use_batch_api: bool = use_batch_api
+        self.batch_size: int = batch_size
+        self.max_concurrency: int = max_concurrency
+        self._batch_clients: Dict[str, Any] = {}
+        self._batch_lock = threading.Lock()
+
+        # key: (species, chromosome, position, ref, alt)
+        self._coalescer: Optional[RequestCoalescer] = None
+        if coalesce_window is not None:
+            self._coalescer = RequestCoalescer(
+                self._fetch_coalesced,
+                max_batch_size=batch_size * max_concurrency,
+                max_wait=coalesce_window,
+                # The batch API parallelises inside one call
+                max_concurrency=1 if use_batch_api else max_concurrency,
+                name="vep",
+            )
+
         # Session for connection pooling
         self.session: requests.Session = requests.Session()
         self.session.headers.update(
@@ -258,27 +376,16 @@ class DbNSFPClient:
 
         self.last_request_time = time.time()
 
-    def _get_from_cache(self, variant_id: str) -> Optional[PredictionScore]:
-        """Retrieve prediction from cache if available and fresh."""
-        if not self.enable_cache or variant_id not in self._cache:
+    def _get_from_cache(self, variant_id: str) -> Any:
+        """Cached prediction (or NOT_FOUND) if available and fresh."""
+        if not self.enable_cache:
             return None
+        return self._cache.get(variant_id)
 
-        prediction, timestamp = self._cache[variant_id]
-        age: timedelta = datetime.now() - timestamp
-
-        if age < self.cache_ttl:
-            logger.debug(f"Cache hit: {variant_id} (age: {age.seconds}s)")
-            return prediction
-        else:
-            logger.debug(f"Cache expired: {variant_id} (age: {age.seconds}s)")
-            del self._cache[variant_id]
-            return None
-
-    def _add_to_cache(self, variant_id: str, prediction: PredictionScore) -> None:
-        """Add prediction to cache."""
+    def _add_to_cache(self, variant_id: str, prediction: Any) -> None:
+        """Add a prediction or NOT_FOUND to the cache."""
         if self.enable_cache:
-            self._cache[variant_id] = (prediction, datetime.now())
-            logger.debug(f"Cached: {variant_id}")
+            self._cache.set(variant_id, prediction)
 
     def clear_cache(self) -> None:
         """Clear all cached predictions."""
@@ -288,72 +395,8 @@ class DbNSFPClient:
     def _parse_vep_response(
         self, data: List[Dict[str, Any]], variant_id: str
     ) -> Optional[PredictionScore]:
-        """Parse VEP API response and extract predictions.
-
-        Note: Not all algorithms may be available in VEP response.
-        This is normal - VEP may not have scores for all variants/algorithms.
-        Missing scores are handled gracefully.
-        """
-        try:
-            if not data:
-                return None
-
-            # VEP returns list, usually one entry per variant
-            variant_data: Dict[str, Any] = data[0] if isinstance(data, list) else data
-
-            # Extract transcript consequences
-            consequences: List[Dict[str, Any]] = variant_data.get(
-                "transcript_consequences", []
-            )
-            if not consequences:
-                logger.debug(f"No transcript consequences for {variant_id}")
-                return None
-
-            # Use first transcript (or most severe)
-            transcript: Dict[str, Any] = consequences[0]
-
-            prediction: PredictionScore = PredictionScore(
-                variant_id=variant_id,
-                consequence=transcript.get("consequence_terms", [""])[0],
-                source="VEP",
-            )
-
-            # Extract SIFT
-            if "sift_score" in transcript:
-                prediction.sift_score = float(transcript["sift_score"])
-            if "sift_prediction" in transcript:
-                prediction.sift_prediction = transcript["sift_prediction"]
-
-            # Extract PolyPhen
-            if "polyphen_score" in transcript:
-                prediction.polyphen_score = float(transcript["polyphen_score"])
-            if "polyphen_prediction" in transcript:
-                prediction.polyphen_prediction = transcript["polyphen_prediction"]
-
-            # Extract CADD (if available in VEP plugins)
-            if "cadd_phred" in transcript:
-                prediction.cadd_phred = float(transcript["cadd_phred"])
-            if "cadd_raw" in transcript:
-                prediction.cadd_raw = float(transcript["cadd_raw"])
-
-            # Extract REVEL (if available)
-            if "revel" in transcript:
-                prediction.revel_score = float(transcript["revel"])
-
-            # Log available algorithms
-            available: List[str] = prediction.get_available_algorithms()
-            logger.info(f"Parsed predictions for {variant_id}: {prediction.summary()}")
-            if len(available) < 3:
-                logger.warning(
-                    f"Limited algorithm coverage for {variant_id}: "
-                    f"only {', '.join(available)} available"
-                )
-
-            return prediction
-
-        except Exception as e:
-            logger.error(f"Failed to parse VEP response for {variant_id}: {e}")
-            return None
+        """Parse VEP API response and extract predictions."""
+        return parse_vep_response(data, variant_id)
 
     def get_predictions(
         self, chromosome: str, position: int, ref: str, alt: str, species: str = "human"
@@ -377,10 +420,25 @@ class DbNSFPClient:
         variant_id: str = f"{chromosome}-{position}-{ref}-{alt}"
 
         # Check cache
-        cached: Optional[PredictionScore] = self._get_from_cache(variant_id)
+        cached = self._get_from_cache(variant_id)
+        if cached is NOT_FOUND:
+            return None
         if cached is not None:
             return cached
 
+        if self._coalescer is not None:
+            try:
+                return self._coalescer.get((species, chromosome, position, ref, alt))
+            except Exception as e:
+                logger.error(f"VEP request failed for {variant_id}: {e}")
+                return None
+        return self._query_predictions(chromosome, position, ref, alt, species)
+
+    def _query_predictions(
+        self, chromosome: str, position: int, ref: str, alt: str, species: str
+    ) -> Optional[PredictionScore]:
+        """Single-variant VEP GET (cached unless it fails, None on error)."""
+        variant_id: str = f"{chromosome}-{position}-{ref}-{alt}"
         try:
             # Rate limit
             self._wait_if_needed()
@@ -408,6 +466,7 @@ class DbNSFPClient:
 
             if prediction is None:
                 logger.warning(f"No predictions found for {variant_id}")
+                self._add_to_cache(variant_id, NOT_FOUND)
                 return None
 
             # Cache result
@@ -433,6 +492,122 @@ class DbNSFPClient:
             logger.error(f"Unexpected error getting predictions for {variant_id}: {e}")
             return None
 
+    def get_predictions_batch(
+        self, variants: Sequence[Tuple[str, int, str, str]], species: str = "human"
+    ) -> List[Optional[PredictionScore]]:
+        """Get computational predictions for many variants.
+
+        Duplicate variants are looked up once and cached ones are served
+        locally; the rest are fetched with batched VEP POSTs (AsyncVEPClient)
+        unless use_batch_api is False. Results are aligned to the input order.
+
+        Args:
+            variants: (chromosome, position, ref, alt) tuples
+            species: Species (default: 'human')
+
+        Returns:
+            List of PredictionScore (None where not found/error)
+        """
+        ids: List[str] = [
+            f"{chrom}-{pos}-{ref}-{alt}" for chrom, pos, ref, alt in variants
+        ]
+        cached: Dict[str, Any] = {}
+        if self.enable_cache:
+            # One bulk read (memory, then backend) instead of one per variant
+            cached = self._cache.get_many(set(ids))
+
+        resolved: Dict[str, Optional[PredictionScore]] = {}
+        misses: Dict[str, Tuple[str, int, str, str]] = {}
+        for variant_id, variant in zip(ids, variants):
+            if variant_id in cached:
+                value = cached[variant_id]
+                resolved[variant_id] = None if value is NOT_FOUND else value
+            else:
+                misses.setdefault(variant_id, variant)
+
+        if misses and self._coalescer is not None:
+            keys = [(species, *variant) for variant in misses.values()]
+            resolved.update(zip(misses, self._coalescer.get_many(keys)))
+        elif misses and self.use_batch_api:
+            resolved.update(self._fetch_batch(misses, species))
+        else:
+            for variant_id, (chrom, pos, ref, alt) in misses.items():
+                resolved[variant_id] = self.get_predictions(
+                    chrom, pos, ref, alt, species=species
+                )
+
+        if self.enable_cache:
+            self._cache.flush()
+
+        logger.info(f"VEP batch: {len(ids)} variants, {len(resolved)} unique lookups")
+        return [resolved[variant_id] for variant_id in ids]
+
+    def _fetch_batch(
+        self, misses: Dict[str, Tuple[str, int, str, str]], species: str
+    ) -> Dict[str, Optional[PredictionScore]]:
+        """Look up uncached variants with batched VEP POSTs."""
+        with self._batch_lock:  # one event loop at a time per batch client
+            return self._fetch_batch_locked(misses, species)
+
+    def _fetch_batch_locked(
+        self, misses: Dict[str, Tuple[str, int, str, str]], species: str
+    ) -> Dict[str, Optional[PredictionScore]]:
+        from varidex.integrations.vep_async import AsyncVEPClient
+
+        client = self._batch_clients.get(species)
+        if client is None:
+            client = AsyncVEPClient(
+                vep_url=self.vep_url,
+                species=species,
+                batch_size=self.batch_size,
+                max_concurrency=self.max_concurrency,
+                requests_per_second=(
+                    self.max_requests_per_second if self.rate_limit else None
+                ),
+                timeout=self.timeout,
+                session=self.session,
+            )
+            self._batch_clients[species] = client
+
+        predictions = client.get_predictions_many_sync(
+            list(misses.values()), failed=_FAILED
+        )
+        fetched: Dict[str, Optional[PredictionScore]] = {}
+        for variant_id, prediction in zip(misses, predictions):
+            if prediction is _FAILED:  # not cached, retried on the next call
+                fetched[variant_id] = None
+                continue
+            self._add_to_cache(
+                variant_id, NOT_FOUND if prediction is None else prediction
+            )
+            fetched[variant_id] = prediction
+        return fetched
+
+    def _fetch_coalesced(
+        self, keys: List[Tuple[str, str, int, str, str]]
+    ) -> Dict[Tuple[str, str, int, str, str], Optional[PredictionScore]]:
+        """RequestCoalescer fetch: one bulk lookup per species."""
+        by_species: Dict[str, Dict[str, Tuple[str, str, int, str, str]]] = {}
+        for key in keys:
+            species, chrom, pos, ref, alt = key
+            by_species.setdefault(species, {})[f"{chrom}-{pos}-{ref}-{alt}"] = key
+
+        results: Dict[Tuple[str, str, int, str, str], Optional[PredictionScore]] = {}
+        for species, group in by_species.items():
+            if self.use_batch_api:
+                fetched = self._fetch_batch(
+                    {vid: key[1:] for vid, key in group.items()}, species
+                )
+            else:
+                fetched = {
+                    vid: self._query_predictions(*key[1:], species)
+                    for vid, key in group.items()
+                }
+            results.update((group[vid], score) for vid, score in fetched.items())
+        if self.enable_cache:
+            self._cache.flush()
+        return results
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get client statistics.
 
@@ -442,6 +617,8 @@ class DbNSFPClient:
         return {
             "cache_enabled": self.enable_cache,
             "cache_size": len(self._cache),
+            "cache": self._cache.get_stats(),
+            "coalescing": self._coalescer.get_stats() if self._coalescer else None,
             "cache_ttl_seconds": self.cache_ttl.seconds,
             "rate_limit_enabled": self.rate_limit,
             "vep_url": self.vep_url,
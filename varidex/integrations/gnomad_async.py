@@ -0,0 +1,226 @@
+"""Async batched client for gnomAD allele frequencies.
+
+Concurrent lookups are coalesced (AsyncBatcher) into a single GraphQL
+document with one aliased `variant` field per variant:
+
+    { v0: variant(dataset: "gnomad_r4", variantId: "17-43094692-G-A") {...}
+      v1: variant(...) {...} }
+
+Requests are rate limited by a token bucket, at most max_concurrency are in
+flight, failures are retried with jittered backoff, and each alias is parsed
+into a GnomadVariantFrequency. Aliases that gnomAD cannot resolve come back
+as null with a path-scoped error and map to None (not found).
+
+GnomadClient.get_variant_frequencies() uses this through the sync facade
+(get_frequencies_sync).
+
+Version: 6.5.0-dev
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import requests
+
+from varidex.integrations.batching import (
+    RETRYABLE_STATUS,
+    AsyncBatcher,
+    AsyncTokenBucket,
+    call_with_retries,
+    run_sync,
+)
+from varidex.integrations.gnomad_client import (
+    GnomadVariantFrequency,
+    normalize_chromosome,
+    parse_variant_data,
+)
+
+logger = logging.getLogger(__name__)
+
+# (dataset, variant_id)
+VariantKey = Tuple[str, str]
+
+VARIANT_SELECTION = """{
+    variantId
+    genome { ac an af filters populations { id ac an af } }
+    exome { ac an af filters populations { id ac an af } }
+  }"""
+
+
+class GnomadRequestError(Exception):
+    """gnomAD batch request failed after all retries."""
+
+
+def build_batch_query(keys: Sequence[VariantKey]) -> str:
+    """GraphQL document with alias v{i} for keys[i]."""
+    fields = [
+        f"  v{i}: variant(dataset: {json.dumps(dataset)}, "
+        f"variantId: {json.dumps(variant_id)}) {VARIANT_SELECTION}"
+        for i, (dataset, variant_id) in enumerate(keys)
+    ]
+    return "{\n" + "\n".join(fields) + "\n}"
+
+
+def parse_batch_response(
+    data: Dict[str, Any], keys: Sequence[VariantKey]
+) -> Dict[VariantKey, Optional[GnomadVariantFrequency]]:
+    """Map each key to its parsed alias (None when null or missing)."""
+    payload = data.get("data") or {}
+    return {
+        key: parse_variant_data(payload.get(f"v{i}"), key[1])
+        for i, key in enumerate(keys)
+    }
+
+
+class AsyncGnomadClient:
+    """Asyncio gnomAD client that batches concurrent lookups."""
+
+    DEFAULT_API_URL: str = "https://gnomad.broadinstitute.org/api"
+    MAX_BATCH_SIZE: int = 100  # keeps each document under the API cost limit
+
+    def __init__(
+        self,
+        api_url: str = DEFAULT_API_URL,
+        batch_size: int = 50,
+        max_concurrency: int = 4,
+        requests_per_second: Optional[float] = 100 / 60,
+        burst: Optional[float] = None,
+        retry_attempts: int = 3,
+        timeout: int = 60,
+        batch_window: float = 0.01,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        """
+        Args:
+            api_url: gnomAD GraphQL endpoint
+            batch_size: Variants per document (capped at MAX_BATCH_SIZE)
+            max_concurrency: Concurrent POST requests
+            requests_per_second: Token bucket rate (None disables limiting)
+            burst: Token bucket capacity (defaults to one second of requests)
+            retry_attempts: Attempts per batch (429/5xx and network errors)
+            timeout: Request timeout in seconds
+            batch_window: Seconds to wait for more lookups before sending
+            session: Shared requests.Session (one is created if omitted)
+        """
+        self.api_url = api_url
+        self.batch_size = max(1, min(batch_size, self.MAX_BATCH_SIZE))
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.retry_attempts = retry_attempts
+        self.timeout = timeout
+        self.batch_window = batch_window
+        self.session = session or requests.Session()
+        self._batcher: Optional[AsyncBatcher[VariantKey, GnomadVariantFrequency]] = None
+        # One limiter per client: the sync facade runs a new loop per call
+        self._bucket = (
+            AsyncTokenBucket(requests_per_second, burst)
+            if requests_per_second
+            else None
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.requests_sent = 0
+
+    def _ensure_loop_state(self) -> AsyncBatcher[VariantKey, GnomadVariantFrequency]:
+        # Batcher futures and locks belong to one event loop
+        loop = asyncio.get_running_loop()
+        if self._batcher is None or self._loop is not loop:
+            self._loop = loop
+            self._batcher = AsyncBatcher(
+                self._fetch_batch,
+                max_batch_size=self.batch_size,
+                max_wait=self.batch_window,
+                max_concurrency=self.max_concurrency,
+            )
+        return self._batcher
+
+    @staticmethod
+    def _key(
+        chromosome: str, position: int, ref: str, alt: str, dataset: str
+    ) -> VariantKey:
+        return dataset, f"{normalize_chromosome(chromosome)}-{position}-{ref}-{alt}"
+
+    async def get_frequency(
+        self,
+        chromosome: str,
+        position: int,
+        ref: str,
+        alt: str,
+        dataset: str = "gnomad_r4",
+    ) -> Optional[GnomadVariantFrequency]:
+        """Frequency for one variant (joins the current batch)."""
+        batcher = self._ensure_loop_state()
+        return await batcher.get(self._key(chromosome, position, ref, alt, dataset))
+
+    async def get_frequencies(
+        self,
+        variants: Sequence[Tuple[str, int, str, str]],
+        dataset: str = "gnomad_r4",
+        failed: Any = None,
+    ) -> List[Optional[GnomadVariantFrequency]]:
+        """Frequencies aligned to variants (None where not found, `failed`
+        where the batch failed)."""
+        batcher = self._ensure_loop_state()
+        return await batcher.get_many(
+            (self._key(*v, dataset) for v in variants), failed=failed
+        )
+
+    def get_frequencies_sync(
+        self,
+        variants: Sequence[Tuple[str, int, str, str]],
+        dataset: str = "gnomad_r4",
+        failed: Any = None,
+    ) -> List[Optional[GnomadVariantFrequency]]:
+        """Blocking facade over get_frequencies()."""
+        if not variants:
+            return []
+        return run_sync(self.get_frequencies(variants, dataset, failed))
+
+    def get_statistics(self) -> Dict[str, int]:
+        stats = dict(self._batcher.stats) if self._batcher else {}
+        stats["requests_sent"] = self.requests_sent
+        return stats
+
+    async def _fetch_batch(
+        self, keys: List[VariantKey]
+    ) -> Dict[VariantKey, Optional[GnomadVariantFrequency]]:
+        document = build_batch_query(keys)
+        try:
+            data = await call_with_retries(
+                self._post,
+                document,
+                attempts=self.retry_attempts,
+                retry_on=(requests.RequestException, ValueError),
+                bucket=self._bucket,
+                label="gnomAD batch",
+            )
+        except (requests.RequestException, ValueError) as e:
+            raise GnomadRequestError(
+                f"gnomAD batch of {len(keys)} failed after "
+                f"{self.retry_attempts} attempts: {e}"
+            ) from e
+        return parse_batch_response(data, keys)
+
+    def _post(self, document: str) -> Dict[str, Any]:
+        """POST one document and return its JSON (worker thread)."""
+        self.requests_sent += 1
+        response = self.session.post(
+            self.api_url, json={"query": document}, timeout=self.timeout
+        )
+        if response.status_code in RETRYABLE_STATUS:
+            raise requests.HTTPError(
+                f"gnomAD returned {response.status_code}", response=response
+            )
+        response.raise_for_status()
+        data = response.json()
+
+        # Errors scoped to an alias (e.g. "Variant not found") leave that
+        # alias null; anything else fails the whole document.
+        errors = data.get("errors") or []
+        fatal = [e for e in errors if not e.get("path")]
+        if fatal or data.get("data") is None:
+            message = (fatal or errors or [{}])[0].get("message", "Unknown error")
+            raise ValueError(f"GraphQL error: {message}")
+        return data
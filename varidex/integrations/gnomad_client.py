@@ -13,15 +13,21 @@ Fixes: Chromosome normalization, error handling
 """
 
 import logging
+import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import requests
 
+from varidex.integrations.batching import RequestCoalescer
+from varidex.integrations.cache import NOT_FOUND, LRUCache
+
 logger = logging.getLogger(__name__)
 
+# Batch results for variants whose request failed (never cached)
+_FAILED = object()
+
 
 def normalize_chromosome(chrom: str) -> str:
     """
@@ -85,6 +91,60 @@ class GnomadVariantFrequency:
         return max_af is None or max_af < 0.0001
 
 
+def parse_variant_data(
+    variant_data: Optional[Dict[str, Any]], variant_id: str
+) -> Optional[GnomadVariantFrequency]:
+    """Build GnomadVariantFrequency from one `variant` object of a response."""
+    try:
+        if not variant_data:
+            logger.debug(f"Variant not found in gnomAD: {variant_id}")
+            return None
+
+        genome = variant_data.get("genome") or {}
+        exome = variant_data.get("exome") or {}
+
+        populations: Dict[str, float] = {}
+        popmax_af: Optional[float] = None
+        popmax_pop: Optional[str] = None
+
+        # Genome populations
+        for pop in genome.get("populations", []):
+            pop_id = pop.get("id")
+            pop_af = pop.get("af")
+            if pop_id and pop_af is not None:
+                populations[f"genome_{pop_id}"] = pop_af
+                if popmax_af is None or pop_af > popmax_af:
+                    popmax_af = pop_af
+                    popmax_pop = pop_id
+
+        # Exome populations
+        for pop in exome.get("populations", []):
+            pop_id = pop.get("id")
+            pop_af = pop.get("af")
+            if pop_id and pop_af is not None:
+                populations[f"exome_{pop_id}"] = pop_af
+                if popmax_af is None or pop_af > popmax_af:
+                    popmax_af = pop_af
+                    popmax_pop = pop_id
+
+        return GnomadVariantFrequency(
+            variant_id=variant_id,
+            genome_af=genome.get("af"),
+            genome_ac=genome.get("ac"),
+            genome_an=genome.get("an"),
+            exome_af=exome.get("af"),
+            exome_ac=exome.get("ac"),
+            exome_an=exome.get("an"),
+            popmax_af=popmax_af,
+            popmax_population=popmax_pop,
+            populations=populations if populations else None,
+            filter_status=(genome.get("filters") or [None])[0],
+        )
+    except Exception as e:
+        logger.error(f"Failed to parse gnomAD response: {e}")
+        return None
+
+
 class RateLimiter:
     """Simple rate limiter for API requests."""
 
@@ -116,6 +176,7 @@ class GnomadClient:
     DEFAULT_TIMEOUT: int = 30
     DEFAULT_RETRY_ATTEMPTS: int = 3
     CACHE_SIZE: int = 1000
+    CACHE_TTL: float = 24 * 3600.0
 
     def __init__(
         self,
@@ -124,8 +185,24 @@ class GnomadClient:
         retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
         enable_cache: bool = True,
         rate_limit: bool = True,
+        cache: Optional[LRUCache] = None,
+        use_batch_api: bool = True,
+        batch_size: int = 50,
+        max_concurrency: int = 4,
+        coalesce_window: Optional[float] = None,
     ) -> None:
-        """Initialize gnomAD API client."""
+        """Initialize gnomAD API client.
+
+        A pre-built LRUCache (e.g. with an on-disk backend) may be passed in;
+        otherwise a CACHE_SIZE-entry, 24-hour cache is created. With
+        use_batch_api, get_variant_frequencies() sends aliased multi-variant
+        queries (AsyncGnomadClient, batch_size variants each, at most
+        max_concurrency in flight) instead of one query per variant.
+
+        coalesce_window (seconds) enables a RequestCoalescer for threads
+        sharing this client: identical concurrent lookups share one request
+        and distinct ones arriving within the window are fetched together.
+        """
         self.api_url: str = api_url or self.DEFAULT_API_URL
         self.timeout: int = timeout
         self.retry_attempts: int = retry_attempts
@@ -138,32 +215,46 @@ class GnomadClient:
             }
         )
         self.rate_limiter: Optional[RateLimiter] = RateLimiter() if rate_limit else None
-        self._cache: Dict[str, Tuple[GnomadVariantFrequency, datetime]] = {}
-        self._cache_duration: timedelta = timedelta(hours=24)
+        if cache is None:
+            cache = LRUCache(max_entries=self.CACHE_SIZE, ttl=self.CACHE_TTL)
+        self._cache: LRUCache = cache
+
+        # Batched lookups (AsyncGnomadClient, created on first use)
+        self.use_batch_api: bool = use_batch_api
+        self.batch_size: int = batch_size
+        self.max_concurrency: int = max_concurrency
+        self._batch_client: Optional[Any] = None
+        self._batch_lock = threading.Lock()
+
+        # key: (dataset, chromosome, position, ref, alt)
+        self._coalescer: Optional[RequestCoalescer] = None
+        if coalesce_window is not None:
+            self._coalescer = RequestCoalescer(
+                self._fetch_coalesced,
+                max_batch_size=batch_size * max_concurrency,
+                max_wait=coalesce_window,
+                # The batch API parallelises inside one call
+                max_concurrency=1 if use_batch_api else max_concurrency,
+                name="gnomad",
+            )
 
         logger.info(f"Initialized gnomAD client: {self.api_url}")
 
-    def _get_from_cache(self, variant_id: str) -> Optional[GnomadVariantFrequency]:
-        """Retrieve variant from cache if available and not expired."""
+    @staticmethod
+    def _cache_key(variant_id: str, dataset: str) -> str:
+        """Cache key: dataset-qualified so r3 and r4 results never mix."""
+        return f"{dataset}|{variant_id}"
+
+    def _get_from_cache(self, variant_id: str) -> Any:
+        """Cached frequency (or NOT_FOUND) if available and not expired."""
         if not self.enable_cache:
             return None
-        if variant_id in self._cache:
-            result, timestamp = self._cache[variant_id]
-            if datetime.now() - timestamp < self._cache_duration:
-                logger.debug(f"Cache hit: {variant_id}")
-                return result
-            del self._cache[variant_id]
-        return None
+        return self._cache.get(variant_id)
 
-    def _add_to_cache(self, variant_id: str, result: GnomadVariantFrequency) -> None:
-        """Add variant to cache, evicting old entries if needed."""
+    def _add_to_cache(self, variant_id: str, result: Any) -> None:
+        """Add a frequency or NOT_FOUND (least recently used entries are evicted)."""
         if self.enable_cache:
-            self._cache[variant_id] = (result, datetime.now())
-            if len(self._cache) > self.CACHE_SIZE:
-                # Evict oldest 10% of entries
-                sorted_items = sorted(self._cache.items(), key=lambda x: x[1][1])
-                for key, _ in sorted_items[: self.CACHE_SIZE // 10]:
-                    del self._cache[key]
+            self._cache.set(variant_id, result)
 
     def _build_graphql_query(self, variant_id: str, dataset: str = "gnomad_r4") -> str:
         """Build GraphQL query for variant frequency data."""
@@ -213,8 +304,12 @@ class GnomadClient:
                 )
                 response.raise_for_status()
                 data = response.json()
-                if "errors" in data:
-                    error_msg = data["errors"][0].get("message", "Unknown error")
+                # A path-scoped error ("Variant not found") leaves the
+                # variant null; anything else fails the query
+                errors = data.get("errors") or []
+                fatal = [e for e in errors if not e.get("path")]
+                if fatal or (errors and data.get("data") is None):
+                    error_msg = (fatal or errors)[0].get("message", "Unknown error")
                     logger.warning(f"GraphQL error: {error_msg}")
                     raise ValueError(f"GraphQL error: {error_msg}")
                 return data
@@ -240,55 +335,7 @@ class GnomadClient:
         self, data: Dict[str, Any], variant_id: str
     ) -> Optional[GnomadVariantFrequency]:
         """Parse GraphQL response into GnomadVariantFrequency object."""
-        try:
-            variant_data = data.get("data", {}).get("variant")
-            if not variant_data:
-                logger.debug(f"Variant not found in gnomAD: {variant_id}")
-                return None
-
-            genome = variant_data.get("genome", {})
-            exome = variant_data.get("exome", {})
-
-            populations: Dict[str, float] = {}
-            popmax_af: Optional[float] = None
-            popmax_pop: Optional[str] = None
-
-            # Genome populations
-            for pop in genome.get("populations", []):
-                pop_id = pop.get("id")
-                pop_af = pop.get("af")
-                if pop_id and pop_af is not None:
-                    populations[f"genome_{pop_id}"] = pop_af
-                    if popmax_af is None or pop_af > popmax_af:
-                        popmax_af = pop_af
-                        popmax_pop = pop_id
-
-            # Exome populations
-            for pop in exome.get("populations", []):
-                pop_id = pop.get("id")
-                pop_af = pop.get("af")
-                if pop_id and pop_af is not None:
-                    populations[f"exome_{pop_id}"] = pop_af
-                    if popmax_af is None or pop_af > popmax_af:
-                        popmax_af = pop_af
-                        popmax_pop = pop_id
-
-            return GnomadVariantFrequency(
-                variant_id=variant_id,
-                genome_af=genome.get("af"),
-                genome_ac=genome.get("ac"),
-                genome_an=genome.get("an"),
-                exome_af=exome.get("af"),
-                exome_ac=exome.get("ac"),
-                exome_an=exome.get("an"),
-                popmax_af=popmax_af,
-                popmax_population=popmax_pop,
-                populations=populations if populations else None,
-                filter_status=(genome.get("filters") or [None])[0],
-            )
-        except Exception as e:
-            logger.error(f"Failed to parse gnomAD response: {e}")
-            return None
+        return parse_variant_data((data.get("data") or {}).get("variant"), variant_id)
 
     def get_variant_frequency(
         self,
@@ -314,33 +361,178 @@ class GnomadClient:
         # Normalize chromosome (handles chr prefix, M→MT)
         chromosome = normalize_chromosome(chromosome)
         variant_id = f"{chromosome}-{position}-{ref}-{alt}"
+        cache_key = self._cache_key(variant_id, dataset)
 
         # Check cache
-        cached = self._get_from_cache(variant_id)
+        cached = self._get_from_cache(cache_key)
+        if cached is NOT_FOUND:
+            return None
         if cached is not None:
             return cached
 
-        # Query API
+        if self._coalescer is not None:
+            try:
+                return self._coalescer.get((dataset, chromosome, position, ref, alt))
+            except Exception as e:
+                logger.error(f"Failed to get frequency for {variant_id}: {e}")
+                return None
+        return self._query_variant(variant_id, dataset)
+
+    def _query_variant(
+        self, variant_id: str, dataset: str
+    ) -> Optional[GnomadVariantFrequency]:
+        """Single-variant query (cached unless it fails, None on error)."""
         try:
             query = self._build_graphql_query(variant_id, dataset)
             response_data = self._execute_query(query)
             result = self._parse_response(response_data, variant_id)
+            cache_key = self._cache_key(variant_id, dataset)
             if result:
-                self._add_to_cache(variant_id, result)
+                self._add_to_cache(cache_key, result)
                 logger.info(f"Retrieved frequency for {variant_id}: AF={result.max_af}")
+            else:
+                self._add_to_cache(cache_key, NOT_FOUND)
             return result
         except Exception as e:
             logger.error(f"Failed to get frequency for {variant_id}: {e}")
             return None
 
+    def get_variant_frequencies(
+        self,
+        variants: Sequence[Tuple[str, int, str, str]],
+        dataset: str = "gnomad_r4",
+    ) -> List[Optional[GnomadVariantFrequency]]:
+        """
+        Query gnomAD for many variants at once.
+
+        Duplicate variants are looked up once and cached variants are served
+        without a request; the rest are fetched with aliased multi-variant
+        queries unless use_batch_api is False. Results are aligned to the
+        input order.
+
+        Args:
+            variants: (chromosome, position, ref, alt) tuples
+            dataset: gnomAD dataset (gnomad_r4, gnomad_r3, etc.)
+
+        Returns:
+            List of GnomadVariantFrequency (None where not found)
+        """
+        ids = [
+            f"{normalize_chromosome(chrom)}-{pos}-{ref}-{alt}"
+            for chrom, pos, ref, alt in variants
+        ]
+        cached: Dict[str, Any] = {}
+        if self.enable_cache:
+            # One bulk read (memory, then backend) instead of one per variant
+            cached = self._cache.get_many({self._cache_key(i, dataset) for i in ids})
+
+        resolved: Dict[str, Optional[GnomadVariantFrequency]] = {}
+        misses: Dict[str, Tuple[str, int, str, str]] = {}
+        for variant_id, variant in zip(ids, variants):
+            cache_key = self._cache_key(variant_id, dataset)
+            if cache_key in cached:
+                value = cached[cache_key]
+                resolved[variant_id] = None if value is NOT_FOUND else value
+            else:
+                misses.setdefault(variant_id, variant)
+
+        if misses and self._coalescer is not None:
+            keys = [
+                (dataset, normalize_chromosome(chrom), pos, ref, alt)
+                for chrom, pos, ref, alt in misses.values()
+            ]
+            resolved.update(zip(misses, self._coalescer.get_many(keys)))
+        elif misses and self.use_batch_api:
+            resolved.update(self._fetch_batch(misses, dataset))
+        else:
+            for variant_id, (chrom, pos, ref, alt) in misses.items():
+                resolved[variant_id] = self.get_variant_frequency(
+                    chrom, pos, ref, alt, dataset=dataset
+                )
+
+        if self.enable_cache:
+            self._cache.flush()
+        logger.info(
+            f"gnomAD batch: {len(ids)} variants, {len(resolved)} unique lookups"
+        )
+        return [resolved[variant_id] for variant_id in ids]
+
+    def _fetch_batch(
+        self, misses: Dict[str, Tuple[str, int, str, str]], dataset: str
+    ) -> Dict[str, Optional[GnomadVariantFrequency]]:
+        """Look up uncached variants with aliased GraphQL batches."""
+        with self._batch_lock:  # one event loop at a time per batch client
+            return self._fetch_batch_locked(misses, dataset)
+
+    def _fetch_batch_locked(
+        self, misses: Dict[str, Tuple[str, int, str, str]], dataset: str
+    ) -> Dict[str, Optional[GnomadVariantFrequency]]:
+        from varidex.integrations.gnomad_async import AsyncGnomadClient
+
+        if self._batch_client is None:
+            limiter = self.rate_limiter
+            self._batch_client = AsyncGnomadClient(
+                api_url=self.api_url,
+                batch_size=self.batch_size,
+                max_concurrency=self.max_concurrency,
+                # Same budget as RateLimiter: max_requests per time_window
+                requests_per_second=(
+                    limiter.max_requests / limiter.time_window if limiter else None
+                ),
+                burst=limiter.max_requests if limiter else None,
+                retry_attempts=self.retry_attempts,
+                timeout=self.timeout,
+                session=self.session,
+            )
+
+        frequencies = self._batch_client.get_frequencies_sync(
+            list(misses.values()), dataset, failed=_FAILED
+        )
+        fetched: Dict[str, Optional[GnomadVariantFrequency]] = {}
+        for variant_id, frequency in zip(misses, frequencies):
+            if frequency is _FAILED:  # not cached, retried on the next call
+                fetched[variant_id] = None
+                continue
+            self._add_to_cache(
+                self._cache_key(variant_id, dataset),
+                NOT_FOUND if frequency is None else frequency,
+            )
+            fetched[variant_id] = frequency
+        return fetched
+
+    def _fetch_coalesced(
+        self, keys: List[Tuple[str, str, int, str, str]]
+    ) -> Dict[Tuple[str, str, int, str, str], Optional[GnomadVariantFrequency]]:
+        """RequestCoalescer fetch: one bulk lookup per dataset."""
+        by_dataset: Dict[str, Dict[str, Tuple[str, str, int, str, str]]] = {}
+        for key in keys:
+            dataset, chrom, pos, ref, alt = key
+            by_dataset.setdefault(dataset, {})[f"{chrom}-{pos}-{ref}-{alt}"] = key
+
+        results: Dict[
+            Tuple[str, str, int, str, str], Optional[GnomadVariantFrequency]
+        ] = {}
+        for dataset, group in by_dataset.items():
+            if self.use_batch_api:
+                fetched = self._fetch_batch(
+                    {vid: key[1:] for vid, key in group.items()}, dataset
+                )
+            else:
+                fetched = {vid: self._query_variant(vid, dataset) for vid in group}
+            results.update((group[vid], freq) for vid, freq in fetched.items())
+        if self.enable_cache:
+            self._cache.flush()
+        return results
+
+    def get_coalescing_stats(self) -> Optional[Dict[str, Any]]:
+        """RequestCoalescer metrics (None when coalescing is off)."""
+        return self._coalescer.get_stats() if self._coalescer else None
+
     def clear_cache(self) -> None:
         """Clear the variant frequency cache."""
         self._cache.clear()
         logger.info("Cache cleared")
 
-    def get_cache_stats(self) -> Dict[str, int]:
-        """Get cache statistics."""
-        return {
-            "size": len(self._cache),
-            "max_size": self.CACHE_SIZE,
-        }
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache statistics (size, max_size, hits, misses, evictions...)."""
+        return self._cache.get_stats()
@@ -0,0 +1,181 @@
+"""Async batched client for Ensembl VEP predictions.
+
+Concurrent lookups are coalesced (AsyncBatcher) into POST requests to
+/vep/{species}/region with up to 200 variants each. Requests are rate
+limited by a token bucket, at most max_concurrency are in flight, failures
+are retried with jittered backoff, and the JSON array response is parsed
+incrementally into PredictionScore objects.
+
+DbNSFPClient.get_predictions_batch() uses this through the sync facade
+(get_predictions_many_sync).
+
+Version: 6.5.0-dev
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import requests
+
+from varidex.integrations.batching import (
+    RETRYABLE_STATUS,
+    AsyncBatcher,
+    AsyncTokenBucket,
+    call_with_retries,
+    iter_json_array,
+    run_sync,
+)
+from varidex.integrations.dbnsfp_client import PredictionScore, parse_vep_response
+
+logger = logging.getLogger(__name__)
+
+
+class VEPRequestError(Exception):
+    """VEP batch request failed after all retries."""
+
+
+def vep_input(chrom: str, pos: int, ref: str, alt: str) -> str:
+    """VCF-style VEP input line ('17 43094692 . G A . . .')."""
+    return f"{str(chrom).replace('chr', '')} {pos} . {ref} {alt} . . ."
+
+
+class AsyncVEPClient:
+    """Asyncio VEP client that batches concurrent lookups."""
+
+    DEFAULT_VEP_URL: str = "https://rest.ensembl.org"
+    MAX_BATCH_SIZE: int = 200  # VEP POST limit
+
+    def __init__(
+        self,
+        vep_url: str = DEFAULT_VEP_URL,
+        species: str = "human",
+        batch_size: int = MAX_BATCH_SIZE,
+        max_concurrency: int = 4,
+        requests_per_second: Optional[float] = 15.0,
+        retry_attempts: int = 3,
+        timeout: int = 60,
+        batch_window: float = 0.01,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        """
+        Args:
+            vep_url: Ensembl REST base URL
+            species: VEP species
+            batch_size: Variants per POST (capped at MAX_BATCH_SIZE)
+            max_concurrency: Concurrent POST requests
+            requests_per_second: Token bucket rate (None disables limiting)
+            retry_attempts: Attempts per batch (429/5xx and network errors)
+            timeout: Request timeout in seconds
+            batch_window: Seconds to wait for more lookups before sending
+            session: Shared requests.Session (one is created if omitted)
+        """
+        self.vep_url = vep_url.rstrip("/")
+        self.species = species
+        self.batch_size = max(1, min(batch_size, self.MAX_BATCH_SIZE))
+        self.max_concurrency = max_concurrency
+        self.retry_attempts = retry_attempts
+        self.timeout = timeout
+        self.batch_window = batch_window
+        self.requests_per_second = requests_per_second
+        self.session = session or requests.Session()
+        self._batcher: Optional[AsyncBatcher[str, PredictionScore]] = None
+        # One limiter per client: the sync facade runs a new loop per call
+        self._bucket = (
+            AsyncTokenBucket(requests_per_second) if requests_per_second else None
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.requests_sent = 0
+
+    def _ensure_loop_state(self) -> AsyncBatcher[str, PredictionScore]:
+        # Batcher futures and locks belong to one event loop
+        loop = asyncio.get_running_loop()
+        if self._batcher is None or self._loop is not loop:
+            self._loop = loop
+            self._batcher = AsyncBatcher(
+                self._fetch_batch,
+                max_batch_size=self.batch_size,
+                max_wait=self.batch_window,
+                max_concurrency=self.max_concurrency,
+            )
+        return self._batcher
+
+    async def get_predictions(
+        self, chromosome: str, position: int, ref: str, alt: str
+    ) -> Optional[PredictionScore]:
+        """Predictions for one variant (joins the current batch)."""
+        batcher = self._ensure_loop_state()
+        return await batcher.get(vep_input(chromosome, position, ref, alt))
+
+    async def get_predictions_many(
+        self, variants: Sequence[Tuple[str, int, str, str]], failed: Any = None
+    ) -> List[Optional[PredictionScore]]:
+        """Predictions aligned to variants (None where missing, `failed`
+        where the batch failed)."""
+        batcher = self._ensure_loop_state()
+        return await batcher.get_many((vep_input(*v) for v in variants), failed=failed)
+
+    def get_predictions_many_sync(
+        self, variants: Sequence[Tuple[str, int, str, str]], failed: Any = None
+    ) -> List[Optional[PredictionScore]]:
+        """Blocking facade over get_predictions_many()."""
+        if not variants:
+            return []
+        return run_sync(self.get_predictions_many(variants, failed))
+
+    def get_statistics(self) -> Dict[str, int]:
+        stats = dict(self._batcher.stats) if self._batcher else {}
+        stats["requests_sent"] = self.requests_sent
+        return stats
+
+    async def _fetch_batch(
+        self, inputs: List[str]
+    ) -> Dict[str, Optional[PredictionScore]]:
+        url = f"{self.vep_url}/vep/{self.species}/region"
+        try:
+            return await call_with_retries(
+                self._post,
+                url,
+                inputs,
+                attempts=self.retry_attempts,
+                retry_on=(requests.RequestException, ValueError),
+                bucket=self._bucket,
+                label="VEP batch",
+            )
+        except (requests.RequestException, ValueError) as e:
+            raise VEPRequestError(
+                f"VEP batch of {len(inputs)} failed after "
+                f"{self.retry_attempts} attempts: {e}"
+            ) from e
+
+    def _post(
+        self, url: str, inputs: List[str]
+    ) -> Dict[str, Optional[PredictionScore]]:
+        """POST one batch and stream-parse the response (worker thread)."""
+        self.requests_sent += 1
+        response = self.session.post(
+            url,
+            json={"variants": inputs},
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            timeout=self.timeout,
+            stream=True,
+        )
+        try:
+            if response.status_code in RETRYABLE_STATUS:
+                raise requests.HTTPError(
+                    f"VEP returned {response.status_code}", response=response
+                )
+            response.raise_for_status()
+
+            results: Dict[str, Optional[PredictionScore]] = {}
+            for record in iter_json_array(response.iter_content(chunk_size=65536)):
+                key = record.get("input")
+                if key in results or key is None:
+                    continue
+                chrom, pos, _, ref, alt = key.split()[:5]
+                results[key] = parse_vep_response(
+                    [record], f"{chrom}-{pos}-{ref}-{alt}"
+                )
+            return results
+        finally:
+            response.close()
@@ -52,6 +52,7 @@ from varidex.exceptions import DataLoadError, FileProcessingError, ValidationErr
 
 # Import parallel validators
 from varidex.io.validators_parallel import validate_position_ranges_parallel
+from varidex.utils.profiling import span
 from varidex.version import __version__
 
 # Normalization handled elsewhere
@@ -67,33 +68,6 @@ REQUIRED_COORD_COLUMNS: List[str] = [
     "alt_allele",
 ]
 VALID_CHROMOSOMES: List[str] = [str(i) for i in range(1, 23)] + ["X", "Y", "MT"]
-CHROMOSOME_MAX_POSITIONS: Dict[str, int] = {
-    "1": 250_000_000,
-    "2": 243_000_000,
-    "3": 198_000_000,
-    "4": 191_000_000,
-    "5": 181_000_000,
-    "6": 171_000_000,
-    "7": 160_000_000,
-    "8": 146_000_000,
-    "9": 142_000_000,
-    "10": 136_000_000,
-    "11": 135_000_000,
-    "12": 134_000_000,
-    "13": 115_000_000,
-    "14": 107_000_000,
-    "15": 103_000_000,
-    "16": 90_500_000,
-    "17": 84_000_000,
-    "18": 80_500_000,
-    "19": 59_000_000,
-    "20": 64_500_000,
-    "21": 48_000_000,
-    "22": 52_000_000,
-    "X": 156_000_000,
-    "Y": 57_000_000,
-    "MT": 17_000,
-}
 CLINVAR_COLUMNS: Dict[str, List[str]] = {
     "rsid": ["#AlleleID", "RS# (dbSNP)", "rsid"],
     "gene": ["GeneSymbol", "Gene(s)", "gene"],
@@ -707,6 +681,38 @@ def load_variant_summary(
         )
 
 
+def _cache_meta_matches(meta: Dict[str, Any], filepath: Path) -> bool:
+    """True if cache metadata matches the source file size, mtime and version."""
+    stat = filepath.stat()
+    return (
+        meta.get("source_size") == stat.st_size
+        and abs(meta.get("source_mtime", 0) - stat.st_mtime) < 1.0
+        and meta.get("cache_version", "0.0.0") == __version__
+    )
+
+
+def processed_cache_file(
+    filepath: Any, checkpoint_dir: Any = ".varidex_cache"
+) -> Optional[Path]:
+    """
+    Valid processed-parquet cache of an (unfiltered) ClinVar file, if any.
+
+    Checks the same metadata as load_clinvar_file without reading any
+    variants, so callers can read just the columns they need.
+    """
+    filepath = Path(filepath)
+    cache_file = Path(checkpoint_dir) / f"{filepath.stem}_processed.parquet"
+    cache_meta_file = cache_file.with_name(f"{cache_file.name}.meta.json")
+    if not (filepath.exists() and cache_file.exists() and cache_meta_file.exists()):
+        return None
+    try:
+        with open(cache_meta_file, "r") as f:
+            meta = json.load(f)
+        return cache_file if _cache_meta_matches(meta, filepath) else None
+    except (OSError, ValueError):
+        return None
+
+
 def load_clinvar_file(
     filepath: Any,
     user_chromosomes: Optional[Set[str]] = None,
@@ -760,8 +766,14 @@ def load_clinvar_file(
     # Import XML loader (UNCONDITIONAL - always available for loaders dict)
     from varidex.io.loaders.clinvar_xml import load_clinvar_xml
 
+    # Only the XML loader filters by chromosome. A filtered frame is not the
+    # whole release, so it is not tagged with clinvar_source_file (the
+    # release key of the PS1/PM5 index cache) and gets fingerprinted by
+    # content instead.
+    chromosome_filtered = file_type == "xml" and bool(user_chromosomes)
+
     # Generate cache filename
-    if file_type == "xml" and user_chromosomes:
+    if chromosome_filtered:
         # XML: Include chromosomes in cache key for filtered loading
         chr_str = "_".join(sorted(user_chromosomes))
         cache_name = f"{filepath.stem}_chr{chr_str}.parquet"
@@ -778,17 +790,9 @@ def load_clinvar_file(
             with open(cache_meta_file, "r") as f:
                 meta = json.load(f)
 
-            # Validate cache: check file size and modification time
-            current_size = filepath.stat().st_size
-            current_mtime = filepath.stat().st_mtime
-
             # IMPORTANT: Invalidate cache if version changed (new gene/consequence extraction)
             cache_version = meta.get("cache_version", "0.0.0")
-            if (
-                meta.get("source_size") == current_size
-                and abs(meta.get("source_mtime", 0) - current_mtime) < 1.0
-                and cache_version == __version__
-            ):
+            if _cache_meta_matches(meta, filepath):
                 use_cache = True
                 logger.info(f"💾 Using cached ClinVar data from {cache_file.name}")
                 print(f"\n💾 Loading from cache: {cache_file.name}")
@@ -808,7 +812,13 @@ def load_clinvar_file(
             import time
 
             start_time = time.time()
-            df = pd.read_parquet(cache_file)
+            with span("clinvar.cache_read") as s:
+                df = pd.read_parquet(cache_file)
+                s.rows_out = len(df)
+                s.add_bytes(cache_file.stat().st_size)
+            df.attrs["clinvar_cache_file"] = str(cache_file)
+            if not chromosome_filtered:
+                df.attrs["clinvar_source_file"] = str(filepath)
             load_time = time.time() - start_time
             logger.info(f"✓ Loaded {len(df):,} variants from cache in {load_time:.1f}s")
             print(f"✓ Loaded {len(df):,} variants in {load_time:.1f}s (from cache)\n")
@@ -830,18 +840,25 @@ def load_clinvar_file(
             raise ValueError(f"Unknown file type: {file_type}")
 
         # Call loader with user_chromosomes for filtering
-        df = loader(
-            filepath,
-            user_chromosomes=user_chromosomes,
-            checkpoint_dir=cache_dir,
-        )
+        with span("clinvar.parse_source", file_type=file_type) as s:
+            df = loader(
+                filepath,
+                user_chromosomes=user_chromosomes,
+                checkpoint_dir=cache_dir,
+            )
+            s.rows_out = len(df)
+            s.add_bytes(filepath.stat().st_size)
+
+        if not chromosome_filtered:
+            df.attrs["clinvar_source_file"] = str(filepath)
 
         # Save to cache
         try:
             logger.info(f"💾 Saving processed ClinVar to cache...")
             print(f"💾 Saving to cache: {cache_file.name}...")
 
-            df.to_parquet(cache_file, index=False, compression="zstd")
+            with span("clinvar.cache_write", rows_in=len(df)):
+                df.to_parquet(cache_file, index=False, compression="zstd")
 
             # Save metadata for validation
             meta = {
@@ -858,6 +875,7 @@ def load_clinvar_file(
             with open(cache_meta_file, "w") as f:
                 json.dump(meta, f, indent=2)
 
+            df.attrs["clinvar_cache_file"] = str(cache_file)
             cache_size_mb = cache_file.stat().st_size / 1024 / 1024
             logger.info(f"✓ Cache saved: {cache_file.name} ({cache_size_mb:.1f} MB)")
             print(f"✓ Cache saved: {cache_size_mb:.1f} MB\n")
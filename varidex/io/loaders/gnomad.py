@@ -12,6 +12,7 @@ Date: 2026-02-04
 """
 
 import logging
+import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from functools import partial
@@ -22,6 +23,8 @@ import pandas as pd
 import pysam
 from tqdm import tqdm
 
+from varidex.utils.profiling import span
+
 logger = logging.getLogger(__name__)
 
 # Standard chromosome list
@@ -239,6 +242,9 @@ class GnomADLoader:
         # Cache for open file handles (single-threaded mode only)
         self.vcf_handles: Dict[str, pysam.TabixFile] = {}
 
+        # Cumulative sequential lookup time: tabix seeks vs INFO parsing
+        self.timings: Dict[str, float] = {"tabix_sec": 0.0, "parse_sec": 0.0}
+
         # Validate directory
         if not self.gnomad_dir.exists():
             raise FileNotFoundError(f"gnomAD directory not found: {gnomad_dir}")
@@ -331,7 +337,9 @@ class GnomADLoader:
 
         try:
             # Query region (tabix uses 1-based coordinates)
+            fetch_start = time.perf_counter()
             records = list(vcf.fetch(chrom, position - 1, position))
+            self.timings["tabix_sec"] += time.perf_counter() - fetch_start
 
             for record_str in records:
                 fields = record_str.split("\t")
@@ -344,7 +352,10 @@ class GnomADLoader:
 
                 # Check if this is our variant
                 if rec_pos == position and rec_ref == ref and rec_alt == alt:
-                    return self._parse_variant_record(fields, chromosome)
+                    parse_start = time.perf_counter()
+                    result = self._parse_variant_record(fields, chromosome)
+                    self.timings["parse_sec"] += time.perf_counter() - parse_start
+                    return result
 
             return None
 
@@ -451,9 +462,18 @@ class GnomADLoader:
                 else variants
             )
 
-            for chrom, pos, ref, alt in iterator:
-                result = self.lookup_variant(chrom, pos, ref, alt)
-                results.append(result)
+            before = dict(self.timings)
+            with span("gnomad.lookup_sequential", rows_in=len(variants)) as s:
+                for chrom, pos, ref, alt in iterator:
+                    result = self.lookup_variant(chrom, pos, ref, alt)
+                    results.append(result)
+                s.rows_out = sum(1 for r in results if r is not None)
+                s.set(
+                    **{
+                        key: round(self.timings[key] - before[key], 3)
+                        for key in self.timings
+                    }
+                )
 
             return results
 
@@ -475,7 +495,9 @@ class GnomADLoader:
         # Process in parallel
         results = [None] * len(variants)
 
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+        with span(
+            "gnomad.lookup_parallel", rows_in=len(variants), workers=self.max_workers
+        ), ProcessPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit all tasks
             future_to_idx = {
                 executor.submit(worker_func, variant): idx
@@ -544,19 +566,23 @@ class GnomADLoader:
         frequencies = self.lookup_variants_batch(variants, show_progress)
 
         # Convert to records
-        freq_records = [freq.to_dict() if freq else {} for freq in frequencies]
+        with span("gnomad.to_frame", rows_in=len(frequencies)) as s:
+            freq_records = [freq.to_dict() if freq else {} for freq in frequencies]
 
-        # Create frequency DataFrame
-        freq_df = pd.DataFrame(freq_records)
+            # Create frequency DataFrame
+            freq_df = pd.DataFrame(freq_records)
+            s.rows_out = len(freq_df)
 
         # Merge with original
         if not freq_df.empty:
             # Merge on coordinates
-            result = df.merge(
-                freq_df,
-                on=["chromosome", "position", "ref_allele", "alt_allele"],
-                how="left",
-            )
+            with span("gnomad.merge", rows_in=len(df)) as s:
+                result = df.merge(
+                    freq_df,
+                    on=["chromosome", "position", "ref_allele", "alt_allele"],
+                    how="left",
+                )
+                s.rows_out = len(result)
         else:
             result = df.copy()
             # Add empty gnomAD columns
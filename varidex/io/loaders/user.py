@@ -17,6 +17,7 @@ except ImportError:
     __version__ = "6.0.2"
 
 from varidex.exceptions import DataLoadError, ValidationError
+from varidex.utils.profiling import span
 
 logger = logging.getLogger(__name__)
 USER_FILE_FORMATS = ["23andme", "vcf", "tsv"]
@@ -148,6 +149,42 @@ def load_23andme_file(filepath: Path) -> pd.DataFrame:
         )
 
 
+def _extract_phase_fields(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """
+    Extract GT and PS from the FORMAT/first-sample columns of a VCF frame.
+
+    Returns:
+        {"gt": ..., "phase_set": ...} for the fields present, else {}
+    """
+    cols = list(df.columns)
+    if "FORMAT" not in cols or cols.index("FORMAT") + 1 >= len(cols):
+        return {}
+
+    sample = df[cols[cols.index("FORMAT") + 1]].astype(str)
+    fmt = df["FORMAT"].astype(str)
+    fields: Dict[str, pd.Series] = {}
+
+    for key, name in (("GT", "gt"), ("PS", "phase_set")):
+        if fmt.nunique() == 1:
+            keys = fmt.iloc[0].split(":")
+            if key not in keys:
+                continue
+            values = sample.str.split(":").str[keys.index(key)]
+        else:
+            values = pd.Series(
+                [
+                    dict(zip(f.split(":"), v.split(":"))).get(key)
+                    for f, v in zip(fmt, sample)
+                ],
+                index=df.index,
+            )
+        values = values.where(~values.isin([".", "./.", ".|."]))
+        if values.notna().any():
+            fields[name] = values
+
+    return fields
+
+
 def load_user_vcf(filepath: Path) -> pd.DataFrame:
     """Load VCF file with flexible column detection."""
     filepath = Path(filepath)
@@ -192,9 +229,14 @@ def load_user_vcf(filepath: Path) -> pd.DataFrame:
         if len(df) == 0:
             raise ValidationError("No variants in VCF", context={"file": str(filepath)})
 
+        # Phased genotype (GT) and phase set (PS) from the first sample
+        phase_cols = _extract_phase_fields(df)
+
         # Keep needed columns
         needed = ["CHROM", "POS", "ID", "REF", "ALT"]
         df = df[[col for col in needed if col in df.columns]]
+        for col, values in phase_cols.items():
+            df[col] = values
 
         # STEP 1: Rename ID->rsid FIRST
         df = df.rename(columns={"CHROM": "chromosome", "POS": "position", "ID": "rsid"})
@@ -216,7 +258,8 @@ def load_user_vcf(filepath: Path) -> pd.DataFrame:
             raise ValidationError("No valid variants", context={"file": str(filepath)})
 
         logger.info(f"Loaded {len(df):,} variants from {stats['input_rows']:,} rows")
-        return df[["rsid", "chromosome", "position", "genotype", "variant_id_type"]]
+        out_cols = ["rsid", "chromosome", "position", "genotype", "variant_id_type"]
+        return df[out_cols + [col for col in phase_cols if col in df.columns]]
 
     except (ValidationError, DataLoadError):
         raise
@@ -273,7 +316,11 @@ def load_user_file(filepath: Path, file_format: Optional[str] = None) -> pd.Data
     }
     if file_format not in loaders:
         raise ValueError(f"Unknown format: {file_format}")
-    return loaders[file_format](filepath)
+    with span("user.load", file_format=file_format) as s:
+        df = loaders[file_format](filepath)
+        s.rows_out = len(df)
+        s.add_bytes(filepath.stat().st_size)
+    return df
 
 
 def load_23andme(filepath: str, assembly: str = "GRCh38") -> pd.DataFrame:
@@ -16,6 +16,7 @@ import logging
 from typing import Any, List, Optional, Set, Tuple
 import pandas as pd
 from varidex.io.normalization import create_coord_key
+from varidex.utils.profiling import traced
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +118,7 @@ def calculate_match_confidence(
     return min(confidence, 1.0)
 
 
+@traced("matching.rsid")
 def match_by_rsid(user_df: pd.DataFrame, clinvar_df: pd.DataFrame) -> pd.DataFrame:
     """Match variants by rsID only."""
     if "rsid" not in user_df.columns or "rsid" not in clinvar_df.columns:
@@ -139,6 +141,7 @@ def match_by_rsid(user_df: pd.DataFrame, clinvar_df: pd.DataFrame) -> pd.DataFra
     return matched
 
 
+@traced("matching.coordinates")
 def match_by_coordinates(
     user_df: pd.DataFrame, clinvar_df: pd.DataFrame
 ) -> pd.DataFrame:
@@ -181,6 +184,7 @@ def match_by_coordinates(
     return matched
 
 
+@traced("matching.position_genotype")
 def match_by_position_23andme_improved(
     user_df: pd.DataFrame, clinvar_df: pd.DataFrame
 ) -> pd.DataFrame:
@@ -255,6 +259,7 @@ def match_by_position_23andme_improved(
     return verified
 
 
+@traced("matching.deduplicate")
 def deduplicate_matches(df: pd.DataFrame, strategy: str = "best") -> pd.DataFrame:
     """Deduplicate matched variants, keeping best quality matches."""
     if len(df) == 0:
@@ -292,6 +297,7 @@ def deduplicate_matches(df: pd.DataFrame, strategy: str = "best") -> pd.DataFram
     return df
 
 
+@traced("matching.hybrid")
 def match_variants_hybrid(
     clinvar_df: pd.DataFrame,
     user_df: pd.DataFrame,
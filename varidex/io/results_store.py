@@ -0,0 +1,144 @@
+"""Pluggable on-disk store for pipeline result frames.
+
+Intermediate and final results are kept in a binary columnar format that
+round-trips dtypes (Int64 positions, booleans, categoricals) and reads
+back quickly:
+
+    parquet   zstd-compressed, the default
+    feather   uncompressed Arrow IPC, memory-mapped on read
+
+CSV is an export format only (export_csv); nothing in the pipeline reads
+it back. Further formats plug in through register_results_store().
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Type, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESULTS_FORMAT = "parquet"
+
+RESULTS_STORES: Dict[str, Type["ResultsStore"]] = {}
+
+
+def register_results_store(cls: Type["ResultsStore"]) -> Type["ResultsStore"]:
+    """Class decorator adding a ResultsStore backend under its format_name."""
+    RESULTS_STORES[cls.format_name] = cls
+    return cls
+
+
+class ResultsStore:
+    """
+    Named result frames under one directory ({root}/{name}{suffix}).
+
+    Subclasses implement _write() and _read() for one file format. Writes
+    go to a temporary file first, so a crashed run never leaves a
+    truncated result behind.
+    """
+
+    format_name = ""
+    suffix = ""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def path(self, name: str) -> Path:
+        return self.root / f"{name}{self.suffix}"
+
+    def exists(self, name: str) -> bool:
+        return self.path(name).exists()
+
+    def write(self, name: str, df: pd.DataFrame) -> Path:
+        """Store df as name (replacing any earlier version)."""
+        path = self.path(name)
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        self._write(df.reset_index(drop=True), tmp_path)
+        os.replace(tmp_path, path)
+        logger.info(f"💾 Stored {name}: {len(df):,} rows -> {path}")
+        return path
+
+    def read(self, name: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Load a stored frame.
+
+        Args:
+            name: Result name
+            columns: Optional projection (only these columns are read)
+
+        Raises:
+            FileNotFoundError: If name has not been stored
+        """
+        path = self.path(name)
+        if not path.exists():
+            raise FileNotFoundError(f"No stored results named {name!r} in {self.root}")
+        return self._read(path, list(columns) if columns is not None else None)
+
+    def _write(self, df: pd.DataFrame, path: Path) -> None:
+        raise NotImplementedError
+
+    def _read(self, path: Path, columns: Optional[List[str]]) -> pd.DataFrame:
+        raise NotImplementedError
+
+
+@register_results_store
+class ParquetResultsStore(ResultsStore):
+    """Parquet (zstd) results."""
+
+    format_name = "parquet"
+    suffix = ".parquet"
+
+    def _write(self, df: pd.DataFrame, path: Path) -> None:
+        df.to_parquet(path, index=False, compression="zstd")
+
+    def _read(self, path: Path, columns: Optional[List[str]]) -> pd.DataFrame:
+        return pd.read_parquet(path, columns=columns)
+
+
+@register_results_store
+class FeatherResultsStore(ResultsStore):
+    """Uncompressed Feather results, memory-mapped on read."""
+
+    format_name = "feather"
+    suffix = ".feather"
+
+    def _write(self, df: pd.DataFrame, path: Path) -> None:
+        df.to_feather(path, compression="uncompressed")
+
+    def _read(self, path: Path, columns: Optional[List[str]]) -> pd.DataFrame:
+        from pyarrow import feather
+
+        table = feather.read_table(path, columns=columns, memory_map=True)
+        return table.to_pandas()
+
+
+def open_results_store(
+    root: Union[str, Path], fmt: str = DEFAULT_RESULTS_FORMAT
+) -> ResultsStore:
+    """
+    ResultsStore for fmt rooted at root.
+
+    Raises:
+        ValueError: If no backend is registered for fmt
+    """
+    try:
+        return RESULTS_STORES[fmt](root)
+    except KeyError:
+        raise ValueError(
+            f"Unknown results format {fmt!r} (available: {sorted(RESULTS_STORES)})"
+        ) from None
+
+
+def export_csv(
+    df: pd.DataFrame, path: Union[str, Path], columns: Optional[Sequence[str]] = None
+) -> Path:
+    """Write a CSV export of df (optionally only columns) to path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    frame = df if columns is None else df[list(columns)]
+    frame.to_csv(path, index=False)
+    return path
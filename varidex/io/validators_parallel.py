@@ -23,38 +23,12 @@ from typing import Dict, List, Tuple
 import pandas as pd
 from tqdm import tqdm
 
+from varidex.core.schema import CHROMOSOME_MAX_POSITIONS
+
 logger = logging.getLogger(__name__)
 
 VALID_CHROMOSOMES: List[str] = [str(i) for i in range(1, 23)] + ["X", "Y", "MT"]
 
-CHROMOSOME_MAX_POSITIONS: Dict[str, int] = {
-    "1": 250_000_000,
-    "2": 243_000_000,
-    "3": 198_000_000,
-    "4": 191_000_000,
-    "5": 181_000_000,
-    "6": 171_000_000,
-    "7": 160_000_000,
-    "8": 146_000_000,
-    "9": 142_000_000,
-    "10": 136_000_000,
-    "11": 135_000_000,
-    "12": 134_000_000,
-    "13": 115_000_000,
-    "14": 107_000_000,
-    "15": 103_000_000,
-    "16": 90_500_000,
-    "17": 84_000_000,
-    "18": 80_500_000,
-    "19": 59_000_000,
-    "20": 64_500_000,
-    "21": 48_000_000,
-    "22": 52_000_000,
-    "X": 156_000_000,
-    "Y": 57_000_000,
-    "MT": 17_000,
-}
-
 
 def _validate_chunk(
     chunk_data: Tuple[pd.DataFrame, int], max_positions: Dict[str, int]
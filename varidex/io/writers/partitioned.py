@@ -0,0 +1,203 @@
+"""Single-pass writer for many row subsets of one result frame.
+
+Each output file is a partition: a row mask (None for every row) plus an
+optional column list. Partitions may overlap. The frame is walked once in
+chunks; each chunk is sliced for every partition and handed, through a
+bounded queue, to a background thread that keeps all output files open and
+serializes the slices. Slicing the next chunk therefore overlaps with
+writing the previous one, and memory stays bounded by the queue size.
+
+A JSON manifest (OUTPUT_MANIFEST) records rows, columns and bytes for
+every file written.
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_MANIFEST = "output_manifest.json"
+DEFAULT_CHUNK_ROWS = 50_000
+DEFAULT_QUEUE_SIZE = 16
+
+_DONE = None
+
+
+@dataclass
+class OutputPartition:
+    """One output file: which rows and columns of the frame it receives."""
+
+    name: str
+    mask: Optional[np.ndarray] = None
+    columns: Optional[List[str]] = None
+    write_empty: bool = False
+
+
+class PartitionedWriter:
+    """
+    Write several CSV partitions of one DataFrame in a single pass.
+
+    Example:
+        writer = PartitionedWriter(output_dir)
+        writer.add("all.csv")
+        writer.add("pvs1.csv", mask=df["PVS1"].eq(True).to_numpy())
+        manifest = writer.write(df)
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        self.output_dir = Path(output_dir)
+        self.chunk_rows = max(1, chunk_rows)
+        self.queue_size = max(1, queue_size)
+        self.partitions: List[OutputPartition] = []
+        self.files: Dict[str, Dict[str, Any]] = {}
+
+    def add(
+        self,
+        name: str,
+        mask: Optional[Union[np.ndarray, pd.Series]] = None,
+        columns: Optional[Sequence[str]] = None,
+        write_empty: bool = False,
+    ) -> None:
+        """
+        Register an output file.
+
+        Args:
+            name: File name relative to output_dir
+            mask: Boolean row membership (None = every row)
+            columns: Columns to write (None = all)
+            write_empty: Write a header-only file when no rows match
+        """
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool)
+        self.partitions.append(
+            OutputPartition(
+                name, mask, list(columns) if columns is not None else None, write_empty
+            )
+        )
+
+    def record(self, name: str, path: Union[str, Path], rows: int) -> None:
+        """Add a file written elsewhere (e.g. the stored results) to the manifest."""
+        path = Path(path)
+        self.files[name] = {
+            "path": str(path),
+            "rows": rows,
+            "bytes": path.stat().st_size,
+        }
+
+    def write(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Write every registered partition of df and the manifest.
+
+        Returns:
+            Manifest dict (also saved as OUTPUT_MANIFEST in output_dir)
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        for part in self.partitions:
+            if part.mask is not None and len(part.mask) != len(df):
+                raise ValueError(
+                    f"Mask for {part.name} has {len(part.mask)} rows, "
+                    f"frame has {len(df)}"
+                )
+
+        start_time = time.time()
+        chunks: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        state: Dict[str, Any] = {"error": None}
+        thread = threading.Thread(
+            target=self._drain, args=(chunks, state), name="partitioned-writer"
+        )
+        thread.start()
+        try:
+            self._produce(df, chunks, state)
+        finally:
+            chunks.put(_DONE)
+            thread.join()
+        if state["error"] is not None:
+            raise state["error"]
+
+        manifest = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "source_rows": len(df),
+            "chunk_rows": self.chunk_rows,
+            "write_sec": round(time.time() - start_time, 3),
+            "files": self.files,
+        }
+        with open(self.output_dir / OUTPUT_MANIFEST, "w") as f:
+            json.dump(manifest, f, indent=2)
+        logger.info(
+            f"📦 Wrote {len(self.files)} output files in one pass "
+            f"({manifest['write_sec']}s)"
+        )
+        return manifest
+
+    def _produce(
+        self, df: pd.DataFrame, chunks: "queue.Queue", state: Dict[str, Any]
+    ) -> None:
+        """Slice each chunk for every partition (main thread)."""
+        matched = {part.name: 0 for part in self.partitions}
+        for start in range(0, len(df), self.chunk_rows):
+            if state["error"] is not None:
+                return
+            stop = min(start + self.chunk_rows, len(df))
+            chunk = df.iloc[start:stop]
+            for part in self.partitions:
+                rows = chunk if part.mask is None else chunk[part.mask[start:stop]]
+                if rows.empty:
+                    continue
+                if part.columns is not None:
+                    rows = rows[part.columns]
+                matched[part.name] += len(rows)
+                chunks.put((part.name, rows))
+
+        for part in self.partitions:
+            if part.write_empty and matched[part.name] == 0:
+                empty = df.iloc[:0]
+                if part.columns is not None:
+                    empty = empty[part.columns]
+                chunks.put((part.name, empty))
+
+    def _drain(self, chunks: "queue.Queue", state: Dict[str, Any]) -> None:
+        """Serialize queued slices into their open files (writer thread)."""
+        handles: Dict[str, IO[str]] = {}
+        try:
+            while True:
+                item = chunks.get()
+                if item is _DONE:
+                    break
+                if state["error"] is not None:
+                    continue  # keep draining so the producer never blocks
+                name, rows = item
+                try:
+                    handle = handles.get(name)
+                    if handle is None:
+                        handle = handles[name] = open(
+                            self.output_dir / name, "w", newline=""
+                        )
+                        self.files[name] = {
+                            "path": str(self.output_dir / name),
+                            "rows": 0,
+                            "columns": len(rows.columns),
+                        }
+                        rows.to_csv(handle, index=False)
+                    else:
+                        rows.to_csv(handle, index=False, header=False)
+                    self.files[name]["rows"] += len(rows)
+                except Exception as e:
+                    state["error"] = e
+        finally:
+            for name, handle in handles.items():
+                handle.close()
+                self.files[name]["bytes"] = (self.output_dir / name).stat().st_size
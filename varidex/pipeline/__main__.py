@@ -10,7 +10,10 @@ Phase 3: Final ACMG Classification (Pathogenic/Benign/VUS)
 
 import sys
 from argparse import ArgumentParser, Namespace
+from functools import partial
 from pathlib import Path
+from typing import Any, Dict, Optional
+
 import pandas as pd
 
 from varidex import version
@@ -18,8 +21,34 @@ from varidex.downloader import setup_genomic_data
 from varidex.io.loaders.clinvar import load_clinvar_file
 from varidex.io.loaders.user import load_user_file
 from varidex.io.matching_improved import match_variants_hybrid
+from varidex.io.results_store import (
+    DEFAULT_RESULTS_FORMAT,
+    RESULTS_STORES,
+    open_results_store,
+)
+from varidex.io.writers.partitioned import OUTPUT_MANIFEST, PartitionedWriter
 from varidex.pipeline.acmg_classifier_stage import apply_full_acmg_classification
 from varidex.pipeline.gnomad_stage import GnomadAnnotationStage
+from varidex.pipeline.stage_cache import DEFAULT_STAGE_CACHE_DIR, StageCache
+from varidex.pipeline.stages import StageGraph, StageProfiler, StageScheduler, StageSpec
+
+DBNSFP_DIR = "data/external/dbNSFP"
+UNIPROT_XML = "uniprot/uniprot_sprot.xml.gz"
+
+# Classification-based CSV exports: acmg_classification value -> file
+CLASSIFICATION_EXPORTS = {
+    "Pathogenic": "PATHOGENIC_variants.csv",
+    "Likely Pathogenic": "PATHOGENIC_variants.csv",
+    "Benign": "BENIGN_variants.csv",
+    "Likely Benign": "BENIGN_variants.csv",
+    "VUS": "VUS_variants.csv",
+    "Uncertain Significance": "VUS_variants.csv",
+}
+CLASSIFICATION_EXPORT_LABELS = {
+    "PATHOGENIC_variants.csv": "🔴",
+    "BENIGN_variants.csv": "🟢",
+    "VUS_variants.csv": "🟡",
+}
 
 
 def detect_genome_build_from_filename(filepath: str) -> str:
@@ -74,8 +103,16 @@ def enhance_with_phase1(result_df: pd.DataFrame) -> pd.DataFrame:
     return result_df
 
 
-def write_output_files(df: pd.DataFrame, output_dir: Path) -> None:
-    """Write ALL output files with classification-based exports"""
+def write_output_files(
+    df: pd.DataFrame, output_dir: Path, results_format: str = DEFAULT_RESULTS_FORMAT
+) -> None:
+    """
+    Write ALL output files with classification-based exports.
+
+    The complete results are stored once in a binary format (results_format,
+    see varidex.io.results_store) that keeps their dtypes; the CSV files are
+    exports only, written in a single pass with an output manifest.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # All 21 implemented ACMG codes
@@ -101,16 +138,17 @@ def write_output_files(df: pd.DataFrame, output_dir: Path) -> None:
     export_base = essentials + acmg_codes + pred_scores
     export_cols = [col for col in export_base if col in df.columns]
 
-    # Full export
-    full_df = df[export_cols].copy()
-    full_path = output_dir / "results_20codes_FULL.csv"
-    full_df.to_csv(full_path, index=False)
-    print(
-        f"\n✅ FULL EXPORT: {len(full_df)} rows x {len(export_cols)} cols -> {full_path}"
-    )
+    # Complete results (internal format)
+    store = open_results_store(output_dir, results_format)
+    results_path = store.write("results_20codes", df)
+    print(f"\n💾 RESULTS: {len(df)} rows x {len(df.columns)} cols -> {results_path}")
 
-    # Complete results
-    df.to_csv(output_dir / "results_20codes.csv", index=False)
+    # CSV exports: every subset's membership is computed up front, then all
+    # files are written in one pass over the frame (PartitionedWriter)
+    writer = PartitionedWriter(output_dir)
+    writer.record(results_path.name, results_path, len(df))
+    writer.add("results_20codes_FULL.csv", columns=export_cols, write_empty=True)
+    writer.add("results_20codes.csv", write_empty=True)
 
     # Priority code files
     priority_codes = {
@@ -120,40 +158,35 @@ def write_output_files(df: pd.DataFrame, output_dir: Path) -> None:
         "PS3": "PRIORITY_PS3.csv",
         "PP3": "PRIORITY_PP3.csv",
     }
+    flags = [code for code in priority_codes if code in df.columns]
+    flag_matrix = df[flags].eq(True).to_numpy()
+    for i, code in enumerate(flags):
+        writer.add(priority_codes[code], mask=flag_matrix[:, i])
 
-    for code, filename in priority_codes.items():
-        if code in df.columns:
-            priority_df = df[df[code] == True]
-            if len(priority_df) > 0:
-                priority_df.to_csv(output_dir / filename, index=False)
-                print(f"  📄 {filename} ({len(priority_df)} variants)")
+    # Classification-based files: one mapping pass assigns every row its file
+    if "acmg_classification" in df.columns:
+        export_file = df["acmg_classification"].map(CLASSIFICATION_EXPORTS)
+        export_file = export_file.to_numpy(dtype=object)
+        for filename in CLASSIFICATION_EXPORT_LABELS:
+            writer.add(filename, mask=export_file == filename)
+
+    files = writer.write(df)["files"]
+
+    print(
+        f"\n✅ FULL EXPORT: {len(df)} rows x {len(export_cols)} cols -> "
+        f"{output_dir / 'results_20codes_FULL.csv'}"
+    )
+    for code in flags:
+        filename = priority_codes[code]
+        if filename in files:
+            print(f"  📄 {filename} ({files[filename]['rows']} variants)")
 
-    # Classification-based files
     if "acmg_classification" in df.columns:
         print("\n🔬 Classification-based exports:")
-
-        # Pathogenic + Likely Pathogenic
-        pathogenic_df = df[
-            df["acmg_classification"].isin(["Pathogenic", "Likely Pathogenic"])
-        ]
-        if len(pathogenic_df) > 0:
-            path_file = output_dir / "PATHOGENIC_variants.csv"
-            pathogenic_df.to_csv(path_file, index=False)
-            print(f"  🔴 PATHOGENIC_variants.csv ({len(pathogenic_df)} variants)")
-
-        # Benign + Likely Benign
-        benign_df = df[df["acmg_classification"].isin(["Benign", "Likely Benign"])]
-        if len(benign_df) > 0:
-            benign_file = output_dir / "BENIGN_variants.csv"
-            benign_df.to_csv(benign_file, index=False)
-            print(f"  🟢 BENIGN_variants.csv ({len(benign_df)} variants)")
-
-        # VUS / Uncertain Significance
-        vus_df = df[df["acmg_classification"].isin(["VUS", "Uncertain Significance"])]
-        if len(vus_df) > 0:
-            vus_file = output_dir / "VUS_variants.csv"
-            vus_df.to_csv(vus_file, index=False)
-            print(f"  🟡 VUS_variants.csv ({len(vus_df)} variants)")
+        for filename, emoji in CLASSIFICATION_EXPORT_LABELS.items():
+            if filename in files:
+                print(f"  {emoji} {filename} ({files[filename]['rows']} variants)")
+    print(f"  📦 Manifest: {output_dir / OUTPUT_MANIFEST}")
 
 
 def print_acmg_summary(df: pd.DataFrame) -> tuple:
@@ -336,118 +369,75 @@ def print_summary(df: pd.DataFrame) -> None:
             )
 
 
-def main() -> None:
-    parser = ArgumentParser(
-        description=f"VariDex v{version} - ACMG Variant Classification Pipeline"
-    )
-    parser.add_argument("--clinvar", default="clinvar/clinvar_GRCh37.vcf.gz")
-    parser.add_argument("--user-genome", help="Your genome file (VCF or 23andMe)")
-    parser.add_argument("--gnomad-dir", help="gnomAD directory path")
-    parser.add_argument(
-        "--gnomad-constraint", help="gnomAD constraint file for PP2 (optional)"
-    )
-    parser.add_argument("--output", default="results_michal")
-    parser.add_argument("--force-reload", action="store_true")
-    parser.add_argument(
-        "--genome-build",
-        choices=["GRCh37", "GRCh38"],
-        help="Genome build (auto-detected if not specified)",
-    )
-
-    args: Namespace = parser.parse_args()
-
-    print("=" * 80)
-    print(f"VariDex v{version} - ACMG Variant Classification Pipeline")
-    print("=" * 80)
-
-    # Detect genome build
-    if args.genome_build:
-        genome_build = args.genome_build
-        print(f"\n🧬 Genome build: {genome_build} (user-specified)")
-    else:
-        genome_build = detect_genome_build_from_filename(args.clinvar)
-        print(f"\n🧬 Genome build: {genome_build} (auto-detected from filename)")
-
-    # Check for cached results
-    cache_file = Path("output/complete_results.csv")
-    if cache_file.exists() and not args.force_reload and not args.user_genome:
-        print(f"\nUsing cached matched results: {cache_file}")
-        matched_df = pd.read_csv(cache_file)
-        print(f"Loaded {len(matched_df)} matched variants")
-    else:
-        if not args.user_genome:
-            print("\nError: --user-genome required for initial run")
-            sys.exit(1)
-
-        # Steps 1-4: Load and Match
-        print("\n" + "=" * 80)
-        print("PHASE 1: DATA LOADING & MATCHING")
-        print("=" * 80)
-
-        clinvar_path = Path(args.clinvar)
-        if not clinvar_path.exists():
-            print(f"\n❌ ClinVar not found at {clinvar_path}")
-            sys.exit(1)
-
-        print(f"\nStep 1: Loading ClinVar from {clinvar_path}...")
-        clinvar_df = load_clinvar_file(str(clinvar_path))
-        print(f"  ✓ Loaded {len(clinvar_df):,} ClinVar variants")
-
-        print(f"\nStep 2: Loading user genome from {args.user_genome}...")
-        user_df = load_user_file(args.user_genome)
-        print(f"  ✓ Loaded {len(user_df):,} variants")
-
-        print(f"\nStep 3: Matching variants (rsID + coordinates)...")
-        matched_df, rsid_matches, coord_matches = match_variants_hybrid(
-            clinvar_df, user_df, clinvar_type="vcf", user_type="23andme"
-        )
-        print(f"  ✓ Matched {len(matched_df):,} variants")
-        print(f"    - rsID matches: {rsid_matches:,}")
-        print(f"    - Coordinate matches: {coord_matches:,}")
-
-        print(f"\nStep 4: Caching matched results...")
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
-        matched_df.to_csv(cache_file, index=False)
-        print(f"  ✓ Cached to {cache_file}")
-
-    # Store clinvar_df for later use
-    if "clinvar_df" not in locals():
-        print("\nLoading ClinVar for criteria reference...")
-        clinvar_df = load_clinvar_file(str(Path(args.clinvar)))
-
-    # Phase 2: Data Enrichment
-    print("\n" + "=" * 80)
-    print("PHASE 2: DATA ENRICHMENT")
-    print("=" * 80)
-
+def stage_gnomad(frame: pd.DataFrame, gnomad_dir: Optional[str]) -> pd.DataFrame:
+    """Step 5: gnomAD population frequencies (BA1, BS1, PM2)."""
     print("\nStep 5: Annotating with gnomAD population frequencies...")
-    if args.gnomad_dir:
-        gnomad_stage = GnomadAnnotationStage(Path(args.gnomad_dir))
-        matched_df = gnomad_stage.process(matched_df)
-    else:
+    if not gnomad_dir:
         print("  ⚠️  Skipped (no --gnomad-dir provided)")
         print("  BA1, BS1, PM2 criteria will be limited")
+        return frame
+    return GnomadAnnotationStage(Path(gnomad_dir)).process(frame)
+
 
+def stage_dbnsfp(frame: pd.DataFrame, genome_build: str) -> pd.DataFrame:
+    """Step 6: dbNSFP prediction scores."""
     print("\nStep 6: Annotating with dbNSFP prediction scores...")
     try:
         from varidex.acmg.dbnsfp_annotator import annotate_with_dbnsfp
 
-        matched_df = annotate_with_dbnsfp(
-            matched_df, "data/external/dbNSFP", genome_build
-        )
+        frame = annotate_with_dbnsfp(frame, DBNSFP_DIR, genome_build)
         print("  ✓ Complete")
     except Exception as e:
         print(f"  ⚠️  dbNSFP annotation failed: {e}")
         print("  PS3, PP3, BP4 criteria will be limited")
+    return frame
+
+
+def stage_pm1_index(frame: pd.DataFrame) -> Dict[str, Any]:
+    """Load the UniProt domain index for PM1 (None if unavailable)."""
+    try:
+        from varidex.acmg.criteria_pm1 import PM1Classifier
 
-    # Phase 3: ACMG Classification
+        return {"pm1": PM1Classifier(UNIPROT_XML)}
+    except Exception as e:
+        print(f"  ⚠️  PM1 index unavailable: {e}")
+        return {"pm1": None}
+
+
+def stage_clinvar_indexes(frame: pd.DataFrame, clinvar_path: Path) -> Dict[str, Any]:
+    """
+    Build the PS1/PM5 pathogenic indexes (None if unavailable).
+
+    Both read ClinVar through a ClinVarReference: cached indexes need no
+    ClinVar data, and a rebuild reads only the index source columns.
+    """
+    try:
+        from varidex.acmg.clinvar_index import ClinVarReference
+        from varidex.acmg.criteria_pm5 import PM5Classifier
+        from varidex.acmg.criteria_ps1 import PS1Classifier
+
+        reference = ClinVarReference(clinvar_path)
+        return {"pm5": PM5Classifier(reference), "ps1": PS1Classifier(reference)}
+    except Exception as e:
+        print(f"  ⚠️  PS1/PM5 indexes unavailable: {e}")
+        return {"pm5": None, "ps1": None}
+
+
+def stage_classify(
+    frame: pd.DataFrame,
+    pm1: Any,
+    pm5: Any,
+    ps1: Any,
+    gnomad_constraint: Optional[str] = None,
+) -> pd.DataFrame:
+    """Steps 7-11: ACMG criteria on the enriched frame."""
     print("\n" + "=" * 80)
     print("PHASE 3: ACMG CLASSIFICATION (21/28 criteria implemented)")
     print("=" * 80)
 
     print("\nStep 7: Base ACMG criteria (PVS1, PM4, PP2, BP1, BP3)...")
     result_df = apply_full_acmg_classification(
-        matched_df, gnomad_constraint_path=args.gnomad_constraint
+        frame, gnomad_constraint_path=gnomad_constraint
     )
     print("  ✓ Complete")
 
@@ -456,23 +446,22 @@ def main() -> None:
 
     print("\nStep 9: Domain/position-based criteria (PM1, PM5, PM3, PS1)...")
     try:
-        from varidex.acmg.criteria_pm1 import PM1Classifier
-        from varidex.acmg.criteria_pm5 import PM5Classifier
         from varidex.acmg.criteria_pm3 import PM3Classifier
-        from varidex.acmg.criteria_ps1 import PS1Classifier
 
-        pm1 = PM1Classifier("uniprot/uniprot_sprot.xml.gz")
-        result_df = pm1.apply_pm1(result_df)
-
-        pm5 = PM5Classifier(clinvar_df)
-        result_df = pm5.apply_pm5(result_df)
+        if pm1 is not None:
+            result_df = pm1.apply_pm1(result_df)
+        if pm5 is not None:
+            result_df = pm5.apply_pm5(result_df)
 
         pm3 = PM3Classifier()
         result_df = pm3.apply_pm3(result_df)
 
-        ps1 = PS1Classifier(clinvar_df)
-        result_df = ps1.apply_ps1(result_df)
+        if ps1 is not None:
+            result_df = ps1.apply_ps1(result_df)
+
+        from varidex.acmg.clinvar_index import get_index_cache
 
+        get_index_cache().log_stats()
         print("  ✓ Complete")
     except Exception as e:
         print(f"  ⚠️  Warning: {e}")
@@ -487,7 +476,7 @@ def main() -> None:
         lof_genes, missense_genes = load_curated_gene_lists()
 
         ps3_classifier = PS3_PP2_Classifier(
-            gnomad_constraint_path=args.gnomad_constraint,
+            gnomad_constraint_path=gnomad_constraint,
             lof_genes=lof_genes,
             missense_genes=missense_genes,
         )
@@ -512,17 +501,256 @@ def main() -> None:
     except Exception as e:
         print(f"  ⚠️  Warning: {e}")
 
+    return result_df
+
+
+def load_and_match(clinvar_path: Path, user_genome: str) -> pd.DataFrame:
+    """
+    Steps 1-3: load ClinVar and the user genome, then match them.
+
+    The ClinVar frame is released on return; later stages read ClinVar
+    through a column-projected ClinVarReference.
+    """
+    print(f"\nStep 1: Loading ClinVar from {clinvar_path}...")
+    clinvar_df = load_clinvar_file(str(clinvar_path))
+    print(f"  ✓ Loaded {len(clinvar_df):,} ClinVar variants")
+
+    print(f"\nStep 2: Loading user genome from {user_genome}...")
+    user_df = load_user_file(user_genome)
+    print(f"  ✓ Loaded {len(user_df):,} variants")
+
+    print(f"\nStep 3: Matching variants (rsID + coordinates)...")
+    matched_df, rsid_matches, coord_matches = match_variants_hybrid(
+        clinvar_df, user_df, clinvar_type="vcf", user_type="23andme"
+    )
+    print(f"  ✓ Matched {len(matched_df):,} variants")
+    print(f"    - rsID matches: {rsid_matches:,}")
+    print(f"    - Coordinate matches: {coord_matches:,}")
+    return matched_df
+
+
+def stage_cache_keys(
+    cache: StageCache,
+    match_key: str,
+    gnomad_dir: Optional[str],
+    genome_build: str,
+    clinvar_path: Path,
+    gnomad_constraint: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Cache keys for the enrichment and classification stages.
+
+    gnomAD and dbNSFP depend only on the matched variants and their own
+    data, so changing one recomputes just that stage and classification.
+    """
+    keys = {
+        "gnomad": cache.key("gnomad", files=[gnomad_dir], upstream=[match_key]),
+        "dbnsfp": cache.key(
+            "dbnsfp",
+            files=[DBNSFP_DIR],
+            upstream=[match_key],
+            config={"genome_build": genome_build},
+        ),
+    }
+    keys["classify"] = cache.key(
+        "classify",
+        files=[clinvar_path, gnomad_constraint, UNIPROT_XML],
+        upstream=[match_key, keys["gnomad"], keys["dbnsfp"]],
+    )
+    return keys
+
+
+def build_stage_graph(
+    gnomad_dir: Optional[str],
+    genome_build: str,
+    clinvar_path: Path,
+    gnomad_constraint: Optional[str] = None,
+    cache_keys: Optional[Dict[str, str]] = None,
+) -> StageGraph:
+    """
+    Steps 5-11 as a stage graph.
+
+    gnomAD and dbNSFP annotation write disjoint columns and the PM1 and
+    PS1/PM5 indexes need no columns, so all four run concurrently after
+    matching; classification waits for all of them. They are thread stages:
+    the annotators already fan out to their own worker pools, and the index
+    builders return large objects that would be costly to pickle back from
+    a process pool.
+
+    cache_keys (see stage_cache_keys) memoize gnomad, dbnsfp and classify.
+    """
+    cache_keys = cache_keys or {}
+    return StageGraph(
+        [
+            StageSpec(
+                "gnomad",
+                partial(stage_gnomad, gnomad_dir=gnomad_dir),
+                inputs=("*",),
+                outputs=("gnomad*", "BA1", "BS1", "PM2"),
+                cache_key=cache_keys.get("gnomad"),
+            ),
+            StageSpec(
+                "dbnsfp",
+                partial(stage_dbnsfp, genome_build=genome_build),
+                inputs=("chromosome", "position", "ref_allele", "alt_allele"),
+                outputs=("SIFT_score", "PolyPhen_score", "CADD_phred", "REVEL_score"),
+                cache_key=cache_keys.get("dbnsfp"),
+            ),
+            StageSpec("pm1_index", stage_pm1_index, provides=("pm1",)),
+            StageSpec(
+                "clinvar_indexes",
+                partial(stage_clinvar_indexes, clinvar_path=clinvar_path),
+                provides=("pm5", "ps1"),
+            ),
+            StageSpec(
+                "classify",
+                partial(stage_classify, gnomad_constraint=gnomad_constraint),
+                inputs=("*",),
+                outputs=("*",),
+                requires=("pm1", "pm5", "ps1"),
+                executor="inline",
+                cache_key=cache_keys.get("classify"),
+            ),
+        ]
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description=f"VariDex v{version} - ACMG Variant Classification Pipeline"
+    )
+    parser.add_argument("--clinvar", default="clinvar/clinvar_GRCh37.vcf.gz")
+    parser.add_argument("--user-genome", help="Your genome file (VCF or 23andMe)")
+    parser.add_argument("--gnomad-dir", help="gnomAD directory path")
+    parser.add_argument(
+        "--gnomad-constraint", help="gnomAD constraint file for PP2 (optional)"
+    )
+    parser.add_argument("--output", default="results_michal")
+    parser.add_argument(
+        "--force-reload",
+        action="store_true",
+        help="Recompute every stage (outputs are still cached)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_STAGE_CACHE_DIR),
+        help="Stage output cache directory",
+    )
+    parser.add_argument(
+        "--results-format",
+        choices=sorted(RESULTS_STORES),
+        default=DEFAULT_RESULTS_FORMAT,
+        help="Format of the stored results (CSV files are exports)",
+    )
+    parser.add_argument(
+        "--trace",
+        help="Write stage and sub-stage spans as Chrome trace JSON to this path",
+    )
+    parser.add_argument(
+        "--genome-build",
+        choices=["GRCh37", "GRCh38"],
+        help="Genome build (auto-detected if not specified)",
+    )
+
+    args: Namespace = parser.parse_args()
+
+    print("=" * 80)
+    print(f"VariDex v{version} - ACMG Variant Classification Pipeline")
+    print("=" * 80)
+
+    # Detect genome build
+    if args.genome_build:
+        genome_build = args.genome_build
+        print(f"\n🧬 Genome build: {genome_build} (user-specified)")
+    else:
+        genome_build = detect_genome_build_from_filename(args.clinvar)
+        print(f"\n🧬 Genome build: {genome_build} (auto-detected from filename)")
+
+    # Stage outputs are memoized by input fingerprints (see stage_cache)
+    cache = StageCache(args.cache_dir, refresh=args.force_reload)
+    clinvar_path = Path(args.clinvar)
+
+    print("\n" + "=" * 80)
+    print("PHASE 1: DATA LOADING & MATCHING")
+    print("=" * 80)
+
+    if args.user_genome:
+        if not clinvar_path.exists():
+            print(f"\n❌ ClinVar not found at {clinvar_path}")
+            sys.exit(1)
+        match_key = cache.key(
+            "match",
+            files=[clinvar_path, args.user_genome],
+            config={"clinvar_type": "vcf", "user_type": "23andme"},
+        )
+        matched_df = cache.get_or_compute(
+            "match",
+            match_key,
+            partial(load_and_match, clinvar_path, args.user_genome),
+        )
+    else:
+        # No genome given: reuse the last matched results, if any
+        match_key = cache.latest_key("match")
+        matched_df = cache.load("match", match_key) if match_key else None
+        if matched_df is None:
+            print("\nError: --user-genome required for initial run")
+            sys.exit(1)
+        print(f"\nUsing cached matched results ({match_key})")
+    print(f"Matched variants: {len(matched_df):,}")
+
+    # Phases 2-3 as a stage graph: enrichment and index building run
+    # concurrently, classification joins them (see build_stage_graph)
+    print("\n" + "=" * 80)
+    print("PHASE 2: DATA ENRICHMENT")
+    print("=" * 80)
+
+    profiler = StageProfiler()
+    scheduler = StageScheduler(profiler, cache=cache)
+    graph = build_stage_graph(
+        gnomad_dir=args.gnomad_dir,
+        genome_build=genome_build,
+        clinvar_path=clinvar_path,
+        gnomad_constraint=args.gnomad_constraint,
+        cache_keys=stage_cache_keys(
+            cache,
+            match_key,
+            args.gnomad_dir,
+            genome_build,
+            clinvar_path,
+            args.gnomad_constraint,
+        ),
+    )
+    result_df, _ = scheduler.run(graph, matched_df)
+    print("\n♻️  Stage cache:")
+    for line in cache.format_report():
+        print(f"   {line}")
+    if scheduler.last_report.get("path"):
+        report = scheduler.last_report
+        print(
+            f"\n⏱  Critical path: {' → '.join(report['path'])} "
+            f"({report['critical_path_sec']}s of {report['wall_sec']}s wall, "
+            f"{report['total_stage_sec']}s total stage time)"
+        )
+    print("\n🔍 Span profile (slowest first):")
+    for line in profiler.spans.format_summary()[:16]:
+        print(f"   {line}")
+    if args.trace:
+        profiler.export_chrome_trace(Path(args.trace))
+        print(f"   Chrome trace: {args.trace}")
+
     # Output
     output_path = Path(args.output)
-    write_output_files(result_df, output_path)
+    write_output_files(result_df, output_path, args.results_format)
 
     print(f"\nOutput directory: {output_path.resolve()}")
-    print("  - results_20codes.csv (all data)")
+    print(f"  - results_20codes.{args.results_format} (all data, typed)")
+    print("  - results_20codes.csv (all data, CSV export)")
     print("  - results_20codes_FULL.csv (essentials + ACMG criteria)")
     print("  - PATHOGENIC_variants.csv (high-risk)")
     print("  - BENIGN_variants.csv (safe)")
     print("  - VUS_variants.csv (uncertain)")
     print("  - PRIORITY_*.csv (code-specific)")
+    print(f"  - {OUTPUT_MANIFEST} (rows and bytes per file)")
 
     print_summary(result_df)
 
@@ -7,17 +7,36 @@ Version: 1.1.0-dev (BA4/BP2 integrated)
 """
 
 import logging
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from varidex.core.classifier.config import ACMGConfig
 from varidex.acmg.criteria_ba4_bp2 import BA4BP2Classifier
 from varidex.core.classifier.evidence_assignment_pm2 import assign_evidence_codes
-from varidex.core.models import ACMGEvidenceSet, VariantData
+from varidex.core.evidence_bits import MASK_DTYPE
+from varidex.core.models import ACMGEvidenceSet, VariantData, VariantRecord
+from varidex.utils.profiling import traced
 
 logger = logging.getLogger(__name__)
 
+FAILED_CLASSIFICATION: Dict[str, Any] = {
+    "PVS1": False,
+    "PM2": False,
+    "PM4": False,
+    "PP2": False,
+    "BA1": False,
+    "BS1": False,
+    "BP1": False,
+    "BP3": False,
+    "BA4": False,
+    "BP2": False,
+    "acmg_classification": "Uncertain Significance",
+    "classification_reason": "Error",
+    "evidence_summary": "",
+    "evidence_mask": 0,
+}
+
 
 def evidence_summary(evidence: ACMGEvidenceSet) -> str:
     """Create summary string from evidence set."""
@@ -73,21 +92,33 @@ def classify_from_evidence(
     return "Uncertain Significance", "No evidence"
 
 
-def classify_variant_with_acmg(row: pd.Series, config: ACMGConfig) -> Dict[str, Any]:
-    """Classify a single variant with ACMG criteria including BA4/BP2."""
-    try:
-        variant = VariantData(
-            chromosome=str(row.get("chromosome_clinvar", row.get("chromosome"))),
-            position=str(row.get("position_clinvar", row.get("position"))),
-            ref=str(row["ref_allele"]),
-            alt=str(row["alt_allele"]),
-        )
-
-        variant.gene = str(row.get("gene", ""))
-        variant.molecular_consequence = str(row.get("molecular_consequence", ""))
+def classify_variant_with_acmg(
+    row: pd.Series, config: ACMGConfig, record: Optional[VariantRecord] = None
+) -> Dict[str, Any]:
+    """Classify a single variant with ACMG criteria including BA4/BP2.
 
-        if pd.notna(row.get("gnomad_af")):
-            object.__setattr__(variant, "gnomad_af", float(row["gnomad_af"]))
+    Args:
+        row: Variant row
+        config: ACMG configuration
+        record: Pre-built VariantRecord for the row (built from the row if
+            omitted)
+    """
+    try:
+        if record is None:
+            variant = VariantData(
+                chromosome=str(row.get("chromosome_clinvar", row.get("chromosome"))),
+                position=str(row.get("position_clinvar", row.get("position"))),
+                ref=str(row["ref_allele"]),
+                alt=str(row["alt_allele"]),
+            )
+
+            variant.gene = str(row.get("gene", ""))
+            variant.molecular_consequence = str(row.get("molecular_consequence", ""))
+
+            if pd.notna(row.get("gnomad_af")):
+                object.__setattr__(variant, "gnomad_af", float(row["gnomad_af"]))
+        else:
+            variant = record
 
         evidence = assign_evidence_codes(variant, config)
 
@@ -109,27 +140,51 @@ def classify_variant_with_acmg(row: pd.Series, config: ACMGConfig) -> Dict[str,
             "acmg_classification": classification,
             "classification_reason": reason,
             "evidence_summary": evidence_summary(evidence),
+            "evidence_mask": evidence.to_mask(),
         }
 
     except Exception as e:
         logger.debug(f"Classification error: {e}")
-        return {
-            "PVS1": False,
-            "PM2": False,
-            "PM4": False,
-            "PP2": False,
-            "BA1": False,
-            "BS1": False,
-            "BP1": False,
-            "BP3": False,
-            "BA4": False,
-            "BP2": False,
-            "acmg_classification": "Uncertain Significance",
-            "classification_reason": "Error",
-            "evidence_summary": "",
-        }
+        return dict(FAILED_CLASSIFICATION)
+
+
+def build_variant_records(df: pd.DataFrame) -> List[Optional[VariantRecord]]:
+    """Build VariantRecords for all rows in one vectorized validation pass.
+
+    Uses the same columns as classify_variant_with_acmg(); rows that fail
+    validation (or a frame without allele columns) yield None.
+    """
+    if "ref_allele" not in df.columns or "alt_allele" not in df.columns:
+        return [None] * len(df)
+
+    def first_column(*names: str) -> Any:
+        for name in names:
+            if name in df.columns:
+                return df[name].astype(str)
+        return ["None"] * len(df)
+
+    columns: Dict[str, Any] = {
+        "gene": df["gene"].astype(str) if "gene" in df.columns else [""] * len(df),
+        "molecular_consequence": (
+            df["molecular_consequence"].astype(str)
+            if "molecular_consequence" in df.columns
+            else [""] * len(df)
+        ),
+    }
+    if "gnomad_af" in df.columns:
+        columns["gnomad_af"] = pd.to_numeric(df["gnomad_af"], errors="coerce")
+
+    return VariantRecord.from_arrays(
+        first_column("chromosome_clinvar", "chromosome"),
+        first_column("position_clinvar", "position"),
+        df["ref_allele"].astype(str),
+        df["alt_allele"].astype(str),
+        on_invalid="none",
+        **columns,
+    )
 
 
+@traced("criteria.base_acmg")
 def apply_full_acmg_classification(
     df: pd.DataFrame, gnomad_constraint_path: str = None
 ) -> pd.DataFrame:
@@ -168,6 +223,7 @@ def apply_full_acmg_classification(
     result["acmg_classification"] = "Uncertain Significance"
     result["classification_reason"] = ""
     result["evidence_summary"] = ""
+    result["evidence_mask"] = 0
 
     # Apply BA4/BP2 criteria BEFORE main classification
     if gnomad_constraint_path:
@@ -181,10 +237,15 @@ def apply_full_acmg_classification(
         logger.warning("gnomad_constraint_path not provided - skipping BA4/BP2")
 
     # Apply main ACMG classification
-    for idx, row in result.iterrows():
-        classification_result = classify_variant_with_acmg(row, config)
+    records = build_variant_records(result)
+    for (idx, row), record in zip(result.iterrows(), records):
+        if record is None:
+            classification_result = dict(FAILED_CLASSIFICATION)
+        else:
+            classification_result = classify_variant_with_acmg(row, config, record)
         for key, value in classification_result.items():
             result.at[idx, key] = value
+    result["evidence_mask"] = result["evidence_mask"].astype(MASK_DTYPE)
 
     logger.info(f"✅ Classified {len(result):,} variants")
 
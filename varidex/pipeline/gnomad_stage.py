@@ -14,6 +14,7 @@ from varidex.pipeline.gnomad_annotator import (
     apply_frequency_acmg_criteria,
 )
 from varidex.utils.cpu_utils import get_optimal_workers
+from varidex.utils.profiling import span
 
 
 class GnomadAnnotationStage:
@@ -82,7 +83,9 @@ class GnomadAnnotationStage:
         original_index = df.index.copy()
 
         # Normalize column names and filter NaNs
-        df_clean = self._normalize_columns(df)
+        with span("gnomad.normalize", rows_in=original_count) as s:
+            df_clean = self._normalize_columns(df)
+            s.rows_out = len(df_clean)
 
         # Check if we have data left
         if len(df_clean) == 0:
@@ -107,7 +110,8 @@ class GnomadAnnotationStage:
             )
 
             print("Applying BA1, BS1, PM2 frequency criteria...")
-            result = apply_frequency_acmg_criteria(result)
+            with span("gnomad.frequency_criteria", rows_in=len(result)):
+                result = apply_frequency_acmg_criteria(result)
 
             # FIXED: Proper DataFrame column counting
             ba1_count = result["BA1"].sum() if "BA1" in result.columns else 0
@@ -123,12 +127,14 @@ class GnomadAnnotationStage:
             print()
 
             # FIXED: Index-preserving merge for ALL cases
-            df_out = df.copy()
-            common_index = original_index.intersection(result.index)
-
-            for col in result.columns:
-                if col.startswith("gnomad") or col in ["BA1", "BS1", "PM2"]:
-                    df_out.loc[common_index, col] = result.loc[common_index, col]
+            with span("gnomad.propagate", rows_in=len(result)) as s:
+                df_out = df.copy()
+                common_index = original_index.intersection(result.index)
+
+                for col in result.columns:
+                    if col.startswith("gnomad") or col in ["BA1", "BS1", "PM2"]:
+                        df_out.loc[common_index, col] = result.loc[common_index, col]
+                s.rows_out = len(common_index)
 
             print(
                 f"  Propagated gnomAD data to {len(common_index):,} matching variants"
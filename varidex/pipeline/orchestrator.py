@@ -14,6 +14,8 @@ from typing import List
 import numpy as np
 import pandas as pd
 
+from varidex.io.results_store import DEFAULT_RESULTS_FORMAT, open_results_store
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -149,11 +151,11 @@ def main(clinvar_path: str, user_data_path: str, **kwargs) -> bool:
     # ==================== STAGE 7: REPORTS ====================
     print("\n📊 STAGE 7: REPORT GENERATION ✓")
 
-    # Save full matches
-    matches.to_csv(
-        output_dir / "01_matched_variants.csv.gz", index=False, compression="gzip"
-    )
-    print(f"  ✓ 01_matched_variants.csv.gz ({len(matches):,} rows)")
+    # Save full matches (binary results store; dtypes survive re-reading)
+    results_format = kwargs.get("results_format", DEFAULT_RESULTS_FORMAT)
+    store = open_results_store(output_dir, results_format)
+    matches_path = store.write("01_matched_variants", matches)
+    print(f"  ✓ {matches_path.name} ({len(matches):,} rows)")
 
     # ✅ FIXED: Summary DataFrame
     summary_data = {
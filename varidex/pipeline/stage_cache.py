@@ -0,0 +1,184 @@
+"""Input-fingerprinted memoization of pipeline stage outputs.
+
+Each stage output is stored as {name}-{key}.parquet, where key hashes
+everything the stage depends on:
+
+    source files    (file_fingerprint; directories by file names, sizes
+                     and mtimes)
+    upstream keys   (so a changed input invalidates every later stage)
+    stage config    (JSON-serialized)
+    versions        (VariDex version plus a per-stage version to bump when
+                     a stage changes what it produces)
+
+Changing only the gnomAD directory therefore recomputes the gnomAD stage
+and everything downstream of it, while matching and dbNSFP are reused.
+StageCache.report records, per stage, whether it was reused, computed or
+skipped.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+from varidex.utils.fingerprint import combine_keys, file_fingerprint
+from varidex.version import __version__ as VARIDEX_VERSION
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STAGE_CACHE_DIR = Path(".varidex_cache") / "stages"
+LATEST_KEYS_FILE = "latest.json"
+
+
+def path_fingerprint(path: Optional[Union[str, Path]]) -> str:
+    """
+    Fingerprint a source file or directory ("none"/"missing" otherwise).
+
+    Directories hash the relative name, size and mtime of every file, so
+    adding, replacing or re-downloading any file changes the result.
+    """
+    if not path:
+        return "none"
+    path = Path(path)
+    if path.is_file():
+        return file_fingerprint(path)
+    if path.is_dir():
+        entries = []
+        for child in sorted(path.rglob("*")):
+            if child.is_file():
+                stat = child.stat()
+                rel = child.relative_to(path)
+                entries.append(f"{rel}:{stat.st_size}:{int(stat.st_mtime)}")
+        return combine_keys(*entries)
+    return "missing"
+
+
+class StageCache:
+    """On-disk stage outputs keyed by a hash of the stage's inputs."""
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_STAGE_CACHE_DIR,
+        enabled: bool = True,
+        refresh: bool = False,
+    ):
+        """
+        Args:
+            cache_dir: Directory for stored outputs
+            enabled: False disables both reads and writes
+            refresh: Recompute every stage but still store the outputs
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.refresh = refresh
+        self.report: Dict[str, Dict[str, Any]] = {}
+
+    def key(
+        self,
+        name: str,
+        files: Iterable[Optional[Union[str, Path]]] = (),
+        upstream: Iterable[str] = (),
+        config: Optional[Dict[str, Any]] = None,
+        version: str = "1",
+    ) -> str:
+        """
+        Cache key for one stage.
+
+        Args:
+            name: Stage name
+            files: Source files/directories the stage reads
+            upstream: Keys of the stages whose outputs it consumes
+            config: Settings that change the output
+            version: Stage version (bump when the stage logic changes)
+        """
+        return combine_keys(
+            name,
+            VARIDEX_VERSION,
+            version,
+            *(path_fingerprint(f) for f in files),
+            *upstream,
+            json.dumps(config or {}, sort_keys=True, default=str),
+        )
+
+    def _path(self, name: str, key: str) -> Path:
+        return self.cache_dir / f"{name}-{key}.parquet"
+
+    def load(self, name: str, key: str) -> Optional[pd.DataFrame]:
+        """Cached output for (name, key), or None on a miss."""
+        if not self.enabled or self.refresh:
+            return None
+        path = self._path(name, key)
+        if not path.exists():
+            return None
+        try:
+            df = pd.read_parquet(path)
+        except Exception as e:
+            logger.warning(f"Stage cache [{name}]: unreadable ({e}), recomputing")
+            return None
+        self.record(name, "reused", key, rows=len(df))
+        return df
+
+    def store(self, name: str, key: str, df: pd.DataFrame) -> None:
+        """Save an output, replacing older entries for the same stage."""
+        self.record(name, "computed", key, rows=len(df))
+        if not self.enabled:
+            return
+        path = self._path(name, key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            df.to_parquet(tmp_path, compression="zstd")
+            tmp_path.replace(path)
+            for stale in self.cache_dir.glob(f"{name}-*.parquet"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+            self._set_latest(name, key)
+        except Exception as e:
+            logger.warning(f"Stage cache [{name}]: failed to store output: {e}")
+
+    def get_or_compute(
+        self, name: str, key: str, compute: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Cached output for (name, key), computing and storing it on a miss."""
+        df = self.load(name, key)
+        if df is None:
+            df = compute()
+            self.store(name, key, df)
+        return df
+
+    def latest_key(self, name: str) -> Optional[str]:
+        """Key of the most recently stored output of a stage."""
+        try:
+            with open(self.cache_dir / LATEST_KEYS_FILE) as f:
+                return json.load(f).get(name)
+        except (OSError, ValueError):
+            return None
+
+    def _set_latest(self, name: str, key: str) -> None:
+        path = self.cache_dir / LATEST_KEYS_FILE
+        try:
+            with open(path) as f:
+                latest = json.load(f)
+        except (OSError, ValueError):
+            latest = {}
+        latest[name] = key
+        with open(path, "w") as f:
+            json.dump(latest, f, indent=2)
+
+    def record(
+        self, name: str, status: str, key: Optional[str] = None, **info: Any
+    ) -> None:
+        """Note what happened to a stage ("reused", "computed", "skipped")."""
+        self.report[name] = {"status": status, "key": key, **info}
+        logger.info(f"Stage cache [{name}]: {status}" + (f" ({key})" if key else ""))
+
+    def format_report(self) -> List[str]:
+        """One line per stage, e.g. 'gnomad: reused (1,234 rows)'."""
+        lines = []
+        for name, entry in self.report.items():
+            rows = entry.get("rows")
+            suffix = f" ({rows:,} rows)" if rows is not None else ""
+            lines.append(f"{name}: {entry['status']}{suffix}")
+        return lines
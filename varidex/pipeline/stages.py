@@ -40,16 +40,25 @@ Changes in v8.0.0:
 Development version - not for production use.
 """
 
+import contextlib
+import fnmatch
 import gc
 import json
 import logging
+import os
 import time
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import types
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import asdict, dataclass
 from enum import Enum
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 import psutil
@@ -78,6 +87,7 @@ class StageMetrics:
     input_rows: int
     output_rows: int
     error: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = None
 
 
 @dataclass
@@ -122,13 +132,32 @@ def validate_stage_input(
 
 
 class StageProfiler:
-    """Performance tracker with thread safety."""
+    """
+    Performance tracker with thread safety.
+
+    Each stage is also the root span of a SpanRecorder (self.spans, see
+    varidex.utils.profiling): span() and @traced sections run by the stage
+    nest under it, and export_chrome_trace()/span_summary() report the
+    hierarchy. The recorder is only active inside recording(), which
+    StageExecutor and StageScheduler enter while they run stages.
+    """
 
     def __init__(self, enabled: bool = True):
+        from varidex.utils.profiling import SpanRecorder
+
         self.enabled = enabled
         self.metrics: List[StageMetrics] = []
+        # Unrounded duration of the last run of each stage (critical_path)
+        self._durations: Dict[str, float] = {}
         self._lock = Lock()
         self.process = psutil.Process()
+        self.spans = SpanRecorder()
+
+    def recording(self):
+        """Context manager activating self.spans (no-op when disabled)."""
+        if not self.enabled:
+            return contextlib.nullcontext(self.spans)
+        return self.spans.recording()
 
     def start_stage(self, stage_id: int, stage_name: str, input_rows: int = 0) -> Dict:
         if not self.enabled:
@@ -140,18 +169,33 @@ class StageProfiler:
             "start_time": time.time(),
             "start_memory": self.process.memory_info().rss / 1024 / 1024,
             "input_rows": input_rows,
+            "span": self.spans.open(
+                stage_name,
+                category="stage",
+                parent=None,
+                rows_in=input_rows,
+                stage_id=stage_id,
+            ),
         }
 
+    def in_stage(self, context: Dict, func: Callable) -> Callable:
+        """func wrapped so its spans nest under the stage of context."""
+        if not context or context.get("span") is None:
+            return func
+        return self.spans.bind(context["span"], func)
+
     def end_stage(
         self,
         context: Dict,
         output_rows: int = 0,
         status: str = "success",
         error: str = None,
+        end_time: Optional[float] = None,
+        extra: Optional[Dict[str, Any]] = None,
     ):
         if not self.enabled or not context:
             return
-        duration = time.time() - context["start_time"]
+        duration = (end_time or time.time()) - context["start_time"]
         memory = self.process.memory_info().rss / 1024 / 1024 - context["start_memory"]
         cpu = self.process.cpu_percent(interval=0)
 
@@ -165,15 +209,71 @@ class StageProfiler:
             input_rows=context["input_rows"],
             output_rows=output_rows,
             error=error,
+            extra=extra,
         )
 
         with self._lock:
             self.metrics.append(metric)
+            self._durations[metric.stage_name] = duration
+
+        span = context.get("span")
+        if span is not None:
+            span.start = context["start_time"]
+            span.rows_out = output_rows
+            if status != "success":
+                span.set(status=status, error=error)
+            self.spans.close(span, end_time)
 
         logger.info(
             f"⏱ {metric.stage_name}: {metric.duration_sec}s, {metric.memory_mb}MB, {metric.output_rows} rows"
         )
 
+    def critical_path(self, dependencies: Dict[str, List[str]]) -> Dict[str, Any]:
+        """
+        Longest chain of recorded stage durations through a stage graph.
+
+        Args:
+            dependencies: Stage name -> names it waits for (StageGraph)
+
+        Returns:
+            Dict with path (stage names), critical_path_sec and
+            total_stage_sec (sum over the graph's stages)
+
+        Uses unrounded durations; ties go to the longer chain, so a
+        near-instant join stage stays on the path that ends in it.
+        """
+        with self._lock:
+            durations = {
+                name: sec
+                for name, sec in self._durations.items()
+                if name in dependencies
+            }
+        finish: Dict[str, Tuple[float, List[str]]] = {}
+
+        def rank(chain: Tuple[float, List[str]]) -> Tuple[float, int]:
+            return chain[0], len(chain[1])
+
+        def longest(name: str) -> Tuple[float, List[str]]:
+            if name not in finish:
+                best = max(
+                    (longest(dep) for dep in dependencies.get(name, [])),
+                    default=(0.0, []),
+                    key=rank,
+                )
+                finish[name] = (best[0] + durations.get(name, 0.0), best[1] + [name])
+            return finish[name]
+
+        total, path = max(
+            (longest(name) for name in dependencies),
+            default=(0.0, []),
+            key=rank,
+        )
+        return {
+            "path": path,
+            "critical_path_sec": round(total, 3),
+            "total_stage_sec": round(sum(durations.values()), 3),
+        }
+
     def export_metrics(self, output_path: Path):
         with self._lock:
             metrics_data = [asdict(m) for m in self.metrics]
@@ -181,19 +281,144 @@ class StageProfiler:
             json.dump(metrics_data, f, indent=2)
         logger.info(f"📊 Metrics exported to {output_path}")
 
+    def export_chrome_trace(self, output_path: Path) -> None:
+        """Stage and sub-stage spans as Chrome trace-event JSON."""
+        self.spans.export_chrome_trace(output_path)
+
+    def span_summary(self) -> List[Dict[str, Any]]:
+        """Flat per-span-name table (see SpanRecorder.summary)."""
+        return self.spans.summary()
+
+
+CHECKPOINT_MANIFEST = "checkpoint_manifest.json"
+# Columns identifying a row; frames with the same keys in the same order
+# share column files between checkpoints.
+CHECKPOINT_ROW_KEYS = (
+    "rsid",
+    "chromosome",
+    "position",
+    "ref_allele",
+    "alt_allele",
+    "ref",
+    "alt",
+)
+
 
 class CheckpointManager:
-    """State snapshots with memory optimization."""
+    """
+    Column-delta stage snapshots with an on-disk manifest.
+
+    Each checkpoint is a manifest entry that maps every column to an
+    uncompressed Feather (Arrow IPC) file. If a frame has the same row keys
+    as an earlier checkpoint (CHECKPOINT_ROW_KEYS fingerprint), only its new
+    or changed columns are written. Unchanged columns keep pointing at the
+    earlier files. With resume=True the manifest of a previous run is
+    loaded, so a crashed pipeline can resume. load_checkpoint() memory-maps
+    only the column files it needs.
+    """
+
+    MANIFEST_VERSION = 1
 
     def __init__(
-        self, checkpoint_dir: Path, enabled: bool = True, free_memory: bool = False
+        self,
+        checkpoint_dir: Path,
+        enabled: bool = True,
+        free_memory: bool = False,
+        resume: bool = False,
     ):
         self.checkpoint_dir = Path(checkpoint_dir)
         self.enabled = enabled
         self.free_memory = free_memory
+        self.manifest_path = self.checkpoint_dir / CHECKPOINT_MANIFEST
+        self.manifest: Dict[str, Any] = {
+            "version": self.MANIFEST_VERSION,
+            "stages": {},
+        }
         self.checkpoints: Dict[int, StageCheckpoint] = {}
         if enabled:
             self.checkpoint_dir.mkdir(exist_ok=True, parents=True)
+            self._init_manifest(resume)
+
+    def _init_manifest(self, resume: bool) -> None:
+        previous = self._read_manifest()
+        if previous is None:
+            return
+        if resume:
+            self.manifest = previous
+            for key, entry in previous["stages"].items():
+                self.checkpoints[int(key)] = self._checkpoint_for(entry)
+            logger.info(
+                f"♻ Checkpoint manifest loaded: stages {sorted(self.checkpoints)}"
+            )
+            return
+        # Fresh run: drop the previous run's files
+        for entry in previous["stages"].values():
+            for name in self._own_files(entry):
+                (self.checkpoint_dir / name).unlink(missing_ok=True)
+        self.manifest_path.unlink(missing_ok=True)
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return None
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint manifest: {e}")
+            return None
+        if manifest.get("version") != self.MANIFEST_VERSION:
+            logger.info("Checkpoint manifest version changed; starting fresh")
+            return None
+        return manifest
+
+    def _write_manifest(self) -> None:
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _checkpoint_for(self, entry: Dict[str, Any]) -> StageCheckpoint:
+        own = self._own_files(entry)
+        return StageCheckpoint(
+            stage_id=entry["stage_id"],
+            timestamp=entry["timestamp"],
+            row_count=entry["row_count"],
+            file_path=self.checkpoint_dir / own[0] if own else None,
+        )
+
+    @staticmethod
+    def _own_files(entry: Dict[str, Any]) -> List[str]:
+        return [entry["file"]] if entry.get("file") else []
+
+    @staticmethod
+    def _row_key(df: pd.DataFrame) -> Optional[str]:
+        from varidex.utils.fingerprint import frame_fingerprint
+
+        keys = [col for col in CHECKPOINT_ROW_KEYS if col in df.columns]
+        if not keys:
+            return None
+        try:
+            return f"{len(df)}:{frame_fingerprint(df, keys)}"
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _column_digest(df: pd.DataFrame, column: str) -> Optional[str]:
+        from varidex.utils.fingerprint import frame_fingerprint
+
+        try:
+            return frame_fingerprint(df, [column])
+        except TypeError:  # unhashable values (e.g. lists) are always written
+            return None
+
+    def _parent(self, row_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Latest checkpoint with the same rows, if any."""
+        if row_key is None:
+            return None
+        matches = [
+            e for e in self.manifest["stages"].values() if e["row_key"] == row_key
+        ]
+        return max(matches, key=lambda e: e["timestamp"]) if matches else None
 
     def save_checkpoint(
         self, stage_id: int, df: pd.DataFrame, stage_name: str
@@ -201,39 +426,102 @@ class CheckpointManager:
         if not self.enabled:
             return df
 
-        file_path = self.checkpoint_dir / f"stage_{stage_id}_{stage_name}.parquet"
-        df.to_parquet(file_path, index=False, compression="zstd", compression_level=3)
+        row_key = self._row_key(df)
+        previous = self.manifest["stages"].pop(str(stage_id), None)
+        parent = self._parent(row_key)
+
+        columns: Dict[str, Dict[str, Optional[str]]] = {}
+        changed: List[str] = []
+        for col in df.columns:
+            digest = self._column_digest(df, col)
+            prior = parent["columns"].get(col) if parent else None
+            if prior and digest and prior["digest"] == digest:
+                columns[col] = prior
+            else:
+                changed.append(col)
+                columns[col] = {"file": None, "digest": digest}
+
+        file_name = None
+        if changed or not columns:
+            file_name = f"stage_{stage_id}_{stage_name}_{time.time_ns()}.feather"
+            df[changed].reset_index(drop=True).to_feather(
+                self.checkpoint_dir / file_name, compression="uncompressed"
+            )
+            for col in changed:
+                columns[col]["file"] = file_name
 
-        checkpoint = StageCheckpoint(
-            stage_id=stage_id,
-            timestamp=time.time(),
-            row_count=len(df),
-            file_path=file_path,
+        entry = {
+            "stage_id": stage_id,
+            "stage_name": stage_name,
+            "timestamp": time.time(),
+            "row_count": len(df),
+            "row_key": row_key,
+            "parent": parent["stage_id"] if parent else None,
+            "file": file_name,
+            "order": list(df.columns),
+            "columns": columns,
+        }
+        self.manifest["stages"][str(stage_id)] = entry
+        self._write_manifest()
+        if previous is not None:
+            self._remove_unreferenced(previous)
+
+        self.checkpoints[stage_id] = self._checkpoint_for(entry)
+        logger.debug(
+            f"💾 Checkpoint saved: Stage {stage_id} ({len(df):,} rows, "
+            f"{len(changed)}/{len(columns)} columns written)"
         )
 
-        self.checkpoints[stage_id] = checkpoint
-        logger.debug(f"💾 Checkpoint saved: Stage {stage_id} ({len(df):,} rows)")
-
         if self.free_memory:
-            df_copy = df.copy()
-            del df
             gc.collect()
             logger.debug(f"♻️ Memory freed for stage {stage_id}")
-            return df_copy
-
         return df
 
-    def load_checkpoint(self, stage_id: int) -> Optional[pd.DataFrame]:
+    def _remove_unreferenced(self, entry: Dict[str, Any]) -> None:
+        referenced = {
+            spec["file"]
+            for e in self.manifest["stages"].values()
+            for spec in e["columns"].values()
+        }
+        for name in self._own_files(entry):
+            if name not in referenced:
+                (self.checkpoint_dir / name).unlink(missing_ok=True)
+
+    def load_checkpoint(
+        self, stage_id: int, columns: Optional[List[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Reassemble a stage frame from its column files.
+
+        Args:
+            stage_id: Stage to load
+            columns: Optional projection (only these column files are read)
+        """
         if not self.enabled or stage_id not in self.checkpoints:
             return None
-        checkpoint = self.checkpoints[stage_id]
-        if checkpoint.file_path and checkpoint.file_path.exists():
-            df = pd.read_parquet(checkpoint.file_path)
-            logger.info(
-                f"♻ Resumed from Stage {stage_id} checkpoint ({len(df):,} rows)"
-            )
-            return df
-        return None
+        from pyarrow import feather
+
+        entry = self.manifest["stages"][str(stage_id)]
+        wanted = [c for c in entry["order"] if columns is None or c in columns]
+        by_file: Dict[str, List[str]] = {}
+        for col in wanted:
+            by_file.setdefault(entry["columns"][col]["file"], []).append(col)
+
+        parts = []
+        for name, cols in by_file.items():
+            path = self.checkpoint_dir / name
+            if not path.exists():
+                logger.warning(f"Checkpoint file missing for Stage {stage_id}: {name}")
+                return None
+            table = feather.read_table(path, columns=cols, memory_map=True)
+            parts.append(table.to_pandas(split_blocks=True))
+
+        if parts:
+            df = pd.concat(parts, axis=1)[wanted]
+        else:
+            df = pd.DataFrame(index=pd.RangeIndex(entry["row_count"]))
+        logger.info(f"♻ Resumed from Stage {stage_id} checkpoint ({len(df):,} rows)")
+        return df
 
     def rollback_to(self, stage_id: int) -> Optional[pd.DataFrame]:
         return self.load_checkpoint(stage_id)
@@ -293,7 +581,8 @@ class StageExecutor:
 
         try:
             logger.info(f"▶ Stage {stage_id}: {stage_name}")
-            result = stage_func(*args, **kwargs)
+            with self.profiler.recording():
+                result = self.profiler.in_stage(ctx, stage_func)(*args, **kwargs)
             output_rows = len(result) if isinstance(result, pd.DataFrame) else 0
             self.profiler.end_stage(ctx, output_rows=output_rows, status="success")
 
@@ -311,6 +600,425 @@ class StageExecutor:
             raise
 
 
+# ============================================================================
+# DECLARATIVE STAGE GRAPH
+# ============================================================================
+
+ALL_COLUMNS = "*"
+STAGE_EXECUTORS = ("thread", "process", "inline")
+
+
+@dataclass
+class StageSpec:
+    """
+    One node of a StageGraph.
+
+    inputs/outputs are column names (fnmatch patterns allowed in outputs,
+    e.g. "gnomad*"); "*" as an input passes the whole frame, "*" as the
+    only output replaces the frame with the stage's result. requires and
+    provides name non-column artifacts (loaded indexes, classifiers).
+
+    func(frame, **artifacts) returns a DataFrame (columns), a dict
+    (artifacts) or a (DataFrame, dict) tuple. executor is "thread" for
+    I/O-bound stages, "process" for CPU-bound ones (func, frame and result
+    must pickle) or "inline" to run on the scheduler thread.
+
+    cache_key (see StageCache.key) memoizes the stage's output columns when
+    the scheduler has a StageCache; artifact-providing stages are not
+    cached.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    requires: Tuple[str, ...] = ()
+    provides: Tuple[str, ...] = ()
+    executor: str = "thread"
+    cache_key: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.inputs = tuple(self.inputs)
+        self.outputs = tuple(self.outputs)
+        self.requires = tuple(self.requires)
+        self.provides = tuple(self.provides)
+        if self.executor not in STAGE_EXECUTORS:
+            raise ValueError(
+                f"Stage {self.name}: executor must be one of {STAGE_EXECUTORS}"
+            )
+        if ALL_COLUMNS in self.outputs and len(self.outputs) > 1:
+            raise ValueError(f"Stage {self.name}: '*' must be the only output")
+
+    @property
+    def replaces_frame(self) -> bool:
+        return self.outputs == (ALL_COLUMNS,)
+
+    def writes(self, column: str) -> bool:
+        return self.replaces_frame or any(
+            fnmatch.fnmatchcase(column, pattern) for pattern in self.outputs
+        )
+
+
+class StageGraph:
+    """Stages plus the dependencies implied by their columns and artifacts."""
+
+    def __init__(self, stages: Optional[List[StageSpec]] = None):
+        self.stages: Dict[str, StageSpec] = {}
+        for stage in stages or []:
+            self.add(stage)
+
+    def add(self, stage: StageSpec) -> "StageGraph":
+        if stage.name in self.stages:
+            raise ValueError(f"Duplicate stage: {stage.name}")
+        self.stages[stage.name] = stage
+        return self
+
+    def dependencies(self) -> Dict[str, List[str]]:
+        """
+        Stage name -> names it waits for, in declaration order.
+
+        A stage depends on the earlier stages that write one of its input
+        columns (any column-writing stage for a "*" input) and on the
+        producers of its required artifacts. A frame-replacing stage is a
+        barrier: it waits for every earlier column writer, and every later
+        stage that reads columns waits for it.
+
+        Raises:
+            ValueError: Duplicate artifact producer or missing artifact
+        """
+        producers: Dict[str, str] = {}
+        for stage in self.stages.values():
+            for artifact in stage.provides:
+                if artifact in producers:
+                    raise ValueError(
+                        f"Artifact {artifact!r} provided by both "
+                        f"{producers[artifact]} and {stage.name}"
+                    )
+                producers[artifact] = stage.name
+
+        deps: Dict[str, List[str]] = {}
+        earlier: List[StageSpec] = []
+        for stage in self.stages.values():
+            needed: Set[str] = set()
+            for artifact in stage.requires:
+                if artifact not in producers:
+                    raise ValueError(
+                        f"Stage {stage.name} requires unknown artifact {artifact!r}"
+                    )
+                needed.add(producers[artifact])
+            for prior in earlier:
+                if not (prior.outputs and (stage.inputs or stage.outputs)):
+                    continue
+                if (
+                    stage.replaces_frame
+                    or ALL_COLUMNS in stage.inputs
+                    or prior.replaces_frame
+                    or any(prior.writes(col) for col in stage.inputs)
+                    # Writers of the same column join in declaration order
+                    or any(prior.writes(col) for col in stage.outputs)
+                ):
+                    needed.add(prior.name)
+            deps[stage.name] = [s for s in self.stages if s in needed]
+            earlier.append(stage)
+
+        self._check_acyclic(deps)
+        return deps
+
+    @staticmethod
+    def _check_acyclic(deps: Dict[str, List[str]]) -> None:
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Stage graph has a cycle through {name}")
+            state[name] = 1
+            for dep in deps[name]:
+                visit(dep)
+            state[name] = 2
+
+        for name in deps:
+            visit(name)
+
+
+def _run_stage_func(
+    func: Callable[..., Any], frame: pd.DataFrame, artifacts: Dict[str, Any]
+) -> Tuple[Any, float, float]:
+    """Worker entry point (module level so process pools can pickle it)."""
+    start = time.time()
+    result = func(frame, **artifacts)
+    return result, start, time.time()
+
+
+class StageScheduler:
+    """
+    Runs a StageGraph, starting each stage as soon as its dependencies are
+    done. Thread and process stages share bounded pools; results are joined
+    on the scheduler thread in declaration order, so the output frame does
+    not depend on completion order.
+
+    With a StageCache, stages with a cache_key reuse their stored output,
+    and stages whose every dependent is reused (or skipped) and replaces
+    the frame are skipped altogether. last_report["cache"] maps stage
+    names to "reused", "computed" or "skipped".
+    """
+
+    def __init__(
+        self,
+        profiler: Optional[StageProfiler] = None,
+        max_threads: int = 4,
+        max_processes: int = 2,
+        cache: Optional[Any] = None,
+    ):
+        self.profiler = profiler or StageProfiler(enabled=False)
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self.cache = cache
+        self.last_report: Dict[str, Any] = {}
+
+    def run(
+        self,
+        graph: StageGraph,
+        frame: pd.DataFrame,
+        artifacts: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Execute every stage; returns (joined frame, artifacts).
+
+        Raises:
+            ValueError: Invalid graph
+            Exception: The first stage failure (pending stages are cancelled)
+        """
+        with self.profiler.recording():
+            return self._run(graph, frame, artifacts)
+
+    def _run(
+        self,
+        graph: StageGraph,
+        frame: pd.DataFrame,
+        artifacts: Optional[Dict[str, Any]],
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        deps = graph.dependencies()
+        order = {name: i for i, name in enumerate(graph.stages)}
+        waiting = {name: set(d) for name, d in deps.items()}
+        artifacts = dict(artifacts or {})
+        base_columns = list(frame.columns)
+        added: Dict[str, List[str]] = {}
+        hits = self._load_cached(graph)
+        skipped = self._skippable(graph, deps, hits)
+        cache_status: Dict[str, str] = {name: "reused" for name in hits}
+
+        pools: Dict[str, Any] = {}
+        running: Dict[Any, Tuple[str, Dict]] = {}
+        started = time.time()
+
+        def ready() -> List[str]:
+            names = [n for n, d in waiting.items() if not d]
+            for name in names:
+                del waiting[name]
+            return sorted(names, key=order.get)
+
+        def finish(name: str, ctx: Dict, outcome: Tuple[Any, float, float]) -> None:
+            nonlocal frame
+            result, start, end = outcome
+            stage = graph.stages[name]
+            if name not in hits and self._cacheable(stage, result):
+                written = [c for c in result.columns if stage.writes(c)]
+                self.cache.store(name, stage.cache_key, result[written])
+                cache_status[name] = "computed"
+            frame = self._join(stage, frame, result, artifacts, added)
+            if ctx:
+                ctx["start_time"] = start
+            self.profiler.end_stage(ctx, output_rows=len(frame), end_time=end)
+            for pending in waiting.values():
+                pending.discard(name)
+
+        try:
+            queue = ready()
+            while queue or running:
+                for name in queue:
+                    stage = graph.stages[name]
+                    if name in skipped:
+                        self.cache.record(name, "skipped")
+                        cache_status[name] = "skipped"
+                        for pending in waiting.values():
+                            pending.discard(name)
+                        continue
+                    if name in hits:
+                        now = time.time()
+                        finish(name, {}, (hits[name], now, now))
+                        continue
+                    ctx = self.profiler.start_stage(
+                        order[name], name, input_rows=len(frame)
+                    )
+                    view = self._project(stage, frame)
+                    needed = {a: artifacts[a] for a in stage.requires}
+                    logger.info(f"▶ Stage {name} ({stage.executor})")
+                    if stage.executor == "inline":
+                        run = self.profiler.in_stage(ctx, _run_stage_func)
+                        try:
+                            outcome = run(stage.func, view, needed)
+                        except Exception as e:
+                            self.profiler.end_stage(ctx, status="failed", error=str(e))
+                            raise
+                        finish(name, ctx, outcome)
+                        continue
+                    pool = pools.get(stage.executor)
+                    if pool is None:
+                        pool = pools[stage.executor] = (
+                            ThreadPoolExecutor(max_workers=self.max_threads)
+                            if stage.executor == "thread"
+                            else ProcessPoolExecutor(max_workers=self.max_processes)
+                        )
+                    run = _run_stage_func
+                    if stage.executor == "thread":
+                        run = self.profiler.in_stage(ctx, run)
+                    future = pool.submit(run, stage.func, view, needed)
+                    running[future] = (name, ctx)
+
+                if running:
+                    done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in sorted(done, key=lambda f: order[running[f][0]]):
+                        name, ctx = running.pop(future)
+                        try:
+                            outcome = future.result()
+                        except Exception as e:
+                            self.profiler.end_stage(ctx, status="failed", error=str(e))
+                            logger.error(f"❌ Stage {name} failed: {e}")
+                            raise
+                        finish(name, ctx, outcome)
+                queue = ready()
+        finally:
+            for future in running:
+                future.cancel()
+            for pool in pools.values():
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        if waiting:
+            raise ValueError(f"Unschedulable stages: {sorted(waiting)}")
+
+        # Deterministic column order: input columns, then outputs by stage order
+        columns = [c for c in base_columns if c in frame.columns]
+        for name in graph.stages:
+            columns.extend(c for c in added.get(name, []) if c not in columns)
+        columns.extend(c for c in frame.columns if c not in columns)
+        frame = frame[columns]
+
+        if self.profiler.enabled:
+            self.last_report = self.profiler.critical_path(deps)
+            self.last_report["wall_sec"] = round(time.time() - started, 3)
+            logger.info(
+                f"⏱ Critical path {' → '.join(self.last_report['path'])}: "
+                f"{self.last_report['critical_path_sec']}s "
+                f"(wall {self.last_report['wall_sec']}s, "
+                f"stages total {self.last_report['total_stage_sec']}s)"
+            )
+        if self.cache is not None:
+            self.last_report["cache"] = cache_status
+        return frame, artifacts
+
+    def _cacheable(self, stage: StageSpec, result: Any) -> bool:
+        return (
+            self.cache is not None
+            and stage.cache_key is not None
+            and not stage.provides
+            and isinstance(result, pd.DataFrame)
+        )
+
+    def _load_cached(self, graph: StageGraph) -> Dict[str, pd.DataFrame]:
+        """Stored outputs of the graph's cacheable stages (hits only)."""
+        hits: Dict[str, pd.DataFrame] = {}
+        if self.cache is None:
+            return hits
+        for name, stage in graph.stages.items():
+            if stage.cache_key is None or stage.provides:
+                continue
+            cached = self.cache.load(name, stage.cache_key)
+            if cached is not None:
+                hits[name] = cached
+        return hits
+
+    @staticmethod
+    def _skippable(
+        graph: StageGraph,
+        deps: Dict[str, List[str]],
+        hits: Dict[str, pd.DataFrame],
+    ) -> Set[str]:
+        """
+        Stages whose results nothing will use.
+
+        A stage (reused or not) is skipped when all of its dependents are
+        skipped or reused frame-replacing stages: their stored frame already
+        holds everything upstream contributed. Sinks always run.
+        """
+        dependents: Dict[str, List[str]] = {name: [] for name in deps}
+        for name, needed in deps.items():
+            for dep in needed:
+                dependents[dep].append(name)
+
+        skipped: Set[str] = set()
+        changed = bool(hits)
+        while changed:
+            changed = False
+            for name, users in dependents.items():
+                if name in skipped or not users:
+                    continue
+                if all(
+                    user in skipped
+                    or (user in hits and graph.stages[user].replaces_frame)
+                    for user in users
+                ):
+                    skipped.add(name)
+                    changed = True
+        return skipped
+
+    @staticmethod
+    def _project(stage: StageSpec, frame: pd.DataFrame) -> pd.DataFrame:
+        if ALL_COLUMNS in stage.inputs:
+            return frame.copy(deep=False)
+        # Absent inputs are left for the stage to handle (optional columns)
+        present = [c for c in stage.inputs if c in frame.columns]
+        if len(present) < len(stage.inputs):
+            missing = [c for c in stage.inputs if c not in frame.columns]
+            logger.warning(f"Stage {stage.name}: input columns absent: {missing}")
+        return frame[present]
+
+    @staticmethod
+    def _join(
+        stage: StageSpec,
+        frame: pd.DataFrame,
+        result: Any,
+        artifacts: Dict[str, Any],
+        added: Dict[str, List[str]],
+    ) -> pd.DataFrame:
+        produced: Dict[str, Any] = {}
+        if isinstance(result, tuple):
+            result, produced = result
+        elif isinstance(result, dict):
+            result, produced = None, result
+
+        for artifact in stage.provides:
+            if artifact not in produced:
+                raise ValueError(f"Stage {stage.name} did not provide {artifact!r}")
+            artifacts[artifact] = produced[artifact]
+
+        if not stage.outputs or result is None:
+            return frame
+        if stage.replaces_frame:
+            added[stage.name] = [c for c in result.columns if c not in frame.columns]
+            return result
+
+        columns = [c for c in result.columns if stage.writes(c)]
+        new = [c for c in columns if c not in frame.columns]
+        if new or columns:
+            frame = frame.copy(deep=False)
+            for col in columns:
+                frame[col] = result[col]
+        added[stage.name] = new
+        return frame
+
+
 def execute_stage2_load_clinvar(
     clinvar_file: Path,
     checkpoint_dir: Path,
@@ -412,54 +1120,165 @@ def execute_stage4_hybrid_matching(
     return matched_df
 
 
-def _classify_batch(batch_data):
-    """Helper for parallel ACMG classification - FIXED v7.0.2."""
-    from varidex.utils.helpers import classify_variants_production
+# Columns the ClinVar-significance classifier reads; workers receive only these.
+CLASSIFICATION_INPUT_COLUMNS = ("clinical_sig", "review_status")
+CLASSIFICATION_RESULT_FIELDS = (
+    "classification",
+    "evidence",
+    "clinical_sig",
+    "review_status",
+)
 
-    batch_df, safeguard_config, clinvar_type, user_type = batch_data
 
-    # ✅ CRITICAL FIX: Convert DataFrame to list of dicts
-    batch_variants = batch_df.to_dict("records")
+def _classify_columns(
+    start: int, n_rows: int, columns: Dict[str, Any]
+) -> Tuple[int, Dict[str, List], Dict[str, int]]:
+    """
+    Worker for ClassificationExecutor: classify one batch of column arrays.
 
-    return classify_variants_production(batch_variants, safeguard_config)
+    Returns (start row, result field -> values, batch stats). The parent
+    re-attaches variant records, so rows are never pickled in either
+    direction.
+    """
+    from varidex.utils.helpers import (
+        classification_stats,
+        classify_clinvar_significance,
+    )
+
+    result = classify_clinvar_significance(
+        pd.DataFrame(columns, index=pd.RangeIndex(n_rows))
+    )
+    fields = {c: result[c].tolist() for c in CLASSIFICATION_RESULT_FIELDS}
+    return start, fields, classification_stats(result["classification"])
 
 
-def _calculate_classification_stats(classified_variants: List[Dict]) -> Dict[str, int]:
+class ClassificationExecutor:
+    """
+    Order-preserving, memory-aware parallel ACMG classification (Stage 5).
+
+    Workers and batch size come from get_optimal_workers() and available
+    RAM; at most two batches per worker are in flight. Results stream into
+    a preallocated list by row offset, so output order always matches the
+    input. deterministic=True additionally fixes the batch plan (ignoring
+    CPU and RAM) and consumes batches in submission order, so logs and
+    progress are reproducible across machines.
     """
-    Calculate classification statistics from classified variants.
 
-    Args:
-        classified_variants: List of classification dicts with 'classification' key
+    MIN_BATCH_SIZE = 256
+    MAX_BATCH_SIZE = 20000
+    DEFAULT_BATCH_SIZE = 1000
+    MEMORY_FRACTION = 0.25  # of available RAM for in-flight batches
+    BYTES_PER_ROW_FACTOR = 4  # arrays + worker dicts + results
 
-    Returns:
-        Dict with counts for each ACMG category
-    """
-    stats = {
-        "pathogenic": 0,
-        "likely_pathogenic": 0,
-        "vus": 0,
-        "likely_benign": 0,
-        "benign": 0,
-        "conflicts": 0,
-    }
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        deterministic: bool = False,
+    ):
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.deterministic = deterministic
+        self.last_plan: Dict[str, Any] = {}
+
+    def plan(self, n_rows: int, row_bytes: float) -> Tuple[int, int]:
+        """(workers, batch_size) for n_rows of about row_bytes each."""
+        from varidex.utils.cpu_utils import get_optimal_workers
+
+        if self.deterministic:
+            batch = self.batch_size or self.DEFAULT_BATCH_SIZE
+            workers = self.max_workers or 4
+            return workers, batch
+
+        workers = self.max_workers or get_optimal_workers("cpu_bound")
+        if self.batch_size:
+            batch = self.batch_size
+        else:
+            available = psutil.virtual_memory().available * self.MEMORY_FRACTION
+            per_row = max(row_bytes, 1.0) * self.BYTES_PER_ROW_FACTOR
+            by_memory = int(available / (2 * workers * per_row))
+            # About four batches per worker for load balancing
+            by_balance = -(-n_rows // (4 * workers))
+            batch = max(
+                self.MIN_BATCH_SIZE, min(by_memory, by_balance, self.MAX_BATCH_SIZE)
+            )
+        workers = max(1, min(workers, -(-n_rows // batch)))
+        return workers, batch
+
+    def run(
+        self, matched_df: pd.DataFrame, parallel: bool = True
+    ) -> Tuple[List[Dict], Dict[str, int]]:
+        """Classify every row; returns (classified variants, stats)."""
+        from varidex.utils.helpers import CLASSIFICATION_STAT_KEYS
+
+        n_rows = len(matched_df)
+        columns = [c for c in CLASSIFICATION_INPUT_COLUMNS if c in matched_df.columns]
+        row_bytes = matched_df.memory_usage(deep=True).sum() / n_rows if n_rows else 0.0
+        workers, batch = self.plan(n_rows, row_bytes)
+        if not parallel:
+            workers = 1
+        self.last_plan = {"workers": workers, "batch_size": batch, "rows": n_rows}
+
+        classified: List[Optional[Dict]] = [None] * n_rows
+        stats = {key: 0 for key in CLASSIFICATION_STAT_KEYS.values()}
+
+        def place(outcome: Tuple[int, Dict[str, List], Dict[str, int]]) -> None:
+            start, fields, batch_stats = outcome
+            names = list(fields)
+            records = matched_df.iloc[start : start + batch].to_dict("records")
+            rows = zip(records, zip(*fields.values()))
+            for offset, (record, values) in enumerate(rows):
+                result = dict(zip(names, values))
+                classified[start + offset] = {"variant": record, **result}
+            for key, count in batch_stats.items():
+                stats[key] += count
+
+        def task(start: int) -> Tuple[int, int, Dict[str, Any]]:
+            chunk = matched_df.iloc[start : start + batch]
+            return start, len(chunk), {c: chunk[c].to_numpy() for c in columns}
+
+        starts = range(0, n_rows, batch)
+        with tqdm(total=len(starts), desc="Classifying batches", unit="batch") as pbar:
+            if workers == 1:
+                for start in starts:
+                    place(_classify_columns(*task(start)))
+                    pbar.update(1)
+            else:
+                self._run_pool(workers, starts, task, place, pbar)
 
-    for variant in classified_variants:
-        classification = variant.get("classification", "")
-
-        if classification in ["P", "Pathogenic"]:
-            stats["pathogenic"] += 1
-        elif classification in ["LP", "Likely Pathogenic"]:
-            stats["likely_pathogenic"] += 1
-        elif classification in ["VUS", "Uncertain Significance"]:
-            stats["vus"] += 1
-        elif classification in ["LB", "Likely Benign"]:
-            stats["likely_benign"] += 1
-        elif classification in ["B", "Benign"]:
-            stats["benign"] += 1
-        elif classification == "CONFLICT":
-            stats["conflicts"] += 1
+        return classified, stats
 
-    return stats
+    def _run_pool(
+        self,
+        workers: int,
+        starts: range,
+        task: Callable[[int], Tuple[int, int, Dict[str, Any]]],
+        place: Callable[[Tuple], None],
+        pbar: Any,
+    ) -> None:
+        pending = iter(starts)
+        in_flight: List[Any] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+
+            def submit() -> None:
+                while len(in_flight) < 2 * workers:
+                    start = next(pending, None)
+                    if start is None:
+                        return
+                    in_flight.append(executor.submit(_classify_columns, *task(start)))
+
+            submit()
+            while in_flight:
+                if self.deterministic:
+                    done = [in_flight[0]]
+                else:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    done = [f for f in in_flight if f in finished]
+                for future in done:
+                    in_flight.remove(future)
+                    place(future.result())
+                    pbar.update(1)
+                submit()
 
 
 def execute_stage5_acmg_classification(
@@ -469,66 +1288,31 @@ def execute_stage5_acmg_classification(
     user_type: str,
     import_mode: str = "centralized",
     parallel: bool = True,
-    batch_size: int = 1000,
+    batch_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    deterministic: bool = False,
 ) -> Tuple[List, Dict]:
-    """STAGE 5: ACMG classification - FIXED v8.0.0."""
-    from varidex.utils.helpers import classify_variants_production
-
-    if parallel and len(matched_df) > batch_size:
-        logger.info(f"🔀 Parallel ACMG classification ({len(matched_df):,} variants)")
-        batches = [
-            matched_df.iloc[i : i + batch_size]
-            for i in range(0, len(matched_df), batch_size)
-        ]
-
-        batch_data = [
-            (batch, safeguard_config, clinvar_type, user_type) for batch in batches
-        ]
-
-        classified_variants = []
-
-        with ProcessPoolExecutor(max_workers=4) as executor:
-            with tqdm(
-                total=len(batches), desc="Classifying batches", unit="batch"
-            ) as pbar:
-                futures = {
-                    executor.submit(_classify_batch, data): i
-                    for i, data in enumerate(batch_data)
-                }
-
-                for future in as_completed(futures):
-                    batch_result = future.result()
-                    batch_classified = (
-                        batch_result
-                        if isinstance(batch_result, list)
-                        else batch_result[0]
-                    )
-                    classified_variants.extend(batch_classified)
-                    pbar.update(1)
-
-        # ✅ BUGFIX: Calculate stats from classified_variants
-        combined_stats = _calculate_classification_stats(classified_variants)
-
-        logger.info(f"✓ Classified {len(classified_variants):,} variants (parallel)")
-        return classified_variants, combined_stats
+    """
+    STAGE 5: ACMG classification.
 
-    else:
-        # ✅ CRITICAL FIX: Convert DataFrame to list of dicts for non-parallel path
-        variant_list = matched_df.to_dict("records")
-
-        with tqdm(
-            total=len(variant_list), desc="Classifying variants", unit="var"
-        ) as pbar:
-            classified_variants, stats = classify_variants_production(
-                variant_list, safeguard_config, clinvar_type, user_type
-            )
-            pbar.update(len(classified_variants))
+    Runs on a ClassificationExecutor: batch size and workers adapt to CPU
+    and available RAM unless given; output order matches matched_df.
+    deterministic=True fixes the batch plan for reproducible reports.
+    """
+    executor = ClassificationExecutor(
+        max_workers=max_workers, batch_size=batch_size, deterministic=deterministic
+    )
+    classified_variants, stats = executor.run(matched_df, parallel=parallel)
 
-        if not classified_variants:
-            raise ValueError("Classification failed: no variants classified")
+    if not classified_variants:
+        raise ValueError("Classification failed: no variants classified")
 
-        logger.info(f"✓ Classified {len(classified_variants):,} variants")
-        return classified_variants, stats
+    plan = executor.last_plan
+    logger.info(
+        f"✓ Classified {len(classified_variants):,} variants "
+        f"({plan['workers']} workers, batches of {plan['batch_size']:,})"
+    )
+    return classified_variants, stats
 
 
 def execute_stage6_create_results(
@@ -555,6 +1339,153 @@ def execute_stage7_generate_reports(
     return report_files
 
 
+def _warm_clinvar_indexes(clinvar_df: Any) -> None:
+    """Build (or hit) the on-disk PS1/PM5 index cache for this release.
+
+    Takes a ClinVar frame or a ClinVarReference.
+    """
+    from varidex.acmg.clinvar_index import (
+        PM5_INDEX_VERSION,
+        PS1_INDEX_VERSION,
+        build_pm5_index,
+        build_ps1_index,
+        load_or_build_index,
+    )
+
+    try:
+        load_or_build_index(
+            clinvar_df, "ps1", build_ps1_index, version=PS1_INDEX_VERSION
+        )
+        load_or_build_index(
+            clinvar_df, "pm5", build_pm5_index, version=PM5_INDEX_VERSION
+        )
+    except Exception as e:
+        logger.warning(f"ClinVar index warm-up failed: {e}")
+
+
+def _valid_clinvar_cache(loader: Any, stage_kwargs: Dict[str, Any]) -> Optional[Path]:
+    """The loader's valid processed ClinVar parquet for an unfiltered load."""
+    lookup = getattr(loader, "processed_cache_file", None)
+    if lookup is None or stage_kwargs.get("user_chromosomes"):
+        return None
+    return lookup(stage_kwargs["clinvar_file"], stage_kwargs["checkpoint_dir"])
+
+
+def _load_stage_shared(
+    stage_id: int,
+    loader_name: str,
+    stage_kwargs: Dict[str, Any],
+    share_path: str,
+    warm_indexes: bool,
+) -> Dict[str, Any]:
+    """
+    Process worker for Stage 2 or 3.
+
+    The frame goes back through a file instead of the result pipe: the
+    ClinVar parquet cache when the loader has a valid one, else an
+    uncompressed Arrow IPC (Feather) file that the parent memory-maps. A
+    valid parquet cache is handed over by path without being read here,
+    so the parent reads it exactly once.
+    """
+    import importlib
+
+    start = time.time()
+    loader = importlib.import_module(loader_name)
+    if stage_id == 2:
+        cached = _valid_clinvar_cache(loader, stage_kwargs)
+        if cached is not None:
+            logger.info(f"💾 Handing over ClinVar cache {cached.name} by path")
+            if warm_indexes:
+                from varidex.acmg.clinvar_index import ClinVarReference
+
+                _warm_clinvar_indexes(
+                    ClinVarReference(
+                        stage_kwargs["clinvar_file"], stage_kwargs["checkpoint_dir"]
+                    )
+                )
+            return {
+                "path": str(cached),
+                "shared_file": False,
+                "attrs": {
+                    "clinvar_cache_file": str(cached),
+                    "clinvar_source_file": str(stage_kwargs["clinvar_file"]),
+                },
+                "start": start,
+                "end": time.time(),
+            }
+        df = execute_stage2_load_clinvar(loader=loader, **stage_kwargs)
+        if warm_indexes:
+            _warm_clinvar_indexes(df)
+    else:
+        df = execute_stage3_load_user_data(loader=loader, **stage_kwargs)
+
+    path = df.attrs.get("clinvar_cache_file")
+    if not path:
+        path = share_path
+        df.reset_index(drop=True).to_feather(path, compression="uncompressed")
+    return {
+        "path": str(path),
+        "shared_file": path == share_path,
+        "attrs": dict(df.attrs),
+        "start": start,
+        "end": time.time(),
+    }
+
+
+def _read_shared_frame(outcome: Dict[str, Any]) -> pd.DataFrame:
+    """Load a frame written by _load_stage_shared (removing temp files)."""
+    path = outcome["path"]
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path)
+    else:
+        from pyarrow import feather
+
+        df = feather.read_table(path, memory_map=True).to_pandas()
+    if outcome["shared_file"]:
+        Path(path).unlink(missing_ok=True)
+    df.attrs.update(outcome["attrs"])
+    return df
+
+
+def _record_parallel_metrics(
+    profiler: Optional[StageProfiler],
+    executor: str,
+    started: float,
+    spans: Dict[str, Tuple[float, float]],
+    rows: int,
+) -> Dict[str, Any]:
+    """Overlap and speedup of the Stage 2/3 spans (logged and profiled)."""
+    wall = time.time() - started
+    serial = sum(end - start for start, end in spans.values())
+    overlap = max(
+        0.0,
+        min(end for _, end in spans.values())
+        - max(start for start, _ in spans.values()),
+    )
+    stats = {
+        "executor": executor,
+        "wall_sec": round(wall, 3),
+        "serial_sec": round(serial, 3),
+        "overlap_sec": round(overlap, 3),
+        "speedup": round(serial / wall, 2) if wall > 0 else 0.0,
+    }
+    logger.info(
+        f"✓ Parallel loading complete ({executor}): wall {stats['wall_sec']}s, "
+        f"overlap {stats['overlap_sec']}s, speedup {stats['speedup']}x"
+    )
+
+    if profiler is not None and profiler.enabled:
+        for stage_id, name in ((2, "load_clinvar"), (3, "load_user_data")):
+            start, end = spans[name]
+            ctx = profiler.start_stage(stage_id, name)
+            ctx["start_time"] = start
+            profiler.end_stage(ctx, end_time=end)
+        ctx = profiler.start_stage(23, "stages_2_3_parallel")
+        ctx["start_time"] = started
+        profiler.end_stage(ctx, output_rows=rows, extra=stats)
+    return stats
+
+
 def execute_stages_2_3_parallel(
     clinvar_file: Path,
     user_file: Path,
@@ -563,26 +1494,92 @@ def execute_stages_2_3_parallel(
     user_type: str,
     safeguard_config: Dict,
     max_workers: int = 2,
+    executor: str = "process",
+    profiler: Optional[StageProfiler] = None,
+    warm_indexes: bool = True,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """Execute Stages 2 and 3 in parallel."""
-    logger.info("🔀 Starting parallel execution: Stages 2 & 3")
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_clinvar = executor.submit(
-            execute_stage2_load_clinvar,
-            clinvar_file,
-            checkpoint_dir,
-            loader,
-            safeguard_config,
-        )
-        future_user = executor.submit(
-            execute_stage3_load_user_data, user_file, user_type, loader
-        )
+    """
+    Execute Stages 2 and 3 in parallel.
+
+    With executor="process" each load runs in its own process, so the
+    GIL-bound parsing really overlaps, and frames come back through the
+    parquet cache or an Arrow IPC file instead of being pickled. A missing
+    user file is reported before any load starts. Loaders that are not
+    importable modules fall back to threads. Overlap and speedup are logged and recorded in
+    profiler as stage "stages_2_3_parallel".
+    """
+    if executor == "process" and not isinstance(loader, types.ModuleType):
+        logger.info("Loader is not an importable module; using threads")
+        executor = "thread"
+    if not Path(user_file).exists():
+        raise FileNotFoundError(f"User file not found: {user_file}")
+    logger.info(f"🔀 Starting parallel execution: Stages 2 & 3 ({executor})")
+    started = time.time()
+
+    if executor == "process":
+        share_dir = Path(checkpoint_dir) / "shared"
+        share_dir.mkdir(parents=True, exist_ok=True)
+        token = f"{os.getpid()}_{int(started * 1000)}"
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            future_clinvar = pool.submit(
+                _load_stage_shared,
+                2,
+                loader.__name__,
+                {
+                    "clinvar_file": clinvar_file,
+                    "checkpoint_dir": checkpoint_dir,
+                    "safeguard_config": safeguard_config,
+                },
+                str(share_dir / f"stage2_{token}.feather"),
+                warm_indexes,
+            )
+            future_user = pool.submit(
+                _load_stage_shared,
+                3,
+                loader.__name__,
+                {"user_file": user_file, "user_type": user_type},
+                str(share_dir / f"stage3_{token}.feather"),
+                False,
+            )
+            clinvar_out = future_clinvar.result()
+            user_out = future_user.result()
+
+        clinvar_df = _read_shared_frame(clinvar_out)
+        user_df = _read_shared_frame(user_out)
+        spans = {
+            "load_clinvar": (clinvar_out["start"], clinvar_out["end"]),
+            "load_user_data": (user_out["start"], user_out["end"]),
+        }
+    else:
 
-        clinvar_df = future_clinvar.result()
-        user_df = future_user.result()
+        def timed(func: Callable[..., pd.DataFrame], *args: Any) -> Tuple:
+            start = time.time()
+            return func(*args), start, time.time()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            future_clinvar = pool.submit(
+                timed,
+                execute_stage2_load_clinvar,
+                clinvar_file,
+                checkpoint_dir,
+                loader,
+                safeguard_config,
+            )
+            future_user = pool.submit(
+                timed, execute_stage3_load_user_data, user_file, user_type, loader
+            )
+            clinvar_df, *clinvar_span = future_clinvar.result()
+            user_df, *user_span = future_user.result()
+        spans = {
+            "load_clinvar": tuple(clinvar_span),
+            "load_user_data": tuple(user_span),
+        }
+        if warm_indexes:
+            _warm_clinvar_indexes(clinvar_df)
 
-    logger.info("✓ Parallel loading complete")
+    _record_parallel_metrics(
+        profiler, executor, started, spans, len(clinvar_df) + len(user_df)
+    )
     return clinvar_df, user_df
 
 
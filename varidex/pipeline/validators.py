@@ -266,3 +266,10 @@ class DataValidator:
         if validate_variant(variant):
             return True, None
         return False, "Invalid variant data"
+
+    @staticmethod
+    def validate_frame(df) -> tuple:
+        """Whole-frame validation; see varidex.core.schema.validate_frame."""
+        from varidex.core.schema import validate_frame
+
+        return validate_frame(df)
@@ -18,6 +18,7 @@ from varidex.pipeline.acmg_classifier_stage import ACMGClassifierStage
 from varidex.pipeline.gnomad_stage import GnomadAnnotationStage
 from varidex.pipeline.matcher import match_variants_hybrid
 from varidex.pipeline.phase1_enhancer import Phase1EnhancementStage
+from varidex.pipeline.stage_cache import StageCache
 
 
 def parse_args():
@@ -74,13 +75,13 @@ Examples:
         "--use-cache",
         action="store_true",
         default=True,
-        help="Use cached matching results if available (default: True)",
+        help="Reuse cached stage outputs whose inputs are unchanged (default: True)",
     )
 
     parser.add_argument(
         "--force-reload",
         action="store_true",
-        help="Force reload and matching even if cache exists",
+        help="Recompute every stage even if cached outputs exist",
     )
 
     parser.add_argument(
@@ -111,8 +112,8 @@ def run_pipeline_integrated(
         user_genome_path: Path to user genome file
         gnomad_dir: Path to gnomAD directory (None = skip gnomAD)
         output_dir: Output directory
-        use_cache: Whether to use cached results
-        force_reload: Force reload even with cache
+        use_cache: Reuse stage outputs whose input fingerprints match
+        force_reload: Recompute every stage (outputs are still cached)
         build: Genome build version
     """
     print("=" * 70)
@@ -123,19 +124,10 @@ def run_pipeline_integrated(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    cache_file = Path("output/complete_results.csv")
-
-    # Stage 1 & 2: Load and match variants (or use cache)
-    if use_cache and cache_file.exists() and not force_reload:
-        print(f"✅ Using cached results: {cache_file}")
-        print(f"   (Use --force-reload to regenerate)")
-        matched_df = pd.read_csv(cache_file)
-        print(f"✅ Loaded {len(matched_df):,} variants\n")
-    else:
-        if not clinvar_path or not user_genome_path:
-            print("❌ Error: --clinvar and --user-genome required for initial run")
-            sys.exit(1)
+    # Stage outputs are memoized by input fingerprints (see stage_cache)
+    cache = StageCache(refresh=force_reload or not use_cache)
 
+    def load_and_match() -> pd.DataFrame:
         print(f"📥 Step 1: Setup genomic data...")
         print(f"✅ ClinVar: {clinvar_path}")
         print(f"✅ User genome: {user_genome_path}")
@@ -160,27 +152,53 @@ def run_pipeline_integrated(
         print(f"✅ Matched {len(matched_df):,} variants:")
         print(f"   • rsID matches: {rsid_matches:,}")
         print(f"   • Coordinate matches: {coord_matches:,}\n")
-
-        # Save cache
-        cache_file.parent.mkdir(exist_ok=True)
-        matched_df.to_csv(cache_file, index=False)
+        return matched_df
+
+    # Stage 1 & 2: Load and match variants (or reuse the cached match)
+    if clinvar_path and user_genome_path:
+        match_key = cache.key(
+            "match", files=[clinvar_path, user_genome_path], config={"build": build}
+        )
+        matched_df = cache.get_or_compute("match", match_key, load_and_match)
+    else:
+        match_key = cache.latest_key("match")
+        matched_df = cache.load("match", match_key) if match_key else None
+        if matched_df is None:
+            print("❌ Error: --clinvar and --user-genome required for initial run")
+            sys.exit(1)
+        print(f"✅ Using cached matching results ({len(matched_df):,} variants)\n")
 
     # Stage 3: gnomAD annotation (if enabled)
+    gnomad_key = cache.key("gnomad", files=[gnomad_dir], upstream=[match_key])
     gnomad_stage = GnomadAnnotationStage(Path(gnomad_dir) if gnomad_dir else None)
-    matched_df = gnomad_stage.process(matched_df)
+    matched_df = cache.get_or_compute(
+        "gnomad", gnomad_key, lambda: gnomad_stage.process(matched_df)
+    )
 
     # Stage 4: ACMG Classification (base 8 codes)
     print("🔬 Step 5: Applying ACMG classification (base codes)...")
+    acmg_key = cache.key("acmg", upstream=[gnomad_key])
     acmg_stage = ACMGClassifierStage()
-    classified_df = acmg_stage.process(matched_df)
+    classified_df = cache.get_or_compute(
+        "acmg", acmg_key, lambda: acmg_stage.process(matched_df)
+    )
     print("✅ Complete\n")
 
     # Stage 5: Phase 1 Enhancements (+5 codes)
     print("⭐ Step 6: Applying Phase 1 enhancements (+5 codes)...")
     phase1_stage = Phase1EnhancementStage()
-    final_df = phase1_stage.process(classified_df)
+    final_df = cache.get_or_compute(
+        "phase1",
+        cache.key("phase1", upstream=[acmg_key]),
+        lambda: phase1_stage.process(classified_df),
+    )
     print("✅ Complete\n")
 
+    print("♻️  Stage cache:")
+    for line in cache.format_report():
+        print(f"  {line}")
+    print()
+
     # Stage 6: Save results
     print("💾 Step 7: Saving results...")
     write_results(final_df, output_path)
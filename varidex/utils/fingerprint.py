@@ -0,0 +1,66 @@
+"""
+Cheap, stable fingerprints for source files and DataFrames.
+
+Used to key derived caches (lookup indexes, stage outputs) so they are
+invalidated when their inputs change.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+# Bytes hashed from the head and tail of a file
+SAMPLE_BYTES = 1 << 20
+
+
+def file_fingerprint(path: Union[str, Path], sample_bytes: int = SAMPLE_BYTES) -> str:
+    """
+    Fingerprint a file from its size, mtime and head/tail bytes.
+
+    Hashing the whole of a multi-GB ClinVar/gnomAD file on every run would
+    cost more than the caches save; size + mtime + sampled content catches
+    re-downloads and in-place edits.
+
+    Args:
+        path: File path
+        sample_bytes: Bytes hashed from each end of the file
+
+    Returns:
+        Hex digest (16 chars)
+    """
+    path = Path(path)
+    stat = path.stat()
+    digest = hashlib.sha256(f"{stat.st_size}:{int(stat.st_mtime)}".encode())
+    with open(path, "rb") as f:
+        digest.update(f.read(sample_bytes))
+        if stat.st_size > sample_bytes:
+            f.seek(max(sample_bytes, stat.st_size - sample_bytes))
+            digest.update(f.read(sample_bytes))
+    return digest.hexdigest()[:16]
+
+
+def frame_fingerprint(df, columns: Optional[Iterable[str]] = None) -> str:
+    """
+    Fingerprint DataFrame content (vectorized row hashing).
+
+    Args:
+        df: DataFrame to hash
+        columns: Optional subset of columns (missing ones are ignored)
+
+    Returns:
+        Hex digest (16 chars)
+    """
+    import pandas as pd
+
+    if columns is not None:
+        df = df[[col for col in columns if col in df.columns]]
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.sha256(",".join(map(str, df.columns)).encode())
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def combine_keys(*parts: object) -> str:
+    """Hash several key parts (versions, fingerprints, config) into one key."""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode())
+    return digest.hexdigest()[:16]
@@ -1,8 +1,14 @@
 """
-VariDex Utilities Helpers Module v7.0.3
+VariDex Utilities Helpers Module v7.1.0
 ========================================
 Helper utilities for variant analysis with ClinVar classification.
 
+Changes v7.1.0:
+- Columnar classify_clinvar_significance(): each distinct clinical_sig is
+  classified once (cached) and mapped back by category code
+- Evidence flag columns and value_counts-based classification_stats()
+- classify_variants_production() is a row-wise adapter over the same table
+
 Changes v7.0.3:
 - Fixed conflicting classification detection (check before pathogenic)
 - Properly categorizes "Conflicting_classifications_of_pathogenicity"
@@ -10,7 +16,8 @@ Changes v7.0.3:
 """
 
 import logging
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -79,9 +86,153 @@ class DataValidator:
         return True, ""
 
 
+# Stats key for each classification code (as in Stage 5 summaries)
+CLASSIFICATION_STAT_KEYS = {
+    "P": "pathogenic",
+    "LP": "likely_pathogenic",
+    "VUS": "vus",
+    "LB": "likely_benign",
+    "B": "benign",
+    "CONFLICT": "conflicts",
+}
+
+# Review-status substring -> (evidence flag column, evidence text)
+REVIEW_EVIDENCE_FLAGS = (
+    ("multiple_submitters", "multiple_submitters", "Multiple submitters"),
+    ("expert_panel", "expert_reviewed", "Expert reviewed"),
+    ("practice_guideline", "expert_reviewed", "Expert reviewed"),
+    ("no_assertion", "no_assertion_criteria", "No assertion criteria"),
+    ("conflicting", "conflicting_review", "Conflicting interpretations noted"),
+)
+EVIDENCE_FLAG_COLUMNS = (
+    "multiple_submitters",
+    "expert_reviewed",
+    "no_assertion_criteria",
+    "conflicting_review",
+)
+
+
+@lru_cache(maxsize=4096)
+def classify_significance(clinical_sig: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Map one ClinVar clinical significance string to an ACMG code.
+
+    Conflicting is checked FIRST (before pathogenic/benign keywords).
+    ClinVar has only a few hundred distinct strings, so results are cached.
+
+    Args:
+        clinical_sig: ClinVar clinical significance (stripped)
+
+    Returns:
+        Tuple of (classification, evidence strings)
+    """
+    sig = clinical_sig.lower()
+
+    if "conflicting" in sig:
+        evidence = ["ClinVar: Conflicting interpretations"]
+        # Extract what the conflict is about
+        if "pathogenic" in sig:
+            evidence.append("Conflicting: Pathogenicity disputed")
+        elif "benign" in sig:
+            evidence.append("Conflicting: Benignness disputed")
+        return "CONFLICT", tuple(evidence)
+    if "pathogenic" in sig and "likely" not in sig:
+        return "P", ("ClinVar: Pathogenic",)
+    if "likely" in sig and "pathogenic" in sig:
+        if sig.startswith("likely"):
+            return "LP", ("ClinVar: Likely Pathogenic",)
+        return "P", ("ClinVar: Pathogenic/Likely Pathogenic",)
+    if "benign" in sig and "likely" not in sig:
+        return "B", ("ClinVar: Benign",)
+    if "likely" in sig and "benign" in sig:
+        if sig.startswith("likely"):
+            return "LB", ("ClinVar: Likely Benign",)
+        return "B", ("ClinVar: Benign/Likely Benign",)
+    return "VUS", (f"ClinVar: {clinical_sig}",)
+
+
+@lru_cache(maxsize=1024)
+def review_evidence(review_status: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Evidence from one ClinVar review status (cached per distinct value).
+
+    Returns:
+        Tuple of (evidence flag columns, evidence strings)
+    """
+    flags: List[str] = []
+    evidence: List[str] = []
+    for needle, flag, text in REVIEW_EVIDENCE_FLAGS:
+        if needle in review_status and flag not in flags:
+            flags.append(flag)
+            evidence.append(text)
+    return tuple(flags), tuple(evidence)
+
+
+def classify_clinvar_significance(df):
+    """
+    Columnar ClinVar-significance classification.
+
+    Each distinct clinical_sig / review_status value is classified once
+    (see classify_significance) and mapped back through its category code.
+
+    Args:
+        df: DataFrame with clinical_sig and review_status columns (missing
+            columns default to Uncertain_significance / "")
+
+    Returns:
+        DataFrame on df.index with clinical_sig, review_status,
+        classification, evidence (list) and one bool column per
+        EVIDENCE_FLAG_COLUMNS entry
+    """
+    import numpy as np
+    import pandas as pd
+
+    def text(column: str, default: str):
+        if column not in df.columns:
+            return pd.Series(default, index=df.index, dtype=object)
+        return df[column].astype(str).str.strip()
+
+    clinical_sig = text("clinical_sig", "Uncertain_significance")
+    review_status = text("review_status", "")
+    sig_codes, sig_values = pd.factorize(clinical_sig)
+    review_codes, review_values = pd.factorize(review_status)
+
+    sig_table = [classify_significance(v) for v in sig_values]
+    review_table = [review_evidence(v) for v in review_values]
+
+    result = pd.DataFrame(
+        {"clinical_sig": clinical_sig, "review_status": review_status},
+        index=df.index,
+    )
+    classes = np.array([code for code, _ in sig_table] or ["VUS"], dtype=object)
+    result["classification"] = classes[sig_codes]
+
+    # Evidence lists per distinct (significance, review status) pair
+    n_review = max(len(review_values), 1)
+    pairs, inverse = np.unique(sig_codes * n_review + review_codes, return_inverse=True)
+    evidence_table = np.empty(len(pairs), dtype=object)
+    for i, pair in enumerate(pairs):
+        sig_i, review_i = divmod(int(pair), n_review)
+        evidence_table[i] = sig_table[sig_i][1] + review_table[review_i][1]
+    result["evidence"] = [list(e) for e in evidence_table[inverse]]
+
+    for flag in EVIDENCE_FLAG_COLUMNS:
+        has_flag = np.array([flag in flags for flags, _ in review_table] or [False])
+        result[flag] = has_flag[review_codes]
+    return result
+
+
+def classification_stats(classification) -> Dict[str, int]:
+    """Counts per ACMG category from a classification column."""
+    counts = classification.value_counts()
+    return {
+        key: int(counts.get(code, 0)) for code, key in CLASSIFICATION_STAT_KEYS.items()
+    }
+
+
 def classify_variants_production(variants: List[Dict], classifier) -> List[Dict]:
     """
-    Classify variants using ClinVar clinical significance - FIXED v7.0.3.
+    Classify variants using ClinVar clinical significance - v7.1.0.
 
     Maps ClinVar classifications to ACMG codes:
     - Pathogenic → P
@@ -91,6 +242,9 @@ def classify_variants_production(variants: List[Dict], classifier) -> List[Dict]
     - Conflicting → CONFLICT (checked FIRST before pathogenic/benign)
     - Uncertain_significance/VUS → VUS
 
+    Row-wise adapter over the cached classify_significance table; use
+    classify_clinvar_significance() for DataFrames.
+
     Args:
         variants: List of variant dictionaries with clinical_sig field
         classifier: ACMG classifier instance (unused in v7.0)
@@ -102,78 +256,20 @@ def classify_variants_production(variants: List[Dict], classifier) -> List[Dict]
 
     for variant in variants:
         try:
-            # Extract ClinVar classification
             clinical_sig = str(
                 variant.get("clinical_sig", "Uncertain_significance")
             ).strip()
             review_status = str(variant.get("review_status", "")).strip()
-
-            # Map ClinVar to ACMG classification
-            classification = "VUS"
-            evidence = []
-            clinical_sig_lower = clinical_sig.lower()
-
-            # CHECK CONFLICTING FIRST (before pathogenic/benign keywords)
-            if "conflicting" in clinical_sig_lower:
-                classification = "CONFLICT"
-                evidence.append("ClinVar: Conflicting interpretations")
-                # Extract what the conflict is about
-                if "pathogenic" in clinical_sig_lower:
-                    evidence.append("Conflicting: Pathogenicity disputed")
-                elif "benign" in clinical_sig_lower:
-                    evidence.append("Conflicting: Benignness disputed")
-            # Pathogenic classifications
-            elif (
-                "pathogenic" in clinical_sig_lower
-                and "likely" not in clinical_sig_lower
-            ):
-                classification = "P"
-                evidence.append("ClinVar: Pathogenic")
-            elif "likely" in clinical_sig_lower and "pathogenic" in clinical_sig_lower:
-                if clinical_sig_lower.startswith("likely"):
-                    classification = "LP"
-                    evidence.append("ClinVar: Likely Pathogenic")
-                else:
-                    classification = "P"
-                    evidence.append("ClinVar: Pathogenic/Likely Pathogenic")
-            # Benign classifications
-            elif "benign" in clinical_sig_lower and "likely" not in clinical_sig_lower:
-                classification = "B"
-                evidence.append("ClinVar: Benign")
-            elif "likely" in clinical_sig_lower and "benign" in clinical_sig_lower:
-                if clinical_sig_lower.startswith("likely"):
-                    classification = "LB"
-                    evidence.append("ClinVar: Likely Benign")
-                else:
-                    classification = "B"
-                    evidence.append("ClinVar: Benign/Likely Benign")
-            # VUS or unknown
-            else:
-                classification = "VUS"
-                evidence.append(f"ClinVar: {clinical_sig}")
-
-            # Add review status to evidence
-            if review_status:
-                if "multiple_submitters" in review_status:
-                    evidence.append("Multiple submitters")
-                if (
-                    "expert_panel" in review_status
-                    or "practice_guideline" in review_status
-                ):
-                    evidence.append("Expert reviewed")
-                if "no_assertion" in review_status:
-                    evidence.append("No assertion criteria")
-                if "conflicting" in review_status:
-                    evidence.append("Conflicting interpretations noted")
-
-            result = {
-                "variant": variant,
-                "classification": classification,
-                "evidence": evidence,
-                "clinical_sig": clinical_sig,
-                "review_status": review_status,
-            }
-            results.append(result)
+            classification, evidence = classify_significance(clinical_sig)
+            results.append(
+                {
+                    "variant": variant,
+                    "classification": classification,
+                    "evidence": list(evidence + review_evidence(review_status)[1]),
+                    "clinical_sig": clinical_sig,
+                    "review_status": review_status,
+                }
+            )
 
         except Exception as e:
             logger.error(f"Error classifying variant: {e}")
@@ -232,7 +328,12 @@ def parse_variant_key(key: str) -> Dict[str, Any]:
 
 
 __all__ = [
+    "CLASSIFICATION_STAT_KEYS",
+    "EVIDENCE_FLAG_COLUMNS",
     "DataValidator",
+    "classification_stats",
+    "classify_clinvar_significance",
+    "classify_significance",
     "classify_variants_production",
     "format_variant_key",
     "parse_variant_key",
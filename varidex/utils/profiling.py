@@ -0,0 +1,407 @@
+"""Span-based hierarchical profiling.
+
+Spans time named sections of work and nest under the pipeline stage that
+runs them:
+
+    with span("gnomad.merge", rows_in=len(df)) as s:
+        result = df.merge(freq_df, ...)
+        s.rows_out = len(result)
+
+    @traced("matching.rsid")
+    def match_by_rsid(clinvar_df, user_df): ...
+
+Each span records wall time, CPU time of its thread, peak RSS (sampled
+in the background while it is open), rows in/out, bytes read and any
+extra attributes. Spans are only recorded while a SpanRecorder is active
+(StageProfiler activates its own while stages run); otherwise span() costs one global
+lookup. The parent of a span is the innermost open span of the current
+context (contextvars), so work submitted to a thread pool nests under a
+stage only when run via SpanRecorder.bind(). Work in worker processes is
+not recorded.
+
+SpanRecorder exports Chrome trace-event JSON (chrome://tracing, Perfetto)
+and a flat per-name summary table.
+"""
+
+import contextlib
+import contextvars
+import functools
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+try:
+    import psutil
+except ImportError:  # RSS is reported as 0 without psutil
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+RSS_SAMPLE_INTERVAL_SEC = 0.05
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar(
+    "varidex_current_span", default=None
+)
+_active_recorder: Optional["SpanRecorder"] = None
+_FROM_CONTEXT = object()
+_process = None
+
+
+def _rss_mb() -> float:
+    global _process
+    if psutil is None:
+        return 0.0
+    if _process is None or _process.pid != os.getpid():
+        _process = psutil.Process()
+    return _process.memory_info().rss / 1024 / 1024
+
+
+@dataclass
+class Span:
+    """One timed section; finished spans are kept by their SpanRecorder."""
+
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    category: str = "span"
+    thread_id: int = 0
+    start: float = 0.0
+    wall_sec: float = 0.0
+    cpu_sec: float = 0.0
+    peak_rss_mb: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    bytes_read: int = 0
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    _cpu_start: float = field(default=0.0, repr=False)
+
+    def add_bytes(self, n: int) -> None:
+        """Count n bytes read by this span."""
+        self.bytes_read += int(n)
+
+    def set(self, **attrs: Any) -> None:
+        """Attach extra attributes (shown in the trace event args)."""
+        self.attrs.update(attrs)
+
+
+class _NullSpan:
+    """Stand-in yielded by span() when no recorder is active."""
+
+    rows_in = rows_out = None
+
+    def add_bytes(self, n: int) -> None:
+        pass
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class SpanRecorder:
+    """Collects spans, samples RSS for open spans and exports the results."""
+
+    def __init__(self, sample_interval: float = RSS_SAMPLE_INTERVAL_SEC):
+        self.sample_interval = sample_interval
+        self.spans: List[Span] = []
+        self._open: Dict[int, Span] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._sampler: Optional[threading.Thread] = None
+        self._previous: Optional["SpanRecorder"] = None
+
+    # -- activation -------------------------------------------------------
+
+    def activate(self) -> "SpanRecorder":
+        """Make this the recorder that span() and traced() write to."""
+        global _active_recorder
+        if _active_recorder is not self:
+            self._previous = _active_recorder
+            _active_recorder = self
+        return self
+
+    def deactivate(self) -> None:
+        """Restore the previously active recorder."""
+        global _active_recorder
+        if _active_recorder is self:
+            _active_recorder = self._previous
+            self._previous = None
+
+    @contextlib.contextmanager
+    def recording(self) -> Iterator["SpanRecorder"]:
+        """Active for the duration of the block; the previous one is restored."""
+        global _active_recorder
+        previous = _active_recorder
+        _active_recorder = self
+        try:
+            yield self
+        finally:
+            _active_recorder = previous
+
+    # -- recording --------------------------------------------------------
+
+    def open(
+        self,
+        name: str,
+        category: str = "span",
+        parent: Any = _FROM_CONTEXT,
+        start: Optional[float] = None,
+        rows_in: Optional[int] = None,
+        **attrs: Any,
+    ) -> Span:
+        """Start a span (parent defaults to the current context's span)."""
+        if parent is _FROM_CONTEXT:
+            parent = _current_span.get()
+        rss = _rss_mb()
+        span = Span(
+            name=name,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent is not None else None,
+            category=category,
+            thread_id=threading.get_ident(),
+            start=start if start is not None else time.time(),
+            peak_rss_mb=rss,
+            rows_in=rows_in,
+            attrs=attrs,
+            _cpu_start=time.thread_time(),
+        )
+        with self._lock:
+            self._open[span.span_id] = span
+            if self._sampler is None or not self._sampler.is_alive():
+                self._sampler = threading.Thread(
+                    target=self._sample_rss, name="span-rss-sampler", daemon=True
+                )
+                self._sampler.start()
+        return span
+
+    def close(self, span: Span, end: Optional[float] = None) -> Span:
+        """Finish a span opened with open()."""
+        span.wall_sec = round((end or time.time()) - span.start, 6)
+        if span.thread_id == threading.get_ident():
+            span.cpu_sec = round(time.thread_time() - span._cpu_start, 6)
+        span.peak_rss_mb = round(max(span.peak_rss_mb, _rss_mb()), 2)
+        with self._lock:
+            self._open.pop(span.span_id, None)
+            self.spans.append(span)
+        return span
+
+    def _sample_rss(self) -> None:
+        while True:
+            with self._lock:
+                open_spans = list(self._open.values())
+                if not open_spans:
+                    self._sampler = None
+                    return
+            rss = _rss_mb()
+            for span in open_spans:
+                if rss > span.peak_rss_mb:
+                    span.peak_rss_mb = rss
+            time.sleep(self.sample_interval)
+
+    def bind(self, parent: Optional[Span], func: Callable) -> Callable:
+        """
+        Wrap func so spans it opens (in any thread) nest under parent.
+
+        Use for work handed to a thread pool; the wrapper is a
+        functools.partial and is not meant for process pools.
+        """
+        return functools.partial(_run_under, parent, func)
+
+    # -- reporting --------------------------------------------------------
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace-event JSON object ("X" complete events, microseconds)."""
+        with self._lock:
+            spans = list(self.spans)
+        pid = os.getpid()
+        events = []
+        for s in sorted(spans, key=lambda s: s.start):
+            args = {
+                "span_id": s.span_id,
+                "parent_id": s.parent_id,
+                "cpu_sec": s.cpu_sec,
+                "peak_rss_mb": s.peak_rss_mb,
+                "rows_in": s.rows_in,
+                "rows_out": s.rows_out,
+                "bytes_read": s.bytes_read,
+                **s.attrs,
+            }
+            events.append(
+                {
+                    "name": s.name,
+                    "cat": s.category,
+                    "ph": "X",
+                    "ts": int(s.start * 1_000_000),
+                    "dur": int(s.wall_sec * 1_000_000),
+                    "pid": pid,
+                    "tid": s.thread_id,
+                    "args": {k: v for k, v in args.items() if v is not None},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, output_path: Union[str, Path]) -> None:
+        """Write chrome_trace() to output_path."""
+        with open(output_path, "w") as f:
+            json.dump(self.chrome_trace(), f, default=str)
+        logger.info(f"📊 Span trace exported to {output_path}")
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Flat table: one row per span name, slowest total wall time first.
+
+        Columns: name, calls, wall_sec, cpu_sec, self_sec (wall minus direct
+        children), peak_rss_mb, rows_in, rows_out, bytes_read.
+        """
+        with self._lock:
+            spans = list(self.spans)
+        child_wall: Dict[int, float] = {}
+        for s in spans:
+            if s.parent_id is not None:
+                child_wall[s.parent_id] = child_wall.get(s.parent_id, 0.0) + s.wall_sec
+
+        rows: Dict[str, Dict[str, Any]] = {}
+        for s in spans:
+            row = rows.setdefault(
+                s.name,
+                {
+                    "name": s.name,
+                    "calls": 0,
+                    "wall_sec": 0.0,
+                    "cpu_sec": 0.0,
+                    "self_sec": 0.0,
+                    "peak_rss_mb": 0.0,
+                    "rows_in": 0,
+                    "rows_out": 0,
+                    "bytes_read": 0,
+                },
+            )
+            row["calls"] += 1
+            row["wall_sec"] += s.wall_sec
+            row["cpu_sec"] += s.cpu_sec
+            row["self_sec"] += max(s.wall_sec - child_wall.get(s.span_id, 0.0), 0.0)
+            row["peak_rss_mb"] = max(row["peak_rss_mb"], s.peak_rss_mb)
+            row["rows_in"] += s.rows_in or 0
+            row["rows_out"] += s.rows_out or 0
+            row["bytes_read"] += s.bytes_read
+
+        for row in rows.values():
+            for key in ("wall_sec", "cpu_sec", "self_sec"):
+                row[key] = round(row[key], 3)
+        return sorted(rows.values(), key=lambda r: r["wall_sec"], reverse=True)
+
+    def format_summary(self) -> List[str]:
+        """summary() as aligned text lines (header first)."""
+        lines = [
+            f"{'span':<40} {'calls':>6} {'wall_s':>9} {'cpu_s':>9} "
+            f"{'self_s':>9} {'rss_mb':>9} {'rows_out':>10} {'bytes':>12}"
+        ]
+        for r in self.summary():
+            lines.append(
+                f"{r['name'][:40]:<40} {r['calls']:>6} {r['wall_sec']:>9.3f} "
+                f"{r['cpu_sec']:>9.3f} {r['self_sec']:>9.3f} "
+                f"{r['peak_rss_mb']:>9.1f} {r['rows_out']:>10,} "
+                f"{r['bytes_read']:>12,}"
+            )
+        return lines
+
+    def export_spans(self, output_path: Union[str, Path]) -> None:
+        """Write every finished span as JSON records."""
+        with self._lock:
+            records = [asdict(s) for s in self.spans]
+        for record in records:
+            record.pop("_cpu_start", None)
+        with open(output_path, "w") as f:
+            json.dump(records, f, indent=2, default=str)
+
+
+def _run_under(parent: Optional[Span], func: Callable, *args: Any, **kwargs: Any):
+    token = _current_span.set(parent)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _current_span.reset(token)
+
+
+def get_recorder() -> Optional[SpanRecorder]:
+    """The active SpanRecorder, or None when profiling is off."""
+    return _active_recorder
+
+
+class span:
+    """
+    Context manager recording one span under the current span.
+
+    Args:
+        name: Span name (dotted by module, e.g. "gnomad.merge")
+        rows_in: Input row count (optional)
+        **attrs: Extra attributes for the trace
+    """
+
+    __slots__ = ("name", "rows_in", "attrs", "_span", "_recorder", "_token")
+
+    def __init__(self, name: str, rows_in: Optional[int] = None, **attrs: Any):
+        self.name = name
+        self.rows_in = rows_in
+        self.attrs = attrs
+        self._span: Optional[Span] = None
+        self._recorder: Optional[SpanRecorder] = None
+
+    def __enter__(self) -> Union[Span, _NullSpan]:
+        recorder = _active_recorder
+        if recorder is None:
+            return _NULL_SPAN
+        self._recorder = recorder
+        self._span = recorder.open(self.name, rows_in=self.rows_in, **self.attrs)
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self._span is None:
+            return False
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self._span.attrs["error"] = exc_type.__name__
+        self._recorder.close(self._span)
+        return False
+
+
+def _row_count(value: Any) -> Optional[int]:
+    if hasattr(value, "shape") and getattr(value, "ndim", 0) >= 1:
+        return int(value.shape[0])
+    if isinstance(value, (list, tuple)) and value and hasattr(value[0], "shape"):
+        return _row_count(value[0])  # e.g. (matched_df, n_rsid, n_coord)
+    return None
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorator recording each call as a span.
+
+    rows_in is the row count of the first positional DataFrame/array
+    argument (after self), rows_out that of the return value.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any):
+            if _active_recorder is None:
+                return func(*args, **kwargs)
+            rows_in = next((n for n in map(_row_count, args) if n is not None), None)
+            with span(span_name, rows_in=rows_in) as s:
+                result = func(*args, **kwargs)
+                s.rows_out = _row_count(result)
+                return result
+
+        return wrapper
+
+    return decorate